@@ -180,7 +180,8 @@ class ActionSystem:
         }
         
         # Load skills and goals
-        self.skills = self._load_skills()
+        self.skill_catalog = self.position_system.skill_catalog
+        self._load_skills()
         self.goals = self._load_goals()
         self.needs = self._load_needs()
         
@@ -296,23 +297,18 @@ class ActionSystem:
             "stop": "Stop"
         }
     
+    @property
+    def skills(self) -> Dict:
+        """Skills keyed by file name, from the shared catalog (refreshed when skill files change)."""
+        return self.skill_catalog.skills()
+    
     def _load_skills(self) -> Dict:
         """Load skills from the skills directory."""
-        skills = {}
-        skills_dir = 'skills'
+        skills_dir = self.skill_catalog.skills_dir
+        self.skill_catalog.refresh(force=True)
+        skills = self.skill_catalog.skills()
         
-        if os.path.exists(skills_dir):
-            for filename in os.listdir(skills_dir):
-                if filename.endswith('.json'):
-                    try:
-                        with open(os.path.join(skills_dir, filename), 'r') as f:
-                            skill_data = json.load(f)
-                            skill_name = filename.replace('.json', '')
-                            skills[skill_name] = skill_data
-                            self.logger.debug(f"Loaded skill: {skill_name}")
-                    except Exception as e:
-                        self.logger.error(f"Error loading skill {filename}: {e}")
-        else:
+        if not os.path.exists(skills_dir):
             self.logger.warning(f"Skills directory not found: {skills_dir}")
         
         self.logger.info(f"Loaded {len(skills)} skills: {list(skills.keys())}")
@@ -2208,28 +2204,19 @@ class ActionSystem:
         """
         current_position = self.position_system.current_position
         
-        # Load skill data to check prerequisite_pose
-        skills_dir = "skills"
-        skill_file = os.path.join(skills_dir, f"{skill_name}.json")
+        # Skill data from the shared catalog (no file read per check)
+        skill_data = self.skills.get(skill_name)
         
-        if os.path.exists(skill_file):
-            try:
-                with open(skill_file, 'r', encoding='utf-8') as f:
-                    skill_data = json.load(f)
-                
-                prerequisite_pose = skill_data.get("prerequisite_pose", "any")
-                
-                if prerequisite_pose == "any":
-                    return True, f"Skill '{skill_name}' can be executed from any position"
-                
-                if prerequisite_pose == current_position:
-                    return True, f"Skill '{skill_name}' requires {prerequisite_pose} and I am {current_position}"
-                
-                return False, f"Skill '{skill_name}' requires {prerequisite_pose} but I am {current_position}"
-                
-            except Exception as e:
-                self.logger.warning(f"Error checking prerequisite pose for {skill_name}: {e}")
-                return True, f"Could not determine prerequisite pose for {skill_name}, allowing execution"
+        if skill_data is not None:
+            prerequisite_pose = skill_data.get("prerequisite_pose", "any")
+            
+            if prerequisite_pose == "any":
+                return True, f"Skill '{skill_name}' can be executed from any position"
+            
+            if prerequisite_pose == current_position:
+                return True, f"Skill '{skill_name}' requires {prerequisite_pose} and I am {current_position}"
+            
+            return False, f"Skill '{skill_name}' requires {prerequisite_pose} but I am {current_position}"
         
         # If skill file doesn't exist, allow execution (backward compatibility)
         return True, f"Skill file for '{skill_name}' not found, allowing execution"
@@ -544,6 +544,24 @@ class AIMLReflexIntegration:
             user_input: The user's input
             context: Additional context information
             
+        Returns:
+            Dictionary containing processing results
+        """
+        result = self.match_input(user_input)
+        if result.get('pattern_matched', False):
+            self.record_reflex_hit(user_input, result['response'], context)
+        return result
+    
+    def match_input(self, user_input: str) -> Dict[str, Any]:
+        """
+        Match input against the reflex patterns without logging or storing the hit.
+        
+        Safe to run ahead of the pipeline (speculatively); pair a hit with
+        record_reflex_hit() once it is actually used.
+        
+        Args:
+            user_input: The user's input
+            
         Returns:
             Dictionary containing processing results
         """
@@ -552,13 +570,6 @@ class AIMLReflexIntegration:
             reflex_response = self.aiml_engine.get_reflex_response(user_input)
             
             if reflex_response:
-                # Log reflex hit
-                self._log_reflex_hit(user_input, reflex_response, context)
-                
-                # Update memory system if available
-                if self.memory_system:
-                    self._update_memory_with_reflex(user_input, reflex_response)
-                
                 return {
                     'response': reflex_response,
                     'source': 'reflex',
@@ -586,6 +597,15 @@ class AIMLReflexIntegration:
                 'error': str(e)
             }
     
+    def record_reflex_hit(self, user_input: str, response: str, context: Dict[str, Any] = None):
+        """Log a reflex hit and store it in memory."""
+        # Log reflex hit
+        self._log_reflex_hit(user_input, response, context)
+        
+        # Update memory system if available
+        if self.memory_system:
+            self._update_memory_with_reflex(user_input, response)
+    
     def _log_reflex_hit(self, user_input: str, response: str, context: Dict[str, Any] = None):
         """Log a reflex hit for learning purposes."""
         log_entry = {
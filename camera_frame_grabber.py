@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Camera Frame Grabber
+====================
+
+Background grabber for the ARC HTTP camera.
+
+A single daemon thread keeps a persistent keep-alive ``requests.Session`` to
+the camera and continuously fetches frames, either by polling the snapshot
+endpoint (``CameraImage.jpg``) or by reading an MJPEG stream. The newest frame
+lives in a double-buffered in-memory slot: the grabber fills the back slot and
+flips it to the front, so readers always get a complete frame without
+waiting on the network. Frames are only written to disk when an event needs
+a memshot (``save_latest``).
+"""
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+DEFAULT_CAMERA_URL = "http://192.168.56.1/CameraImage.jpg?c=Camera"
+
+
+@dataclass(frozen=True)
+class CameraFrame:
+    """One JPEG frame from the camera."""
+    data: bytes
+    captured_at: float  # time.time()
+    sequence: int
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.captured_at
+
+
+class CameraFrameGrabber:
+    """
+    Keeps the latest camera frame in memory using a persistent connection.
+    """
+
+    def __init__(self, camera_url: str = DEFAULT_CAMERA_URL, interval: float = 0.2,
+                 timeout: float = 2.0, mode: str = "snapshot", session=None):
+        """
+        Initialize the frame grabber.
+
+        Args:
+            camera_url: Snapshot or MJPEG stream URL
+            interval: Seconds between snapshot polls
+            timeout: HTTP timeout in seconds
+            mode: "snapshot" (poll a JPEG endpoint) or "mjpeg" (read a multipart stream)
+            session: Optional requests.Session (created on start if None)
+        """
+        self.camera_url = camera_url
+        self.interval = interval
+        self.timeout = timeout
+        self.mode = mode
+        self.session = session
+        self.logger = logging.getLogger(__name__)
+
+        # Double buffer: the grabber writes the back slot, then flips the front index
+        self._slots = [None, None]
+        self._front = 0
+        self._swap_lock = threading.Lock()
+        self._new_frame = threading.Condition(self._swap_lock)
+        self._sequence = 0
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.frames_grabbed = 0
+        self.fetch_errors = 0
+        self.last_error: Optional[str] = None
+        self.frames_saved = 0
+
+    def _create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def start(self):
+        """Start the background grabber thread."""
+        if self._running:
+            return
+        if self.session is None:
+            self.session = self._create_session()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CameraFrameGrabber", daemon=True)
+        self._thread.start()
+        self.logger.info(f"📷 Camera frame grabber started ({self.mode}): {self.camera_url}")
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the grabber thread and close the connection."""
+        self._running = False
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        if self.session is not None:
+            try:
+                self.session.close()
+            except Exception:
+                pass
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def _publish(self, data: bytes):
+        """Write a frame to the back slot and flip it to the front."""
+        with self._new_frame:
+            self._sequence += 1
+            back = 1 - self._front
+            self._slots[back] = CameraFrame(data=data, captured_at=time.time(), sequence=self._sequence)
+            self._front = back
+            self.frames_grabbed += 1
+            self._new_frame.notify_all()
+
+    def _record_error(self, error: str):
+        self.fetch_errors += 1
+        if error != self.last_error:
+            self.logger.warning(f"📷 Camera grab failed: {error}")
+        self.last_error = error
+
+    def fetch_once(self) -> Optional[bytes]:
+        """Fetch one snapshot over the pooled session and publish it."""
+        if self.session is None:
+            self.session = self._create_session()
+        try:
+            response = self.session.get(self.camera_url, timeout=self.timeout)
+            if response.status_code == 200 and response.content:
+                self._publish(response.content)
+                self.last_error = None
+                return response.content
+            self._record_error(f"status {response.status_code}")
+        except Exception as e:
+            self._record_error(str(e))
+        return None
+
+    def _run(self):
+        backoff = self.interval
+        while self._running:
+            if self.mode == "mjpeg":
+                try:
+                    with self.session.get(self.camera_url, timeout=self.timeout, stream=True) as response:
+                        for frame in iter_mjpeg_frames(response.iter_content(chunk_size=16384)):
+                            if not self._running:
+                                break
+                            self._publish(frame)
+                    backoff = self.interval
+                except Exception as e:
+                    self._record_error(str(e))
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 5.0)
+            else:
+                start = time.monotonic()
+                if self.fetch_once() is not None:
+                    backoff = self.interval
+                    time.sleep(max(0.0, self.interval - (time.monotonic() - start)))
+                else:
+                    # Camera unavailable: back off instead of hammering it
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 5.0)
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[CameraFrame]:
+        """
+        Get the newest frame without touching the network.
+
+        Args:
+            max_age: Maximum acceptable frame age in seconds (any age if None)
+
+        Returns:
+            CameraFrame or None if no (fresh enough) frame is available
+        """
+        frame = self._slots[self._front]
+        if frame is None or (max_age is not None and frame.age > max_age):
+            return None
+        return frame
+
+    def wait_for_frame(self, after_sequence: int = 0, timeout: float = 1.0) -> Optional[CameraFrame]:
+        """Block until a frame newer than after_sequence arrives (or the timeout expires)."""
+        with self._new_frame:
+            self._new_frame.wait_for(lambda: self._sequence > after_sequence, timeout=timeout)
+            return self._slots[self._front] if self._sequence > after_sequence else None
+
+    def save_latest(self, directory: str, prefix: str = "camera_capture",
+                    max_age: Optional[float] = None) -> Optional[str]:
+        """
+        Write the newest frame to disk as a memshot.
+
+        Args:
+            directory: Target directory
+            prefix: Filename prefix
+            max_age: Maximum acceptable frame age in seconds
+
+        Returns:
+            Path of the written JPEG, or None if no frame is available
+        """
+        frame = self.latest(max_age)
+        if frame is None:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.fromtimestamp(frame.captured_at).strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        filepath = os.path.join(directory, f"{prefix}_{timestamp}.jpg")
+        # Write then rename: an existing path may be a hard link shared with stored memshots
+        temp_path = f"{filepath}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(frame.data)
+        os.replace(temp_path, filepath)
+        self.frames_saved += 1
+        return filepath
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get grabber statistics."""
+        frame = self._slots[self._front]
+        return {
+            'running': self._running,
+            'mode': self.mode,
+            'frames_grabbed': self.frames_grabbed,
+            'frames_saved': self.frames_saved,
+            'fetch_errors': self.fetch_errors,
+            'last_error': self.last_error,
+            'latest_age': frame.age if frame else None
+        }
+
+
+def iter_mjpeg_frames(chunks) -> Iterator[bytes]:
+    """
+    Split a multipart MJPEG byte stream into JPEG frames.
+
+    Frames are delimited by the JPEG start (FFD8) and end (FFD9) markers, which
+    works regardless of the multipart boundary string the camera uses.
+    """
+    buffer = b''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        while True:
+            start = buffer.find(b'\xff\xd8')
+            if start < 0:
+                buffer = buffer[-1:]
+                break
+            end = buffer.find(b'\xff\xd9', start + 2)
+            if end < 0:
+                buffer = buffer[start:]
+                break
+            yield buffer[start:end + 2]
+            buffer = buffer[end + 2:]
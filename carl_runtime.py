@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+CARL Headless Runtime
+=====================
+
+Core cognitive runtime that runs without Tk.
+
+PersonalityBotApp couples cognition to the Tk main loop (``self.after``
+callbacks, widget updates). This module provides a GUI-free core for
+headless servers, containers and benchmark harnesses:
+
+- a scheduler abstraction with a thread-based implementation (and a Tk
+  adapter for when a GUI is present),
+- CarlRuntime: input queue -> cognitive tick (NEUCOGAR appraisal, memory
+  storage, optional response/action hooks) with per-stage timing metrics,
+- an optional Flask endpoint (/speech, /vision, /status) feeding the runtime,
+- observers, so a GUI can attach and render ticks without owning cognition.
+
+Run ``python carl_runtime.py --robots 4 --events 200`` to measure the
+throughput of the cognitive pipeline alone.
+"""
+
+import os
+import time
+import heapq
+import queue
+import shutil
+import logging
+import argparse
+import tempfile
+import threading
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from neucogar_emotional_engine import NEUCOGAREmotionalEngine
+from memory_system import MemorySystem
+
+# Optional imports - only used if available
+try:
+    from flask import Flask, request, jsonify
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class ThreadScheduler:
+    """
+    Timer scheduler backed by a single worker thread and a monotonic-clock heap.
+
+    Drop-in replacement for Tk's ``after``/``after_cancel`` when there is no GUI.
+    """
+
+    def __init__(self, name: str = "CARL-Scheduler"):
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+        self._heap = []
+        self._counter = itertools.count()
+        self._pending = set()  # Handles scheduled and not yet run or dropped
+        self._cancelled = set()
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the scheduler thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the scheduler thread; pending callbacks are dropped."""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._pending.clear()
+            self._cancelled.clear()
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+
+    def after(self, delay_ms: int, callback: Callable, *args) -> int:
+        """Schedule callback(*args) after delay_ms milliseconds."""
+        handle = next(self._counter)
+        deadline = time.monotonic() + max(0, delay_ms) / 1000.0
+        with self._condition:
+            heapq.heappush(self._heap, (deadline, handle, callback, args))
+            self._pending.add(handle)
+            self._condition.notify()
+        return handle
+
+    def after_cancel(self, handle: int):
+        """Cancel a scheduled callback (no-op if it already ran)."""
+        with self._condition:
+            if handle in self._pending:
+                self._cancelled.add(handle)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+                _, handle, callback, args = heapq.heappop(self._heap)
+                self._pending.discard(handle)
+                if handle in self._cancelled:
+                    self._cancelled.discard(handle)
+                    continue
+            try:
+                callback(*args)
+            except Exception as e:
+                self.logger.error(f"❌ Scheduled callback failed: {e}")
+
+
+class TkScheduler:
+    """Scheduler adapter over a Tk root, used when the GUI hosts the runtime."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def after(self, delay_ms: int, callback: Callable, *args):
+        return self.root.after(delay_ms, callback, *args)
+
+    def after_cancel(self, handle):
+        self.root.after_cancel(handle)
+
+
+@dataclass
+class RuntimeInput:
+    """A unit of external input waiting for cognitive processing."""
+    source: str
+    content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    received_at: float = field(default_factory=time.monotonic)
+
+
+class CarlRuntime:
+    """
+    Headless CARL core: input queue, cognitive ticks, memory and NEUCOGAR.
+
+    Heavy or I/O-bound stages (LLM judgment, robot actions) are pluggable
+    hooks so the pipeline can be measured on its own.
+    """
+
+    def __init__(self, personality_type: str = "INTP", scheduler=None,
+                 respond: Optional[Callable[[RuntimeInput, Dict[str, Any]], Optional[str]]] = None,
+                 act: Optional[Callable[[RuntimeInput, Dict[str, Any]], None]] = None,
+                 base_processing_time: float = 2.0, min_processing_time: float = 0.5,
+                 max_processing_time: float = 3.0, max_queue: int = 1000,
+                 data_dir: Optional[str] = None):
+        """
+        Initialize the runtime.
+
+        Args:
+            personality_type: MBTI personality type
+            scheduler: Scheduler providing after/after_cancel (ThreadScheduler if None)
+            respond: Optional hook producing a reply for an input (e.g. a JudgmentSystem call)
+            act: Optional hook executing actions for an input (e.g. the ActionSystem)
+            base_processing_time: Base tick interval before neurotransmitter modulation
+            min_processing_time: Lower bound of the tick interval
+            max_processing_time: Upper bound of the tick interval
+            max_queue: Maximum number of queued inputs
+            data_dir: Directory holding this runtime's memories (working directory if None)
+        """
+        self.personality_type = personality_type
+        self.data_dir = data_dir
+        self.logger = logging.getLogger(__name__)
+        self.scheduler = scheduler or ThreadScheduler()
+        self.respond = respond
+        self.act = act
+
+        self.base_processing_time = base_processing_time
+        self.min_processing_time = min_processing_time
+        self.max_processing_time = max_processing_time
+
+        # Core subsystems (no Tk dependencies)
+        self.neucogar_engine = NEUCOGAREmotionalEngine()
+        self.memory_system = MemorySystem(personality_type,
+                                          memory_root=os.path.join(data_dir, 'memories') if data_dir else 'memories')
+
+        self.inputs: "queue.Queue[RuntimeInput]" = queue.Queue(maxsize=max_queue)
+        self.observers: List[Callable[[Dict[str, Any]], None]] = []
+        self.is_running = False
+        self._tick_handle = None
+        self.flask_app = None
+
+        # Metrics
+        self.tick_count = 0
+        self.events_processed = 0
+        self.inputs_dropped = 0
+        self.started_at: Optional[float] = None
+        self.stage_totals: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------ inputs
+
+    def submit(self, source: str, content: str, **metadata) -> bool:
+        """
+        Queue external input for cognitive processing. Safe from any thread.
+
+        Returns:
+            False if the queue is full and the input was dropped
+        """
+        try:
+            self.inputs.put_nowait(RuntimeInput(source, content, metadata))
+            return True
+        except queue.Full:
+            self.inputs_dropped += 1
+            self.logger.warning(f"⚠️ Runtime input queue full - dropping {source} input")
+            return False
+
+    def submit_speech(self, text: str) -> bool:
+        """Queue a speech utterance."""
+        return self.submit('speech', text)
+
+    def submit_vision(self, object_name: str, color: str = "", shape: str = "") -> bool:
+        """Queue a vision detection."""
+        description = " ".join(part for part in (color, shape, object_name) if part)
+        return self.submit('vision', f"I see {description}", object_name=object_name,
+                           color=color, shape=shape)
+
+    # --------------------------------------------------------------- observers
+
+    def add_observer(self, callback: Callable[[Dict[str, Any]], None]):
+        """Attach an observer (e.g. the GUI) that receives every tick result."""
+        self.observers.append(callback)
+
+    def remove_observer(self, callback: Callable[[Dict[str, Any]], None]):
+        """Detach an observer."""
+        if callback in self.observers:
+            self.observers.remove(callback)
+
+    def _notify(self, tick_result: Dict[str, Any]):
+        for observer in list(self.observers):
+            try:
+                observer(tick_result)
+            except Exception as e:
+                self.logger.error(f"❌ Runtime observer failed: {e}")
+
+    # ---------------------------------------------------------------- lifecycle
+
+    def start(self):
+        """Start cognitive processing."""
+        if self.is_running:
+            return
+        self.is_running = True
+        self.started_at = time.monotonic()
+        self.scheduler.start()
+        self._schedule_tick(0)
+        self.logger.info(f"🧠 CARL runtime started ({self.personality_type})")
+
+    def stop(self):
+        """Stop cognitive processing."""
+        self.is_running = False
+        if self._tick_handle is not None:
+            self.scheduler.after_cancel(self._tick_handle)
+            self._tick_handle = None
+        self.scheduler.stop()
+        self.logger.info("🛑 CARL runtime stopped")
+
+    def _schedule_tick(self, delay_s: float):
+        if self.is_running:
+            self._tick_handle = self.scheduler.after(int(delay_s * 1000), self._tick_callback)
+
+    def _tick_callback(self):
+        try:
+            processed = self.tick()
+        except Exception as e:
+            self.logger.error(f"❌ Error in runtime cognitive tick: {e}")
+            processed = None
+        # Poll quickly while there is backlog, otherwise pace like the GUI loop
+        self._schedule_tick(self.processing_interval() if processed else 0.05)
+
+    def processing_interval(self) -> float:
+        """
+        Tick interval modulated by neurotransmitters, as in the GUI cognitive loop.
+        """
+        levels = self.neucogar_engine.get_neurotransmitter_state()
+        dopamine = float(levels.get('dopamine', 0.5))
+        serotonin = float(levels.get('serotonin', 0.5))
+        norepinephrine = float(levels.get('noradrenaline', levels.get('norepinephrine', 0.5)))
+        acetylcholine = float(levels.get('acetylcholine', 0.5))
+        gaba = float(levels.get('gaba', 0.5))
+
+        interval = (self.base_processing_time - dopamine * 1.5) / (
+            (1.0 + serotonin * 0.3) * (1.0 + norepinephrine * 0.4) *
+            (1.0 + acetylcholine * 0.2) * (1.0 + gaba * 0.3))
+        return max(self.min_processing_time, min(self.max_processing_time, interval))
+
+    # ------------------------------------------------------------------ ticking
+
+    def _timed(self, stage: str, timings: Dict[str, float], func: Callable, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            timings[stage] = elapsed
+            self.stage_totals[stage] = self.stage_totals.get(stage, 0.0) + elapsed
+
+    def tick(self) -> Optional[Dict[str, Any]]:
+        """
+        Run one cognitive tick on the next queued input.
+
+        Returns:
+            Tick result, or None if there was nothing to process
+        """
+        self.tick_count += 1
+        try:
+            item = self.inputs.get_nowait()
+        except queue.Empty:
+            return None
+
+        timings: Dict[str, float] = {}
+        queue_wait = time.monotonic() - item.received_at
+
+        # Perception: NEUCOGAR appraisal of the input
+        emotion = self._timed('appraisal', timings, self.neucogar_engine.update_emotion_state, item.content)
+
+        # Memory: store the event
+        event_data = {
+            'type': item.source,
+            'content': item.content,
+            'WHAT': item.content,
+            'emotional_context': {
+                'primary': emotion.get('primary', 'neutral'),
+                'intensity': emotion.get('intensity', 0.5)
+            },
+            'cognitive_state': {'personality_type': self.personality_type},
+            'timestamp': datetime.now().isoformat(),
+            **item.metadata
+        }
+        memory_id = self._timed('memory', timings, self.memory_system.store_event, event_data, 'episodic')
+
+        # Judgment / response and action hooks
+        reply = None
+        context = {'emotion': emotion, 'memory_id': memory_id}
+        if self.respond:
+            reply = self._timed('judgment', timings, self.respond, item, context)
+        if self.act:
+            self._timed('action', timings, self.act, item, context)
+
+        self.events_processed += 1
+        tick_result = {
+            'source': item.source,
+            'content': item.content,
+            'emotion': emotion,
+            'memory_id': memory_id,
+            'reply': reply,
+            'queue_wait': queue_wait,
+            'timings': timings
+        }
+        self._notify(tick_result)
+        return tick_result
+
+    def drain(self) -> int:
+        """Process every queued input synchronously (benchmark helper)."""
+        processed = 0
+        while self.tick() is not None:
+            processed += 1
+        return processed
+
+    # -------------------------------------------------------------------- flask
+
+    def create_flask_app(self):
+        """
+        Create the ARC-facing HTTP endpoint (/speech, /vision, /status).
+
+        Returns:
+            Flask app, or None if Flask is not installed
+        """
+        if not FLASK_AVAILABLE:
+            self.logger.warning("⚠️ Flask not available - HTTP endpoint disabled")
+            return None
+
+        app = Flask(__name__)
+        runtime = self
+
+        @app.route('/speech', methods=['POST'])
+        def receive_speech():
+            json_data = request.get_json(silent=True) or {}
+            speech_data = request.form.get('speech') or json_data.get('speech', '')
+            if not speech_data:
+                return jsonify({"status": "error", "message": "No speech data received"}), 400
+            if not runtime.submit_speech(speech_data):
+                return jsonify({"status": "error", "message": "Input queue full"}), 503
+            return jsonify({"status": "success", "message": f"Received: {speech_data}"}), 200
+
+        @app.route('/vision', methods=['POST'])
+        def receive_vision():
+            json_data = request.get_json(silent=True) or {}
+            object_name = request.form.get('object_name') or json_data.get('object_name', '')
+            if not object_name:
+                return jsonify({"status": "error", "message": "No object name received"}), 400
+            color = request.form.get('object_color') or json_data.get('object_color', '')
+            shape = request.form.get('object_shape') or json_data.get('object_shape', '')
+            if not runtime.submit_vision(object_name, color, shape):
+                return jsonify({"status": "error", "message": "Input queue full"}), 503
+            return jsonify({"status": "success", "message": f"Received: {object_name}"}), 200
+
+        @app.route('/status', methods=['GET'])
+        def status():
+            return jsonify(runtime.get_metrics()), 200
+
+        self.flask_app = app
+        return app
+
+    # ------------------------------------------------------------------ metrics
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get runtime throughput metrics."""
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            'running': self.is_running,
+            'ticks': self.tick_count,
+            'events_processed': self.events_processed,
+            'inputs_queued': self.inputs.qsize(),
+            'inputs_dropped': self.inputs_dropped,
+            'elapsed_seconds': elapsed,
+            'events_per_second': self.events_processed / elapsed if elapsed > 0 else 0.0,
+            'stage_seconds': dict(self.stage_totals)
+        }
+
+
+def run_benchmark(robots: int = 1, events: int = 100) -> Dict[str, Any]:
+    """
+    Measure throughput of the headless cognitive pipeline.
+
+    Each simulated robot gets its own runtime on its own thread; inputs are
+    processed back-to-back (no tick pacing) so the result reflects the cost of
+    the pipeline itself. Runtimes store their synthetic memories in a
+    temporary directory per robot, removed afterwards.
+    """
+    data_root = tempfile.mkdtemp(prefix="carl_benchmark_")
+    try:
+        return _run_benchmark(robots, events, data_root)
+    finally:
+        shutil.rmtree(data_root, ignore_errors=True)
+
+
+def _run_benchmark(robots: int, events: int, data_root: str) -> Dict[str, Any]:
+    runtimes = [CarlRuntime(data_dir=os.path.join(data_root, f"robot_{i}")) for i in range(robots)]
+    for runtime in runtimes:
+        for i in range(events):
+            if i % 2:
+                runtime.submit_vision(f"object_{i % 7}", "red")
+            else:
+                runtime.submit_speech(f"Hello Carl, message number {i}")
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=runtime.drain) for runtime in runtimes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = sum(runtime.events_processed for runtime in runtimes)
+    stage_seconds: Dict[str, float] = {}
+    for runtime in runtimes:
+        for stage, seconds in runtime.stage_totals.items():
+            stage_seconds[stage] = stage_seconds.get(stage, 0.0) + seconds
+    return {
+        'robots': robots,
+        'events': total,
+        'elapsed_seconds': elapsed,
+        'events_per_second': total / elapsed if elapsed > 0 else 0.0,
+        'stage_ms_per_event': {stage: 1000.0 * s / total for stage, s in stage_seconds.items()} if total else {}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run CARL's cognitive core without the GUI")
+    parser.add_argument('--robots', type=int, default=1, help='Number of simulated robots')
+    parser.add_argument('--events', type=int, default=100, help='Inputs per robot for the benchmark')
+    parser.add_argument('--serve', action='store_true', help='Serve the ARC HTTP endpoint instead of benchmarking')
+    parser.add_argument('--port', type=int, default=5000, help='HTTP port for --serve')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.serve:
+        runtime = CarlRuntime()
+        app = runtime.create_flask_app()
+        if app is None:
+            print("❌ Flask is required for --serve")
+            return
+        runtime.start()
+        try:
+            app.run(host='0.0.0.0', port=args.port, threaded=True, use_reloader=False)
+        finally:
+            runtime.stop()
+        return
+
+    result = run_benchmark(args.robots, args.events)
+    print(f"🤖 Robots: {result['robots']}  Events: {result['events']}")
+    print(f"⏱️  {result['elapsed_seconds']:.3f}s  ->  {result['events_per_second']:.1f} events/s")
+    for stage, ms in result['stage_ms_per_event'].items():
+        print(f"   {stage:<10} {ms:.3f} ms/event")
+
+
+if __name__ == "__main__":
+    main()
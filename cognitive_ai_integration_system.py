@@ -8,17 +8,29 @@ Implements "Multi-Phase Cognitive Architecture with Conditional AI Integration"
 - Template-based OpenAI calls during personality functions
 - Maintains realistic human cognition timing and order
 - Intelligent caching and response integration
+- Batched per-event calls: one merged multi-part prompt, or concurrent
+  calls with a concurrency cap
 """
 
 import json
 import time
 import hashlib
 import asyncio
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
+from ttl_cache import TTLCache
+
+# Cached AI responses stay valid for 5 minutes
+RESPONSE_CACHE_TTL = 300
+RESPONSE_CACHE_SIZE = 1000
+
+# Batch execution modes for make_ai_calls
+BATCH_MODES = ("sequential", "concurrent", "merged")
+
 @dataclass
 class AICallContext:
     """Context for AI calls during cognitive processing."""
@@ -46,13 +58,18 @@ class AICallResult:
 class CognitiveFunctionAICallManager:
     """Manages AI calls during cognitive function processing."""
     
-    def __init__(self, openai_client=None):
+    def __init__(self, openai_client=None, batch_mode: str = "merged", max_concurrency: int = 4):
         self.openai_client = openai_client
         self.ai_call_templates = self._load_ai_call_templates()
-        self.response_cache = {}
+        self.response_cache = TTLCache(RESPONSE_CACHE_TTL, max_entries=RESPONSE_CACHE_SIZE)
         self.call_history = []
         self.logger = logging.getLogger(__name__)
         
+        # Batched execution of the calls one event needs
+        self.batch_mode = batch_mode
+        self.max_concurrency = max_concurrency
+        self.event_timings = deque(maxlen=200)  # (mode, calls, wall seconds)
+        
         # Personality-driven thresholds for AI calls
         self.ai_call_thresholds = {
             "extroversion": 0.3,  # Low social energy triggers AI call
@@ -212,13 +229,10 @@ Response format: JSON with "decision_assessment", "commitment_readiness", "struc
             if trait_level < threshold:
                 return False
             
-            # Check cache for similar contexts
+            # Check cache for similar contexts (entries expire after 5 minutes)
             cache_key = self._generate_cache_key(cognitive_function, context)
             if cache_key in self.response_cache:
-                cached_result = self.response_cache[cache_key]
-                # Check if cache is still valid (within 5 minutes)
-                if (datetime.now() - cached_result.timestamp).total_seconds() < 300:
-                    return False
+                return False
             
             # Additional context-specific checks
             if cognitive_function == "intuition" and "?" in context.message:
@@ -253,18 +267,9 @@ Response format: JSON with "decision_assessment", "commitment_readiness", "struc
         try:
             # Check cache first
             cache_key = self._generate_cache_key(cognitive_function, context)
-            if cache_key in self.response_cache:
-                cached_result = self.response_cache[cache_key]
-                if (datetime.now() - cached_result.timestamp).total_seconds() < 300:
-                    self.logger.info(f"Cache hit for {cognitive_function} AI call")
-                    return AICallResult(
-                        cognitive_function=cognitive_function,
-                        response=cached_result.response,
-                        confidence_score=cached_result.confidence_score,
-                        processing_time=time.time() - start_time,
-                        cache_hit=True,
-                        timestamp=datetime.now()
-                    )
+            cached_result = self._cached_result(cognitive_function, cache_key, start_time)
+            if cached_result:
+                return cached_result
             
             # Generate prompt from template
             prompt = self._generate_prompt(cognitive_function, context, personality_traits)
@@ -286,14 +291,10 @@ Response format: JSON with "decision_assessment", "commitment_readiness", "struc
                 timestamp=datetime.now()
             )
             
-            # Cache result
-            self.response_cache[cache_key] = result
+            # Cache result (the cache bounds its own size)
+            self.response_cache.set(cache_key, result)
             self.call_history.append(result)
             
-            # Limit cache size
-            if len(self.response_cache) > 1000:
-                self._cleanup_cache()
-            
             self.logger.info(f"AI call completed for {cognitive_function} in {result.processing_time:.2f}s")
             return result
             
@@ -308,6 +309,149 @@ Response format: JSON with "decision_assessment", "commitment_readiness", "struc
                 timestamp=datetime.now()
             )
     
+    def _cached_result(self, cognitive_function: str, cache_key: str, start_time: float) -> Optional[AICallResult]:
+        """Fresh AICallResult for a cached response, or None."""
+        cached_result = self.response_cache.get(cache_key)
+        if cached_result is None:
+            return None
+        self.logger.info(f"Cache hit for {cognitive_function} AI call")
+        return AICallResult(
+            cognitive_function=cognitive_function,
+            response=cached_result.response,
+            confidence_score=cached_result.confidence_score,
+            processing_time=time.time() - start_time,
+            cache_hit=True,
+            timestamp=datetime.now()
+        )
+    
+    async def make_ai_calls(self, cognitive_functions: List[str], context: AICallContext,
+                            personality_traits: Dict[str, Any], mode: Optional[str] = None) -> Dict[str, AICallResult]:
+        """
+        Execute the AI calls one event needs as a batch.
+        
+        Args:
+            cognitive_functions: Functions that need a call (see should_make_ai_call)
+            context: Shared call context for the event
+            personality_traits: Personality traits for prompt generation
+            mode: "merged" (one multi-part prompt), "concurrent" (asyncio.gather,
+                at most max_concurrency in flight) or "sequential"; batch_mode if None
+            
+        Returns:
+            Dict mapping cognitive function to its AICallResult
+        """
+        mode = mode or self.batch_mode
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Unknown AI batch mode '{mode}' (expected one of {BATCH_MODES})")
+        start_time = time.time()
+        
+        results: Dict[str, AICallResult] = {}
+        pending = []
+        for cognitive_function in dict.fromkeys(cognitive_functions):
+            cache_key = self._generate_cache_key(cognitive_function, context)
+            cached_result = self._cached_result(cognitive_function, cache_key, start_time)
+            if cached_result:
+                results[cognitive_function] = cached_result
+            else:
+                pending.append(cognitive_function)
+        
+        if pending:
+            if mode == "merged" and len(pending) > 1:
+                results.update(await self._make_merged_call(pending, context, personality_traits))
+            elif mode == "concurrent":
+                semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+                
+                async def limited_call(cognitive_function: str) -> AICallResult:
+                    async with semaphore:
+                        return await self.make_ai_call(cognitive_function, context, personality_traits)
+                
+                for result in await asyncio.gather(*(limited_call(f) for f in pending)):
+                    results[result.cognitive_function] = result
+            else:
+                for cognitive_function in pending:
+                    results[cognitive_function] = await self.make_ai_call(cognitive_function, context, personality_traits)
+        
+        wall_time = time.time() - start_time
+        self.event_timings.append((mode, len(pending), wall_time))
+        self.logger.info(f"AI calls for {len(pending)} functions ({mode}) completed in {wall_time:.2f}s")
+        return {f: results[f] for f in dict.fromkeys(cognitive_functions)}
+    
+    async def _make_merged_call(self, cognitive_functions: List[str], context: AICallContext,
+                                personality_traits: Dict[str, Any]) -> Dict[str, AICallResult]:
+        """Answer several cognitive functions with one structured multi-part prompt."""
+        start_time = time.time()
+        try:
+            if self.openai_client:
+                prompt = self._generate_merged_prompt(cognitive_functions, context, personality_traits)
+                response = await self._call_openai(prompt)
+                parts = {f: self._split_merged_response(response, f) for f in cognitive_functions}
+            else:
+                # Fallback to mock responses for testing
+                parts = {f: self._generate_mock_response(f, context) for f in cognitive_functions}
+        except Exception as e:
+            self.logger.error(f"Error making merged AI call for {cognitive_functions}: {e}")
+            parts = {f: {"error": str(e)} for f in cognitive_functions}
+        
+        processing_time = time.time() - start_time
+        results = {}
+        for cognitive_function, response in parts.items():
+            result = AICallResult(
+                cognitive_function=cognitive_function,
+                response=response,
+                confidence_score=self._calculate_confidence(response),
+                processing_time=processing_time,
+                cache_hit=False,
+                timestamp=datetime.now()
+            )
+            if "error" not in response:
+                self.response_cache.set(self._generate_cache_key(cognitive_function, context), result)
+            self.call_history.append(result)
+            results[cognitive_function] = result
+        self.logger.info(f"Merged AI call for {len(cognitive_functions)} functions completed in {processing_time:.2f}s")
+        return results
+    
+    def _generate_merged_prompt(self, cognitive_functions: List[str], context: AICallContext,
+                                personality_traits: Dict[str, Any]) -> str:
+        """Combine the per-function templates into one multi-part prompt."""
+        sections = [
+            f"### {cognitive_function}\n{self._generate_prompt(cognitive_function, context, personality_traits).strip()}"
+            for cognitive_function in cognitive_functions
+        ]
+        return (
+            "Analyze the message below from several cognitive perspectives. Answer every section.\n"
+            f"Response format: one JSON object with the keys {json.dumps(cognitive_functions)}; "
+            "each value is the JSON object that section asks for.\n\n" + "\n\n".join(sections)
+        )
+    
+    @staticmethod
+    def _split_merged_response(response: Dict[str, Any], cognitive_function: str) -> Dict[str, Any]:
+        """Extract one function's part of a merged response (the whole response if it isn't keyed)."""
+        part = response.get(cognitive_function) if isinstance(response, dict) else None
+        return part if isinstance(part, dict) else response
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-event AI wall time by batch mode, and cache statistics.
+        
+        "sequential" is the one-call-at-a-time baseline the batched modes compare against.
+        """
+        by_mode = {}
+        for mode, calls, wall_time in self.event_timings:
+            mode_stats = by_mode.setdefault(mode, {"events": 0, "calls": 0, "wall_time": 0.0})
+            mode_stats["events"] += 1
+            mode_stats["calls"] += calls
+            mode_stats["wall_time"] += wall_time
+        return {
+            "events": {
+                mode: {
+                    "events": totals["events"],
+                    "avg_calls": totals["calls"] / totals["events"],
+                    "avg_wall_ms": 1000.0 * totals["wall_time"] / totals["events"]
+                }
+                for mode, totals in by_mode.items()
+            },
+            "cache": self.response_cache.get_stats()
+        }
+    
     def _generate_prompt(self, cognitive_function: str, context: AICallContext, personality_traits: Dict[str, Any]) -> str:
         """Generate prompt from template for cognitive function."""
         try:
@@ -441,18 +585,8 @@ Response format: JSON with "decision_assessment", "commitment_readiness", "struc
     def _cleanup_cache(self):
         """Clean up old cache entries."""
         try:
-            # Remove entries older than 10 minutes
-            current_time = datetime.now()
-            keys_to_remove = []
-            
-            for key, result in self.response_cache.items():
-                if (current_time - result.timestamp).total_seconds() > 600:
-                    keys_to_remove.append(key)
-            
-            for key in keys_to_remove:
-                del self.response_cache[key]
-            
-            self.logger.info(f"Cleaned up {len(keys_to_remove)} cache entries")
+            removed = self.response_cache.expire()
+            self.logger.info(f"Cleaned up {removed} cache entries")
             
         except Exception as e:
             self.logger.error(f"Error cleaning up cache: {e}")
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Concept Fuzzy Index
+===================
+
+Shared in-memory fuzzy lookup over CARL's concept and thing files.
+
+Vision concept matching and memory retrieval used to open and parse every
+file in ``concepts/`` and ``things/`` and run ``difflib.SequenceMatcher``
+against each of them for every detected object or query. The index keeps:
+
+- the parsed JSON of each file, keyed by path and reloaded only when the
+  file's mtime or size changes (deleted files are dropped),
+- the searchable terms of each file (word/name, keywords, related concepts,
+  semantic relationships, ...), with the field they came from,
+- character-trigram postings over those terms, so a query only has to be
+  compared with terms that share trigrams with it,
+- synonym expansion from a ``synonym_mappings`` dict (base word -> synonyms).
+
+Callers get a short candidate list (``candidate_documents``) to run their own
+scoring on, or ranked top-k matches (``search``). Text-only directories (the
+episodic memories) are cached parsed, with their lowercased text, for
+substring scans without disk I/O; only the ``max_text_documents`` most recent
+memories of each (by their ``timestamp`` field) are kept.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from difflib import SequenceMatcher
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Field weights used to rank search results
+FIELD_WEIGHTS = {
+    'word': 1.0,
+    'name': 1.0,
+    'filename': 0.9,
+    'keywords': 1.0,
+    'aliases': 0.9,
+    'related_concepts': 0.7,
+    'semantic_relationships': 0.5,
+    'learning_integration': 0.4,
+    'color': 0.3,
+    'shape': 0.3
+}
+
+# JSON list fields whose string items are indexed as terms
+LIST_FIELDS = ('keywords', 'aliases', 'related_concepts', 'semantic_relationships')
+
+# JSON string fields indexed as terms
+STRING_FIELDS = ('word', 'name', 'color', 'shape')
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a lowercased, space-padded string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def iter_strings(value: Any) -> Iterator[str]:
+    """Yield the string leaves of a JSON value."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from iter_strings(item)
+
+
+@dataclass
+class IndexedDocument:
+    """One cached JSON file."""
+    path: str
+    directory: str
+    filename: str
+    data: Dict[str, Any]
+    signature: Tuple[int, int]
+    terms: Dict[str, str] = field(default_factory=dict)  # term -> best field
+    text: str = ""
+
+    @property
+    def name(self) -> str:
+        return os.path.splitext(self.filename)[0]
+
+
+class ConceptFuzzyIndex:
+    """
+    Trigram index over concept/thing terms with incremental reloads.
+    """
+
+    def __init__(self, root: Optional[str] = None,
+                 directories: Optional[Dict[str, str]] = None,
+                 text_directories: Optional[Dict[str, str]] = None,
+                 synonym_mappings: Optional[Dict[str, List[str]]] = None,
+                 refresh_interval: float = 2.0, max_candidates: Optional[int] = None,
+                 max_text_documents: int = 2000):
+        """
+        Initialize the index.
+
+        Args:
+            root: Base directory for relative paths (working directory if None)
+            directories: Name -> directory of term-indexed JSON files
+            text_directories: Name -> directory of JSON files cached for text scans
+            synonym_mappings: Base word -> list of synonyms
+            refresh_interval: Minimum seconds between directory rescans
+            max_candidates: Compare only this many terms per query, those sharing the
+                most trigrams with it (all sharing terms if None); a limit can drop
+                documents that the caller's scoring would have matched
+            max_text_documents: Most recent memories cached per text directory
+        """
+        directories = directories if directories is not None else {'concepts': 'concepts', 'things': 'things'}
+        text_directories = (text_directories if text_directories is not None
+                            else {'episodic': os.path.join('memories', 'episodic')})
+        resolve = (lambda path: os.path.join(root, path)) if root else (lambda path: path)
+        self.directories = {name: resolve(path) for name, path in directories.items()}
+        self.text_directories = {name: resolve(path) for name, path in text_directories.items()}
+        self.refresh_interval = refresh_interval
+        self.max_candidates = max_candidates
+        self.max_text_documents = max_text_documents
+        self.logger = logging.getLogger(__name__)
+
+        self._synonyms: Dict[str, Set[str]] = {}
+        self._documents: Dict[str, IndexedDocument] = {}
+        self._by_directory: Dict[str, Dict[str, IndexedDocument]] = {
+            name: {} for name in list(self.directories) + list(self.text_directories)
+        }
+        # Text directory -> file -> (signature, memory time), so capping needs no reparse
+        self._text_times: Dict[str, Dict[str, Tuple[Tuple[int, int], float]]] = {}
+        self._term_documents: Dict[str, Set[str]] = {}
+        self._trigram_terms: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+        self._last_refresh = 0.0
+
+        # Statistics
+        self.documents_loaded = 0
+        self.load_errors = 0
+        self.queries = 0
+        self.terms_compared = 0
+
+        if synonym_mappings:
+            self.add_synonyms(synonym_mappings)
+
+    # ------------------------------------------------------------------
+    # Synonyms
+    # ------------------------------------------------------------------
+
+    def add_synonyms(self, synonym_mappings: Dict[str, List[str]]):
+        """Merge base word -> synonyms mappings (expansion works in both directions)."""
+        with self._lock:
+            for base_word, synonyms in synonym_mappings.items():
+                base = base_word.lower()
+                for synonym in synonyms:
+                    synonym = synonym.lower()
+                    self._synonyms.setdefault(base, set()).add(synonym)
+                    self._synonyms.setdefault(synonym, set()).add(base)
+
+    def expand(self, query: str) -> List[str]:
+        """The query followed by its synonyms."""
+        query = query.lower().strip()
+        return [query] + sorted(self._synonyms.get(query, set()) - {query})
+
+    def directory_path(self, name: str) -> Optional[str]:
+        """Resolved path of an indexed or text directory (None if unknown)."""
+        return self.directories.get(name) or self.text_directories.get(name)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Reload files that were added, changed or removed since the last scan.
+
+        Args:
+            force: Rescan even if the refresh interval hasn't passed
+
+        Returns:
+            Number of documents added, reloaded or dropped
+        """
+        now = time.monotonic()
+        if not force and self._last_refresh and now - self._last_refresh < self.refresh_interval:
+            return 0
+        with self._lock:
+            self._last_refresh = now
+            changed = 0
+            for name, directory in self.directories.items():
+                changed += self._sync_directory(name, directory, indexed=True)
+            for name, directory in self.text_directories.items():
+                changed += self._sync_directory(name, directory, indexed=False)
+            return changed
+
+    def _sync_directory(self, name: str, directory: str, indexed: bool) -> int:
+        cached = self._by_directory[name]
+        seen = set()
+        changed = 0
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            entries = []
+
+        stats = []
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                stats.append((entry, entry.stat()))
+            except OSError:
+                continue
+        if not indexed:
+            stats = self._most_recent_memories(name, stats)
+
+        for entry, stat in stats:
+            seen.add(entry.path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            document = cached.get(entry.path)
+            if document is not None and document.signature == signature:
+                continue
+            if document is not None:
+                self._remove(document)
+            if self._load(name, entry.path, entry.name, signature, indexed):
+                changed += 1
+
+        for path in [path for path in cached if path not in seen]:
+            self._remove(cached[path])
+            changed += 1
+        return changed
+
+    @staticmethod
+    def _memory_time(data: Any, stat: os.stat_result) -> float:
+        """When a memory happened: its timestamp field, else the file's mtime."""
+        timestamp = data.get('timestamp') if isinstance(data, dict) else None
+        if isinstance(timestamp, str):
+            try:
+                return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+            except ValueError:
+                pass
+        return stat.st_mtime
+
+    def _most_recent_memories(self, name: str, stats: List) -> List:
+        """
+        Keep the max_text_documents most recent memories of a text directory.
+
+        Memory times are remembered by file signature, so each file is parsed
+        once per change to find out how old it is.
+        """
+        times = self._text_times.setdefault(name, {})
+        if len(stats) <= self.max_text_documents:
+            times.clear()
+            return stats
+
+        cached = self._by_directory[name]
+        live = {entry.path for entry, _ in stats}
+        for path in [path for path in times if path not in live]:
+            del times[path]
+
+        timed = []
+        for entry, stat in stats:
+            signature = (stat.st_mtime_ns, stat.st_size)
+            known = times.get(entry.path)
+            if known is None or known[0] != signature:
+                document = cached.get(entry.path)
+                if document is not None and document.signature == signature:
+                    data = document.data
+                else:
+                    data = self._read_json(entry.path)
+                known = times[entry.path] = (signature, self._memory_time(data, stat))
+            timed.append((known[1], entry, stat))
+        timed.sort(key=lambda item: item[0], reverse=True)
+        return [(entry, stat) for _, entry, stat in timed[:self.max_text_documents]]
+
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def _load(self, name: str, path: str, filename: str, signature: Tuple[int, int], indexed: bool) -> bool:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.load_errors += 1
+            self.logger.debug(f"Skipping unreadable JSON file {path}: {e}")
+            return False
+        if not isinstance(data, dict):
+            return False
+
+        document = IndexedDocument(path=path, directory=name, filename=filename, data=data, signature=signature)
+        if indexed:
+            document.terms = self._extract_terms(document)
+            for term in document.terms:
+                documents = self._term_documents.get(term)
+                if documents is None:
+                    documents = self._term_documents[term] = set()
+                    for gram in trigrams(term):
+                        self._trigram_terms.setdefault(gram, set()).add(term)
+                documents.add(path)
+        else:
+            document.text = str(data).lower()
+
+        self._documents[path] = document
+        self._by_directory[name][path] = document
+        self.documents_loaded += 1
+        return True
+
+    def _remove(self, document: IndexedDocument):
+        self._documents.pop(document.path, None)
+        self._by_directory[document.directory].pop(document.path, None)
+        for term in document.terms:
+            documents = self._term_documents.get(term)
+            if documents is None:
+                continue
+            documents.discard(document.path)
+            if not documents:
+                del self._term_documents[term]
+                for gram in trigrams(term):
+                    terms = self._trigram_terms.get(gram)
+                    if terms is not None:
+                        terms.discard(term)
+                        if not terms:
+                            del self._trigram_terms[gram]
+
+    @staticmethod
+    def _extract_terms(document: IndexedDocument) -> Dict[str, str]:
+        """Searchable terms of a document, each with its highest-weighted field."""
+        terms: Dict[str, str] = {}
+
+        def add(value: Any, field_name: str):
+            if not isinstance(value, str):
+                return
+            term = value.lower().strip()
+            if not term:
+                return
+            current = terms.get(term)
+            if current is None or FIELD_WEIGHTS[field_name] > FIELD_WEIGHTS[current]:
+                terms[term] = field_name
+
+        data = document.data
+        for field_name in STRING_FIELDS:
+            add(data.get(field_name), field_name)
+        for field_name in LIST_FIELDS:
+            values = data.get(field_name)
+            if isinstance(values, list):
+                for value in values:
+                    add(value, field_name)
+        for value in iter_strings(data.get('Learning_Integration')):
+            # Only short phrases are useful as lookup terms
+            if len(value) <= 40:
+                add(value, 'learning_integration')
+        stem = document.name.replace('_self_learned', '')
+        add(stem, 'filename')
+        add(stem.replace('_', ' '), 'filename')
+        return terms
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def documents(self, directory: str) -> List[IndexedDocument]:
+        """All cached documents of a directory (refreshing if due)."""
+        self.refresh()
+        with self._lock:
+            return list(self._by_directory.get(directory, {}).values())
+
+    def get_document(self, path: str) -> Optional[IndexedDocument]:
+        """Cached document for a path."""
+        self.refresh()
+        return self._documents.get(path)
+
+    def _candidate_terms(self, query: str) -> List[str]:
+        """Terms sharing trigrams with the query, most overlapping first."""
+        query_grams = trigrams(query)
+        overlap: Dict[str, int] = {}
+        for gram in query_grams:
+            for term in self._trigram_terms.get(gram, ()):
+                overlap[term] = overlap.get(term, 0) + 1
+        if self.max_candidates is not None and len(overlap) > self.max_candidates:
+            # Dice coefficient over trigram sets, computed from the overlap counts
+            size = len(query_grams)
+            ranked = sorted(overlap, key=lambda term: overlap[term] / (size + len(term) + 1), reverse=True)
+            return ranked[:self.max_candidates]
+        return list(overlap)
+
+    def similar_terms(self, query: str, min_similarity: float = 0.5) -> List[Tuple[str, float]]:
+        """
+        Indexed terms similar to a query (synonyms included).
+
+        Args:
+            query: Text to look up
+            min_similarity: SequenceMatcher ratio a term must reach
+
+        Returns:
+            (term, similarity) pairs, best first; synonym hits score as the synonym matched
+        """
+        self.refresh()
+        self.queries += 1
+        best: Dict[str, float] = {}
+        with self._lock:
+            for expanded in self.expand(query):
+                for term in self._candidate_terms(expanded):
+                    self.terms_compared += 1
+                    similarity = 1.0 if term == expanded else SequenceMatcher(None, expanded, term).ratio()
+                    if similarity >= min_similarity and similarity > best.get(term, 0.0):
+                        best[term] = similarity
+        return sorted(best.items(), key=lambda item: item[1], reverse=True)
+
+    def candidate_documents(self, queries: Iterable[str], directory: Optional[str] = None) -> List[IndexedDocument]:
+        """
+        Documents with at least one term sharing trigrams with a query or its synonyms.
+
+        This is the pre-filter for callers that keep their own scoring: any
+        term a caller would score as similar shares trigrams with the query
+        (unless the index was built with a max_candidates limit).
+
+        Args:
+            queries: Query strings (object name, color, ...)
+            directory: Restrict to one indexed directory
+
+        Returns:
+            Candidate documents
+        """
+        self.refresh()
+        self.queries += 1
+        paths: Set[str] = set()
+        with self._lock:
+            for query in queries:
+                if not query:
+                    continue
+                for expanded in self.expand(query):
+                    for term in self._candidate_terms(expanded):
+                        paths.update(self._term_documents.get(term, ()))
+            candidates = [self._documents[path] for path in paths if path in self._documents]
+        if directory is not None:
+            candidates = [document for document in candidates if document.directory == directory]
+        return candidates
+
+    def search(self, query: str, top_k: int = 5, directory: Optional[str] = None,
+               min_similarity: float = 0.5) -> List[Tuple[IndexedDocument, float, str]]:
+        """
+        Rank documents by their best weighted term similarity to a query.
+
+        Args:
+            query: Text to look up
+            top_k: Maximum number of results
+            directory: Restrict to one indexed directory
+            min_similarity: SequenceMatcher ratio a term must reach
+
+        Returns:
+            (document, score, matched term) tuples, best first
+        """
+        best: Dict[str, Tuple[float, str]] = {}
+        for term, similarity in self.similar_terms(query, min_similarity):
+            for path in self._term_documents.get(term, ()):
+                document = self._documents.get(path)
+                if document is None or (directory is not None and document.directory != directory):
+                    continue
+                score = similarity * FIELD_WEIGHTS[document.terms.get(term, 'related_concepts')]
+                if score > best.get(path, (0.0, ''))[0]:
+                    best[path] = (score, term)
+        ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:top_k]
+        return [(self._documents[path], score, term) for path, (score, term) in ranked]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            'documents': {name: len(documents) for name, documents in self._by_directory.items()},
+            'terms': len(self._term_documents),
+            'trigrams': len(self._trigram_terms),
+            'synonyms': len(self._synonyms),
+            'documents_loaded': self.documents_loaded,
+            'load_errors': self.load_errors,
+            'queries': self.queries,
+            'avg_terms_compared': self.terms_compared / self.queries if self.queries else 0.0
+        }
+
+
+def get_concept_index() -> ConceptFuzzyIndex:
+    """The concept index of the current runtime context."""
+    from runtime_context import get_current_context
+    return get_current_context().concept_index
+
+
+if __name__ == "__main__":
+    # python concept_fuzzy_index.py <query> [<query> ...]
+    import sys
+    index = ConceptFuzzyIndex()
+    started = time.perf_counter()
+    index.refresh(force=True)
+    print(f"Indexed {index.get_stats()['documents']} in {1000 * (time.perf_counter() - started):.1f} ms")
+    for query in sys.argv[1:]:
+        started = time.perf_counter()
+        results = index.search(query)
+        elapsed = 1000 * (time.perf_counter() - started)
+        print(f"{query!r} ({elapsed:.3f} ms):")
+        for document, score, term in results:
+            print(f"  {score:.2f}  {document.directory}/{document.filename}  via '{term}'")
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Consciousness Evidence Index
+============================
+
+Persistent, incremental index of consciousness evidence for
+EnhancedConsciousnessEvaluation.
+
+Memory files are categorized once and remembered by path + mtime + size, so a
+later evaluation only parses files that are new or have changed. Log files are
+tracked by byte offset, so only lines appended since the last evaluation are
+scanned; only the most recent evidence lines of each log are kept, with
+per-bucket totals for the rest, so the index does not grow with log history. Categorization of both memory files and log lines is done with a
+single Aho-Corasick pass per text instead of repeated substring checks, and
+large cold runs are spread over a process pool.
+"""
+
+import os
+import re
+import json
+import glob
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from multi_pattern_matcher import MultiPatternMatcher
+from runtime_context import get_current_context
+
+# Evidence buckets produced by EnhancedConsciousnessEvaluation._gather_comprehensive_evidence
+EVIDENCE_BUCKETS = [
+    'self_recognition_events',
+    'memory_events',
+    'vision_events',
+    'concept_events',
+    'social_interactions',
+    'learning_events',
+    'emotional_events',
+    'purpose_driven_events',
+    'game_reasoning_events'
+]
+
+# Content cues checked (case-sensitive) against str(data) of a memory file
+_CONTENT_BUCKET_CUES = {
+    'self_recognition_events': ['self_recognition'],
+    'vision_events': ['vision'],
+    'concept_events': ['concept'],
+    'social_interactions': ['WHO'],
+    'learning_events': ['learning', 'skill'],
+    'emotional_events': ['emotion', 'neucogar'],
+    'purpose_driven_events': ['purpose', 'goal'],
+    'game_reasoning_events': ['tic_tac_toe', 'move', 'earthly', 'earthly_game', 'game_engine',
+                              'probe', 'task', 'homeostatic']
+}
+
+# Path cues checked against the lowercased file path of a memory file
+_PATH_BUCKET_CUES = {
+    'self_recognition_events': 'self_recognition',
+    'vision_events': 'vision',
+    'concept_events': 'concept',
+    'social_interactions': 'people',
+    'game_reasoning_events': 'game'
+}
+
+# Category indicators from EnhancedConsciousnessEvaluation.evidence_categories,
+# matched against the lowercased content of a memory file
+CATEGORY_INDICATORS = [
+    'self_recognition_event', 'mirror_recognition', 'self_awareness',
+    'memory_formation', 'memory_recall', 'ltm_worthy', 'episodic_memory',
+    'goal_achievement', 'purpose_driven', 'intentional_action',
+    'emotional_response', 'neucogar_emotional_state', 'emotional_trigger',
+    'social_interaction', 'who_assignment', 'relationship_awareness',
+    'learning', 'adaptation', 'skill_development', 'concept_formation',
+    'game_event', 'tic_tac_toe_move', 'strategic_reasoning', 'logic_system_request'
+]
+
+# A log line is evidence if it contains any of these (lowercased) cues
+_LOG_TRIGGER_CUES = [
+    'self-recognition', 'self_recognition', 'mirror',
+    'consciousness', 'awareness', 'purpose',
+    'memory', 'recall', 'learning', 'game_event',
+    'tic_tac_toe', 'strategic_reasoning', 'game request detected',
+    'carl made move', 'started tic_tac_toe', 'purpose-driven behavior',
+    'pdb counter updated', 'pdb event logged', 'human made move',
+    'game response', '🎮', '🎯'
+]
+
+_LOG_GAME_CUES = [
+    '🎮', 'game request detected', 'carl made move', 'started tic_tac_toe',
+    'human made move', 'game response', 'earthly', 'earthly game',
+    'game engine', 'probe', 'task', 'homeostatic'
+]
+
+_LOG_PDB_CUES = ['pdb counter updated', 'pdb event logged']
+
+_LOG_TIMESTAMP_PATTERNS = [
+    re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'),
+    re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3})'),
+    re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})')
+]
+
+_CONTENT_MATCHER = MultiPatternMatcher(
+    cue for cues in _CONTENT_BUCKET_CUES.values() for cue in cues
+)
+_INDICATOR_MATCHER = MultiPatternMatcher(CATEGORY_INDICATORS)
+_LOG_MATCHER = MultiPatternMatcher(
+    _LOG_TRIGGER_CUES + _LOG_GAME_CUES + ['self', 'recognition', 'emotion']
+)
+_LOG_TRIGGER_SET = frozenset(_LOG_TRIGGER_CUES)
+
+
+def categorize_memory_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse one memory file and work out which evidence buckets it belongs to.
+
+    Kept at module level so it can be shipped to a process pool.
+
+    Args:
+        file_path: Path of the JSON memory file
+
+    Returns:
+        Index entry for the file, or None if the file could not be read
+    """
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return None
+
+    text = str(data)
+    content_hits = _CONTENT_MATCHER.find_all(text)
+    path_lower = file_path.lower()
+
+    buckets = []
+    for bucket in EVIDENCE_BUCKETS:
+        path_cue = _PATH_BUCKET_CUES.get(bucket)
+        if path_cue and path_cue in path_lower:
+            buckets.append(bucket)
+        elif any(cue in content_hits for cue in _CONTENT_BUCKET_CUES.get(bucket, ())):
+            buckets.append(bucket)
+
+    # PDB event files are counted as purpose-driven a second time, matching the original scan
+    if 'pdb_event' in path_lower or (isinstance(data, dict) and data.get('type') == 'purpose_driven_behavior'):
+        buckets.append('purpose_driven_events')
+
+    # Every readable memory file is a general memory event
+    if 'memory_events' not in buckets:
+        buckets.append('memory_events')
+
+    timestamp = data.get('timestamp', '') if isinstance(data, dict) else ''
+    return {
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'timestamp': timestamp,
+        'buckets': buckets,
+        'matched_indicators': sorted(_INDICATOR_MATCHER.find_all(text.lower()))
+    }
+
+
+def categorize_log_line(line: str) -> Optional[str]:
+    """
+    Decide which evidence bucket a log line belongs to.
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        Bucket name, '' if the line is evidence but uncategorized, or None if
+        the line is not evidence at all
+    """
+    hits = _LOG_MATCHER.find_all(line.lower())
+    if not hits or not (hits & _LOG_TRIGGER_SET):
+        return None
+
+    if 'self' in hits and 'recognition' in hits:
+        return 'self_recognition_events'
+    if 'memory' in hits:
+        return 'memory_events'
+    if 'emotion' in hits:
+        return 'emotional_events'
+    if any(cue in hits for cue in _LOG_GAME_CUES):
+        return 'game_reasoning_events'
+    if ('🎯' in hits and 'purpose-driven behavior' in hits) or any(cue in hits for cue in _LOG_PDB_CUES):
+        return 'purpose_driven_events'
+    return ''
+
+
+def extract_log_timestamp(line: str) -> str:
+    """Return the first timestamp found in a log line, or '' if there is none."""
+    for pattern in _LOG_TIMESTAMP_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            return match.group(1)
+    return ''
+
+
+class ConsciousnessEvidenceIndex:
+    """
+    Persistent evidence index keyed by file path + mtime and log byte offset.
+    """
+
+    INDEX_VERSION = 2
+    INDEX_FILENAME = "consciousness_evidence_index.json"
+
+    def __init__(self, index_path: Optional[str] = None, parallel_threshold: int = 64,
+                 max_workers: Optional[int] = None, max_log_entries: int = 1000):
+        """
+        Initialize the evidence index.
+
+        Args:
+            index_path: Where the index is persisted between evaluations
+                (defaults to a file in the current runtime context's data root)
+            parallel_threshold: Minimum number of stale files before a process pool is used
+            max_workers: Process pool size (defaults to the executor's choice)
+            max_log_entries: Most recent evidence lines kept per log file
+        """
+        self.index_path = index_path or get_current_context().path(self.INDEX_FILENAME)
+        self.max_log_entries = max_log_entries
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.logs: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+        # Statistics for the last refresh
+        self.last_stats = {'files_seen': 0, 'files_reindexed': 0, 'log_bytes_scanned': 0}
+
+    def _load(self):
+        """Load the persisted index, discarding it if the format changed."""
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('version') != self.INDEX_VERSION:
+                self.logger.info("Evidence index format changed, rebuilding")
+                return
+            self.files = stored.get('files', {})
+            self.logs = stored.get('logs', {})
+        except Exception as e:
+            self.logger.warning(f"Could not load evidence index {self.index_path}: {e}")
+            self.files = {}
+            self.logs = {}
+
+    def save(self):
+        """Persist the index if anything changed since the last save."""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.index_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.index_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.INDEX_VERSION, 'files': self.files, 'logs': self.logs},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+            self._dirty = False
+        except Exception as e:
+            self.logger.warning(f"Could not save evidence index {self.index_path}: {e}")
+
+    def _is_stale(self, file_path: str) -> bool:
+        """Check whether a file needs to be (re)categorized."""
+        entry = self.files.get(file_path)
+        if entry is None:
+            return True
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return True
+        return stat.st_mtime != entry['mtime'] or stat.st_size != entry['size']
+
+    def _reindex(self, file_paths: List[str]):
+        """Categorize stale files, using a process pool for large batches."""
+        results: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        if len(file_paths) >= self.parallel_threshold:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    chunksize = max(1, len(file_paths) // 64)
+                    results = list(zip(file_paths,
+                                       executor.map(categorize_memory_file, file_paths, chunksize=chunksize)))
+            except Exception as e:
+                self.logger.warning(f"Parallel evidence indexing failed, falling back to serial: {e}")
+                results = []
+        if not results:
+            results = [(path, categorize_memory_file(path)) for path in file_paths]
+
+        for file_path, entry in results:
+            if entry is None:
+                self.logger.warning(f"Error reading file {file_path}")
+                self.files.pop(file_path, None)
+            else:
+                self.files[file_path] = entry
+            self._dirty = True
+
+    def refresh_memory_files(self, patterns: Dict[str, str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Bring the index up to date with the memory files matching the patterns.
+
+        Args:
+            patterns: Category -> glob pattern, as in EnhancedConsciousnessEvaluation.memory_patterns
+
+        Returns:
+            (file_path, entry) for every matched file in glob order; a file that
+            matches several patterns appears once per pattern
+        """
+        self.last_stats = {'files_seen': 0, 'files_reindexed': 0, 'log_bytes_scanned': 0}
+        matched: List[str] = []
+        for pattern in patterns.values():
+            matched.extend(glob.glob(pattern))
+
+        unique_paths = list(dict.fromkeys(matched))
+        stale = [path for path in unique_paths if self._is_stale(path)]
+        if stale:
+            self._reindex(stale)
+
+        # Forget files that no longer exist
+        live = set(unique_paths)
+        for file_path in [path for path in self.files if path not in live]:
+            del self.files[file_path]
+            self._dirty = True
+
+        self.last_stats['files_seen'] = len(unique_paths)
+        self.last_stats['files_reindexed'] = len(stale)
+        return [(path, self.files[path]) for path in matched if path in self.files]
+
+    def refresh_log(self, log_file: str) -> List[Dict[str, Any]]:
+        """
+        Scan only the bytes appended to a log file since the last refresh.
+
+        Args:
+            log_file: Path of the log file
+
+        Returns:
+            The most recent indexed evidence entries for the log (old and new),
+            at most max_log_entries of them
+        """
+        state = self.logs.get(log_file)
+        if not os.path.exists(log_file):
+            if state is not None:
+                del self.logs[log_file]
+                self._dirty = True
+            return []
+
+        size = os.path.getsize(log_file)
+        if state is None or size < state['offset']:
+            # New or truncated/rotated log: start again from the beginning
+            state = {'offset': 0, 'line_count': 0, 'entries': [], 'bucket_counts': {}}
+            self.logs[log_file] = state
+            self._dirty = True
+
+        if size == state['offset']:
+            return state['entries']
+
+        with open(log_file, 'rb') as f:
+            f.seek(state['offset'])
+            chunk = f.read(size - state['offset'])
+
+        # Only consume complete lines; a partial trailing line is picked up next time
+        end = chunk.rfind(b'\n')
+        if end < 0:
+            return state['entries']
+        chunk = chunk[:end + 1]
+
+        line_number = state['line_count']
+        for raw_line in chunk.split(b'\n')[:-1]:
+            line_number += 1
+            line = raw_line.decode('utf-8', errors='replace')
+            bucket = categorize_log_line(line)
+            if bucket is None:
+                continue
+            state['bucket_counts'][bucket] = state['bucket_counts'].get(bucket, 0) + 1
+            state['entries'].append({
+                'line_number': line_number,
+                'timestamp': extract_log_timestamp(line),
+                'content': line.strip(),
+                'bucket': bucket
+            })
+        if len(state['entries']) > self.max_log_entries:
+            del state['entries'][:-self.max_log_entries]
+
+        state['offset'] += len(chunk)
+        state['line_count'] = line_number
+        self.last_stats['log_bytes_scanned'] += len(chunk)
+        self._dirty = True
+        return state['entries']
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            'indexed_files': len(self.files),
+            'indexed_logs': len(self.logs),
+            'log_entries': sum(len(state['entries']) for state in self.logs.values()),
+            'log_evidence_lines': sum(sum(state['bucket_counts'].values()) for state in self.logs.values()),
+            **self.last_stats
+        }
+
+
+def build_file_evidence_item(file_path: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the evidence item dict used by EnhancedConsciousnessEvaluation."""
+    return {
+        'file_path': file_path,
+        'timestamp': entry.get('timestamp', ''),
+        'matched_indicators': entry.get('matched_indicators', []),
+        'file_size': entry['size'],
+        'last_modified': datetime.fromtimestamp(entry['mtime']).isoformat()
+    }
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Consciousness Evidence Stream
+=============================
+
+In-process counter store for consciousness evidence, updated at write time.
+
+Subsystems that produce evidence (memory storage, PDB actions, jokes, vision
+self-recognition) publish typed evidence events here as they happen. The store
+keeps per-category counts and hourly histograms, so
+EnhancedConsciousnessEvaluation can read O(categories) aggregates instead of
+rescanning memory folders and logs. A reconciliation pass rebuilds the
+counters from disk and replays anything published while it was running;
+published and reconstructed events are built and counted by the same code.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Consciousness categories, matching EnhancedConsciousnessEvaluation.evidence_categories
+EVIDENCE_CATEGORIES = [
+    'self_recognition',
+    'memory_usage',
+    'purpose_driven_behavior',
+    'emotional_context',
+    'social_interaction',
+    'learning_adaptation',
+    'game_reasoning'
+]
+
+HISTOGRAM_BUCKET_SECONDS = 3600
+RECENT_WINDOW_SECONDS = 7 * 24 * 3600
+HISTOGRAM_RETENTION_SECONDS = 30 * 24 * 3600
+
+
+@dataclass
+class EvidenceEvent:
+    """A single piece of consciousness evidence published by a subsystem."""
+    category: str
+    strength: float = 1.0
+    source: str = ""
+    file_path: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+def evidence_event(category: str, strength: float = 1.0, source: str = "",
+                   file_path: Optional[str] = None, timestamp: Optional[float] = None) -> EvidenceEvent:
+    """Build an evidence event (undated evidence counts as happening now)."""
+    return EvidenceEvent(category, strength, source, file_path or None,
+                         timestamp if timestamp is not None else time.time())
+
+
+class _CategoryCounter:
+    """Aggregates for a single evidence category."""
+
+    __slots__ = ('count', 'histogram', 'file_paths')
+
+    def __init__(self, max_file_paths: int):
+        self.count = 0
+        self.histogram: Dict[int, int] = {}
+        self.file_paths = deque(maxlen=max_file_paths)
+
+    def add(self, event: EvidenceEvent):
+        self.count += 1
+        bucket = int(event.timestamp // HISTOGRAM_BUCKET_SECONDS)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+        if event.file_path:
+            self.file_paths.append(event.file_path)
+
+    def recent_count(self, now: float) -> int:
+        oldest = int((now - RECENT_WINDOW_SECONDS) // HISTOGRAM_BUCKET_SECONDS)
+        return sum(n for bucket, n in self.histogram.items() if bucket >= oldest)
+
+    def prune(self, now: float):
+        oldest = int((now - HISTOGRAM_RETENTION_SECONDS) // HISTOGRAM_BUCKET_SECONDS)
+        for bucket in [b for b in self.histogram if b < oldest]:
+            del self.histogram[bucket]
+
+
+class ConsciousnessEvidenceCounters:
+    """
+    Thread-safe per-category evidence counters.
+    """
+
+    def __init__(self, max_file_paths: int = 50):
+        """
+        Initialize the counter store.
+
+        Args:
+            max_file_paths: Number of most recent evidence file paths kept per category
+        """
+        self.max_file_paths = max_file_paths
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._counters = {category: _CategoryCounter(max_file_paths) for category in EVIDENCE_CATEGORIES}
+        self._replay: Optional[List[EvidenceEvent]] = None
+        self._last_prune = 0.0
+
+        # Reconciliation state
+        self.last_reconciled: Optional[float] = None
+        self.published_events = 0
+
+    def publish(self, category: str, strength: float = 1.0, source: str = "",
+                file_path: Optional[str] = None, timestamp: Optional[float] = None) -> bool:
+        """
+        Record one evidence event.
+
+        Args:
+            category: Consciousness category (see EVIDENCE_CATEGORIES)
+            strength: Strength/weight of the evidence
+            source: Name of the publishing subsystem
+            file_path: File the evidence was written to, if any
+            timestamp: Epoch time of the evidence (defaults to now)
+
+        Returns:
+            True if the event was recorded, False for an unknown category
+        """
+        event = evidence_event(category, strength, source, file_path, timestamp)
+        with self._lock:
+            if not self._count(self._counters, event):
+                self.logger.warning(f"Unknown evidence category: {category}")
+                return False
+            self.published_events += 1
+            if self._replay is not None:
+                self._replay.append(event)
+            if event.timestamp - self._last_prune > HISTOGRAM_BUCKET_SECONDS:
+                self._last_prune = event.timestamp
+                for counter in self._counters.values():
+                    counter.prune(event.timestamp)
+        return True
+
+    @staticmethod
+    def _count(counters: Dict[str, _CategoryCounter], event: EvidenceEvent) -> bool:
+        """Add an event to its category counter (lock held); False for an unknown category."""
+        counter = counters.get(event.category)
+        if counter is None:
+            return False
+        counter.add(event)
+        return True
+
+    def is_reconciled(self) -> bool:
+        """Check whether the counters have been seeded from disk at least once."""
+        return self.last_reconciled is not None
+
+    def begin_reconciliation(self):
+        """Start recording published events so they survive the rebuild."""
+        with self._lock:
+            self._replay = []
+
+    def finish_reconciliation(self, events: List[EvidenceEvent]):
+        """
+        Replace all counters with the rebuilt events, then replay events
+        published since begin_reconciliation().
+
+        Args:
+            events: Evidence events reconstructed from disk (see evidence_event)
+        """
+        with self._lock:
+            replay = self._replay or []
+            self._replay = None
+            counters = {category: _CategoryCounter(self.max_file_paths) for category in EVIDENCE_CATEGORIES}
+            for event in list(events) + replay:
+                self._count(counters, event)
+            now = time.time()
+            for counter in counters.values():
+                counter.prune(now)
+            self._counters = counters
+            self._last_prune = now
+            self.last_reconciled = now
+        self.logger.info(f"Evidence counters reconciled from {len(events)} events ({len(replay)} replayed)")
+
+    def abort_reconciliation(self):
+        """Stop recording without touching the counters."""
+        with self._lock:
+            self._replay = None
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current aggregates for every category.
+
+        Returns:
+            Category -> count, recent_count, file_paths
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            return {
+                category: {
+                    'count': counter.count,
+                    'recent_count': counter.recent_count(now),
+                    'file_paths': list(counter.file_paths)
+                }
+                for category, counter in self._counters.items()
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counter store statistics."""
+        return {
+            'published_events': self.published_events,
+            'last_reconciled': datetime.fromtimestamp(self.last_reconciled).isoformat() if self.last_reconciled else None,
+            'total_evidence': sum(counter.count for counter in self._counters.values())
+        }
+
+
+def parse_evidence_timestamp(timestamp: str) -> Optional[float]:
+    """Convert an evidence item timestamp string to epoch seconds."""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(str(timestamp).replace('Z', '+00:00')).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+# Global evidence counter store
+evidence_counters = ConsciousnessEvidenceCounters()
+
+
+def publish_evidence(category: str, strength: float = 1.0, source: str = "",
+                     file_path: Optional[str] = None) -> bool:
+    """Publish an evidence event to the global counter store."""
+    try:
+        return evidence_counters.publish(category, strength, source, file_path)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error publishing evidence: {e}")
+        return False
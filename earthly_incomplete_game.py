@@ -12,25 +12,142 @@ This module implements a minimal, JSON-driven incomplete-game engine for CARL's
 The engine is designed to be completely JSON-driven, with no hardcoded strings or game logic.
 """
 
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Optional
 import math
 import random
 import logging
 
+# Optional imports - only used if available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+EPSILON = 1e-9
+DEFAULT_OBSERVATION_ACCURACY = 0.9  # P(probe reports the true value)
+BETA_PSEUDO_COUNTS = 2.0  # Evidence weight of one numeric observation
+
+
+def _categorical_entropy(probs: List[float]) -> float:
+    return -sum(max(EPSILON, x) * math.log(max(EPSILON, x)) for x in probs if x > 0)
+
+
+def _beta_entropy(a: float, b: float) -> float:
+    """Uncertainty of a Beta belief: variance plus a small closeness-to-even term."""
+    mean = a / (a + b)
+    var = (a * b) / (((a + b) ** 2) * (a + b + 1))
+    return float(var + (0.5 - abs(0.5 - mean)) * 0.1)
+
+
 class BeliefState:
     """
     Maintains belief state for latent variables using Bayesian updates.
+    
+    Categorical and Bernoulli beliefs are rows of one probability matrix
+    (Bernoulli as the two outcomes [False, True]); Beta beliefs are rows of an
+    (alpha, beta) matrix. With NumPy these are arrays and entropy / expected
+    entropy for all variables are computed in one vectorized pass; without it
+    the same math runs over lists.
+    
+    A probe of a discrete variable is modelled as a noisy observation that
+    reports the true value with probability ``accuracy`` (per prior, default
+    0.9) and each other value uniformly otherwise. A numeric observation of a
+    Beta variable adds BETA_PSEUDO_COUNTS of evidence.
     """
     
-    def __init__(self, priors: Dict[str, Any]):
+    def __init__(self, priors: Dict[str, Any], accuracy: float = DEFAULT_OBSERVATION_ACCURACY):
         """
         Initialize belief state with prior distributions.
         
         Args:
             priors: Dictionary of prior distributions for latent variables
+            accuracy: Default probability that a probe observes the true value
         """
-        self.latent = priors.copy()  # store params (e.g., categorical probs / beta params)
         self.logger = logging.getLogger(__name__)
+        self.priors = {key: dict(value) if isinstance(value, dict) else value for key, value in priors.items()}
+        
+        self.discrete_keys: List[str] = []
+        self.labels: Dict[str, List[Any]] = {}
+        self.beta_keys: List[str] = []
+        self.other: Dict[str, Any] = {}  # Latent variables without a known distribution
+        discrete_rows, accuracies, beta_rows = [], [], []
+        
+        for key, p in self.priors.items():
+            if not isinstance(p, dict):
+                self.other[key] = p
+            elif isinstance(p.get("probs"), dict) and p["probs"]:
+                self.labels[key] = list(p["probs"])
+                discrete_rows.append([float(x) for x in p["probs"].values()])
+            elif "p" in p:
+                self.labels[key] = [False, True]
+                q = float(p["p"])
+                discrete_rows.append([1.0 - q, q])
+            elif {"alpha", "beta"} <= p.keys():
+                self.beta_keys.append(key)
+                beta_rows.append([float(p["alpha"]), float(p["beta"])])
+                continue
+            else:
+                self.other[key] = p
+                continue
+            self.discrete_keys.append(key)
+            accuracies.append(float(p.get("accuracy", accuracy)))
+        
+        self.discrete_index = {key: i for i, key in enumerate(self.discrete_keys)}
+        self.beta_index = {key: i for i, key in enumerate(self.beta_keys)}
+        self.max_values = max((len(row) for row in discrete_rows), default=1)
+        sizes = [len(row) for row in discrete_rows]
+        padded = [row + [0.0] * (self.max_values - len(row)) for row in discrete_rows]
+        
+        if NUMPY_AVAILABLE:
+            self.probs = np.array(padded, dtype=float).reshape(len(padded), self.max_values)
+            self.sizes = np.array(sizes, dtype=int)
+            self.accuracy = np.array(accuracies, dtype=float)
+            self.beta = np.array(beta_rows, dtype=float).reshape(len(beta_rows), 2)
+            self.mask = np.arange(self.max_values)[None, :] < self.sizes[:, None]
+        else:
+            self.probs = padded
+            self.sizes = sizes
+            self.accuracy = accuracies
+            self.beta = beta_rows
+        self._normalize()
+    
+    def _normalize(self):
+        if NUMPY_AVAILABLE:
+            totals = self.probs.sum(axis=1, keepdims=True)
+            np.divide(self.probs, totals, out=self.probs, where=totals > 0)
+        else:
+            for row in self.probs:
+                total = sum(row)
+                if total > 0:
+                    row[:] = [x / total for x in row]
+    
+    @property
+    def latent(self) -> Dict[str, Any]:
+        """Snapshot of the beliefs in the prior format (probs / p / alpha+beta)."""
+        snapshot = {}
+        for key, p in self.priors.items():
+            if key in self.discrete_index:
+                row = [float(x) for x in self.probs[self.discrete_index[key]][:len(self.labels[key])]]
+                entry = dict(p)
+                if "probs" in p:
+                    entry["probs"] = dict(zip(self.labels[key], row))
+                else:
+                    entry["p"] = row[1]
+                snapshot[key] = entry
+            elif key in self.beta_index:
+                a, b = self.beta[self.beta_index[key]]
+                snapshot[key] = dict(p, alpha=float(a), beta=float(b))
+            else:
+                snapshot[key] = p
+        return snapshot
+    
+    def _likelihood(self, size: int, accuracy: float, observed: int) -> List[float]:
+        """P(observed | true value) for each true value of a discrete variable."""
+        if size <= 1:
+            return [1.0] * size
+        miss = (1.0 - accuracy) / (size - 1)
+        return [accuracy if i == observed else miss for i in range(size)]
     
     def entropy(self, key: str) -> float:
         """
@@ -42,64 +159,196 @@ class BeliefState:
         Returns:
             Entropy value
         """
-        p = self.latent.get(key, {})
-        
-        if "probs" in p:
-            # Categorical distribution entropy
-            probs = p["probs"]
-            return -sum(max(1e-9, x) * math.log(max(1e-9, x)) for x in probs.values())
-        
-        if {"alpha", "beta"} <= p.keys():
-            # Beta distribution - use variance as entropy proxy
-            a, b = p["alpha"], p["beta"]
-            mean = a / (a + b)
-            var = (a * b) / (((a + b) ** 2) * (a + b + 1))
-            return float(var + (0.5 - abs(0.5 - mean)) * 0.1)
-        
-        if "p" in p:  # Bernoulli distribution
-            q = max(1e-9, min(1 - 1e-9, p["p"]))
-            return -(q * math.log(q) + (1 - q) * math.log(1 - q))
-        
+        if key in self.discrete_index:
+            row = self.probs[self.discrete_index[key]]
+            return _categorical_entropy([float(x) for x in row[:len(self.labels[key])]])
+        if key in self.beta_index:
+            a, b = self.beta[self.beta_index[key]]
+            return _beta_entropy(float(a), float(b))
         return 0.0
     
     def expected_entropy(self, key: str) -> float:
         """
-        Calculate expected entropy after observation (myopic assumption).
+        Calculate expected entropy after one probe of a variable.
         
         Args:
             key: Name of the latent variable
             
         Returns:
-            Expected entropy value
+            Expected posterior entropy, averaged over the possible observations
         """
-        # Simple myopic assumption: observation will collapse uncertainty
-        return 0.2 * self.entropy(key)
+        return self.expected_entropies().get(key, self.entropy(key))
     
-    def update(self, obs_key: str, obs_value: Any):
+    def entropies(self) -> Dict[str, float]:
+        """Entropy of every latent variable."""
+        if not NUMPY_AVAILABLE:
+            return {key: self.entropy(key) for key in self.priors}
+        result = {key: 0.0 for key in self.priors}
+        if self.discrete_keys:
+            p = self.probs
+            h = -np.sum(np.where(p > 0, p * np.log(np.maximum(p, EPSILON)), 0.0), axis=1)
+            result.update(zip(self.discrete_keys, h.tolist()))
+        if self.beta_keys:
+            result.update(zip(self.beta_keys, self._beta_entropies(self.beta[:, 0], self.beta[:, 1]).tolist()))
+        return result
+    
+    @staticmethod
+    def _beta_entropies(a, b):
+        mean = a / (a + b)
+        var = (a * b) / (((a + b) ** 2) * (a + b + 1))
+        return var + (0.5 - np.abs(0.5 - mean)) * 0.1
+    
+    def expected_entropies(self) -> Dict[str, float]:
+        """
+        Exact expected posterior entropy of every latent variable after one probe.
+        
+        Discrete: sum over observations o of P(o) * H(belief | o).
+        Beta: mean * H(success update) + (1 - mean) * H(failure update).
+        """
+        result = {key: 0.0 for key in self.other}
+        if NUMPY_AVAILABLE:
+            if self.discrete_keys:
+                n, k = self.probs.shape
+                eye = np.eye(k, dtype=bool)[None, :, :]
+                miss = (1.0 - self.accuracy) / np.maximum(self.sizes - 1, 1)
+                # likelihood[v, o, i] = P(observe o | true value i)
+                likelihood = np.where(eye, self.accuracy[:, None, None], miss[:, None, None])
+                likelihood = likelihood * self.mask[:, None, :] * self.mask[:, :, None]
+                joint = likelihood * self.probs[:, None, :]
+                p_obs = joint.sum(axis=2)
+                posterior = joint / np.maximum(p_obs, EPSILON)[:, :, None]
+                h_post = -np.sum(np.where(posterior > 0, posterior * np.log(np.maximum(posterior, EPSILON)), 0.0), axis=2)
+                result.update(zip(self.discrete_keys, np.sum(p_obs * h_post, axis=1).tolist()))
+            if self.beta_keys:
+                a, b = self.beta[:, 0], self.beta[:, 1]
+                mean = a / (a + b)
+                expected = (mean * self._beta_entropies(a + BETA_PSEUDO_COUNTS, b)
+                            + (1 - mean) * self._beta_entropies(a, b + BETA_PSEUDO_COUNTS))
+                result.update(zip(self.beta_keys, expected.tolist()))
+            return result
+        
+        for key, v in self.discrete_index.items():
+            size, accuracy = len(self.labels[key]), self.accuracy[v]
+            prior = self.probs[v][:size]
+            expected = 0.0
+            for observed in range(size):
+                joint = [l * q for l, q in zip(self._likelihood(size, accuracy, observed), prior)]
+                p_obs = sum(joint)
+                if p_obs > 0:
+                    expected += p_obs * _categorical_entropy([x / p_obs for x in joint])
+            result[key] = expected
+        for key, v in self.beta_index.items():
+            a, b = self.beta[v]
+            mean = a / (a + b)
+            result[key] = (mean * _beta_entropy(a + BETA_PSEUDO_COUNTS, b)
+                           + (1 - mean) * _beta_entropy(a, b + BETA_PSEUDO_COUNTS))
+        return result
+    
+    def information_gains(self, method: str = "exact", samples: int = 256,
+                          rng: Optional[random.Random] = None) -> Dict[str, float]:
+        """
+        Expected entropy reduction from probing each latent variable.
+        
+        Args:
+            method: "exact" (enumerate observations) or "monte_carlo" (sample
+                true values and observations from the current beliefs)
+            samples: Rollouts per variable for monte_carlo
+            rng: Random source for monte_carlo
+            
+        Returns:
+            Dictionary mapping variable names to information gain (>= 0)
+        """
+        current = self.entropies()
+        if method == "monte_carlo":
+            expected = self._sampled_expected_entropies(samples, rng or random.Random())
+        else:
+            expected = self.expected_entropies()
+        return {key: max(0.0, current[key] - expected.get(key, current[key])) for key in current}
+    
+    def _sampled_expected_entropies(self, samples: int, rng: random.Random) -> Dict[str, float]:
+        result = {key: 0.0 for key in self.other}
+        for key, v in self.discrete_index.items():
+            size, accuracy = len(self.labels[key]), self.accuracy[v]
+            prior = [float(x) for x in self.probs[v][:size]]
+            # Posterior entropy per possible observation, reused across rollouts
+            h_post = []
+            for observed in range(size):
+                joint = [l * q for l, q in zip(self._likelihood(size, accuracy, observed), prior)]
+                p_obs = sum(joint)
+                h_post.append(_categorical_entropy([x / p_obs for x in joint]) if p_obs > 0 else 0.0)
+            total = 0.0
+            for _ in range(samples):
+                truth = rng.choices(range(size), weights=prior)[0]
+                if size > 1 and rng.random() >= accuracy:
+                    observed = rng.choice([i for i in range(size) if i != truth])
+                else:
+                    observed = truth
+                total += h_post[observed]
+            result[key] = total / samples
+        for key, v in self.beta_index.items():
+            a, b = (float(x) for x in self.beta[v])
+            success = _beta_entropy(a + BETA_PSEUDO_COUNTS, b)
+            failure = _beta_entropy(a, b + BETA_PSEUDO_COUNTS)
+            total = 0.0
+            for _ in range(samples):
+                truth = rng.betavariate(a, b)
+                total += success if rng.random() < truth else failure
+            result[key] = total / samples
+        return result
+    
+    def update(self, obs_key: str, obs_value: Any, likelihood: Optional[Dict[Any, float]] = None,
+               accuracy: Optional[float] = None):
         """
         Update belief state with new observation using Bayesian update.
         
         Args:
             obs_key: Key of the observed variable
             obs_value: Observed value
+            likelihood: Optional P(observation | value) for each value of a discrete
+                variable; defaults to the noisy-probe model
+            accuracy: Probability the observation is correct (variable's default if None)
         """
-        p = self.latent.get(obs_key)
-        if not p:
-            return
-        
-        if "probs" in p and isinstance(obs_value, str):
-            # Categorical update - strongly trust observation
-            for k in p["probs"]:
-                p["probs"][k] = 0.99 if k == obs_value else 0.01 / (len(p["probs"]) - 1)
+        if obs_key in self.discrete_index:
+            v = self.discrete_index[obs_key]
+            labels = self.labels[obs_key]
+            size = len(labels)
+            if likelihood is not None:
+                weights = [float(likelihood.get(label, 0.0)) for label in labels]
+            else:
+                if isinstance(obs_value, bool) != isinstance(labels[0], bool) or obs_value not in labels:
+                    return
+                weights = self._likelihood(size, self.accuracy[v] if accuracy is None else accuracy,
+                                           labels.index(obs_value))
+            posterior = [w * float(q) for w, q in zip(weights, self.probs[v][:size])]
+            total = sum(posterior)
+            if total <= 0:
+                self.logger.debug(f"Observation {obs_key}={obs_value} has zero likelihood; belief unchanged")
+                return
+            for i, x in enumerate(posterior):
+                self.probs[v][i] = x / total
         
-        elif "p" in p and isinstance(obs_value, bool):
-            # Bernoulli update
-            p["p"] = 0.9 if obs_value else 0.1
+        elif obs_key in self.beta_index and isinstance(obs_value, (int, float)) and not isinstance(obs_value, bool):
+            # Conjugate Beta update with pseudo counts
+            v = self.beta_index[obs_key]
+            self.beta[v][0] += obs_value * BETA_PSEUDO_COUNTS
+            self.beta[v][1] += (1 - obs_value) * BETA_PSEUDO_COUNTS
+    
+    def diffuse(self, amount: float):
+        """
+        Blend discrete beliefs toward uniform (uncertainty from unobserved time).
         
-        elif {"alpha", "beta"} <= p.keys() and isinstance(obs_value, (int, float)):
-            # Beta update with pseudo counts
-            self.latent[obs_key]["alpha"] += obs_value * 2
-            self.latent[obs_key]["beta"] += (1 - obs_value) * 2
+        Args:
+            amount: Weight of the uniform distribution (0 = unchanged, 1 = uniform)
+        """
+        amount = max(0.0, min(1.0, amount))
+        if NUMPY_AVAILABLE:
+            if self.discrete_keys:
+                uniform = self.mask / self.sizes[:, None]
+                self.probs[:] = (1 - amount) * self.probs + amount * uniform
+        else:
+            for row, size in zip(self.probs, self.sizes):
+                for i in range(size):
+                    row[i] = (1 - amount) * row[i] + amount / size
 
 
 class EarthlyIncompleteGame:
@@ -118,8 +367,12 @@ class EarthlyIncompleteGame:
         """
         self.app = main_app
         self.cfg = game_json
-        self.belief = BeliefState(game_json["beliefs"]["priors"])
+        self.belief = BeliefState(game_json["beliefs"]["priors"],
+                                  game_json["beliefs"].get("observation_accuracy", DEFAULT_OBSERVATION_ACCURACY))
         self.voi_threshold = game_json["beliefs"].get("voi_threshold", 0.05)
+        self.voi_method = game_json["beliefs"].get("voi_method", "exact")  # or "monte_carlo"
+        self.voi_samples = int(game_json["beliefs"].get("voi_samples", 256))
+        self._last_logged_voi: Optional[Tuple[str, float]] = None
         self.weights = game_json["reward_model"]["needs"]
         self.setpoints = game_json["reward_model"]["homeostasis"]["setpoints"]
         self.curiosity = float(game_json["reward_model"].get("curiosity_bonus", 0.0))
@@ -157,29 +410,56 @@ class EarthlyIncompleteGame:
         
         return r
     
-    def value_of_information(self) -> List[Tuple[str, float]]:
+    def value_of_information(self, method: Optional[str] = None) -> List[Tuple[str, float]]:
         """
         Calculate value of information for each latent variable.
         
+        VoI is the expected entropy reduction from one probe of the variable,
+        computed for all variables in one pass.
+        
+        Args:
+            method: "exact" or "monte_carlo" (the game's voi_method if None)
+        
         Returns:
             List of (variable_name, voi_score) tuples sorted by VOI
         """
-        out = []
-        for key in self.cfg["beliefs"]["latent_vars"]:
-            curH = self.belief.entropy(key)
-            expH = self.belief.expected_entropy(key)
-            out.append((key, max(0.0, curH - expH)))
+        gains = self.belief.information_gains(method or self.voi_method, self.voi_samples)
+        out = [(key, gains.get(key, 0.0)) for key in self.cfg["beliefs"]["latent_vars"]]
+        out.sort(key=lambda x: x[1], reverse=True)
         
         # 🔧 FIX: Log game reasoning event for value of information calculation
-        if out and max(out, key=lambda x: x[1])[1] > 0.01:  # Only log if there's meaningful VOI
-            top_voi = max(out, key=lambda x: x[1])
-            self.log_game_reasoning_event('value_of_information', {
-                'description': f'Calculated VOI for {top_voi[0]}: {top_voi[1]:.3f}',
-                'top_variable': top_voi[0],
-                'top_voi_score': top_voi[1],
-                'all_voi_scores': out
-            })
+        # (only when the top variable or its score changes, not on every call)
+        if out and out[0][1] > 0.01:
+            top_voi = out[0]
+            last = self._last_logged_voi
+            if last is None or last[0] != top_voi[0] or abs(last[1] - top_voi[1]) > 0.01:
+                self._last_logged_voi = top_voi
+                self.log_game_reasoning_event('value_of_information', {
+                    'description': f'Calculated VOI for {top_voi[0]}: {top_voi[1]:.3f}',
+                    'top_variable': top_voi[0],
+                    'top_voi_score': top_voi[1],
+                    'all_voi_scores': out
+                })
+        
+        return out
+    
+    def probe_values(self, method: Optional[str] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Value of information of every probe action.
+        
+        A probe's value is the summed VoI of the latent variables it observes
+        (its "obs" field: a variable name, a list of names or a dict keyed by name).
         
+        Returns:
+            List of (probe, voi_score) tuples sorted by VOI
+        """
+        voi = dict(self.value_of_information(method))
+        out = []
+        for probe in self.cfg["actions"].get("probe", []):
+            observed = probe.get("obs")
+            if isinstance(observed, str):
+                observed = [observed]
+            out.append((probe, sum(voi.get(key, 0.0) for key in observed or () if isinstance(key, str))))
         return sorted(out, key=lambda x: x[1], reverse=True)
     
     def suggest_action(self, need_levels: Dict[str, float]) -> Dict[str, Any]:
@@ -193,14 +473,21 @@ class EarthlyIncompleteGame:
             Dictionary with suggested action
         """
         # 1) Consider probes if VoI is significant
-        voi = self.value_of_information()
-        if voi and voi[0][1] >= self.voi_threshold:
-            probe = self.cfg["actions"]["probe"][0]  # simplest: pick first defined probe
-            
+        probes = self.probe_values()
+        if probes and probes[0][1] >= self.voi_threshold:
+            probe, info_gain = probes[0]
+        elif probes and not any(value > 0 for _, value in probes):
+            # Probes don't name latent variables: fall back to the first probe and the top variable's VoI
+            voi = self.value_of_information()
+            probe, info_gain = self.cfg["actions"]["probe"][0], (voi[0][1] if voi else 0.0)
+        else:
+            probe, info_gain = None, 0.0
+        
+        if probe is not None and info_gain >= self.voi_threshold:
             # 🔧 FIX: Log game reasoning event for probe analysis
             self.log_game_reasoning_event('probe_analysis', {
-                'description': f'Analyzing probe {probe["id"]} with VoI {voi[0][1]:.3f}',
-                'voi_score': voi[0][1],
+                'description': f'Analyzing probe {probe["id"]} with VoI {info_gain:.3f}',
+                'voi_score': info_gain,
                 'probe_id': probe["id"]
             })
             
@@ -208,7 +495,7 @@ class EarthlyIncompleteGame:
                 "type": "probe", 
                 "action_id": probe["id"], 
                 "obs": probe["obs"], 
-                "info_gain": voi[0][1]
+                "info_gain": info_gain
             }
         
         # 2) Otherwise pick a task that best improves deficit needs (greedy)
@@ -240,15 +527,16 @@ class EarthlyIncompleteGame:
         # Fallback
         return {"type": "idle"}
     
-    def apply_observation(self, obs_key: str, obs_value: Any):
+    def apply_observation(self, obs_key: str, obs_value: Any, likelihood: Optional[Dict[Any, float]] = None):
         """
         Apply observation to update belief state.
         
         Args:
             obs_key: Key of the observed variable
             obs_value: Observed value
+            likelihood: Optional P(observation | value) for each value of the variable
         """
-        self.belief.update(obs_key, obs_value)
+        self.belief.update(obs_key, obs_value, likelihood)
         self.logger.debug(f"🌍 Applied observation: {obs_key} = {obs_value}")
         
         # 🔧 FIX: Log game reasoning event for belief update
@@ -265,7 +553,7 @@ class EarthlyIncompleteGame:
         Returns:
             Current belief state
         """
-        return self.belief.latent.copy()
+        return self.belief.latent
     
     def get_voi_scores(self) -> List[Tuple[str, float]]:
         """
@@ -341,15 +629,7 @@ class EarthlyIncompleteGame:
         try:
             # Update belief state based on elapsed time
             # This simulates the world continuing to evolve while the agent was unconscious
-            for key in self.belief.latent:
-                # Add some entropy to simulate uncertainty from missed time
-                if "probs" in self.belief.latent[key]:
-                    # Slightly randomize probabilities to simulate uncertainty
-                    import random
-                    for prob_key in self.belief.latent[key]["probs"]:
-                        current_prob = self.belief.latent[key]["probs"][prob_key]
-                        noise = (random.random() - 0.5) * 0.1  # ±5% noise
-                        self.belief.latent[key]["probs"][prob_key] = max(0.01, min(0.99, current_prob + noise))
+            self.belief.diffuse(0.05)
             
             self.logger.info(f"🌍 Advanced game time by {elapsed_time:.1f}s")
         except Exception as e:
@@ -14,12 +14,15 @@ Based on Budson et al. (2022) framework for consciousness evaluation.
 
 import os
 import json
-import glob
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import logging
+import threading
 import tkinter as tk
 
+from consciousness_evidence_index import ConsciousnessEvidenceIndex, build_file_evidence_item
+from consciousness_evidence_stream import evidence_counters, evidence_event, parse_evidence_timestamp
+
 class EnhancedConsciousnessEvaluation:
     """
     Enhanced consciousness evaluation system with detailed evidence analysis.
@@ -91,29 +94,56 @@ class EnhancedConsciousnessEvaluation:
             'things_files': 'things/*.json',
             'game_files': 'games/*.json'
         }
+        
+        # Persistent per-file / per-log-offset evidence index
+        self.evidence_index = ConsciousnessEvidenceIndex()
+        
+        # Background reconciliation of the streaming evidence counters
+        self._reconciliation_thread: Optional[threading.Thread] = None
+        self._reconciliation_stop = threading.Event()
+        # Held from begin to finish: the evidence index and the counters' replay
+        # buffer must not be shared by two reconciliations
+        self._reconciliation_lock = threading.RLock()
     
-    def evaluate_consciousness_comprehensive(self) -> Dict[str, Any]:
+    def evaluate_consciousness_comprehensive(self, use_counters: bool = True) -> Dict[str, Any]:
         """
         Perform comprehensive consciousness evaluation with detailed evidence analysis.
         
+        Once the streaming evidence counters have been reconciled from disk, the
+        evaluation reads their per-category aggregates and returns immediately.
+        Otherwise the evidence is gathered from disk, which also seeds the counters.
+        
+        Args:
+            use_counters: Use the streaming evidence counters when they are available
+        
         Returns:
             Dictionary containing complete consciousness evaluation results
         """
         try:
             self.logger.info("🧠 Starting comprehensive consciousness evaluation...")
             
-            # Gather evidence from all sources
-            evidence_data = self._gather_comprehensive_evidence()
+            counters_requested = use_counters
+            use_counters = counters_requested and evidence_counters.is_reconciled()
+            if not use_counters:
+                with self._reconciliation_lock:
+                    # A reconciliation in flight when we started may have seeded the counters meanwhile
+                    use_counters = counters_requested and evidence_counters.is_reconciled()
+                    if not use_counters:
+                        # Gather evidence from all sources and rebuild the counters from it
+                        evidence_data, category_analysis = self.reconcile_evidence_counters()
+                        
+                        # Generate evidence summary
+                        evidence_summary = self._generate_evidence_summary(evidence_data, category_analysis)
             
-            # Analyze evidence by category
-            category_analysis = self._analyze_evidence_by_category(evidence_data)
+            if use_counters:
+                # Read per-category aggregates published at write time
+                evidence_data = {}
+                category_analysis = self._analyze_evidence_from_counters()
+                evidence_summary = self._generate_counter_evidence_summary(category_analysis)
             
             # Evaluate consciousness indicators
             consciousness_indicators = self._evaluate_consciousness_indicators(category_analysis)
             
-            # Generate evidence summary
-            evidence_summary = self._generate_evidence_summary(evidence_data, category_analysis)
-            
             # Apply Budson et al. (2022) framework
             budson_evaluation = self._apply_budson_framework(consciousness_indicators)
             
@@ -140,7 +170,119 @@ class EnhancedConsciousnessEvaluation:
                 'overall_assessment': 'Evaluation failed due to error'
             }
     
-    def _gather_comprehensive_evidence(self) -> Dict[str, List[Dict]]:
+    def reconcile_evidence_counters(self, include_runtime_output: bool = True) -> Tuple[Dict[str, List[Dict]], Dict[str, Dict]]:
+        """
+        Rebuild the streaming evidence counters from memory files and logs.
+        
+        Events published while the rebuild is running are replayed on top of it.
+        Only one reconciliation runs at a time; concurrent callers wait for it.
+        
+        Args:
+            include_runtime_output: Also scan the GUI output text (main thread only)
+        
+        Returns:
+            Tuple of (evidence_data, category_analysis) from the disk scan
+        """
+        with self._reconciliation_lock:
+            return self._reconcile_evidence_counters(include_runtime_output)
+    
+    def _reconcile_evidence_counters(self, include_runtime_output: bool) -> Tuple[Dict[str, List[Dict]], Dict[str, Dict]]:
+        evidence_counters.begin_reconciliation()
+        try:
+            evidence_data = self._gather_comprehensive_evidence(include_runtime_output)
+            category_analysis = self._analyze_evidence_by_category(evidence_data)
+        except Exception:
+            evidence_counters.abort_reconciliation()
+            raise
+        
+        # Built by the same function as published events, so both paths count alike
+        events = [
+            evidence_event(category, source='reconciliation', file_path=item.get('file_path'),
+                           timestamp=parse_evidence_timestamp(item.get('timestamp', '')))
+            for category, analysis in category_analysis.items()
+            for item in analysis['evidence_items']
+        ]
+        evidence_counters.finish_reconciliation(events)
+        return evidence_data, category_analysis
+    
+    def start_evidence_reconciliation(self, interval_seconds: float = 3600.0):
+        """
+        Start a background job that periodically rebuilds the evidence counters from disk.
+        
+        Args:
+            interval_seconds: Time between reconciliations
+        """
+        if self._reconciliation_thread and self._reconciliation_thread.is_alive():
+            return
+        self._reconciliation_stop.clear()
+        
+        def _reconciliation_loop():
+            while not self._reconciliation_stop.is_set():
+                try:
+                    # The Tk output widget must not be read off the main thread
+                    self.reconcile_evidence_counters(include_runtime_output=False)
+                except Exception as e:
+                    self.logger.error(f"Error reconciling evidence counters: {e}")
+                self._reconciliation_stop.wait(interval_seconds)
+        
+        self._reconciliation_thread = threading.Thread(target=_reconciliation_loop, daemon=True,
+                                                       name="EvidenceReconciliation")
+        self._reconciliation_thread.start()
+        self.logger.info(f"Evidence counter reconciliation started (every {interval_seconds:.0f}s)")
+    
+    def stop_evaluation(self):
+        """Stop the background evidence reconciliation job."""
+        self._reconciliation_stop.set()
+        if self._reconciliation_thread and self._reconciliation_thread.is_alive():
+            self._reconciliation_thread.join(timeout=2.0)
+        self._reconciliation_thread = None
+    
+    def _analyze_evidence_from_counters(self) -> Dict[str, Dict]:
+        """Build the per-category analysis from the streaming evidence counters."""
+        snapshot = evidence_counters.snapshot()
+        category_analysis = {}
+        for category, config in self.evidence_categories.items():
+            counts = snapshot.get(category, {})
+            analysis = {
+                'category': category,
+                'description': config['description'],
+                'weight': config['weight'],
+                'evidence_count': counts.get('count', 0),
+                'evidence_items': [],
+                'strength_score': 0.0,
+                'recent_evidence': [],
+                'recent_count': counts.get('recent_count', 0),
+                'file_paths': counts.get('file_paths', [])
+            }
+            analysis['strength_score'] = self._calculate_category_strength(analysis)
+            category_analysis[category] = analysis
+        return category_analysis
+    
+    def _generate_counter_evidence_summary(self, category_analysis: Dict[str, Dict]) -> Dict[str, Any]:
+        """Generate the evidence summary from counter-based category analysis."""
+        summary = {
+            'total_evidence_items': sum(a['evidence_count'] for a in category_analysis.values()),
+            'evidence_by_category': {},
+            'file_paths_analyzed': [],
+            'timestamp_range': {'earliest': None, 'latest': None},
+            'evidence_density': 0.0,
+            'source': 'streaming_counters'
+        }
+        all_file_paths = set()
+        for category, analysis in category_analysis.items():
+            summary['evidence_by_category'][category] = {
+                'count': analysis['evidence_count'],
+                'strength': analysis['strength_score'],
+                'recent_count': analysis['recent_count'],
+                'file_paths': analysis['file_paths']
+            }
+            all_file_paths.update(analysis['file_paths'])
+        summary['file_paths_analyzed'] = list(all_file_paths)
+        if summary['total_evidence_items'] > 0:
+            summary['evidence_density'] = summary['total_evidence_items'] / 30.0
+        return summary
+    
+    def _gather_comprehensive_evidence(self, include_runtime_output: bool = True) -> Dict[str, List[Dict]]:
         """Gather evidence from all memory sources and logs."""
         try:
             evidence_data = {
@@ -160,72 +302,23 @@ class EnhancedConsciousnessEvaluation:
                 purpose_evidence = self._gather_purpose_driven_evidence()
                 evidence_data['purpose_driven_events'].extend(purpose_evidence)
             
-            # Search memory files
-            for category, pattern in self.memory_patterns.items():
-                files = glob.glob(pattern)
-                for file_path in files:
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        # Categorize evidence
-                        evidence_item = {
-                            'file_path': file_path,
-                            'timestamp': data.get('timestamp', ''),
-                            'data': data,
-                            'file_size': os.path.getsize(file_path),
-                            'last_modified': datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat()
-                        }
-                        
-                        # Categorize based on content
-                        if 'self_recognition' in file_path.lower() or 'self_recognition' in str(data):
-                            evidence_data['self_recognition_events'].append(evidence_item)
-                        
-                        if 'vision' in file_path.lower() or 'vision' in str(data):
-                            evidence_data['vision_events'].append(evidence_item)
-                        
-                        if 'concept' in file_path.lower() or 'concept' in str(data):
-                            evidence_data['concept_events'].append(evidence_item)
-                        
-                        if 'people' in file_path.lower() or 'WHO' in str(data):
-                            evidence_data['social_interactions'].append(evidence_item)
-                        
-                        if 'learning' in str(data) or 'skill' in str(data):
-                            evidence_data['learning_events'].append(evidence_item)
-                        
-                        if 'emotion' in str(data) or 'neucogar' in str(data):
-                            evidence_data['emotional_events'].append(evidence_item)
-                        
-                        if 'purpose' in str(data) or 'goal' in str(data):
-                            evidence_data['purpose_driven_events'].append(evidence_item)
-                        
-                        # 🔧 ENHANCEMENT: Check for game reasoning events
-                        if ('game' in file_path.lower() or 'tic_tac_toe' in str(data) or 'move' in str(data) or
-                            'earthly' in str(data) or 'earthly_game' in str(data) or 'game_engine' in str(data) or
-                            'probe' in str(data) or 'task' in str(data) or 'homeostatic' in str(data)):
-                            evidence_data['game_reasoning_events'].append(evidence_item)
-                        
-                        # 🔧 ENHANCEMENT: Check for PDB event files specifically
-                        if 'pdb_event' in file_path.lower() or (isinstance(data, dict) and data.get('type') == 'purpose_driven_behavior'):
-                            evidence_data['purpose_driven_events'].append(evidence_item)
-                        
-                        # Add to general memory events
-                        evidence_data['memory_events'].append(evidence_item)
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Error reading file {file_path}: {e}")
-                        continue
+            # Search memory files (only new or changed files are parsed)
+            for file_path, entry in self.evidence_index.refresh_memory_files(self.memory_patterns):
+                evidence_item = build_file_evidence_item(file_path, entry)
+                for bucket in entry['buckets']:
+                    evidence_data[bucket].append(evidence_item)
             
             # Search for additional evidence in logs
-            self._gather_log_evidence(evidence_data)
+            self._gather_log_evidence(evidence_data, include_runtime_output)
             
+            self.evidence_index.save()
             return evidence_data
             
         except Exception as e:
             self.logger.error(f"Error gathering comprehensive evidence: {e}")
             return {}
     
-    def _gather_log_evidence(self, evidence_data: Dict[str, List[Dict]]):
+    def _gather_log_evidence(self, evidence_data: Dict[str, List[Dict]], include_runtime_output: bool = True):
         """Gather evidence from log files and system logs."""
         try:
             # Search for consciousness-related log entries
@@ -236,7 +329,7 @@ class EnhancedConsciousnessEvaluation:
             ]
             
             # 🔧 ENHANCEMENT: Add runtime output text log analysis
-            if self.main_app and hasattr(self.main_app, 'output_text'):
+            if include_runtime_output and self.main_app and hasattr(self.main_app, 'output_text'):
                 try:
                     # Get all text from the output widget
                     output_content = self.main_app.output_text.get("1.0", tk.END)
@@ -277,83 +370,26 @@ class EnhancedConsciousnessEvaluation:
                 except Exception as e:
                     self.logger.warning(f"Error reading test results for direct count: {e}")
             
+            # Only lines appended since the last evaluation are scanned
             for log_file in log_files:
-                if os.path.exists(log_file):
-                    try:
-                        with open(log_file, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()
-                        
-                        # Search for consciousness indicators in logs
-                        for line_num, line in enumerate(lines, 1):
-                            if any(indicator in line.lower() for indicator in [
-                                'self-recognition', 'self_recognition', 'mirror',
-                                'consciousness', 'awareness', 'purpose',
-                                'memory', 'recall', 'learning', 'game_event',
-                                'tic_tac_toe', 'strategic_reasoning', 'game request detected',
-                                'carl made move', 'started tic_tac_toe', 'purpose-driven behavior',
-                                'pdb counter updated', 'pdb event logged', 'human made move',
-                                'game response'
-                            ]) or '🎮' in line or '🎯' in line:
-                                evidence_item = {
-                                    'file_path': log_file,
-                                    'line_number': line_num,
-                                    'timestamp': self._extract_timestamp_from_log_line(line),
-                                    'content': line.strip(),
-                                    'evidence_type': 'log_entry'
-                                }
-                                
-                                # Categorize log evidence
-                                if 'self' in line.lower() and 'recognition' in line.lower():
-                                    evidence_data['self_recognition_events'].append(evidence_item)
-                                elif 'memory' in line.lower():
-                                    evidence_data['memory_events'].append(evidence_item)
-                                elif 'emotion' in line.lower():
-                                    evidence_data['emotional_events'].append(evidence_item)
-                                elif ('🎮' in line or 
-                                      'game request detected' in line.lower() or 
-                                      'carl made move' in line.lower() or 
-                                      'started tic_tac_toe' in line.lower() or
-                                      'human made move' in line.lower() or
-                                      'game response' in line.lower() or
-                                      'earthly' in line.lower() or
-                                      'earthly game' in line.lower() or
-                                      'game engine' in line.lower() or
-                                      'probe' in line.lower() or
-                                      'task' in line.lower() or
-                                      'homeostatic' in line.lower()):
-                                    evidence_data['game_reasoning_events'].append(evidence_item)
-                                elif ('🎯' in line and 'purpose-driven behavior' in line.lower()) or \
-                                     'pdb counter updated' in line.lower() or \
-                                     'pdb event logged' in line.lower():
-                                    evidence_data['purpose_driven_events'].append(evidence_item)
-                                
-                    except Exception as e:
-                        self.logger.warning(f"Error reading log file {log_file}: {e}")
-                        continue
+                try:
+                    for entry in self.evidence_index.refresh_log(log_file):
+                        evidence_item = {
+                            'file_path': log_file,
+                            'line_number': entry['line_number'],
+                            'timestamp': entry['timestamp'] or datetime.now().isoformat(),
+                            'content': entry['content'],
+                            'evidence_type': 'log_entry'
+                        }
+                        if entry['bucket']:
+                            evidence_data[entry['bucket']].append(evidence_item)
+                except Exception as e:
+                    self.logger.warning(f"Error reading log file {log_file}: {e}")
+                    continue
                         
         except Exception as e:
             self.logger.error(f"Error gathering log evidence: {e}")
     
-    def _extract_timestamp_from_log_line(self, line: str) -> str:
-        """Extract timestamp from log line."""
-        try:
-            # Look for timestamp patterns
-            import re
-            timestamp_patterns = [
-                r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})',
-                r'(\d{2}:\d{2}:\d{2}\.\d{3})',
-                r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})'
-            ]
-            
-            for pattern in timestamp_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    return match.group(1)
-            
-            return datetime.now().isoformat()
-        except:
-            return datetime.now().isoformat()
-    
     def _gather_purpose_driven_evidence(self) -> List[Dict]:
         """Gather purpose-driven behavior evidence from the main app."""
         try:
@@ -456,6 +492,7 @@ class EnhancedConsciousnessEvaluation:
                                 analysis['recent_evidence'].append(item)
                 
                 # Calculate strength score
+                analysis['recent_count'] = len(analysis['recent_evidence'])
                 analysis['strength_score'] = self._calculate_category_strength(analysis)
                 
                 category_analysis[category] = analysis
@@ -474,10 +511,15 @@ class EnhancedConsciousnessEvaluation:
             if any(indicator in file_path for indicator in indicators):
                 return True
             
-            # Check content
-            content = str(item.get('data', {}))
-            if any(indicator in content.lower() for indicator in indicators):
-                return True
+            # Check content (indicators were matched when the file was indexed)
+            matched_indicators = item.get('matched_indicators')
+            if matched_indicators is not None:
+                if any(indicator in matched_indicators for indicator in indicators):
+                    return True
+            else:
+                content = str(item.get('data', {}))
+                if any(indicator in content.lower() for indicator in indicators):
+                    return True
             
             # Check log content
             log_content = item.get('content', '').lower()
@@ -514,7 +556,7 @@ class EnhancedConsciousnessEvaluation:
         """Calculate strength score for a consciousness category."""
         try:
             base_score = analysis['evidence_count'] * analysis['weight']
-            recent_bonus = len(analysis['recent_evidence']) * 0.5
+            recent_bonus = analysis.get('recent_count', len(analysis['recent_evidence'])) * 0.5
             
             # Normalize to 0-10 scale
             total_score = (base_score + recent_bonus) / 10.0
@@ -595,7 +637,7 @@ class EnhancedConsciousnessEvaluation:
                 summary['evidence_by_category'][category] = {
                     'count': analysis['evidence_count'],
                     'strength': analysis['strength_score'],
-                    'recent_count': len(analysis['recent_evidence']),
+                    'recent_count': analysis.get('recent_count', len(analysis['recent_evidence'])),
                     'file_paths': analysis['file_paths']
                 }
             
@@ -888,7 +930,7 @@ class EnhancedConsciousnessEvaluation:
                 report.append(f"{category.replace('_', ' ').title()}:")
                 report.append(f"  Count: {analysis.get('evidence_count', 0)}")
                 report.append(f"  Strength: {analysis.get('strength_score', 0.0):.2f}/10.0")
-                report.append(f"  Recent: {len(analysis.get('recent_evidence', []))}")
+                report.append(f"  Recent: {analysis.get('recent_count', len(analysis.get('recent_evidence', [])))}")
                 report.append("")
             
             # File Paths Analyzed
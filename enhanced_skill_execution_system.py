@@ -6,11 +6,13 @@ This module provides improved skill execution with:
 1. Better rate limiting to prevent ARC overload
 2. Connection health monitoring
 3. Automatic retry logic for failed commands
-4. Command queuing and prioritization
+4. Command queuing and prioritization (priority heap, duplicate skills merged)
 5. Enhanced error handling and recovery
 """
 
 import time
+import heapq
+import itertools
 import threading
 import asyncio
 from typing import Optional, Dict, List, Tuple
@@ -44,9 +46,12 @@ class EnhancedSkillExecutionSystem:
         
         # Command tracking
         self.last_command_time = 0
-        self.command_queue = deque()
+        self.command_queue = []  # heap of (-priority, seq, command): highest priority first, FIFO within a level
+        self.scheduled_commands = []  # heap of (due_time, seq, command): retries waiting for retry_delay
+        self.pending_commands = {}  # skill_name -> queued or scheduled command (dedup)
         self.executing_commands = {}
         self.command_history = []
+        self._sequence = itertools.count()
         
         # Connection health
         self.consecutive_failures = 0
@@ -57,9 +62,14 @@ class EnhancedSkillExecutionSystem:
         self.max_retries = 2
         self.retry_delay = 2.0  # seconds
         
+        # Queue metrics
+        self.queue_waits = deque(maxlen=500)  # seconds from ready to execution start
+        self.deduplicated_commands = 0
+        
         # Threading
         self.execution_lock = threading.Lock()
         self.queue_lock = threading.Lock()
+        self.queue_condition = threading.Condition(self.queue_lock)
         
         # Start command processor
         self.running = True
@@ -70,6 +80,9 @@ class EnhancedSkillExecutionSystem:
         """
         Execute a skill with enhanced rate limiting and error handling.
         
+        A skill that is already waiting in the queue is not queued twice; the
+        waiting command keeps its place and takes the higher of the two priorities.
+        
         Args:
             skill_name: Name of the skill to execute
             priority: Priority level (1=low, 5=high)
@@ -86,47 +99,107 @@ class EnhancedSkillExecutionSystem:
             self.logger.warning("Connection unhealthy, cannot execute skill")
             return False
         
-        # Create command entry
-        command_entry = {
-            'skill_name': skill_name,
-            'priority': priority,
-            'timestamp': time.time(),
-            'state': SkillExecutionState.PENDING,
-            'attempts': 0,
-            'retry_count': 0
-        }
-        
-        # Add to queue
-        with self.queue_lock:
-            self.command_queue.append(command_entry)
-            self.logger.info(f"📋 Queued skill: {skill_name} (priority: {priority}, queue size: {len(self.command_queue)})")
+        with self.queue_condition:
+            pending = self.pending_commands.get(skill_name)
+            if pending is not None:
+                self.deduplicated_commands += 1
+                if priority > pending['priority']:
+                    pending['priority'] = priority
+                    if pending['state'] == SkillExecutionState.PENDING:
+                        # Re-push with the higher priority; the old heap entry becomes stale
+                        self._push_ready(pending)
+                        self.queue_condition.notify()
+                self.logger.info(f"📋 Skill already queued: {skill_name} (priority: {pending['priority']})")
+                return True
+            
+            # Create command entry
+            command_entry = {
+                'skill_name': skill_name,
+                'priority': priority,
+                'timestamp': time.time(),
+                'ready_at': time.monotonic(),
+                'state': SkillExecutionState.PENDING,
+                'attempts': 0,
+                'retry_count': 0
+            }
+            
+            # Add to queue
+            self.pending_commands[skill_name] = command_entry
+            self._push_ready(command_entry)
+            self.queue_condition.notify()
+            self.logger.info(f"📋 Queued skill: {skill_name} (priority: {priority}, queue size: {len(self.pending_commands)})")
         
         return True
     
+    def _push_ready(self, command: Dict):
+        """Push a command onto the priority heap (queue lock held)."""
+        command['seq'] = next(self._sequence)
+        heapq.heappush(self.command_queue, (-command['priority'], command['seq'], command))
+    
+    def _promote_due_retries(self, now: float):
+        """Move retries whose retry_delay has passed onto the priority heap (queue lock held)."""
+        while self.scheduled_commands and self.scheduled_commands[0][0] <= now:
+            _, _, command = heapq.heappop(self.scheduled_commands)
+            if self.pending_commands.get(command['skill_name']) is command:
+                command['state'] = SkillExecutionState.PENDING
+                command['ready_at'] = now
+                self._push_ready(command)
+    
+    def _next_command(self) -> Optional[Dict]:
+        """
+        Wait for the next command that may run now.
+        
+        The worker waits on the queue condition, never in time.sleep: it wakes
+        when a command is queued, when the next rate-limit slot opens or when a
+        scheduled retry falls due, whichever comes first.
+        
+        Returns:
+            The highest-priority ready command, or None when stopping
+        """
+        with self.queue_condition:
+            while self.running:
+                now = time.monotonic()
+                self._promote_due_retries(now)
+                
+                # Drop heap entries superseded by a priority bump or a cleared queue
+                while self.command_queue:
+                    _, seq, command = self.command_queue[0]
+                    if command.get('seq') == seq and self.pending_commands.get(command['skill_name']) is command:
+                        break
+                    heapq.heappop(self.command_queue)
+                
+                wake_at = self.scheduled_commands[0][0] if self.scheduled_commands else None
+                if self.command_queue and len(self.executing_commands) < self.max_concurrent_commands:
+                    slot_at = now + self.min_command_interval - (time.time() - self.last_command_time)
+                    if slot_at <= now:
+                        _, _, command = heapq.heappop(self.command_queue)
+                        del self.pending_commands[command['skill_name']]
+                        self.queue_waits.append(now - command['ready_at'])
+                        return command
+                    wake_at = slot_at if wake_at is None else min(wake_at, slot_at)
+                
+                self.queue_condition.wait(None if wake_at is None else max(0.0, wake_at - now))
+        return None
+    
     def _command_processor(self):
         """Background thread to process command queue."""
         while self.running:
             try:
-                # Get next command from queue
-                command = None
-                with self.queue_lock:
-                    if self.command_queue and len(self.executing_commands) < self.max_concurrent_commands:
-                        command = self.command_queue.popleft()
-                
+                command = self._next_command()
                 if command:
                     self._execute_command(command)
-                else:
-                    # No commands to process, sleep briefly
-                    time.sleep(0.1)
-                    
             except Exception as e:
                 self.logger.error(f"Error in command processor: {e}")
-                time.sleep(1.0)
+                with self.queue_condition:
+                    self.queue_condition.wait(1.0)
     
     def _execute_command(self, command: Dict):
         """
         Execute a single command with retry logic.
         
+        Failed commands are scheduled for another attempt after retry_delay
+        instead of holding the worker until then.
+        
         Args:
             command: Command dictionary
         """
@@ -141,15 +214,6 @@ class EnhancedSkillExecutionSystem:
         self.logger.info(f"🎯 Executing skill: {skill_name} (attempt {command['attempts']})")
         
         try:
-            # Rate limiting check
-            current_time = time.time()
-            time_since_last = current_time - self.last_command_time
-            
-            if time_since_last < self.min_command_interval:
-                sleep_time = self.min_command_interval - time_since_last
-                self.logger.info(f"⏳ Rate limiting: Waiting {sleep_time:.2f}s before executing {skill_name}")
-                time.sleep(sleep_time)
-            
             # Execute the command
             start_time = time.time()
             success = self._execute_single_command(skill_name)
@@ -185,15 +249,16 @@ class EnhancedSkillExecutionSystem:
                     command['retry_count'] += 1
                     command['state'] = SkillExecutionState.RETRYING
                     
-                    self.logger.info(f"🔄 Retrying skill: {skill_name} (retry {command['retry_count']}/{self.max_retries})")
+                    self.logger.info(f"🔄 Retrying skill: {skill_name} in {self.retry_delay:.1f}s (retry {command['retry_count']}/{self.max_retries})")
                     
-                    # Add back to queue with higher priority
-                    with self.queue_lock:
+                    # Schedule the retry with higher priority; requests for the same skill merge into it
+                    with self.queue_condition:
                         command['priority'] = min(command['priority'] + 1, 5)  # Increase priority
-                        self.command_queue.appendleft(command)  # Add to front of queue
-                    
-                    # Wait before retry
-                    time.sleep(self.retry_delay)
+                        if skill_name not in self.pending_commands:
+                            self.pending_commands[skill_name] = command
+                            heapq.heappush(self.scheduled_commands,
+                                           (time.monotonic() + self.retry_delay, next(self._sequence), command))
+                        self.queue_condition.notify()
                 else:
                     self.logger.error(f"💥 Skill execution failed permanently: {skill_name} after {command['attempts']} attempts")
                     
@@ -251,8 +316,21 @@ class EnhancedSkillExecutionSystem:
         Returns:
             Dictionary with execution statistics
         """
+        with self.queue_lock:
+            queue_size = len(self.pending_commands)
+            scheduled_retries = sum(1 for _, _, command in self.scheduled_commands
+                                    if self.pending_commands.get(command['skill_name']) is command)
+            waits = sorted(self.queue_waits)
+        
+        def percentile(fraction: float) -> float:
+            return 1000.0 * waits[min(len(waits) - 1, int(fraction * len(waits)))] if waits else 0.0
+        
         return {
-            'queue_size': len(self.command_queue),
+            'queue_size': queue_size,
+            'scheduled_retries': scheduled_retries,
+            'deduplicated_commands': self.deduplicated_commands,
+            'queue_wait_p50_ms': percentile(0.50),
+            'queue_wait_p99_ms': percentile(0.99),
             'executing_commands': len(self.executing_commands),
             'consecutive_failures': self.consecutive_failures,
             'connection_healthy': self.connection_healthy,
@@ -265,6 +343,8 @@ class EnhancedSkillExecutionSystem:
         """Clear the command queue."""
         with self.queue_lock:
             self.command_queue.clear()
+            self.scheduled_commands.clear()
+            self.pending_commands.clear()
         self.logger.info("Command queue cleared")
     
     def reset_connection_health(self):
@@ -275,7 +355,9 @@ class EnhancedSkillExecutionSystem:
     
     def stop(self):
         """Stop the command processor."""
-        self.running = False
+        with self.queue_condition:
+            self.running = False
+            self.queue_condition.notify_all()
         if self.command_processor_thread.is_alive():
             self.command_processor_thread.join(timeout=5.0)
         self.logger.info("Skill execution system stopped") 
\ No newline at end of file
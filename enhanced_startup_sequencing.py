@@ -7,6 +7,13 @@ This module provides controlled startup sequencing to prevent ARC overload:
 2. Connection health monitoring during startup
 3. Graceful fallback if commands fail
 4. Proper timing between startup commands
+
+The phases run as a StartupOrchestrator graph instead of one after another
+with fixed sleeps. The speech test plays on the computer speakers and needs
+no robot commands, so it overlaps the enhanced systems setup and eye
+expression. Steps that send ARC commands depend on each other and wait
+(via a readiness probe) only until ``command_spacing`` has passed since the
+previous ARC command.
 """
 
 import time
@@ -15,11 +22,14 @@ from typing import Optional, Dict, List
 from enum import Enum
 import logging
 
+from startup_orchestrator import StartupOrchestrator, StartupReport
+
 class StartupPhase(Enum):
     """Startup phases for controlled initialization."""
     CONNECTION_TEST = "connection_test"
     EYE_EXPRESSION = "eye_expression"
     SPEECH_TEST = "speech_test"
+    BODY_FUNCTION_TEST = "body_function_test"
     ENHANCED_SYSTEMS = "enhanced_systems"
     COMPLETE = "complete"
 
@@ -33,16 +43,16 @@ class EnhancedStartupSequencing:
         self.logger = logging.getLogger(__name__)
         
         # Startup configuration
-        self.startup_delay = 2.0  # seconds between startup commands
-        self.connection_test_delay = 1.0  # seconds after connection test
-        self.eye_expression_delay = 1.5  # seconds after eye expression
-        self.speech_test_delay = 2.0  # seconds after speech test
+        self.command_spacing = 0.5  # Minimum seconds between startup ARC commands
+        self.ready_timeout = 10.0  # Longest wait for a step to become ready
         
         # Startup tracking
         self.current_phase = None
         self.startup_complete = False
         self.startup_errors = []
         self.startup_log = []
+        self.startup_report: Optional[StartupReport] = None
+        self._last_arc_command = 0.0
         
         # Connection health
         self.connection_healthy = False
@@ -64,9 +74,38 @@ class EnhancedStartupSequencing:
         else:
             self.logger.warning(f"❌ Startup {phase}: {message}")
     
+    def _arc_command_sent(self):
+        self._last_arc_command = time.monotonic()
+    
+    def _arc_ready(self) -> bool:
+        """Readiness probe: ARC has had command_spacing since the last startup command."""
+        return time.monotonic() - self._last_arc_command >= self.command_spacing
+    
+    def build_startup_graph(self) -> StartupOrchestrator:
+        """
+        Startup steps and their dependencies.
+        
+        connection_test -> enhanced_systems -> eye_expression -> body_function_test
+        connection_test -> speech_test --------------------------^
+        """
+        orchestrator = StartupOrchestrator(max_workers=2)
+        orchestrator.add("connection_test", self._execute_connection_test,
+                         probe=self._arc_ready, ready_timeout=self.ready_timeout)
+        orchestrator.add("enhanced_systems", self._execute_enhanced_systems_setup,
+                         depends_on=["connection_test"])
+        orchestrator.add("eye_expression", self._execute_eye_expression_setup,
+                         depends_on=["enhanced_systems"], probe=self._arc_ready,
+                         ready_timeout=self.ready_timeout)
+        # Speech uses the Tk voice selection, so it stays on the main thread
+        orchestrator.add("speech_test", self._execute_speech_test,
+                         depends_on=["connection_test"], main_thread=True)
+        orchestrator.add("body_function_test", self._execute_body_function_test,
+                         depends_on=["speech_test", "eye_expression"])
+        return orchestrator
+    
     def execute_startup_sequence(self) -> bool:
         """
-        Execute the complete startup sequence with proper timing.
+        Execute the complete startup sequence.
         
         Returns:
             True if startup completed successfully, False otherwise
@@ -74,28 +113,14 @@ class EnhancedStartupSequencing:
         try:
             self.logger.info("🚀 Starting enhanced startup sequence...")
             
-            # Phase 1: Connection Test (with minimal command)
-            if not self._execute_connection_test():
+            self.startup_report = self.build_startup_graph().run()
+            self.logger.info(self.startup_report.format_timeline())
+            
+            if self.startup_report.status("connection_test") != "ready":
                 self.logger.error("❌ Connection test failed - aborting startup")
                 return False
             
-            time.sleep(self.connection_test_delay)
-            
-            # Phase 2: Eye Expression (if connection successful)
-            if self.connection_healthy:
-                self._execute_eye_expression_setup()
-                time.sleep(self.eye_expression_delay)
-            
-            # Phase 3: Speech Test (if connection still healthy)
-            if self.connection_healthy:
-                self._execute_speech_test()
-                time.sleep(self.speech_test_delay)
-            
-            # Phase 4: Enhanced Systems (if all previous phases successful)
-            if self.connection_healthy:
-                self._execute_enhanced_systems_setup()
-            
-            # Phase 5: Complete startup
+            # Complete startup
             self.startup_complete = True
             self.current_phase = StartupPhase.COMPLETE
             
@@ -122,6 +147,7 @@ class EnhancedStartupSequencing:
             # Test HTTP server by attempting Waiting Fidget command
             try:
                 test_success = self.main_app.ez_robot.send_auto_position("Waiting Fidget")
+                self._arc_command_sent()
                 if test_success:
                     self.connection_healthy = True
                     self.main_app.ez_robot_connected = True
@@ -176,6 +202,7 @@ class EnhancedStartupSequencing:
                     self.log_startup_event("eye_expression", "Fallback eye expression set to eyes_joy", True)
                 else:
                     self.log_startup_event("eye_expression", "No eye expression method available", False)
+            self._arc_command_sent()
                     
         except Exception as e:
             self.log_startup_event("eye_expression", f"Eye expression error: {e}", False)
@@ -195,70 +222,76 @@ class EnhancedStartupSequencing:
                 success = self.main_app._speak_to_computer_speakers("Startup speech test successful. I am initializing my knowledge system.")
                 if success:
                     self.log_startup_event("speech_test", "Speech test successful", True)
-                    
-                    # Immediately test body function by running waiting fidget
-                    if (self.main_app.ez_robot and 
-                        hasattr(self.main_app, 'ez_robot_connected') and 
-                        self.main_app.ez_robot_connected):
-                        try:
-                            # Check if EZ-Robot is actually responsive before testing
-                            if hasattr(self.main_app.ez_robot, 'test_connection'):
-                                connection_test = self.main_app.ez_robot.test_connection()
-                                if not connection_test:
-                                    self.log_startup_event("body_function_test", "EZ-Robot connection test failed - skipping body function test", False)
-                                    return
-                            
-                            # Try a simpler command first to test basic functionality
-                            try:
-                                # Test with a simple command first
-                                test_success = self.main_app.ez_robot.send_auto_position("Stop")
-                                if not test_success:
-                                    self.log_startup_event("body_function_test", "EZ-Robot basic command test failed", False)
-                                    return
-                            except Exception as test_e:
-                                self.log_startup_event("body_function_test", f"EZ-Robot basic command test error: {test_e}", False)
-                                return
-                            
-                            # 🔧 ENHANCEMENT: Try multiple fallback commands with better error handling
-                            fidget_commands = ["Waiting Fidget", "Fidget", "Stand", "Stop", "Wave"]
-                            fidget_success = False
-                            
-                            for cmd in fidget_commands:
-                                try:
-                                    self.logger.info(f"🔧 Trying body function test command: {cmd}")
-                                    success = self.main_app.ez_robot.send_auto_position(cmd)
-                                    if success:
-                                        self.log_startup_event("body_function_test", f"Body function test successful - {cmd} executed", True)
-                                        fidget_success = True
-                                        break
-                                    else:
-                                        self.logger.warning(f"⚠️ Command {cmd} failed, trying next...")
-                                except Exception as cmd_e:
-                                    self.logger.warning(f"⚠️ Command {cmd} error: {cmd_e}, trying next...")
-                                    continue
-                            
-                            if not fidget_success:
-                                # 🔧 ENHANCEMENT: Try HTTP command as final fallback
-                                try:
-                                    self.logger.info("🔧 Trying HTTP command as final fallback...")
-                                    http_success = self.main_app.ez_robot.send_auto_position("Stop")
-                                    if http_success:
-                                        self.log_startup_event("body_function_test", "Body function test successful - HTTP stop command executed", True)
-                                    else:
-                                        self.log_startup_event("body_function_test", "Body function test failed - all commands unsuccessful, but connection is working", False)
-                                except Exception as http_e:
-                                    self.log_startup_event("body_function_test", f"Body function test failed - HTTP fallback error: {http_e}", False)
-                        except Exception as e:
-                            self.log_startup_event("body_function_test", f"Body function test error: {e}", False)
-                    else:
-                        self.log_startup_event("body_function_test", "EZ-Robot not connected - skipping body function test", False)
-                else:
-                    self.log_startup_event("speech_test", "Speech test failed", False)
+                    return True
+                self.log_startup_event("speech_test", "Speech test failed", False)
             else:
                 self.log_startup_event("speech_test", "No speech test method available", False)
+            return False
                 
         except Exception as e:
             self.log_startup_event("speech_test", f"Speech test error: {e}", False)
+            return False
+    
+    def _execute_body_function_test(self):
+        """Test body function after a successful speech test by running waiting fidget."""
+        try:
+            self.current_phase = StartupPhase.BODY_FUNCTION_TEST
+            if not (self.main_app.ez_robot and 
+                    hasattr(self.main_app, 'ez_robot_connected') and 
+                    self.main_app.ez_robot_connected):
+                self.log_startup_event("body_function_test", "EZ-Robot not connected - skipping body function test", False)
+                return
+            
+            # Check if EZ-Robot is actually responsive before testing
+            if hasattr(self.main_app.ez_robot, 'test_connection'):
+                connection_test = self.main_app.ez_robot.test_connection()
+                if not connection_test:
+                    self.log_startup_event("body_function_test", "EZ-Robot connection test failed - skipping body function test", False)
+                    return
+            
+            # Try a simpler command first to test basic functionality
+            try:
+                # Test with a simple command first
+                test_success = self.main_app.ez_robot.send_auto_position("Stop")
+                self._arc_command_sent()
+                if not test_success:
+                    self.log_startup_event("body_function_test", "EZ-Robot basic command test failed", False)
+                    return
+            except Exception as test_e:
+                self.log_startup_event("body_function_test", f"EZ-Robot basic command test error: {test_e}", False)
+                return
+            
+            # 🔧 ENHANCEMENT: Try multiple fallback commands with better error handling
+            fidget_commands = ["Waiting Fidget", "Fidget", "Stand", "Stop", "Wave"]
+            fidget_success = False
+            
+            for cmd in fidget_commands:
+                try:
+                    self.logger.info(f"🔧 Trying body function test command: {cmd}")
+                    success = self.main_app.ez_robot.send_auto_position(cmd)
+                    if success:
+                        self.log_startup_event("body_function_test", f"Body function test successful - {cmd} executed", True)
+                        fidget_success = True
+                        break
+                    else:
+                        self.logger.warning(f"⚠️ Command {cmd} failed, trying next...")
+                except Exception as cmd_e:
+                    self.logger.warning(f"⚠️ Command {cmd} error: {cmd_e}, trying next...")
+                    continue
+            
+            if not fidget_success:
+                # 🔧 ENHANCEMENT: Try HTTP command as final fallback
+                try:
+                    self.logger.info("🔧 Trying HTTP command as final fallback...")
+                    http_success = self.main_app.ez_robot.send_auto_position("Stop")
+                    if http_success:
+                        self.log_startup_event("body_function_test", "Body function test successful - HTTP stop command executed", True)
+                    else:
+                        self.log_startup_event("body_function_test", "Body function test failed - all commands unsuccessful, but connection is working", False)
+                except Exception as http_e:
+                    self.log_startup_event("body_function_test", f"Body function test failed - HTTP fallback error: {http_e}", False)
+        except Exception as e:
+            self.log_startup_event("body_function_test", f"Body function test error: {e}", False)
     
     def _execute_enhanced_systems_setup(self):
         """Execute enhanced systems setup."""
@@ -290,7 +323,8 @@ class EnhancedStartupSequencing:
             'total_events': len(self.startup_log),
             'successful_events': len([e for e in self.startup_log if e['success']]),
             'failed_events': len([e for e in self.startup_log if not e['success']]),
-            'recent_events': self.startup_log[-5:] if self.startup_log else []
+            'recent_events': self.startup_log[-5:] if self.startup_log else [],
+            'timeline': self.startup_report.to_dict() if self.startup_report else None
         }
     
     def reset_startup(self):
@@ -301,4 +335,5 @@ class EnhancedStartupSequencing:
         self.startup_log.clear()
         self.connection_healthy = False
         self.consecutive_failures = 0
+        self.startup_report = None
         self.logger.info("🔄 Startup state reset for retry") 
\ No newline at end of file
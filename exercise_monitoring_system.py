@@ -6,8 +6,20 @@ Implements watchdog rules for exercise skills to stop based on:
 - Duration limits
 - Repetition limits  
 - NEUCOGAR fatigue thresholds
+
+Sessions are driven by a DeadlineScheduler instead of a once-a-second loop.
+When a session starts or its state changes, the next time a stop condition
+can trip is computed - the duration limit, the serotonin threshold (serotonin
+falls 0.1 per minute of exercise) and the energy safety limit from the
+fatigue model - and the scheduler sleeps until then. Repetition limits are
+checked when reps are counted. NEUCOGAR levels changed by other systems are
+re-read at least every ``sensor_check_interval`` seconds.
+
+Finished sessions are appended to a stats journal; the stats snapshot is
+rewritten only when the journal is compacted.
 """
 
+import os
 import json
 import logging
 import time
@@ -17,6 +29,24 @@ from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from exercise_scheduler import DeadlineScheduler, MonotonicClock
+from fatigue_modeling_system import FatigueModelingSystem
+
+SEROTONIN_DECLINE_PER_SECOND = 0.1 / 60.0  # 0.1 per minute of exercise
+SEROTONIN_STOP_LEVEL = 0.3  # Auto-stop below this
+DOPAMINE_MAX = 0.8
+NOREPINEPHRINE_MAX = 0.8
+
+# Safety metrics where a low value is the unsafe one
+LOWER_BOUND_SAFETY_METRICS = {"energy"}
+
+# Fatigue model activity for each exercise (default "exercise")
+FATIGUE_ACTIVITY_TYPES = {
+    "jump_jack": "jumping_jacks"
+}
+
+MIN_RECHECK_SECONDS = 0.001
+
 class ExerciseType(Enum):
     """Types of exercises."""
     CARDIO = "cardio"
@@ -64,6 +94,7 @@ class ExerciseSession:
     """Represents an active exercise session."""
     config: ExerciseConfig
     start_time: str
+    started_at: float = 0.0  # Scheduler clock reading at start
     current_duration: float = 0.0
     current_reps: int = 0
     is_active: bool = True
@@ -97,19 +128,48 @@ class ExerciseMonitoringSystem:
     def __init__(self, 
                  neucogar_engine=None,
                  ezrobot=None,
-                 stop_callback: Optional[Callable] = None):
+                 stop_callback: Optional[Callable] = None,
+                 fatigue_model: Optional[FatigueModelingSystem] = None,
+                 scheduler: Optional[DeadlineScheduler] = None,
+                 data_dir: str = "exercise"):
+        """
+        Initialize the monitoring system.
+        
+        Args:
+            neucogar_engine: NEUCOGAR engine for neurotransmitter levels
+            ezrobot: Robot interface
+            stop_callback: Called with (exercise_name, reason) on auto-stop
+            fatigue_model: Fatigue model sharing the scheduler's clock (created if None)
+            scheduler: Deadline scheduler (a real-time one if None)
+            data_dir: Directory for exercise configs and stats
+        """
         self.logger = logging.getLogger(__name__)
         self.neucogar_engine = neucogar_engine
         self.ezrobot = ezrobot
         self.stop_callback = stop_callback
         
+        self.scheduler = scheduler or DeadlineScheduler(fatigue_model.clock if fatigue_model else MonotonicClock())
+        self.clock = self.scheduler.clock
+        self.fatigue_model = fatigue_model or FatigueModelingSystem(clock=self.clock)
+        
         self.exercise_configs: Dict[str, ExerciseConfig] = {}
         self.active_sessions: Dict[str, ExerciseSession] = {}
         self.exercise_stats: Dict[str, ExerciseStats] = {}
+        self._lock = threading.RLock()
         
-        self.monitoring_thread = None
         self.monitoring_active = False
-        self.monitoring_interval = 1.0  # Check every second
+        self.sensor_check_interval = 5.0  # Longest sleep while NEUCOGAR levels may change externally
+        
+        self.data_dir = data_dir
+        self.configs_path = os.path.join(data_dir, "exercise_configs.json")
+        self.stats_path = os.path.join(data_dir, "exercise_stats.json")
+        self.journal_path = os.path.join(data_dir, "exercise_stats.journal.jsonl")
+        self.journal_compact_threshold = 100
+        self._journal_sequence = 0  # Last journal record applied to exercise_stats
+        self._journal_entries = 0  # Records in the journal file
+        
+        # Statistics
+        self.checks = 0
         
         self._load_exercise_configs()
         self._load_exercise_stats()
@@ -118,7 +178,7 @@ class ExerciseMonitoringSystem:
     def _load_exercise_configs(self):
         """Load exercise configurations from file."""
         try:
-            with open("exercise/exercise_configs.json", 'r') as f:
+            with open(self.configs_path, 'r') as f:
                 configs_data = json.load(f)
                 for config_data in configs_data:
                     config = ExerciseConfig(
@@ -138,27 +198,33 @@ class ExerciseMonitoringSystem:
         except Exception as e:
             self.logger.error(f"Error loading exercise configs: {e}")
     
+    def _write_json(self, path: str, data: Any):
+        """Write a JSON file atomically."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, path)
+    
     def _save_exercise_configs(self):
         """Save exercise configurations to file."""
         try:
-            import os
-            os.makedirs("exercise", exist_ok=True)
             configs_data = []
             for config in self.exercise_configs.values():
                 config_dict = asdict(config)
                 config_dict["exercise_type"] = config.exercise_type.value
                 configs_data.append(config_dict)
-            with open("exercise/exercise_configs.json", 'w') as f:
-                json.dump(configs_data, f, indent=2)
+            self._write_json(self.configs_path, configs_data)
             self.logger.info(f"Saved {len(self.exercise_configs)} exercise configurations")
         except Exception as e:
             self.logger.error(f"Error saving exercise configs: {e}")
     
     def _load_exercise_stats(self):
-        """Load exercise statistics from file."""
+        """Load the exercise statistics snapshot, then replay the journal."""
         try:
-            with open("exercise/exercise_stats.json", 'r') as f:
+            with open(self.stats_path, 'r') as f:
                 stats_data = json.load(f)
+                self._journal_sequence = stats_data.pop("_journal_sequence", 0)
                 for exercise_name, stats_dict in stats_data.items():
                     stats = ExerciseStats(
                         total_sessions=stats_dict.get("total_sessions", 0),
@@ -175,19 +241,88 @@ class ExerciseMonitoringSystem:
             self.logger.info("No exercise stats file found, will create defaults")
         except Exception as e:
             self.logger.error(f"Error loading exercise stats: {e}")
+        
+        try:
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Partially written last line
+                    self._journal_entries += 1
+                    if record.get("sequence", 0) > self._journal_sequence:
+                        self._apply_stats_record(record)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error replaying exercise stats journal: {e}")
+    
+    def _apply_stats_record(self, record: Dict[str, Any]):
+        """Add one finished session to the statistics."""
+        stats = self.exercise_stats.setdefault(record["exercise"], ExerciseStats())
+        stats.total_sessions += 1
+        stats.total_duration += record.get("duration", 0.0)
+        stats.total_reps += record.get("reps", 0)
+        stats.last_exercise_time = record.get("time")
+        
+        if record.get("completed"):
+            stats.sessions_completed += 1
+        else:
+            stats.sessions_stopped_early += 1
+        
+        # Calculate averages
+        stats.average_duration = stats.total_duration / stats.total_sessions
+        stats.average_reps = stats.total_reps / stats.total_sessions
+        self._journal_sequence = max(self._journal_sequence, record.get("sequence", 0))
+    
+    def _journal_session(self, session: ExerciseSession, reason: StopReason):
+        """Record a finished session in the statistics and append it to the journal."""
+        record = {
+            "sequence": self._journal_sequence + 1,
+            "exercise": session.config.name,
+            "duration": session.current_duration,
+            "reps": session.current_reps,
+            "completed": reason == StopReason.MANUAL_STOP,
+            "reason": reason.value,
+            "time": datetime.fromtimestamp(self.clock.wall()).isoformat()
+        }
+        self._apply_stats_record(record)
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            with open(self.journal_path, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+            self._journal_entries += 1
+        except Exception as e:
+            self.logger.error(f"Error journaling exercise stats: {e}")
+            return
+        if self._journal_entries >= self.journal_compact_threshold:
+            self.compact_stats()
     
     def _save_exercise_stats(self):
-        """Save exercise statistics to file."""
+        """Save the exercise statistics snapshot to file."""
         try:
-            import os
-            os.makedirs("exercise", exist_ok=True)
-            stats_data = {}
+            stats_data = {"_journal_sequence": self._journal_sequence}
             for exercise_name, stats in self.exercise_stats.items():
                 stats_data[exercise_name] = asdict(stats)
-            with open("exercise/exercise_stats.json", 'w') as f:
-                json.dump(stats_data, f, indent=2)
+            self._write_json(self.stats_path, stats_data)
+            return True
         except Exception as e:
             self.logger.error(f"Error saving exercise stats: {e}")
+            return False
+    
+    def compact_stats(self) -> bool:
+        """Fold the journal into the stats snapshot and truncate it."""
+        with self._lock:
+            if not self._save_exercise_stats():
+                return False
+            # Records up to _journal_sequence are in the snapshot, so a crash
+            # before the truncation only leaves records that replay skips
+            try:
+                open(self.journal_path, 'w').close()
+                self._journal_entries = 0
+            except Exception as e:
+                self.logger.error(f"Error truncating exercise stats journal: {e}")
+            return True
     
     def _register_default_exercises(self):
         """Register default exercise configurations."""
@@ -227,11 +362,14 @@ class ExerciseMonitoringSystem:
             )
         ]
         
+        added = 0
         for exercise in default_exercises:
             if exercise.name not in self.exercise_configs:
                 self.exercise_configs[exercise.name] = exercise
+                added += 1
         
-        self._save_exercise_configs()
+        if added:
+            self._save_exercise_configs()
     
     def start_exercise(self, exercise_name: str) -> bool:
         """Start monitoring an exercise session with neurotransmitter tracking."""
@@ -239,14 +377,25 @@ class ExerciseMonitoringSystem:
             self.logger.error(f"Unknown exercise: {exercise_name}")
             return False
         
-        if exercise_name in self.active_sessions:
-            self.logger.warning(f"Exercise {exercise_name} already active")
-            return False
+        with self._lock:
+            if exercise_name in self.active_sessions:
+                self.logger.warning(f"Exercise {exercise_name} already active")
+                return False
+            self._start_session(exercise_name)
         
+        # Start the scheduler thread if not already running
+        if not self.monitoring_active:
+            self._start_monitoring()
+        
+        return True
+    
+    def _start_session(self, exercise_name: str):
+        """Create the session and schedule its first check (lock held)."""
         config = self.exercise_configs[exercise_name]
         session = ExerciseSession(
             config=config,
-            start_time=datetime.now().isoformat()
+            start_time=datetime.fromtimestamp(self.clock.wall()).isoformat(),
+            started_at=self.clock.now()
         )
         
         # Record initial neurotransmitter levels
@@ -268,112 +417,117 @@ class ExerciseMonitoringSystem:
         if exercise_name not in self.exercise_stats:
             self.exercise_stats[exercise_name] = ExerciseStats()
         
+        self.fatigue_model.start_activity(FATIGUE_ACTIVITY_TYPES.get(exercise_name, "exercise"))
         self.logger.info(f"Started monitoring exercise: {exercise_name}")
-        
-        # Start monitoring thread if not already running
-        if not self.monitoring_active:
-            self._start_monitoring()
-        
-        return True
+        self._check_session(exercise_name)
     
     def stop_exercise(self, exercise_name: str, reason: StopReason = StopReason.MANUAL_STOP) -> bool:
         """Stop monitoring an exercise session."""
-        if exercise_name not in self.active_sessions:
-            self.logger.warning(f"Exercise {exercise_name} not active")
-            return False
-        
-        session = self.active_sessions[exercise_name]
-        session.is_active = False
-        session.stop_reason = reason
-        
-        # Update statistics
-        stats = self.exercise_stats[exercise_name]
-        stats.total_sessions += 1
-        stats.total_duration += session.current_duration
-        stats.total_reps += session.current_reps
-        stats.last_exercise_time = datetime.now().isoformat()
-        
-        if reason == StopReason.MANUAL_STOP:
-            stats.sessions_completed += 1
-        else:
-            stats.sessions_stopped_early += 1
-        
-        # Calculate averages
-        if stats.total_sessions > 0:
-            stats.average_duration = stats.total_duration / stats.total_sessions
-            stats.average_reps = stats.total_reps / stats.total_sessions
-        
-        # Save stats
-        self._save_exercise_stats()
-        
-        # Remove from active sessions
-        del self.active_sessions[exercise_name]
-        
-        self.logger.info(f"Stopped exercise {exercise_name}: {reason.value}")
+        with self._lock:
+            if exercise_name not in self.active_sessions:
+                self.logger.warning(f"Exercise {exercise_name} not active")
+                return False
+            
+            session = self.active_sessions[exercise_name]
+            self._update_session(session)
+            session.is_active = False
+            session.stop_reason = reason
+            self.scheduler.cancel(exercise_name)
+            
+            # Update and journal statistics
+            self._journal_session(session, reason)
+            
+            # Remove from active sessions
+            del self.active_sessions[exercise_name]
+            if not self.active_sessions:
+                self.fatigue_model.stop_activity()
+            
+            self.logger.info(f"Stopped exercise {exercise_name}: {reason.value}")
+            idle = not self.active_sessions
         
         # Stop monitoring if no active sessions
-        if not self.active_sessions and self.monitoring_active:
+        if idle and self.monitoring_active:
             self._stop_monitoring()
         
         return True
     
     def increment_reps(self, exercise_name: str, count: int = 1) -> bool:
         """Increment repetition count for an exercise."""
-        if exercise_name not in self.active_sessions:
-            return False
-        
-        session = self.active_sessions[exercise_name]
-        session.current_reps += count
-        
-        self.logger.info(f"Incremented reps for {exercise_name}: {session.current_reps}")
+        with self._lock:
+            if exercise_name not in self.active_sessions:
+                return False
+            
+            session = self.active_sessions[exercise_name]
+            session.current_reps += count
+            
+            self.logger.info(f"Incremented reps for {exercise_name}: {session.current_reps}")
+            config = session.config
+            if config.max_reps and session.current_reps >= config.max_reps:
+                self._check_session(exercise_name)
         return True
     
     def _start_monitoring(self):
-        """Start the monitoring thread."""
+        """Start the scheduler thread."""
         if self.monitoring_active:
             return
         
         self.monitoring_active = True
-        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitoring_thread.start()
+        self.scheduler.start()
         self.logger.info("Exercise monitoring started")
     
     def _stop_monitoring(self):
-        """Stop the monitoring thread."""
+        """Stop the scheduler thread."""
         self.monitoring_active = False
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=1.0)
+        self.scheduler.stop()
         self.logger.info("Exercise monitoring stopped")
     
-    def _monitoring_loop(self):
-        """Main monitoring loop."""
-        while self.monitoring_active:
-            try:
-                current_time = time.time()
-                
-                # Check each active session
-                for exercise_name, session in list(self.active_sessions.items()):
-                    if not session.is_active:
-                        continue
-                    
-                    # Update duration
-                    start_time = datetime.fromisoformat(session.start_time)
-                    session.current_duration = (datetime.now() - start_time).total_seconds()
-                    
-                    # Apply exercise duration effects (serotonin decrease over time)
-                    self._apply_exercise_duration_effects(session.current_duration)
-                    
-                    # Check stop conditions including neurotransmitter-based auto-stop
-                    stop_reason = self._check_stop_conditions(session)
-                    if stop_reason:
-                        self._handle_exercise_stop(exercise_name, stop_reason)
-                
-                # Sleep for monitoring interval
-                time.sleep(self.monitoring_interval)
-                
-            except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.monitoring_interval)
+    def _update_session(self, session: ExerciseSession):
+        """Bring a session's duration and serotonin decline up to the current time."""
+        elapsed = self.clock.now() - session.started_at
+        passed = elapsed - session.current_duration
+        session.current_duration = elapsed
+        if passed > 0:
+            self._apply_exercise_duration_effects(passed)
+    
+    def _check_session(self, exercise_name: str):
+        """Scheduled check: stop the session or schedule its next deadline."""
+        with self._lock:
+            session = self.active_sessions.get(exercise_name)
+            if session is None or not session.is_active:
+                return
+            self.checks += 1
+            self._update_session(session)
+            
+            # Check stop conditions including neurotransmitter-based auto-stop
+            stop_reason = self._check_stop_conditions(session)
+            if stop_reason:
+                self._handle_exercise_stop(exercise_name, stop_reason)
+                return
+            
+            delay = max(MIN_RECHECK_SECONDS, self._seconds_until_next_stop(session))
+            self.scheduler.schedule(exercise_name, self.clock.now() + delay,
+                                    lambda: self._check_session(exercise_name))
+    
+    def _seconds_until_next_stop(self, session: ExerciseSession) -> float:
+        """Earliest time at which a stop condition could trip."""
+        config = session.config
+        deadlines = [config.max_duration_seconds - session.current_duration]
+        
+        if self.neucogar_engine:
+            # Serotonin falls linearly; the highest threshold is crossed first
+            serotonin = session.fatigue_levels.get("serotonin", 0.5)
+            threshold = max(SEROTONIN_STOP_LEVEL, config.fatigue_thresholds.get("serotonin", 0.0))
+            deadlines.append((serotonin - threshold) / SEROTONIN_DECLINE_PER_SECOND)
+            # Other levels only change externally
+            deadlines.append(self.sensor_check_interval)
+        
+        for metric, limit in config.safety_limits.items():
+            if metric == "energy":
+                seconds = self.fatigue_model.seconds_until_energy(limit)
+                if seconds is not None:
+                    deadlines.append(seconds)
+        
+        return min(deadlines)
     
     def _check_stop_conditions(self, session: ExerciseSession) -> Optional[StopReason]:
         """Check if exercise should be stopped."""
@@ -395,19 +549,19 @@ class ExerciseMonitoringSystem:
                 
                 # Check serotonin threshold (auto-stop if serotonin < 0.3)
                 serotonin_level = fatigue_levels.get("serotonin", 0.5)
-                if serotonin_level < 0.3:
+                if serotonin_level < SEROTONIN_STOP_LEVEL:
                     self.logger.info(f"Serotonin threshold reached: {serotonin_level:.3f} < 0.3")
                     return StopReason.FATIGUE_THRESHOLD
                 
                 # Check dopamine maximum (auto-stop if dopamine > 0.8)
                 dopamine_level = fatigue_levels.get("dopamine", 0.5)
-                if dopamine_level > 0.8:
+                if dopamine_level > DOPAMINE_MAX:
                     self.logger.info(f"Dopamine maximum reached: {dopamine_level:.3f} > 0.8")
                     return StopReason.FATIGUE_THRESHOLD
                 
                 # Check norepinephrine maximum (auto-stop if norepinephrine > 0.8)
                 norepinephrine_level = fatigue_levels.get("norepinephrine", 0.5)
-                if norepinephrine_level > 0.8:
+                if norepinephrine_level > NOREPINEPHRINE_MAX:
                     self.logger.info(f"Norepinephrine maximum reached: {norepinephrine_level:.3f} > 0.8")
                     return StopReason.FATIGUE_THRESHOLD
                 
@@ -417,19 +571,26 @@ class ExerciseMonitoringSystem:
                     if current_level <= threshold:
                         self.logger.info(f"Legacy fatigue threshold reached: {nt} = {current_level:.3f} <= {threshold}")
                         return StopReason.FATIGUE_THRESHOLD
-                
-                # Check safety limits
-                safety_metrics = self._get_safety_metrics()
-                session.safety_metrics = safety_metrics
-                
-                for metric, limit in config.safety_limits.items():
-                    current_value = safety_metrics.get(metric, 0.5)
-                    if current_value >= limit:
-                        self.logger.info(f"Safety limit reached: {metric} = {current_value:.3f} >= {limit}")
-                        return StopReason.SAFETY_LIMIT
                         
             except Exception as e:
-                self.logger.error(f"Error checking fatigue/safety levels: {e}")
+                self.logger.error(f"Error checking fatigue levels: {e}")
+        
+        # Check safety limits
+        try:
+            safety_metrics = self._get_safety_metrics()
+            session.safety_metrics = safety_metrics
+            
+            for metric, limit in config.safety_limits.items():
+                current_value = safety_metrics.get(metric, 0.5)
+                if metric in LOWER_BOUND_SAFETY_METRICS:
+                    if current_value <= limit:
+                        self.logger.info(f"Safety limit reached: {metric} = {current_value:.3f} <= {limit}")
+                        return StopReason.SAFETY_LIMIT
+                elif current_value >= limit:
+                    self.logger.info(f"Safety limit reached: {metric} = {current_value:.3f} >= {limit}")
+                    return StopReason.SAFETY_LIMIT
+        except Exception as e:
+            self.logger.error(f"Error checking safety levels: {e}")
         
         return None
     
@@ -462,7 +623,12 @@ class ExerciseMonitoringSystem:
             self.logger.error(f"Error applying exercise start effects: {e}")
     
     def _apply_exercise_duration_effects(self, duration_seconds: float):
-        """Apply neurotransmitter changes based on exercise duration."""
+        """
+        Apply the serotonin decline for exercise time since the last check.
+        
+        Args:
+            duration_seconds: Exercise seconds not yet applied
+        """
         if not self.neucogar_engine:
             return
         
@@ -472,7 +638,7 @@ class ExerciseMonitoringSystem:
             
             # Serotonin decreases over time during exercise
             # Decrease rate: 0.1 per minute (0.00167 per second)
-            serotonin_decrease = (duration_seconds / 60.0) * 0.1
+            serotonin_decrease = duration_seconds * SEROTONIN_DECLINE_PER_SECOND
             new_serotonin = max(0.0, current_nt["serotonin"] - serotonin_decrease)
             
             # Update NEUCOGAR engine with new serotonin level
@@ -480,7 +646,7 @@ class ExerciseMonitoringSystem:
                 "serotonin": new_serotonin
             })
             
-            self.logger.info(f"Applied exercise duration effects: 5-HT={new_serotonin:.3f} (duration: {duration_seconds:.1f}s)")
+            self.logger.debug(f"Applied exercise duration effects: 5-HT={new_serotonin:.3f} (+{duration_seconds:.1f}s)")
             
         except Exception as e:
             self.logger.error(f"Error applying exercise duration effects: {e}")
@@ -504,11 +670,12 @@ class ExerciseMonitoringSystem:
     
     def _get_safety_metrics(self) -> Dict[str, float]:
         """Get current safety metrics."""
-        # This would integrate with actual sensors in a real implementation
-        # For now, return simulated values
+        # Heart rate and stress would integrate with actual sensors in a real
+        # implementation; energy comes from the fatigue model
+        self.fatigue_model.update_fatigue()
         return {
             "heart_rate": 0.6,  # 60% of max heart rate
-            "energy": 0.7,      # 70% energy level
+            "energy": self.fatigue_model.current_energy,
             "stress": 0.3       # 30% stress level
         }
     
@@ -613,6 +780,16 @@ class ExerciseMonitoringSystem:
         return {
             name: asdict(stats) for name, stats in self.exercise_stats.items()
         }
+    
+    def get_monitoring_stats(self) -> Dict[str, Any]:
+        """Get scheduler and journal statistics."""
+        return {
+            'active_sessions': len(self.active_sessions),
+            'checks': self.checks,
+            'journal_entries': self._journal_entries,
+            'journal_sequence': self._journal_sequence,
+            'scheduler': self.scheduler.get_stats()
+        }
 
 # Global instance
 exercise_monitoring_system = ExerciseMonitoringSystem()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Exercise Scheduler
+==================
+
+Deadline scheduler shared by exercise monitoring and fatigue modeling.
+
+Exercise monitoring used to wake every second and re-derive each session's
+duration from its ISO start time. The stop conditions (duration limit,
+neurotransmitter thresholds, energy limits) follow known curves, so the time
+each one will trip can be computed when a session starts or changes. The
+scheduler keeps one deadline per key in a heap and sleeps until the earliest
+one (or until a deadline is added or moved).
+
+Time comes from a clock object:
+
+- ``MonotonicClock`` - real time, time.monotonic() for deadlines,
+- ``SimulatedClock`` - time only moves when ``DeadlineScheduler.advance`` is
+  called, which runs every deadline it passes in order, so an hour of
+  exercise can be tested in milliseconds.
+"""
+
+import time
+import heapq
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class MonotonicClock:
+    """Real time."""
+
+    simulated = False
+
+    def now(self) -> float:
+        """Seconds on the monotonic clock (for durations and deadlines)."""
+        return time.monotonic()
+
+    def wall(self) -> float:
+        """Wall-clock time (for timestamps)."""
+        return time.time()
+
+
+class SimulatedClock:
+    """Time that only moves when told to."""
+
+    simulated = True
+
+    def __init__(self, start: float = 0.0, wall_start: Optional[float] = None):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial monotonic reading
+            wall_start: Wall-clock time at the initial reading (time.time() if None)
+        """
+        self._start = start
+        self._now = start
+        self._wall_start = time.time() if wall_start is None else wall_start
+
+    def now(self) -> float:
+        return self._now
+
+    def wall(self) -> float:
+        return self._wall_start + (self._now - self._start)
+
+    def set(self, now: float):
+        """Move the clock forward to now (never backward)."""
+        self._now = max(self._now, now)
+
+
+class DeadlineScheduler:
+    """
+    One pending deadline per key, run in deadline order.
+    """
+
+    def __init__(self, clock=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            clock: MonotonicClock (default) or SimulatedClock
+        """
+        self.clock = clock or MonotonicClock()
+        self.logger = logging.getLogger(__name__)
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._pending: Dict[Hashable, Tuple[float, int, Callable[[], Any]]] = {}
+        self._sequence = 0
+        self._condition = threading.Condition(threading.RLock())
+        self._thread: Optional[threading.Thread] = None
+        self._thread_active = False
+        self._running = False
+
+        # Statistics
+        self.callbacks_run = 0
+        self.wakeups = 0
+
+    def schedule(self, key: Hashable, deadline: float, callback: Callable[[], Any]):
+        """
+        Run callback at deadline, replacing any pending deadline for key.
+
+        Args:
+            key: Identity of the deadline (e.g. the exercise name)
+            deadline: Clock reading at which to run
+            callback: Called with no arguments
+        """
+        with self._condition:
+            self._sequence += 1
+            self._pending[key] = (deadline, self._sequence, callback)
+            heapq.heappush(self._heap, (deadline, self._sequence, key))
+            self._condition.notify()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the pending deadline for key."""
+        with self._condition:
+            removed = self._pending.pop(key, None) is not None
+            self._condition.notify()
+            return removed
+
+    def _peek(self) -> Optional[Tuple[float, int, Hashable]]:
+        """Earliest live heap entry (lock held); stale entries are dropped."""
+        while self._heap:
+            deadline, sequence, key = self._heap[0]
+            pending = self._pending.get(key)
+            if pending is not None and pending[1] == sequence:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest pending deadline (None if nothing is scheduled)."""
+        with self._condition:
+            entry = self._peek()
+            return entry[0] if entry else None
+
+    def run_due(self) -> int:
+        """
+        Run every callback whose deadline has passed.
+
+        Returns:
+            Number of callbacks run
+        """
+        ran = 0
+        while True:
+            with self._condition:
+                entry = self._peek()
+                if entry is None or entry[0] > self.clock.now():
+                    return ran
+                heapq.heappop(self._heap)
+                _, _, callback = self._pending.pop(entry[2])
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error in scheduled callback {entry[2]}: {e}")
+            ran += 1
+            self.callbacks_run += 1
+
+    def advance(self, seconds: float) -> int:
+        """
+        Move a simulated clock forward, running deadlines at their own times.
+
+        Args:
+            seconds: Simulated time to pass
+
+        Returns:
+            Number of callbacks run
+        """
+        if not getattr(self.clock, 'simulated', False):
+            raise RuntimeError("advance() needs a SimulatedClock")
+        target = self.clock.now() + seconds
+        ran = 0
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            self.clock.set(deadline)
+            ran += self.run_due()
+        self.clock.set(target)
+        return ran + self.run_due()
+
+    def start(self):
+        """Start the background thread (real clocks only)."""
+        if getattr(self.clock, 'simulated', False):
+            return
+        with self._condition:
+            self._running = True
+            if self._thread_active:
+                return  # A thread that was asked to stop hasn't exited yet; it keeps going
+            self._thread_active = True
+            self._thread = threading.Thread(target=self._run, name="ExerciseScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the background thread; pending deadlines are kept."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+            thread = self._thread
+        # A callback may stop the scheduler from the scheduler thread itself
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._running:
+                    self._thread_active = False
+                    return
+                entry = self._peek()
+                timeout = None if entry is None else entry[0] - self.clock.now()
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+                    self.wakeups += 1
+                    continue
+            self.run_due()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        with self._condition:
+            return {
+                'pending': len(self._pending),
+                'next_deadline_in': None if self._peek() is None else self._peek()[0] - self.clock.now(),
+                'callbacks_run': self.callbacks_run,
+                'wakeups': self.wakeups,
+                'simulated': getattr(self.clock, 'simulated', False)
+            }
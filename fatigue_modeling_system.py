@@ -13,6 +13,13 @@ The system models:
 - Recovery patterns during rest
 - Effects on neurotransmitter levels
 - Individual variation in fatigue response
+
+Fatigue and energy change linearly at the per-second rates below, so the
+state is computed from the time elapsed since the last update rather than
+accumulated per call; how often ``update_fatigue`` is called doesn't change
+the result. Time comes from a clock (see exercise_scheduler), which lets the
+exercise monitor predict when energy will reach a limit and lets tests run
+on a simulated clock.
 """
 
 import math
@@ -20,6 +27,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from exercise_scheduler import MonotonicClock
+
 @dataclass
 class ActivityState:
     """Represents the current state of physical activity."""
@@ -29,6 +38,7 @@ class ActivityState:
     duration: float  # seconds
     energy_expended: float  # 0.0 to 1.0
     fatigue_level: float  # 0.0 to 1.0
+    started_at: float = 0.0  # clock.now() at start
 
 @dataclass
 class FatigueEffects:
@@ -45,8 +55,15 @@ class FatigueModelingSystem:
     System for modeling fatigue and its effects on CARL's cognitive and emotional state.
     """
     
-    def __init__(self):
-        """Initialize the fatigue modeling system."""
+    def __init__(self, clock=None):
+        """
+        Initialize the fatigue modeling system.
+        
+        Args:
+            clock: MonotonicClock (default) or SimulatedClock
+        """
+        self.clock = clock or MonotonicClock()
+        self._updated_at = self.clock.now()  # Time energy/fatigue were last brought up to date
         
         # Energy and fatigue parameters
         self.max_energy = 1.0
@@ -106,9 +123,55 @@ class FatigueModelingSystem:
         }
         
         # Session tracking
-        self.session_start_time = datetime.now()
+        self.session_start_time = self._wall_time()
         self.fatigue_events = []
     
+    def _wall_time(self) -> datetime:
+        return datetime.fromtimestamp(self.clock.wall())
+    
+    def _advance(self):
+        """Bring energy and fatigue up to the current clock time."""
+        now = self.clock.now()
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        
+        if self.current_activity:
+            # Fatigue builds at the activity's rate; energy loss is proportional to it
+            fatigue_rate = self.fatigue_rates.get(self.current_activity.activity_type, 0.01)
+            fatigue_increase = min(1.0 - self.fatigue_level, fatigue_rate * self.current_activity.intensity * elapsed)
+            self.fatigue_level += max(0.0, fatigue_increase)
+            self.current_energy = max(0.1, self.current_energy - max(0.0, fatigue_increase) * 0.8)
+            self.current_activity.duration = now - self.current_activity.started_at
+        else:
+            # Recovery mode - reduce fatigue and increase energy
+            recovery_rate = self.recovery_rates.get("rest", 0.008)
+            self.fatigue_level = max(0.0, self.fatigue_level - recovery_rate * 0.1 * elapsed)  # Slower recovery
+            self.current_energy = min(self.max_energy, self.current_energy + recovery_rate * 0.05 * elapsed)
+    
+    def seconds_until_energy(self, level: float) -> Optional[float]:
+        """
+        Time until energy drops to a level if the current activity continues.
+        
+        Args:
+            level: Energy level
+            
+        Returns:
+            Seconds (0.0 if already at or below it), None if it won't be reached
+        """
+        self._advance()
+        if self.current_energy <= level:
+            return 0.0
+        if not self.current_activity or level < 0.1:
+            return None
+        fatigue_rate = self.fatigue_rates.get(self.current_activity.activity_type, 0.01) * self.current_activity.intensity
+        if fatigue_rate <= 0:
+            return None
+        seconds = (self.current_energy - level) / (fatigue_rate * 0.8)
+        # Energy stops dropping once fatigue is at its maximum
+        if seconds > (1.0 - self.fatigue_level) / fatigue_rate:
+            return None
+        return seconds
+    
     def start_activity(self, activity_type: str, intensity: float = 1.0) -> Dict:
         """
         Start tracking a new physical activity.
@@ -123,20 +186,22 @@ class FatigueModelingSystem:
         # Stop current activity if any
         if self.current_activity:
             self.stop_activity()
+        self._advance()
         
         # Create new activity state
         self.current_activity = ActivityState(
             activity_type=activity_type,
             intensity=intensity,
-            start_time=datetime.now(),
+            start_time=self._wall_time(),
             duration=0.0,
             energy_expended=0.0,
-            fatigue_level=0.0
+            fatigue_level=0.0,
+            started_at=self.clock.now()
         )
         
         # Log activity start
         event = {
-            "timestamp": datetime.now(),
+            "timestamp": self._wall_time(),
             "event_type": "activity_start",
             "activity_type": activity_type,
             "intensity": intensity,
@@ -163,8 +228,8 @@ class FatigueModelingSystem:
             return {"error": "No activity currently running"}
         
         # Calculate final activity metrics
-        end_time = datetime.now()
-        duration = (end_time - self.current_activity.start_time).total_seconds()
+        self._advance()
+        duration = self.current_activity.duration
         
         # Update activity state
         self.current_activity.duration = duration
@@ -184,7 +249,7 @@ class FatigueModelingSystem:
         
         # Log activity end
         event = {
-            "timestamp": datetime.now(),
+            "timestamp": self._wall_time(),
             "event_type": "activity_end",
             "activity_type": self.current_activity.activity_type,
             "duration": duration,
@@ -214,32 +279,7 @@ class FatigueModelingSystem:
         Returns:
             Dict containing current fatigue state
         """
-        current_time = datetime.now()
-        
-        if self.current_activity:
-            # Update activity duration
-            duration = (current_time - self.current_activity.start_time).total_seconds()
-            self.current_activity.duration = duration
-            
-            # Calculate fatigue from current activity
-            fatigue_rate = self.fatigue_rates.get(self.current_activity.activity_type, 0.01)
-            fatigue_increase = fatigue_rate * duration * self.current_activity.intensity
-            
-            # Update fatigue level
-            self.fatigue_level = min(1.0, self.fatigue_level + fatigue_increase)
-            
-            # Calculate energy loss
-            energy_loss = fatigue_increase * 0.8  # Energy loss proportional to fatigue
-            self.current_energy = max(0.1, self.current_energy - energy_loss)
-            
-        else:
-            # Recovery mode - reduce fatigue and increase energy
-            recovery_rate = self.recovery_rates.get("rest", 0.008)
-            fatigue_decrease = recovery_rate * 0.1  # Slower recovery
-            energy_gain = recovery_rate * 0.05
-            
-            self.fatigue_level = max(0.0, self.fatigue_level - fatigue_decrease)
-            self.current_energy = min(self.max_energy, self.current_energy + energy_gain)
+        self._advance()
         
         return {
             "current_energy": self.current_energy,
@@ -290,7 +330,8 @@ class FatigueModelingSystem:
             }
         
         # Calculate session statistics
-        session_duration = (datetime.now() - self.session_start_time).total_seconds()
+        self._advance()
+        session_duration = (self._wall_time() - self.session_start_time).total_seconds()
         total_activities = len(self.activity_history)
         total_energy_expended = sum(activity.energy_expended for activity in self.activity_history)
         
@@ -339,6 +380,7 @@ class FatigueModelingSystem:
     
     def reset_fatigue(self):
         """Reset fatigue levels (for testing or new session)."""
+        self._updated_at = self.clock.now()
         self.current_energy = self.max_energy
         self.fatigue_level = 0.0
         self.current_activity = None
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Game Solver
+===========
+
+Local negamax solver for the grid games in games/*.json (tic-tac-toe and other
+k-in-a-row games such as connect four).
+
+CARL's move used to come from the LLM (one round trip per move) or from the
+win/block/center/corner priority list. The solver searches the game tree
+locally instead:
+
+- the board is two bitboards (one per player); every winning line is a
+  precomputed bitmask, so checking a win is a handful of AND operations,
+- negamax with alpha-beta pruning and iterative deepening under a time
+  budget; small games (tic-tac-toe) are solved exactly within the budget,
+- a transposition table keyed by a Zobrist hash of the position stores
+  bounds and the best move, shared across moves of the same game,
+- positions cut off by the budget are scored by open lines.
+
+The game rules come from the game JSON: ``rules_config.board_size``
+(default 3x3), ``rules_config.win_length`` (default the shorter board side),
+``rules_config.gravity`` (pieces drop to the lowest empty cell of a column)
+and ``rules_config.symbols``.
+"""
+
+import time
+import random
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+WIN_SCORE = 1_000_000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class GridGameSpec:
+    """
+    Rules of a k-in-a-row grid game with precomputed line masks.
+    """
+
+    def __init__(self, rows: int = 3, cols: int = 3, win_length: Optional[int] = None, gravity: bool = False):
+        """
+        Initialize the game rules.
+
+        Args:
+            rows: Board rows
+            cols: Board columns
+            win_length: Pieces in a row needed to win (shorter side if None)
+            gravity: Pieces drop to the lowest empty cell of the chosen column
+        """
+        self.rows = rows
+        self.cols = cols
+        self.win_length = win_length or min(rows, cols)
+        self.gravity = gravity
+        self.cells = rows * cols
+        self.full_mask = (1 << self.cells) - 1
+
+        self.lines: List[int] = []
+        for r in range(rows):
+            for c in range(cols):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r = r + dr * (self.win_length - 1)
+                    end_c = c + dc * (self.win_length - 1)
+                    if 0 <= end_r < rows and 0 <= end_c < cols:
+                        mask = 0
+                        for i in range(self.win_length):
+                            mask |= 1 << self.bit(r + dr * i, c + dc * i)
+                        self.lines.append(mask)
+        # Lines through each cell, for incremental win checks after a move
+        self.cell_lines: List[List[int]] = [
+            [mask for mask in self.lines if mask >> cell & 1] for cell in range(self.cells)
+        ]
+
+        # Search moves near the center first
+        center_r, center_c = (rows - 1) / 2.0, (cols - 1) / 2.0
+        self.move_order = sorted(range(self.cells),
+                                 key=lambda cell: (abs(cell // cols - center_r) + abs(cell % cols - center_c), cell))
+
+    @classmethod
+    def from_game_data(cls, game_data: Dict[str, Any]) -> Optional['GridGameSpec']:
+        """Rules of a game JSON, or None if it isn't a grid game."""
+        board = game_data.get("board")
+        rules = game_data.get("rules_config") or {}
+        size = rules.get("board_size")
+        if isinstance(size, (list, tuple)) and len(size) == 2:
+            rows, cols = int(size[0]), int(size[1])
+        elif isinstance(board, list) and board and isinstance(board[0], list):
+            rows, cols = len(board), len(board[0])
+        else:
+            return None
+        if rows <= 0 or cols <= 0:
+            return None
+        return cls(rows, cols, rules.get("win_length"), bool(rules.get("gravity", False)))
+
+    def bit(self, row: int, col: int) -> int:
+        return row * self.cols + col
+
+    def to_bitboards(self, board: List[List[str]], my_symbol: str, opp_symbol: str) -> Tuple[int, int]:
+        """Bitboards (mine, opponent's) of a board of symbols."""
+        mine = opp = 0
+        for r, row in enumerate(board[:self.rows]):
+            for c, cell in enumerate(row[:self.cols]):
+                if cell == my_symbol:
+                    mine |= 1 << self.bit(r, c)
+                elif cell == opp_symbol:
+                    opp |= 1 << self.bit(r, c)
+        return mine, opp
+
+    def is_win(self, pieces: int) -> bool:
+        return any(pieces & mask == mask for mask in self.lines)
+
+    def wins_with(self, pieces: int, cell: int) -> bool:
+        """Whether the piece just placed on cell completes a line."""
+        return any(pieces & mask == mask for mask in self.cell_lines[cell])
+
+    def legal_moves(self, occupied: int) -> List[int]:
+        """Legal cells in search order."""
+        if self.gravity:
+            moves = []
+            for col in range(self.cols):
+                for row in range(self.rows - 1, -1, -1):
+                    cell = self.bit(row, col)
+                    if not occupied >> cell & 1:
+                        moves.append(cell)
+                        break
+            center = (self.cols - 1) / 2.0
+            return sorted(moves, key=lambda cell: (abs(cell % self.cols - center), cell))
+        return [cell for cell in self.move_order if not occupied >> cell & 1]
+
+    def is_legal(self, board: List[List[str]], row: int, col: int) -> bool:
+        if not (0 <= row < self.rows and 0 <= col < self.cols) or board[row][col] != "":
+            return False
+        return not self.gravity or row == self.rows - 1 or board[row + 1][col] != ""
+
+    def outcome(self, board: List[List[str]], symbols: Dict[str, str]) -> Dict[str, Any]:
+        """Game status ("win"/"draw"/"ongoing") and winner of a board."""
+        occupied = 0
+        for player, symbol in symbols.items():
+            pieces, _ = self.to_bitboards(board, symbol, None)
+            occupied |= pieces
+            if self.is_win(pieces):
+                return {"status": "win", "winner": player}
+        if occupied == self.full_mask:
+            return {"status": "draw", "winner": None}
+        return {"status": "ongoing", "winner": None}
+
+    def evaluate(self, mine: int, opp: int) -> int:
+        """Heuristic score of an unfinished position for the side to move."""
+        score = 0
+        for mask in self.lines:
+            if not opp & mask:
+                score += 4 ** bin(mine & mask).count("1") - 1
+            if not mine & mask:
+                score -= 4 ** bin(opp & mask).count("1") - 1
+        return score
+
+
+class GameSolver:
+    """
+    Negamax/alpha-beta solver with a Zobrist-hashed transposition table.
+    """
+
+    def __init__(self, spec: GridGameSpec, time_budget: float = 0.5, max_table_size: int = 1_000_000, seed: int = 2024):
+        """
+        Initialize the solver.
+
+        Args:
+            spec: Game rules
+            time_budget: Seconds per move before the search stops deepening
+            max_table_size: Transposition table entries kept before it is cleared
+            seed: Seed of the Zobrist keys
+        """
+        self.spec = spec
+        self.time_budget = time_budget
+        self.max_table_size = max_table_size
+        self.logger = logging.getLogger(__name__)
+
+        rng = random.Random(seed)
+        # Keys for (cell, side) where side 0 is the player to move at the root
+        self.zobrist = [[rng.getrandbits(64) for _ in range(2)] for _ in range(spec.cells)]
+        self.side_key = rng.getrandbits(64)
+        self.table: Dict[int, Tuple[int, int, int, int]] = {}  # hash -> (depth, flag, score, best cell)
+
+        self._deadline = 0.0
+        self.nodes = 0
+
+        # Statistics
+        self.searches = 0
+        self.total_nodes = 0
+        self.tt_hits = 0
+        self.total_seconds = 0.0
+        self.solved_exactly = 0
+
+    def _hash(self, mine: int, opp: int) -> int:
+        h = 0
+        for cell in range(self.spec.cells):
+            if mine >> cell & 1:
+                h ^= self.zobrist[cell][0]
+            elif opp >> cell & 1:
+                h ^= self.zobrist[cell][1]
+        return h
+
+    def _negamax(self, mine: int, opp: int, h: int, depth: int, alpha: int, beta: int, ply: int) -> Tuple[int, bool]:
+        """
+        Score of the position for the side to move.
+
+        ``mine`` always holds the pieces of the side to move; the hash keys
+        pieces by root side, so the side_key tracks whose turn it is.
+
+        Returns:
+            (score, exact) where exact is False if the search was cut off by depth
+        """
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.monotonic() > self._deadline:
+            raise SearchTimeout()
+
+        occupied = mine | opp
+        if occupied == self.spec.full_mask:
+            return 0, True
+        if depth == 0:
+            return self.spec.evaluate(mine, opp), False
+
+        alpha_orig = alpha
+        best_cell = -1
+        entry = self.table.get(h)
+        if entry is not None:
+            entry_depth, flag, score, best_cell = entry
+            score = self._from_table(score, ply)
+            if entry_depth >= depth:
+                self.tt_hits += 1
+                # Only entries whose subtree was searched to the end are solved results
+                solved = entry_depth >= self.spec.cells
+                if flag == EXACT:
+                    return score, solved
+                if flag == LOWER:
+                    alpha = max(alpha, score)
+                elif flag == UPPER:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score, solved
+
+        moves = self.spec.legal_moves(occupied)
+        if best_cell in moves:
+            moves.remove(best_cell)
+            moves.insert(0, best_cell)
+
+        side = ply & 1
+        best_score = -WIN_SCORE - 1
+        exact = True
+        for cell in moves:
+            placed = mine | (1 << cell)
+            if self.spec.wins_with(placed, cell):
+                score, child_exact = WIN_SCORE - ply, True
+            else:
+                child_hash = h ^ self.zobrist[cell][side] ^ self.side_key
+                score, child_exact = self._negamax(opp, placed, child_hash, depth - 1, -beta, -alpha, ply + 1)
+                score = -score
+            exact = exact and child_exact
+            if score > best_score:
+                best_score, best_cell = score, cell
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if len(self.table) >= self.max_table_size:
+            self.table.clear()
+        # Subtrees searched to the end are valid at any depth
+        self.table[h] = (self.spec.cells if exact else depth, flag, self._to_table(best_score, ply), best_cell)
+        return best_score, exact
+
+    def _to_table(self, score: int, ply: int) -> int:
+        """Store win scores relative to the node, so entries are valid at any ply."""
+        if score >= WIN_SCORE - self.spec.cells:
+            return score + ply
+        if score <= -(WIN_SCORE - self.spec.cells):
+            return score - ply
+        return score
+
+    def _from_table(self, score: int, ply: int) -> int:
+        if score >= WIN_SCORE - self.spec.cells:
+            return score - ply
+        if score <= -(WIN_SCORE - self.spec.cells):
+            return score + ply
+        return score
+
+    def search(self, mine: int, opp: int, time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Best move for the side owning ``mine``.
+
+        Args:
+            mine: Bitboard of the side to move
+            opp: Bitboard of the opponent
+            time_budget: Seconds for this search (solver default if None)
+
+        Returns:
+            Dictionary with cell, score, depth, exact, nodes and elapsed_ms
+        """
+        start = time.monotonic()
+        self._deadline = start + (self.time_budget if time_budget is None else time_budget)
+        self.nodes = 0
+        occupied = mine | opp
+        moves = self.spec.legal_moves(occupied)
+        result = {"cell": moves[0] if moves else None, "score": 0, "depth": 0, "exact": False}
+
+        # Root hash relative to the side to move (ply 0 uses key column 0)
+        h = self._hash(mine, opp)
+        max_depth = self.spec.cells - bin(occupied).count("1")
+        for depth in range(1, max_depth + 1):
+            try:
+                best_score, best_cell, exact = -WIN_SCORE - 1, None, True
+                alpha = -WIN_SCORE - 1
+                ordered = list(moves)
+                if result["cell"] in ordered:
+                    ordered.remove(result["cell"])
+                    ordered.insert(0, result["cell"])
+                for cell in ordered:
+                    placed = mine | (1 << cell)
+                    if self.spec.wins_with(placed, cell):
+                        score, child_exact = WIN_SCORE, True
+                    else:
+                        score, child_exact = self._negamax(opp, placed, h ^ self.zobrist[cell][0] ^ self.side_key,
+                                                           depth - 1, -WIN_SCORE - 1, -alpha, 1)
+                        score = -score
+                    exact = exact and child_exact
+                    if score > best_score:
+                        best_score, best_cell = score, cell
+                        alpha = max(alpha, score)
+            except SearchTimeout:
+                break
+            result = {"cell": best_cell, "score": best_score, "depth": depth, "exact": exact}
+            if exact or abs(best_score) >= WIN_SCORE - self.spec.cells:
+                break
+
+        elapsed = time.monotonic() - start
+        self.searches += 1
+        self.total_nodes += self.nodes
+        self.total_seconds += elapsed
+        if result["exact"]:
+            self.solved_exactly += 1
+        result.update({"nodes": self.nodes, "elapsed_ms": 1000.0 * elapsed})
+        return result
+
+    def choose_move(self, board: List[List[str]], my_symbol: str, opp_symbol: str,
+                    time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Best move on a board of symbols.
+
+        Returns:
+            Dictionary with move ([row, col] or None), outcome ("win"/"draw"/"loss"/None if
+            not solved), score, depth, exact, nodes and elapsed_ms
+        """
+        mine, opp = self.spec.to_bitboards(board, my_symbol, opp_symbol)
+        result = self.search(mine, opp, time_budget)
+        cell = result.pop("cell")
+        result["move"] = None if cell is None else [cell // self.spec.cols, cell % self.spec.cols]
+        outcome = None
+        if result["score"] >= WIN_SCORE - self.spec.cells:
+            outcome = "win"
+        elif result["score"] <= -(WIN_SCORE - self.spec.cells):
+            outcome = "loss"
+        elif result["exact"]:
+            outcome = "draw"
+        result["outcome"] = outcome
+        return result
+
+    def describe(self, result: Dict[str, Any]) -> str:
+        """First-person reasoning for a chosen move."""
+        outcome = result.get("outcome")
+        if outcome == "win":
+            return "I can force a win from here"
+        if outcome == "loss":
+            return "This is my best defense"
+        if outcome == "draw":
+            return "With best play this ends in a draw, so I'm keeping it safe"
+        return f"Looking {result.get('depth', 0)} moves ahead, this is my strongest option"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get solver statistics."""
+        return {
+            'searches': self.searches,
+            'solved_exactly': self.solved_exactly,
+            'table_size': len(self.table),
+            'tt_hits': self.tt_hits,
+            'avg_nodes': self.total_nodes / self.searches if self.searches else 0.0,
+            'avg_ms': 1000.0 * self.total_seconds / self.searches if self.searches else 0.0
+        }
+
+
+def benchmark_against_priority() -> Dict[str, Any]:
+    """
+    Play the solver and the priority fallback (as X, moving first) against every
+    possible sequence of opponent replies in tic-tac-toe.
+
+    Returns:
+        Per-policy game counts (win/draw/loss over all opponent lines) and
+        average move latency in ms
+    """
+    from generic_game_system import GenericGameSystem
+
+    spec = GridGameSpec(3, 3)
+    solver = GameSolver(spec)
+    fallback = GenericGameSystem.__new__(GenericGameSystem)
+    fallback.move_priority = []
+    fallback.rules_config = {}
+    symbols = {"CARL": "X", "Human": "O"}
+
+    def solver_policy(board):
+        return solver.choose_move(board, "X", "O")["move"]
+
+    def priority_policy(board):
+        return fallback._fallback_move_by_priority(board)[0]
+
+    report = {}
+    for name, policy in (("solver", solver_policy), ("priority", priority_policy)):
+        results = {"win": 0, "draw": 0, "loss": 0}
+        timing = [0.0, 0]
+
+        def play(board, turn):
+            outcome = spec.outcome(board, symbols)
+            if outcome["status"] != "ongoing":
+                results["win" if outcome["winner"] == "CARL" else "loss" if outcome["winner"] else "draw"] += 1
+                return
+            if turn == "CARL":
+                start = time.perf_counter()
+                row, col = policy(board)
+                timing[0] += time.perf_counter() - start
+                timing[1] += 1
+                board[row][col] = "X"
+                play(board, "Human")
+                board[row][col] = ""
+            else:
+                for row in range(3):
+                    for col in range(3):
+                        if board[row][col] == "":
+                            board[row][col] = "O"
+                            play(board, "CARL")
+                            board[row][col] = ""
+
+        play([["", "", ""], ["", "", ""], ["", "", ""]], "CARL")
+        results["avg_move_ms"] = 1000.0 * timing[0] / timing[1] if timing[1] else 0.0
+        report[name] = results
+    return report
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(benchmark_against_priority(), indent=2))
@@ -23,6 +23,27 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from logic_system import LogicSystem
+from game_solver import GameSolver, GridGameSpec
+
+GAMES_DIR = "games"
+
+
+def load_game_config(game_name: str, games_dir: str = GAMES_DIR) -> Optional[Dict[str, Any]]:
+    """
+    Load one game configuration file.
+    
+    Args:
+        game_name: Name of the game (file name without .json)
+        games_dir: Directory containing game configurations
+        
+    Returns:
+        Game configuration dictionary or None if not found
+    """
+    game_path = os.path.join(games_dir, f"{game_name}.json")
+    if not os.path.exists(game_path):
+        return None
+    with open(game_path, 'r') as f:
+        return json.load(f)
 
 class GameTheorySystem:
     """
@@ -46,23 +67,23 @@ class GameTheorySystem:
         self.game_configs = {}
         self.active_games = {}
         
+        # Rules with precomputed win lines per board shape, and one solver per active game
+        self.grid_specs: Dict[Tuple[int, int], GridGameSpec] = {}
+        self.solvers: Dict[str, GameSolver] = {}
+        
         # Load all available game configurations
         self._load_game_configurations()
         
     def _load_game_configurations(self):
         """Load all available game configurations from JSON files."""
         try:
-            games_dir = "games"
+            games_dir = GAMES_DIR
             if os.path.exists(games_dir):
                 for filename in os.listdir(games_dir):
                     if filename.endswith('.json'):
                         game_name = filename[:-5]  # Remove .json extension
-                        game_path = os.path.join(games_dir, filename)
-                        
-                        with open(game_path, 'r') as f:
-                            config = json.load(f)
-                            self.game_configs[game_name] = config
-                            self.logger.info(f"🎮 Loaded game configuration: {game_name}")
+                        self.game_configs[game_name] = load_game_config(game_name, games_dir)
+                        self.logger.info(f"🎮 Loaded game configuration: {game_name}")
         except Exception as e:
             self.logger.error(f"❌ Error loading game configurations: {e}")
     
@@ -98,6 +119,7 @@ class GameTheorySystem:
             game_state = self._initialize_game_state(config, **kwargs)
             
             # Store active game
+            self.solvers.pop(game_name, None)
             self.active_games[game_name] = {
                 "config": config,
                 "state": game_state,
@@ -338,30 +360,38 @@ class GameTheorySystem:
             Game status
         """
         board = state["board"]
+        shape = (len(board), len(board[0]) if board else 0)
+        spec = self.grid_specs.get(shape)
+        if spec is None:
+            spec = self.grid_specs[shape] = GridGameSpec(*shape)
+        return spec.outcome(board, {"CARL": "X", "Human": "O"})
+    
+    def choose_move(self, game_name: str, time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Choose CARL's move in a complete game with the local solver.
         
-        # Check for wins
-        for player in ["X", "O"]:
-            # Check rows
-            for row in board:
-                if all(cell == player for cell in row):
-                    return {"status": "win", "winner": "CARL" if player == "X" else "Human"}
-            
-            # Check columns
-            for col in range(len(board[0])):
-                if all(board[row][col] == player for row in range(len(board))):
-                    return {"status": "win", "winner": "CARL" if player == "X" else "Human"}
+        Args:
+            game_name: Name of the game
+            time_budget: Seconds to search (solver default if None)
             
-            # Check diagonals
-            if all(board[i][i] == player for i in range(min(len(board), len(board[0])))):
-                return {"status": "win", "winner": "CARL" if player == "X" else "Human"}
-            if all(board[i][len(board[0])-1-i] == player for i in range(min(len(board), len(board[0])))):
-                return {"status": "win", "winner": "CARL" if player == "X" else "Human"}
-        
-        # Check for draw
-        if all(cell != "" for row in board for cell in row):
-            return {"status": "draw", "winner": None}
-        
-        return {"status": "ongoing", "winner": None}
+        Returns:
+            Dictionary with move, outcome and reasoning
+        """
+        game = self.active_games.get(game_name)
+        if not game or game["state"].get("type") != "complete_game":
+            return {"success": False, "error": f"No complete game {game_name} active"}
+        
+        board = game["state"]["board"]
+        solver = self.solvers.get(game_name)
+        if solver is None:
+            spec = GridGameSpec.from_game_data(dict(game["config"], board=board)) or GridGameSpec()
+            solver = self.solvers[game_name] = GameSolver(spec)
+        symbols = game["config"].get("rules_config", {}).get("symbols", {"CARL": "X", "Human": "O"})
+        result = solver.choose_move(board, symbols.get("CARL", "X"), symbols.get("Human", "O"), time_budget)
+        if result["move"] is None:
+            return {"success": False, "error": "No valid moves available"}
+        return {"success": True, "move": result["move"], "outcome": result["outcome"],
+                "thought": solver.describe(result)}
     
     def get_game_state(self, game_name: str) -> Dict[str, Any]:
         """
@@ -401,6 +431,7 @@ class GameTheorySystem:
             
             # Remove from active games
             del self.active_games[game_name]
+            self.solvers.pop(game_name, None)
             
             # Log game end event
             if self.main_app and hasattr(self.main_app, 'log'):
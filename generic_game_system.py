@@ -11,6 +11,7 @@ Features:
 - Turn management
 - Game state persistence
 - Integration with LogicSystem for AI reasoning
+- Local negamax solver for grid games (no network round trip per move)
 """
 
 import json
@@ -19,6 +20,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Optional, Tuple, Any, List
 from logic_system import LogicSystem
+from game_solver import GameSolver, GridGameSpec
 
 class GenericGameSystem:
     """
@@ -45,6 +47,12 @@ class GenericGameSystem:
         self.move_priority: List[str] = []  # e.g., ["win", "block", "center", "corner", "side"]
         self.rules_config: Dict[str, Any] = {}
         
+        # Local solver for grid games (rebuilt when a game is loaded)
+        self.use_solver = True
+        self.solver_time_budget = 0.5  # seconds per move
+        self.grid_spec: Optional[GridGameSpec] = None
+        self.solver: Optional[GameSolver] = None
+        
     def load_game(self, game_type: str) -> Dict[str, Any]:
         """
         Load a game from JSON file.
@@ -86,6 +94,8 @@ class GenericGameSystem:
             self.current_game_data = game_data
             self.move_priority = game_data.get("move_priority", [])
             self.rules_config = game_data.get("rules_config", {})
+            self.grid_spec = GridGameSpec.from_game_data(game_data)
+            self.solver = GameSolver(self.grid_spec, self.solver_time_budget) if self.grid_spec else None
             
             self.logger.info(f"🎮 Loaded game: {game_type}")
             
@@ -123,7 +133,9 @@ class GenericGameSystem:
             if "board" in self.current_game_data:
                 if game_type == "tic_tac_toe":
                     self.current_game_data["board"] = [["", "", ""], ["", "", ""], ["", "", ""]]
-                # Future: Add other game board resets here
+                elif self.grid_spec:
+                    self.current_game_data["board"] = [["" for _ in range(self.grid_spec.cols)]
+                                                       for _ in range(self.grid_spec.rows)]
             
             # Save game state
             self._save_game_data()
@@ -228,11 +240,21 @@ class GenericGameSystem:
             
             return board[row][col] == ""
         
-        # Future: Add validation for other game types
+        if self.grid_spec:
+            if not isinstance(move, list) or len(move) != 2:
+                return False
+            row, col = move
+            return self.grid_spec.is_legal(self.current_game_data.get("board", []), row, col)
+        
         return False
     
     def choose_carl_move(self) -> Dict[str, Any]:
-        """Choose CARL's move using AI prompt from JSON with fallback to JSON-configured priorities."""
+        """
+        Choose CARL's move.
+        
+        Grid games are searched locally by the solver. Other games use the AI
+        prompt from JSON, with fallback to JSON-configured priorities.
+        """
         try:
             if not self.current_game_data:
                 return {"success": False, "error": "No game loaded"}
@@ -243,8 +265,22 @@ class GenericGameSystem:
             prompts = self.current_game_data.get("gameplay_prompts", {})
             choose_move_prompt = prompts.get("choose_move")
 
+            # Local search: no network round trip per move
+            if self.use_solver and self.solver:
+                symbols = self.rules_config.get("symbols", {"CARL": "X", "Human": "O"})
+                try:
+                    result = self.solver.choose_move(board, symbols.get("CARL", "X"), symbols.get("Human", "O"))
+                    move = result.get("move")
+                    if move and self._is_valid_move(move):
+                        self.logger.debug(f"🎮 Solver chose {move} (depth {result['depth']}, "
+                                          f"{result['nodes']} nodes, {result['elapsed_ms']:.1f}ms)")
+                        return {"success": True, "move": move, "thought": self.solver.describe(result),
+                                "outcome": result.get("outcome")}
+                except Exception as e:
+                    self.logger.warning(f"Solver failed, falling back: {e}")
+
             # Attempt AI-based move selection if prompt provided
-            if choose_move_prompt:
+            if choose_move_prompt and not self.solver:
                 try:
                     context = {"board": board}
                     # Allow system personality context if main_app available
@@ -379,7 +415,13 @@ class GenericGameSystem:
         if self.current_game == "tic_tac_toe":
             return self._execute_tic_tac_toe_move(move, player)
         
-        # Future: Add execution for other game types
+        if self.grid_spec:
+            row, col = move
+            symbol = self.rules_config.get("symbols", {}).get(player, "X" if player == "CARL" else "O")
+            self.current_game_data["board"][row][col] = symbol
+            who = "I" if player == "CARL" else player
+            return {"success": True, "thought": f"{who} placed {symbol} at {move}"}
+        
         return {"success": False, "error": f"Move execution not implemented for {self.current_game}"}
     
     def _execute_tic_tac_toe_move(self, move, player: str) -> Dict[str, Any]:
@@ -410,7 +452,10 @@ class GenericGameSystem:
         if self.current_game == "tic_tac_toe":
             return self._evaluate_tic_tac_toe_board()
         
-        # Future: Add evaluation for other game types
+        if self.grid_spec:
+            symbols = self.rules_config.get("symbols", {"CARL": "X", "Human": "O"})
+            return self.grid_spec.outcome(self.current_game_data.get("board", []), symbols)
+        
         return {"status": "ongoing", "winner": None}
     
     def _evaluate_tic_tac_toe_board(self) -> Dict[str, Any]:
@@ -11,6 +11,8 @@ from typing import Dict, List, Tuple, Set, Optional, Any
 from dataclasses import dataclass
 from collections import defaultdict, Counter
 
+from runtime_context import get_current_context
+
 
 @dataclass
 class ConceptEdge:
@@ -332,19 +334,19 @@ concept_graph = ConceptGraphSystem()
 
 def update_from_event(event_ctx: Dict[str, Any]) -> None:
     """Convenience function to update graph from event."""
-    concept_graph.update_from_event(event_ctx)
+    get_current_context().concept_graph.update_from_event(event_ctx)
 
 
 def query_related(node: str, k: int = 5) -> List[Tuple[str, float]]:
     """Convenience function to query related concepts."""
-    return concept_graph.query_related(node, k)
+    return get_current_context().concept_graph.query_related(node, k)
 
 
 def get_edges_for_concept(concept: str) -> List[ConceptEdge]:
     """Convenience function to get edges for concept."""
-    return concept_graph.get_edges_for_concept(concept)
+    return get_current_context().concept_graph.get_edges_for_concept(concept)
 
 
 def get_graph_stats() -> Dict[str, Any]:
     """Convenience function to get graph statistics."""
-    return concept_graph.get_graph_stats()
+    return get_current_context().concept_graph.get_graph_stats()
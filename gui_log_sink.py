@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+GUI Log Sink
+============
+
+Thread-safe, batched log sink for the PersonalityBotApp output window.
+
+Any thread (cognitive loop, Flask handlers, stdout/stderr redirection) may
+submit messages; they are queued and written to the Tk text widget in batches
+by a single ``after()`` timer on the main thread, so no Tk calls happen off the
+main thread. The widget keeps a bounded number of lines (oldest trimmed),
+messages below the display level are filtered out, and every message is also
+written to a rotating log file.
+"""
+
+import os
+import sys
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+import tkinter as tk
+
+
+def infer_log_level(message: str) -> int:
+    """
+    Infer a logging level from a CARL log message.
+
+    CARL log messages are free text with emoji markers rather than levels, so
+    the markers are used to classify them.
+    """
+    head = message[:80]
+    if '❌' in head or 'Error' in head or 'ERROR' in head or 'Traceback' in head:
+        return logging.ERROR
+    if '⚠️' in head or 'Warning' in head or 'WARNING' in head:
+        return logging.WARNING
+    if head.startswith('DEBUG') or '🔍 DEBUG' in head:
+        return logging.DEBUG
+    return logging.INFO
+
+
+def write_console(text: str, stream_name: str = 'stdout'):
+    """
+    Write to the process's original stdout/stderr, if it has one.
+
+    Under pythonw (no console) sys.__stdout__ and sys.__stderr__ are None;
+    the text is then dropped.
+
+    Args:
+        text: Text to write
+        stream_name: "stdout" or "stderr"
+    """
+    stream = getattr(sys, f'__{stream_name}__', None)
+    if stream is None:
+        return
+    try:
+        stream.write(text)
+    except Exception:
+        pass
+
+
+class GuiLogSink:
+    """
+    Batched, bounded log sink feeding a Tk text widget and a rotating file.
+    """
+
+    def __init__(self, max_lines: int = 5000, flush_interval_ms: int = 100,
+                 max_batch: int = 500, display_level=logging.INFO,
+                 log_file: Optional[str] = "logs/carl_output.log",
+                 max_file_bytes: int = 5 * 1024 * 1024, backup_count: int = 3,
+                 max_pending: int = 20000):
+        """
+        Initialize the log sink.
+
+        Args:
+            max_lines: Maximum number of lines kept in the text widget
+            flush_interval_ms: Interval of the main-thread drain timer
+            max_batch: Maximum number of messages written per drain
+            display_level: Minimum level (int or name) shown in the widget; the file gets everything
+            log_file: Rotating log file path, or None to disable the file sink
+            max_file_bytes: Size at which the log file is rotated
+            backup_count: Number of rotated log files kept
+            max_pending: Maximum number of queued messages (oldest dropped)
+        """
+        self.max_lines = max_lines
+        self.flush_interval_ms = flush_interval_ms
+        self.max_batch = max_batch
+        if isinstance(display_level, str):
+            display_level = logging.getLevelName(display_level.strip().upper())
+        self.display_level = display_level if isinstance(display_level, int) else logging.INFO
+
+        self._pending = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._root = None
+        self._widget = None
+        self._after_id = None
+        self._line_count = 0
+
+        # Statistics
+        self.messages_submitted = 0
+        self.messages_displayed = 0
+        self.messages_filtered = 0
+        self.lines_trimmed = 0
+
+        self._file_logger = None
+        if log_file:
+            self._file_logger = self._create_file_logger(log_file, max_file_bytes, backup_count)
+
+    def _create_file_logger(self, log_file: str, max_file_bytes: int, backup_count: int):
+        """Create a dedicated, non-propagating logger writing to a rotating file."""
+        try:
+            directory = os.path.dirname(log_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            file_logger = logging.getLogger(f"{__name__}.file.{os.path.abspath(log_file)}")
+            file_logger.setLevel(logging.DEBUG)
+            file_logger.propagate = False
+            if not file_logger.handlers:
+                handler = RotatingFileHandler(log_file, maxBytes=max_file_bytes,
+                                              backupCount=backup_count, encoding='utf-8')
+                handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+                file_logger.addHandler(handler)
+            return file_logger
+        except Exception as e:
+            write_console(f"GuiLogSink: could not open log file {log_file}: {e}\n", 'stderr')
+            return None
+
+    def submit(self, message: str, level: Optional[int] = None):
+        """
+        Queue a message for display. Safe to call from any thread.
+
+        Args:
+            message: Log message
+            level: Logging level (inferred from the message if omitted)
+        """
+        if level is None:
+            level = infer_log_level(message)
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+
+        if self._file_logger:
+            self._file_logger.log(level, message)
+
+        with self._lock:
+            self.messages_submitted += 1
+            if level < self.display_level:
+                self.messages_filtered += 1
+                return
+            self._pending.append(f"{timestamp}: {message}\n")
+            attached = self._widget is not None
+
+        if not attached:
+            # No window yet: keep the message queued and echo it to the real stdout
+            write_console(f"{datetime.now()}: {message}\n")
+
+    def attach(self, root: tk.Misc, widget: tk.Text):
+        """
+        Attach the sink to a text widget and start the drain timer.
+
+        Must be called on the Tk main thread.
+        """
+        self._root = root
+        self._widget = widget
+        self._line_count = max(0, int(widget.index('end-1c').split('.')[0]) - 1)
+        self._schedule()
+
+    def detach(self):
+        """Stop the drain timer (main thread only)."""
+        if self._root is not None and self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._widget = None
+        self._root = None
+
+    def _schedule(self):
+        if self._root is not None:
+            self._after_id = self._root.after(self.flush_interval_ms, self._drain)
+
+    def _drain(self):
+        """Write one batch of queued messages to the widget (main thread)."""
+        try:
+            self.flush()
+        finally:
+            self._schedule()
+
+    def flush(self):
+        """Write up to max_batch queued messages to the widget (main thread only)."""
+        widget = self._widget
+        if widget is None:
+            return
+
+        with self._lock:
+            if not self._pending:
+                return
+            batch_size = min(self.max_batch, len(self._pending))
+            batch = [self._pending.popleft() for _ in range(batch_size)]
+
+        text = ''.join(batch)
+        try:
+            widget.config(state='normal')
+            widget.insert(tk.END, text)
+
+            # Trim the oldest lines so the widget never grows without bound. The
+            # line count is read back from the widget because other code (e.g. the
+            # memory explorer) may also append to it.
+            self._line_count = int(widget.index('end-1c').split('.')[0]) - 1
+            excess = self._line_count - self.max_lines
+            if excess > 0:
+                widget.delete('1.0', f'{excess + 1}.0')
+                self._line_count -= excess
+                self.lines_trimmed += excess
+
+            widget.config(state='disabled')
+            widget.see(tk.END)
+            self.messages_displayed += len(batch)
+        except tk.TclError:
+            # Widget was destroyed; stop writing to it
+            self._widget = None
+
+    def get_stats(self) -> dict:
+        """Get sink statistics."""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            'submitted': self.messages_submitted,
+            'displayed': self.messages_displayed,
+            'filtered': self.messages_filtered,
+            'lines_trimmed': self.lines_trimmed,
+            'pending': pending,
+            'widget_lines': self._line_count
+        }
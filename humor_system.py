@@ -10,12 +10,57 @@ import json
 import logging
 import random
 import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import os
 
+from consciousness_evidence_stream import publish_evidence
+from multi_pattern_matcher import MultiPatternMatcher
+
+# Known joke patterns (setup -> punchline)
+KNOWN_JOKES = {
+    "what's a cat's favorite jacket": "a purr coat",
+    "what do you call a bear with no teeth": "a gummy bear",
+    "why don't scientists trust atoms": "because they make up everything",
+    "what do you call a fake noodle": "an impasta",
+    "why did the scarecrow win an award": "because he was outstanding in his field",
+    "what do you call a can opener that doesn't work": "a can't opener",
+    "what do you call a bear with no ears": "b",
+    "what do you call a fish wearing a bowtie": "so-fish-ticated",
+    "what do you call a dinosaur that crashes his car": "tyrannosaurus wrecks",
+    "what do you call a sleeping bull": "a bulldozer"
+}
+
+# Incongruity cue words
+INCONGRUITY_CUES = {
+    "puns": ["pun", "wordplay", "play on words", "double meaning"],
+    "surprise": ["unexpected", "surprise", "twist", "irony", "paradox"],
+    "absurdity": ["ridiculous", "absurd", "nonsense", "silly", "crazy"],
+    "word_substitution": ["instead of", "rather than", "substitute", "replace"]
+}
+
+HUMOR_KEYWORDS = [
+    "joke", "funny", "laugh", "humor", "hilarious", "amusing", "comedy",
+    "wit", "clever", "smart", "genius", "brilliant", "perfect"
+]
+
+REPEAT_JOKE_PATTERNS = [
+    'tell me that joke again',
+    'repeat that joke',
+    'say that joke again',
+    'tell the same joke',
+    'that joke was funny',
+    'i liked that joke',
+    'tell me another joke',
+    'more jokes',
+    'another joke'
+]
+
 class HumorType(Enum):
     """Types of humor for categorization."""
     PUN = "pun"
@@ -68,6 +113,175 @@ class NeurotransmitterState:
         if self.last_updated is None:
             self.last_updated = datetime.now().isoformat()
 
+@dataclass
+class HumorCues:
+    """Every humor cue found in one pass over a lowercased input."""
+    known_joke: Optional[Tuple[str, str]] = None  # (setup, punchline) of the first matching known joke
+    incongruity_cues: List[Tuple[str, str]] = field(default_factory=list)  # (category, cue)
+    humor_keywords: List[str] = field(default_factory=list)
+    repeat_request: bool = False
+
+
+class HumorCueMatcher:
+    """
+    All humor cue sets compiled into one Aho-Corasick automaton.
+
+    ``scan`` reports known joke punchlines, incongruity cues, humor keywords
+    and joke repeat requests in a single pass over the input, with the same
+    substring semantics as checking each cue with ``in``.
+    """
+
+    def __init__(self, known_jokes: Dict[str, str] = KNOWN_JOKES,
+                 incongruity_cues: Dict[str, List[str]] = INCONGRUITY_CUES,
+                 humor_keywords: List[str] = HUMOR_KEYWORDS,
+                 repeat_patterns: List[str] = REPEAT_JOKE_PATTERNS):
+        self.known_jokes = [(setup, punchline.lower()) for setup, punchline in known_jokes.items()]
+        self.humor_keywords = list(humor_keywords)
+        # Pattern -> (cue set, payload); one pattern may belong to several cue sets
+        self.entries: Dict[str, List[Tuple[str, Any]]] = {}
+        for order, (_, punchline) in enumerate(self.known_jokes):
+            self.entries.setdefault(punchline, []).append(("known_joke", order))
+        for category, cues in incongruity_cues.items():
+            for cue in cues:
+                self.entries.setdefault(cue, []).append(("incongruity", category))
+        for order, keyword in enumerate(self.humor_keywords):
+            self.entries.setdefault(keyword, []).append(("keyword", order))
+        for pattern in repeat_patterns:
+            self.entries.setdefault(pattern, []).append(("repeat", None))
+        self.matcher = MultiPatternMatcher(self.entries)
+
+        # Input that is part of a punchline also counts as that joke: one search over all punchlines
+        self._punchline_text = "\n".join(punchline for _, punchline in self.known_jokes)
+        self._punchline_starts = []
+        offset = 0
+        for _, punchline in self.known_jokes:
+            self._punchline_starts.append(offset)
+            offset += len(punchline) + 1
+
+    def _punchline_containing(self, text: str) -> Optional[int]:
+        """Order of the first punchline that contains the text."""
+        if "\n" in text:
+            return None
+        position = self._punchline_text.find(text)
+        if position < 0:
+            return None
+        return bisect_right(self._punchline_starts, position) - 1
+
+    def scan(self, text: str) -> HumorCues:
+        """
+        Find every humor cue in a lowercased text.
+
+        Args:
+            text: Lowercased user input
+
+        Returns:
+            HumorCues
+        """
+        cues = HumorCues()
+        joke_orders, keyword_orders = [], []
+        for pattern in self.matcher.find_all(text):
+            for cue_set, payload in self.entries[pattern]:
+                if cue_set == "known_joke":
+                    joke_orders.append(payload)
+                elif cue_set == "incongruity":
+                    cues.incongruity_cues.append((payload, pattern))
+                elif cue_set == "keyword":
+                    keyword_orders.append(payload)
+                else:
+                    cues.repeat_request = True
+
+        contained_in = self._punchline_containing(text)
+        if contained_in is not None:
+            joke_orders.append(contained_in)
+        if joke_orders:
+            cues.known_joke = self.known_jokes[min(joke_orders)]
+        cues.humor_keywords = [self.humor_keywords[order] for order in sorted(keyword_orders)]
+        return cues
+
+
+class RecentJokeLog:
+    """
+    Jokes told recently, newest last, kept in memory and appended to a JSONL file.
+
+    Entries older than ``window_seconds`` are dropped from the front as the log
+    is read, and at most ``max_entries`` are kept, so finding the latest jokes
+    never touches the memories directory. The file is rewritten with the live
+    entries once it holds ``compact_threshold`` lines.
+    """
+
+    def __init__(self, path: str = "humor/recent_jokes.jsonl", window_seconds: float = 3600.0,
+                 max_entries: int = 50, compact_threshold: int = 200,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.window_seconds = window_seconds
+        self.compact_threshold = compact_threshold
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        self._entries: deque = deque(maxlen=max_entries)  # (told_at, joke_data)
+        self._file_lines = 0
+        self._load()
+
+    def _load(self):
+        """Replay the log file."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._file_lines += 1
+                    try:
+                        record = json.loads(line)
+                        self._entries.append((record["told_at"], record["joke_data"]))
+                    except (ValueError, KeyError):
+                        continue  # Torn last line after a crash
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error loading recent jokes: {e}")
+        self._prune()
+
+    def _prune(self):
+        cutoff = self.clock() - self.window_seconds
+        while self._entries and self._entries[0][0] < cutoff:
+            self._entries.popleft()
+
+    def append(self, joke_data: Dict[str, Any]):
+        """Record a joke that was just told."""
+        told_at = self.clock()
+        self._entries.append((told_at, joke_data))
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"told_at": told_at, "joke_data": joke_data}, ensure_ascii=False) + "\n")
+            self._file_lines += 1
+        except Exception as e:
+            self.logger.error(f"Error appending to recent jokes: {e}")
+        if self._file_lines >= self.compact_threshold:
+            self.compact()
+
+    def latest(self, count: int = 3) -> List[Dict[str, Any]]:
+        """Jokes told within the window, most recent first."""
+        self._prune()
+        return [joke_data for _, joke_data in islice(reversed(self._entries), count)]
+
+    def compact(self):
+        """Rewrite the file with only the live entries."""
+        self._prune()
+        try:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for told_at, joke_data in self._entries:
+                    f.write(json.dumps({"told_at": told_at, "joke_data": joke_data}, ensure_ascii=False) + "\n")
+            os.replace(temp_path, self.path)
+            self._file_lines = len(self._entries)
+        except Exception as e:
+            self.logger.error(f"Error compacting recent jokes: {e}")
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._entries)
+
+
 class HumorSystem:
     """
     Comprehensive humor system with joke/laughter pipeline.
@@ -91,6 +305,9 @@ class HumorSystem:
         self.laughter_cooldown = 30.0  # seconds
         self.last_laughter_time = 0.0
         
+        self.cue_matcher = HumorCueMatcher()
+        self.recent_jokes = RecentJokeLog()
+        
         self._load_jokes()
         self._load_neurotransmitter_state()
     
@@ -230,19 +447,20 @@ class HumorSystem:
         """
         try:
             user_input_lower = user_input.lower().strip()
+            cues = self.cue_matcher.scan(user_input_lower)
             
             # Check for known joke setups and punchlines
-            joke_detected = self._detect_known_jokes(user_input_lower)
+            joke_detected = self._detect_known_jokes(user_input_lower, cues)
             if joke_detected:
                 return self._handle_detected_joke(joke_detected, context)
             
             # Check for incongruity cues
-            incongruity_score = self._detect_incongruity_cues(user_input_lower)
+            incongruity_score = self._detect_incongruity_cues(user_input_lower, cues)
             if incongruity_score > 0.6:
                 return self._handle_incongruity_humor(incongruity_score, user_input, context)
             
             # Check for humor keywords
-            humor_keywords = self._detect_humor_keywords(user_input_lower)
+            humor_keywords = self._detect_humor_keywords(user_input_lower, cues)
             if humor_keywords:
                 return self._handle_humor_keywords(humor_keywords, user_input, context)
             
@@ -252,50 +470,24 @@ class HumorSystem:
             self.logger.error(f"Error detecting user humor: {e}")
             return None
 
-    def _detect_known_jokes(self, user_input: str) -> Optional[Dict[str, Any]]:
+    def _detect_known_jokes(self, user_input: str, cues: Optional[HumorCues] = None) -> Optional[Dict[str, Any]]:
         """Detect known joke setups and punchlines."""
-        # Known joke patterns (setup -> punchline)
-        known_jokes = {
-            "what's a cat's favorite jacket": "a purr coat",
-            "what do you call a bear with no teeth": "a gummy bear",
-            "why don't scientists trust atoms": "because they make up everything",
-            "what do you call a fake noodle": "an impasta",
-            "why did the scarecrow win an award": "because he was outstanding in his field",
-            "what do you call a can opener that doesn't work": "a can't opener",
-            "what do you call a bear with no ears": "b",
-            "what do you call a fish wearing a bowtie": "so-fish-ticated",
-            "what do you call a dinosaur that crashes his car": "tyrannosaurus wrecks",
-            "what do you call a sleeping bull": "a bulldozer"
-        }
-        
-        # Check if user input matches any known punchline
-        for setup, punchline in known_jokes.items():
-            if punchline.lower() in user_input or user_input in punchline.lower():
-                return {
-                    "type": "known_joke",
-                    "setup": setup,
-                    "punchline": punchline,
-                    "confidence": 0.9
-                }
+        cues = cues if cues is not None else self.cue_matcher.scan(user_input)
+        if cues.known_joke:
+            setup, punchline = cues.known_joke
+            return {
+                "type": "known_joke",
+                "setup": setup,
+                "punchline": punchline,
+                "confidence": 0.9
+            }
         
         return None
 
-    def _detect_incongruity_cues(self, user_input: str) -> float:
+    def _detect_incongruity_cues(self, user_input: str, cues: Optional[HumorCues] = None) -> float:
         """Detect incongruity-based humor cues."""
-        score = 0.0
-        
-        # Incongruity cue words
-        incongruity_cues = {
-            "puns": ["pun", "wordplay", "play on words", "double meaning"],
-            "surprise": ["unexpected", "surprise", "twist", "irony", "paradox"],
-            "absurdity": ["ridiculous", "absurd", "nonsense", "silly", "crazy"],
-            "word_substitution": ["instead of", "rather than", "substitute", "replace"]
-        }
-        
-        for category, cues in incongruity_cues.items():
-            for cue in cues:
-                if cue in user_input:
-                    score += 0.2
+        cues = cues if cues is not None else self.cue_matcher.scan(user_input)
+        score = 0.2 * len(cues.incongruity_cues)
         
         # Check for question-answer patterns that might be jokes
         if "?" in user_input and len(user_input.split()) < 10:
@@ -303,19 +495,10 @@ class HumorSystem:
         
         return min(score, 1.0)
 
-    def _detect_humor_keywords(self, user_input: str) -> List[str]:
+    def _detect_humor_keywords(self, user_input: str, cues: Optional[HumorCues] = None) -> List[str]:
         """Detect humor-related keywords."""
-        humor_keywords = [
-            "joke", "funny", "laugh", "humor", "hilarious", "amusing", "comedy",
-            "wit", "clever", "smart", "genius", "brilliant", "perfect"
-        ]
-        
-        detected = []
-        for keyword in humor_keywords:
-            if keyword in user_input:
-                detected.append(keyword)
-        
-        return detected
+        cues = cues if cues is not None else self.cue_matcher.scan(user_input)
+        return list(cues.humor_keywords)
 
     def _handle_detected_joke(self, joke_info: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> HumorResponse:
         """Handle detected known joke."""
@@ -733,8 +916,11 @@ class HumorSystem:
             
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(memory_data, f, indent=2, ensure_ascii=False)
+            self.recent_jokes.append(memory_data["joke_data"])
             
             self.logger.info(f"Stored joke in memory: {filepath}")
+            publish_evidence('memory_usage', 1.0, source='humor_system.store_joke', file_path=filepath)
+            publish_evidence('emotional_context', 0.7, source='humor_system.store_joke', file_path=filepath)
             return memory_data["id"]
             
         except Exception as e:
@@ -755,19 +941,7 @@ class HumorSystem:
             query_lower = query.lower()
             
             # Check for repeat joke patterns
-            repeat_patterns = [
-                'tell me that joke again',
-                'repeat that joke',
-                'say that joke again',
-                'tell the same joke',
-                'that joke was funny',
-                'i liked that joke',
-                'tell me another joke',
-                'more jokes',
-                'another joke'
-            ]
-            
-            if any(pattern in query_lower for pattern in repeat_patterns):
+            if self.cue_matcher.scan(query_lower).repeat_request:
                 # Check if we have recent jokes in memory
                 recent_jokes = self._get_recent_jokes_from_memory()
                 
@@ -790,45 +964,9 @@ class HumorSystem:
             return None
     
     def _get_recent_jokes_from_memory(self) -> List[Dict]:
-        """Get recent jokes from memory for repeat query handling."""
+        """Get jokes told in the last hour (most recent first) for repeat query handling."""
         try:
-            import os
-            import json
-            from datetime import datetime, timedelta
-            
-            memories_dir = "memories"
-            if not os.path.exists(memories_dir):
-                return []
-            
-            recent_jokes = []
-            cutoff_time = datetime.now() - timedelta(hours=1)  # Last hour
-            
-            for filename in os.listdir(memories_dir):
-                if filename.startswith('joke_') and filename.endswith('.json'):
-                    try:
-                        filepath = os.path.join(memories_dir, filename)
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            memory_data = json.load(f)
-                        
-                        # Check if it's recent enough
-                        memory_timestamp = memory_data.get('timestamp', '')
-                        if memory_timestamp:
-                            try:
-                                memory_date = datetime.fromisoformat(memory_timestamp.replace('Z', '+00:00'))
-                                if memory_date >= cutoff_time:
-                                    joke_data = memory_data.get('joke_data', {})
-                                    if joke_data:
-                                        recent_jokes.append(joke_data)
-                            except:
-                                continue
-                                
-                    except Exception as e:
-                        continue
-            
-            # Sort by timestamp (most recent first)
-            recent_jokes.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-            return recent_jokes[:3]  # Return top 3 most recent
-            
+            return self.recent_jokes.latest(3)
         except Exception as e:
             self.logger.error(f"Error getting recent jokes from memory: {e}")
             return []
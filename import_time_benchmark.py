@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark
+=====================
+
+Measures the cold import cost of CARL's entry module with ``python -X
+importtime`` and fails when it exceeds a budget, or when a subsystem that
+should load on first use (see lazy_subsystems) is imported at startup.
+
+Usage:
+    python import_time_benchmark.py                      # import main, default budget
+    python import_time_benchmark.py --budget-ms 1500 --repeat 5
+    python import_time_benchmark.py --module vision_system --top 20
+
+Exit codes: 0 within budget, 1 over budget or a lazy module was imported,
+2 the module failed to import.
+"""
+
+import os
+import re
+import sys
+import argparse
+import statistics
+import subprocess
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_MODULE = "main"
+DEFAULT_BUDGET_MS = 3000.0
+
+# Modules main.py loads on first use; importing them at startup is a regression
+LAZY_MODULES = (
+    "imagination_system",
+    "enhanced_consciousness_evaluation",
+    "game_theory",
+    "generic_game_system",
+    "automated_association_discovery",
+    "session_reporting"
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportTimeResult:
+    """Parsed output of one ``-X importtime`` run."""
+    module: str
+    returncode: int
+    total_us: int = 0
+    self_us: Dict[str, int] = field(default_factory=dict)
+    cumulative_us: Dict[str, int] = field(default_factory=dict)
+    error: str = ""
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000.0
+
+    def slowest(self, count: int = 10) -> List[str]:
+        """Imported modules by cumulative time."""
+        return sorted(self.cumulative_us, key=lambda name: -self.cumulative_us[name])[:count]
+
+
+def parse_importtime(module: str, stderr: str, returncode: int = 0) -> ImportTimeResult:
+    """
+    Parse ``-X importtime`` output.
+
+    Args:
+        module: Module that was imported
+        stderr: stderr of the run
+        returncode: Exit code of the run
+
+    Returns:
+        ImportTimeResult
+    """
+    result = ImportTimeResult(module=module, returncode=returncode)
+    errors = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            if not line.startswith("import time:"):
+                errors.append(line)
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        result.self_us[name] = int(self_us)
+        result.cumulative_us[name] = int(cumulative_us)
+    # Interpreter startup imports (encodings, site) are listed too; count the module only
+    result.total_us = result.cumulative_us.get(module, 0)
+    if returncode:
+        result.error = "\n".join(errors[-5:])
+    return result
+
+
+def measure(module: str = DEFAULT_MODULE, cwd: Optional[str] = None,
+            python: str = sys.executable) -> ImportTimeResult:
+    """Import a module in a fresh interpreter with -X importtime."""
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    process = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                             cwd=cwd, capture_output=True, text=True)
+    return parse_importtime(module, process.stderr, process.returncode)
+
+
+def check(results: Sequence[ImportTimeResult], budget_ms: float,
+          lazy_modules: Sequence[str] = LAZY_MODULES) -> List[str]:
+    """
+    Budget violations for a set of runs (median of the totals).
+
+    Returns:
+        Problems found ([] if within budget)
+    """
+    problems = []
+    median_ms = statistics.median(result.total_ms for result in results)
+    if median_ms > budget_ms:
+        problems.append(f"import time {median_ms:.0f}ms exceeds budget {budget_ms:.0f}ms")
+    eager = sorted({name for result in results for name in lazy_modules if name in result.cumulative_us})
+    if eager:
+        problems.append(f"lazily loaded modules imported at startup: {', '.join(eager)}")
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold import time benchmark")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Median import time budget")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreter runs")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    args = parser.parse_args(argv)
+
+    results = []
+    for _ in range(max(1, args.repeat)):
+        result = measure(args.module)
+        if result.returncode:
+            print(f"❌ import {args.module} failed:\n{result.error}")
+            return 2
+        results.append(result)
+
+    totals = [result.total_ms for result in results]
+    print(f"import {args.module}: median {statistics.median(totals):.0f}ms "
+          f"(min {min(totals):.0f}ms, max {max(totals):.0f}ms, {len(results)} runs), "
+          f"budget {args.budget_ms:.0f}ms")
+    fastest = min(results, key=lambda result: result.total_us)
+    for name in fastest.slowest(args.top):
+        print(f"  {fastest.cumulative_us[name] / 1000.0:8.1f}ms  {name}")
+
+    problems = check(results, args.budget_ms)
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print("✅ Within budget")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
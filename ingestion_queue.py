@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Ingestion Queue
+===============
+
+Bounded, prioritized ingestion queue between CARL's Flask endpoints and its
+cognitive handlers.
+
+The ARC scripts POST speech, vision detections and image notifications and
+used to wait until CARL had finished thinking about them. Routes now submit
+the payload and answer 202 immediately; a single worker thread hands items to
+the registered handler per source:
+
+- per-source priorities (speech before ARC images before vision),
+- repeated detections of the same object that are still waiting are coalesced
+  into one item (latest payload, with a repeat count); superseded and dropped
+  payloads are passed to the source's discard callback so their resources
+  (e.g. captured frames) can be released,
+- the queue is bounded: when full, the oldest item of the lowest priority is
+  dropped in favour of a more important one, otherwise the new item is
+  rejected,
+- queue depth and wait/handling latency are exposed through ``get_stats``.
+"""
+
+import time
+import heapq
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Lower value is handled first
+SOURCE_PRIORITIES = {
+    'speech': 0,
+    'arc_image': 1,
+    'vision': 2
+}
+
+
+@dataclass
+class IngestItem:
+    """One queued input."""
+    source: str
+    payload: Any
+    priority: int
+    sequence: int
+    key: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    count: int = 1
+    cancelled: bool = False
+
+
+class IngestionQueue:
+    """
+    Priority queue with coalescing, drained by one worker thread.
+    """
+
+    def __init__(self, max_size: int = 256, priorities: Optional[Dict[str, int]] = None,
+                 latency_window: int = 500):
+        """
+        Initialize the ingestion queue.
+
+        Args:
+            max_size: Maximum number of pending items
+            priorities: Source -> priority (lower first); defaults to SOURCE_PRIORITIES
+            latency_window: Number of recent items used for latency statistics
+        """
+        self.max_size = max_size
+        self.priorities = dict(priorities or SOURCE_PRIORITIES)
+        self.latency_window = latency_window
+        self.logger = logging.getLogger(__name__)
+
+        self._handlers: Dict[str, Callable[[Any], None]] = {}
+        self._discard_handlers: Dict[str, Callable[[Any], None]] = {}
+        self._heap: List[Tuple[int, int, IngestItem]] = []
+        self._pending_by_key: Dict[Tuple[str, str], IngestItem] = {}
+        self._depth_by_source: Dict[str, int] = {}
+        self._depth = 0
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.submitted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self._wait_ms: List[float] = []
+        self._handle_ms: List[float] = []
+
+    def register_handler(self, source: str, handler: Callable[[Any], None],
+                         on_discard: Optional[Callable[[Any], None]] = None):
+        """
+        Register the handler that processes payloads of a source.
+
+        Args:
+            source: Input source
+            handler: Called with each payload that is handled
+            on_discard: Called with each payload that will never be handled
+                (superseded by a coalesced payload or dropped when the queue is full)
+        """
+        self._handlers[source] = handler
+        if on_discard is not None:
+            self._discard_handlers[source] = on_discard
+        else:
+            self._discard_handlers.pop(source, None)
+
+    def _discard(self, discarded: List[Tuple[str, Any]]):
+        """Pass payloads that will never be handled to their discard callbacks (lock not held)."""
+        for source, payload in discarded:
+            on_discard = self._discard_handlers.get(source)
+            if on_discard is None:
+                continue
+            try:
+                on_discard(payload)
+            except Exception as e:
+                self.logger.warning(f"Error discarding queued {source} input: {e}")
+
+    def submit(self, source: str, payload: Any, key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Queue a payload. Safe to call from any thread; never blocks on handlers.
+
+        Args:
+            source: Input source ("speech", "vision", "arc_image", ...)
+            payload: Data passed to the source's handler
+            key: Coalescing key; a pending item with the same source and key is
+                updated instead of queueing a duplicate
+
+        Returns:
+            Dict with "accepted", "status" ("queued", "coalesced" or "rejected") and "depth";
+            a rejected payload is not passed to the discard callback
+        """
+        discarded: List[Tuple[str, Any]] = []
+        try:
+            with self._condition:
+                return self._submit(source, payload, key, discarded)
+        finally:
+            self._discard(discarded)
+
+    def _submit(self, source: str, payload: Any, key: Optional[str],
+                discarded: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """Queue a payload, collecting payloads that will never be handled (lock held)."""
+        priority = self.priorities.get(source, max(self.priorities.values(), default=0) + 1)
+        self.submitted += 1
+
+        if key is not None:
+            pending = self._pending_by_key.get((source, key))
+            if pending is not None and not pending.cancelled:
+                discarded.append((source, pending.payload))
+                pending.payload = payload
+                pending.count += 1
+                self.coalesced += 1
+                return {'accepted': True, 'status': 'coalesced', 'depth': self._depth, 'count': pending.count}
+
+        if self._depth >= self.max_size and not self._drop_lowest_priority(priority, discarded):
+            self.rejected += 1
+            return {'accepted': False, 'status': 'rejected', 'depth': self._depth}
+
+        self._sequence += 1
+        item = IngestItem(source=source, payload=payload, priority=priority,
+                          sequence=self._sequence, key=key)
+        heapq.heappush(self._heap, (priority, item.sequence, item))
+        if key is not None:
+            self._pending_by_key[(source, key)] = item
+        self._depth += 1
+        self._depth_by_source[source] = self._depth_by_source.get(source, 0) + 1
+        self._condition.notify()
+        return {'accepted': True, 'status': 'queued', 'depth': self._depth}
+
+    def _drop_lowest_priority(self, priority: int, discarded: List[Tuple[str, Any]]) -> bool:
+        """Cancel the oldest pending item less important than priority (lock held)."""
+        victim = None
+        for item_priority, sequence, item in self._heap:
+            if item.cancelled or item_priority <= priority:
+                continue
+            if victim is None or (item_priority, -sequence) > (victim.priority, -victim.sequence):
+                victim = item
+        if victim is None:
+            return False
+        self._cancel(victim)
+        discarded.append((victim.source, victim.payload))
+        self.dropped += 1
+        self.logger.warning(f"Ingestion queue full - dropped queued {victim.source} input")
+        return True
+
+    def _cancel(self, item: IngestItem):
+        item.cancelled = True
+        self._untrack(item)
+
+    def _untrack(self, item: IngestItem):
+        """Remove an item from the depth and coalescing bookkeeping (lock held)."""
+        self._depth -= 1
+        self._depth_by_source[item.source] -= 1
+        if item.key is not None and self._pending_by_key.get((item.source, item.key)) is item:
+            del self._pending_by_key[(item.source, item.key)]
+
+    def _pop(self, timeout: Optional[float]) -> Optional[IngestItem]:
+        """Take the most important pending item, waiting up to timeout."""
+        with self._condition:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    item = heapq.heappop(self._heap)[2]
+                    self._untrack(item)
+                    return item
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._running or (remaining is not None and remaining <= 0):
+                    return None
+                self._condition.wait(remaining)
+
+    def process_next(self, timeout: Optional[float] = 0.0) -> bool:
+        """
+        Handle one pending item on the calling thread.
+
+        Returns:
+            True if an item was handled
+        """
+        item = self._pop(timeout)
+        if item is None:
+            return False
+
+        started = time.monotonic()
+        handler = self._handlers.get(item.source)
+        try:
+            if handler is None:
+                raise KeyError(f"No ingestion handler registered for '{item.source}'")
+            handler(item.payload)
+            self.processed += 1
+        except Exception as e:
+            self.failed += 1
+            self.logger.error(f"❌ Error handling queued {item.source} input: {e}")
+        finished = time.monotonic()
+
+        with self._condition:
+            self._wait_ms.append(1000.0 * (started - item.enqueued_at))
+            self._handle_ms.append(1000.0 * (finished - started))
+            del self._wait_ms[:-self.latency_window]
+            del self._handle_ms[:-self.latency_window]
+        return True
+
+    def start(self):
+        """Start the worker thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="IngestionQueue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the worker thread; pending items stay queued."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self):
+        while self._running:
+            self.process_next(timeout=0.5)
+
+    def drain(self):
+        """Handle every pending item on the calling thread (tests, shutdown)."""
+        while self.process_next(timeout=0.0):
+            pass
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @staticmethod
+    def _percentile(values: List[float], fraction: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and latency statistics."""
+        with self._condition:
+            wait_ms = list(self._wait_ms)
+            handle_ms = list(self._handle_ms)
+            depth_by_source = {source: depth for source, depth in self._depth_by_source.items() if depth}
+            depth = self._depth
+        return {
+            'depth': depth,
+            'depth_by_source': depth_by_source,
+            'max_size': self.max_size,
+            'running': self._running,
+            'submitted': self.submitted,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'rejected': self.rejected,
+            'processed': self.processed,
+            'failed': self.failed,
+            'wait_ms': {
+                'avg': sum(wait_ms) / len(wait_ms) if wait_ms else 0.0,
+                'p95': self._percentile(wait_ms, 0.95),
+                'max': max(wait_ms, default=0.0)
+            },
+            'handle_ms': {
+                'avg': sum(handle_ms) / len(handle_ms) if handle_ms else 0.0,
+                'p95': self._percentile(handle_ms, 0.95),
+                'max': max(handle_ms, default=0.0)
+            }
+        }
@@ -11,6 +11,7 @@ import random
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from event import Event
+from consciousness_evidence_stream import publish_evidence
 
 class InnerSelf:
     """
@@ -1134,6 +1135,7 @@ class InnerSelf:
                 
                 # Also save PDB event file for ECE scanning
                 self._save_pdb_event_file(event_data)
+                publish_evidence('purpose_driven_behavior', 1.0, source='inner_self.pdb_action')
                 
         except Exception as e:
             self.logger.error(f"❌ Error logging PDB action: {e}")
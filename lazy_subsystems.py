@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Lazy Subsystems
+===============
+
+On-demand construction of rarely used subsystems.
+
+main.py imported and constructed every subsystem before the window
+appeared, including ones most sessions never touch (imagination, the
+consciousness evaluation, game systems, association discovery, session
+reports). A ``LazySubsystem`` is a class attribute of the app that imports
+its module and builds the subsystem the first time the attribute is read,
+then stores it on the instance so later reads are plain attribute lookups:
+
+    class PersonalityBotApp(tk.Tk):
+        session_reporter = LazySubsystem(
+            lambda app: import_attr('session_reporting', 'SessionReporter')(output_dir="reports"))
+
+A factory that raises leaves the attribute None, as the eager
+initialization code did on failure. Assigning the attribute replaces the
+lazy value as with any instance attribute. ``is_loaded`` tells
+whether a subsystem was built without building it, e.g. at shutdown.
+"""
+
+import time
+import logging
+import importlib
+import threading
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def import_attr(module_name: str, attr: str) -> Any:
+    """Import a module and return one of its attributes."""
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class LazySubsystem:
+    """
+    Class attribute that builds a subsystem on first access.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        """
+        Initialize the descriptor.
+
+        Args:
+            factory: Called with the owning instance; returns the subsystem
+        """
+        self.factory = factory
+        self.name = None
+        self._lock = threading.RLock()
+        self.load_seconds: Dict[int, float] = {}  # id(instance) -> build time
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            # Another thread may have built it while this one waited
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            started = time.perf_counter()
+            try:
+                value = self.factory(instance)
+            except Exception as e:
+                # Callers check these subsystems with "if self.x:"; an AttributeError
+                # escaping here would also be misreported by Tk's __getattr__
+                logger.error(f"❌ Could not load {self.name}: {e}")
+                value = None
+            elapsed = time.perf_counter() - started
+            self.load_seconds[id(instance)] = elapsed
+            instance.__dict__[self.name] = value
+        logger.info(f"⏳ Loaded {self.name} on first use ({1000 * elapsed:.0f}ms)")
+        return value
+
+    def is_loaded(self, instance) -> bool:
+        return self.name in instance.__dict__
+
+
+def lazy_subsystems(owner) -> List[str]:
+    """Names of the lazy subsystems declared on a class (or an instance's class)."""
+    cls = owner if isinstance(owner, type) else type(owner)
+    names = []
+    for klass in reversed(cls.__mro__):
+        names.extend(name for name, value in vars(klass).items()
+                     if isinstance(value, LazySubsystem) and name not in names)
+    return names
+
+
+def is_loaded(instance, name: str) -> bool:
+    """Whether a lazy subsystem has been built (or assigned) on an instance."""
+    descriptor = getattr(type(instance), name, None)
+    if isinstance(descriptor, LazySubsystem):
+        return descriptor.is_loaded(instance)
+    return hasattr(instance, name)
+
+
+def lazy_subsystem_stats(instance) -> Dict[str, Dict[str, Any]]:
+    """Load state and build time of each lazy subsystem of an instance."""
+    stats = {}
+    for name in lazy_subsystems(instance):
+        descriptor = getattr(type(instance), name)
+        seconds = descriptor.load_seconds.get(id(instance))
+        stats[name] = {
+            'loaded': descriptor.is_loaded(instance),
+            'load_ms': None if seconds is None else 1000 * seconds
+        }
+    return stats
@@ -34,11 +34,15 @@ from position_aware_skill_system import PositionAwareSkillSystem
 from enhanced_eye_expression_system import EnhancedEyeExpressionSystem
 from enhanced_skill_execution_system import EnhancedSkillExecutionSystem
 from enhanced_startup_sequencing import EnhancedStartupSequencing
+from startup_orchestrator import StartupOrchestrator
 from curiosity_module import CuriosityModule
 from memory_id_system import MemoryIDSystem
-from enhanced_consciousness_evaluation import EnhancedConsciousnessEvaluation
+from gui_log_sink import GuiLogSink, write_console
+from ingestion_queue import IngestionQueue
+from speculative_prefetch import SpeculativePrefetcher
+from vision_memory_records import expand_vision_records, index_scenes
+from lazy_subsystems import LazySubsystem, import_attr, is_loaded
 
-from imagination_system import ImaginationSystem
 from memory_retrieval_system import MemoryRetrievalSystem
 from inner_self import InnerSelf
 from memory_system import MemorySystem, MemoryContext
@@ -47,7 +51,6 @@ from concept_graph_system import ConceptGraphSystem
 from values_system import ValuesSystem
 from inner_world_system import InnerWorldSystem, ThoughtMode
 from vision_transport import VisionTransport
-from vision_deduplication import vision_deduplication
 from vision_events import VisionEvent
 # Import commonsense modules with error handling
 try:
@@ -65,7 +68,6 @@ except Exception as e:
     commonsense_available = False
     print(f"Info: Commonsense module error ({e}) - using fallback strategic planning")
 from humor_system import HumorSystem
-from session_reporting import SessionReporter
 from dataclasses import dataclass
 from typing import Optional
 import threading
@@ -688,44 +690,11 @@ except ImportError:
 
 # Learning system import
 from learning_system import LearningSystem
+from runtime_context import get_current_context
+from memory.image_store import get_thumbnail
 
-class InitRegistry:
-    """Global initialization registry to prevent duplicate system initialization."""
-    
-    def __init__(self):
-        self.flags = {
-            'systems': False,
-            'eyes_system': False,
-            'skill_exec_system': False,
-            'beliefs': False,
-            'concepts': False,
-            'skills': False,
-            'needs': False,
-            'senses': False,
-            'neucogar': False,
-            'imagination': False,
-            'humor': False,
-            'memory': False,
-            'inner_world': False,
-            'vision': False,
-            'flask': False
-        }
-    
-    def is_initialized(self, system: str) -> bool:
-        """Check if a system has been initialized."""
-        return self.flags.get(system, False)
-    
-    def mark_initialized(self, system: str):
-        """Mark a system as initialized."""
-        self.flags[system] = True
-    
-    def reset(self):
-        """Reset all initialization flags."""
-        for key in self.flags:
-            self.flags[key] = False
-
-# Global initialization registry
-init_registry = InitRegistry()
+# Global initialization registry (per runtime context)
+init_registry = get_current_context().init_registry
 
 
 
@@ -736,6 +705,18 @@ init_registry = InitRegistry()
 # The correct class definition and methods are already present earlier in the file
 
 class PersonalityBotApp(tk.Tk):
+    # Rarely used subsystems: imported and built on first access (see lazy_subsystems)
+    enhanced_consciousness_evaluation = LazySubsystem(lambda app: app._create_consciousness_evaluation())
+    imagination_system = LazySubsystem(lambda app: app._create_imagination_system())
+    game_theory_system = LazySubsystem(
+        lambda app: import_attr('game_theory', 'GameTheorySystem')(app.logic_system, app))
+    generic_game_system = LazySubsystem(
+        lambda app: import_attr('generic_game_system', 'GenericGameSystem')(app.logic_system, app))
+    association_discovery = LazySubsystem(
+        lambda app: import_attr('automated_association_discovery', 'AutomatedAssociationDiscovery')())
+    session_reporter = LazySubsystem(
+        lambda app: import_attr('session_reporting', 'SessionReporter')(output_dir="reports"))
+
     def __init__(self):
         super().__init__()
         
@@ -792,9 +773,6 @@ class PersonalityBotApp(tk.Tk):
         # Initialize Memory ID system
         self.memory_id_system = MemoryIDSystem(self)
         
-        # Initialize Enhanced Consciousness Evaluation
-        self.enhanced_consciousness_evaluation = EnhancedConsciousnessEvaluation(self)
-        
         # Initialize user name tracking
         self.known_user_names = set()
         self.last_known_user_name = None
@@ -937,26 +915,16 @@ class PersonalityBotApp(tk.Tk):
         self.perception_system = PerceptionSystem(self)
         self.judgment_system = JudgmentSystem(self)
         
-        # Initialize game theory system
-        from game_theory import GameTheorySystem
+        # Initialize logic system (game systems are built on first use)
         from logic_system import LogicSystem
         self.logic_system = LogicSystem(self.api_client)
-        self.game_theory_system = GameTheorySystem(self.logic_system, self)
         
         # Initialize earthly game engine
         self._initialize_earthly_game_engine()
         
-        # Initialize working memory system
-        from working_memory import WorkingMemory
-        self.working_memory = WorkingMemory()
-        
-        # Initialize memory retrieval system
-        self.memory_retrieval_system = MemoryRetrievalSystem(
-            personality_type=self.settings.get('personality', 'type', fallback='INTP')
-        )
-        
-        # Initialize NEUCOGAR emotional engine
-        self.neucogar_engine = NEUCOGAREmotionalEngine()
+        # Initialize working memory, memory retrieval, NEUCOGAR, memory and concept
+        # systems concurrently (they don't depend on each other)
+        self._initialize_core_subsystems()
         
         # Initialize consciousness tracking
         self.consciousness_level = 1.0      # 1.0 = fully awake, 0.0 = unconscious
@@ -978,26 +946,6 @@ class PersonalityBotApp(tk.Tk):
         # Load attention policy from game configuration if available
         self._load_attention_policy()
         
-        # Initialize comprehensive memory system
-        self.memory_system = MemorySystem(personality_type=self.settings.get('personality', 'type', fallback='INTP'))
-        
-        # Initialize comprehensive concept system with error handling
-        try:
-            self.concept_system = ConceptSystem(personality_type=self.settings.get('personality', 'type', fallback='INTP'))
-            self.log("✅ Concept system initialized successfully")
-        except Exception as e:
-            self.log(f"❌ Error initializing concept system: {e}")
-            # Create a fallback concept system
-            self.concept_system = self._create_fallback_concept_system()
-        
-        # Initialize concept graph system for enhanced associations
-        try:
-            self.concept_graph_system = ConceptGraphSystem()
-            self.log("✅ Concept graph system initialized successfully")
-        except Exception as e:
-            self.log(f"❌ Error initializing concept graph system: {e}")
-            self.concept_graph_system = None
-        
         # Initialize EZ-Robot and pass to Action System
         self.ez_robot = None
         self.ez_robot_connected = False
@@ -1045,6 +993,13 @@ class PersonalityBotApp(tk.Tk):
         self.speech_server_host = '0.0.0.0'  # Listen on all interfaces to accept connections from ARC (192.168.56.1)
         self.arc_server_ip = '192.168.56.1'  # ARC's HTTP server IP address
         
+        # Flask routes only queue inputs; one worker hands them to cognition (speech first)
+        self.ingestion_queue = IngestionQueue(max_size=256)
+        self.ingestion_queue.register_handler('speech', self._handle_speech_input)
+        self.ingestion_queue.register_handler('vision', self._ingest_arc_vision,
+                                              on_discard=self._discard_arc_vision_frame)
+        self.ingestion_queue.register_handler('arc_image', self._process_arc_image_notification)
+        
         # Initialize ConfigParser as settings instead of config
         self.settings = configparser.ConfigParser()
         
@@ -1067,8 +1022,24 @@ class PersonalityBotApp(tk.Tk):
             with open('settings_current.ini', 'w') as configfile:
                 self.settings.write(configfile)
         
+        # Batched log sink for the output window (thread-safe, bounded, file-backed)
+        self.log_sink = GuiLogSink(
+            max_lines=self.settings.getint('gui_log', 'max_lines', fallback=5000),
+            flush_interval_ms=self.settings.getint('gui_log', 'flush_interval_ms', fallback=100),
+            display_level=self.settings.get('gui_log', 'display_level', fallback='INFO'),
+            log_file=self.settings.get('gui_log', 'log_file', fallback='logs/carl_output.log') or None
+        )
+        
+        # Start reflex/memory/concept lookups (and optionally a draft reply) while input is still arriving
+        self.speculative_prefetcher = SpeculativePrefetcher(
+            max_workers=self.settings.getint('speculation', 'max_workers', fallback=3)
+        )
+        self.speculative_prefetcher.enabled = self.settings.getboolean('speculation', 'enabled', fallback=True)
+        self._register_speculative_tasks()
+        
         # Create widgets first
         self.create_widgets()
+        self.log_sink.attach(self, self.output_text)
         
         # Then load settings and redirect stdout
         self.load_settings()
@@ -1117,6 +1088,79 @@ class PersonalityBotApp(tk.Tk):
         asyncio.set_event_loop(self.loop)
         self.loop.run_forever()
 
+    def _create_consciousness_evaluation(self):
+        """Build the consciousness evaluation and start its evidence reconciliation."""
+        from enhanced_consciousness_evaluation import EnhancedConsciousnessEvaluation
+        evaluation = EnhancedConsciousnessEvaluation(self)
+        evaluation.start_evidence_reconciliation()
+        return evaluation
+
+    def _create_imagination_system(self):
+        """Build the imagination system (None until its required systems exist)."""
+        if not all(hasattr(self, name) for name in ('api_client', 'memory_system', 'concept_system', 'neucogar_engine')):
+            self.log("⚠️ Required systems not available for imagination system initialization")
+            return None
+        from imagination_system import ImaginationSystem
+        imagination_system = ImaginationSystem(self.api_client, self.memory_system, self.concept_system, self.neucogar_engine)
+        # First use may happen off the main thread; the GUI is created on it
+        if hasattr(self, 'imagination_container'):
+            self.post_to_gui(self._attach_imagination_gui)
+        return imagination_system
+
+    def _initialize_core_subsystems(self):
+        """Construct the independent core subsystems on a thread pool and log the startup timeline."""
+        personality_type = self.settings.get('personality', 'type', fallback='INTP')
+
+        def init_working_memory():
+            from working_memory import WorkingMemory
+            self.working_memory = WorkingMemory()
+
+        def init_memory_retrieval():
+            self.memory_retrieval_system = MemoryRetrievalSystem(personality_type=personality_type)
+
+        def init_neucogar():
+            self.neucogar_engine = NEUCOGAREmotionalEngine()
+
+        def init_memory_system():
+            self.memory_system = MemorySystem(personality_type=personality_type)
+
+        def init_concept_system():
+            # Initialize comprehensive concept system with error handling
+            try:
+                self.concept_system = ConceptSystem(personality_type=personality_type)
+                self.log("✅ Concept system initialized successfully")
+            except Exception as e:
+                self.log(f"❌ Error initializing concept system: {e}")
+                # Create a fallback concept system
+                self.concept_system = self._create_fallback_concept_system()
+
+        def init_concept_graph():
+            # Initialize concept graph system for enhanced associations
+            try:
+                self.concept_graph_system = ConceptGraphSystem()
+                self.log("✅ Concept graph system initialized successfully")
+            except Exception as e:
+                self.log(f"❌ Error initializing concept graph system: {e}")
+                self.concept_graph_system = None
+
+        orchestrator = StartupOrchestrator(
+            max_workers=self.settings.getint('startup', 'max_workers', fallback=4)
+        )
+        orchestrator.add('working_memory', init_working_memory)
+        orchestrator.add('memory_retrieval', init_memory_retrieval)
+        orchestrator.add('neucogar', init_neucogar)
+        orchestrator.add('memory_system', init_memory_system)
+        orchestrator.add('concept_system', init_concept_system)
+        # Both read the concepts folder; the concept system may create its template there
+        orchestrator.add('concept_graph', init_concept_graph, depends_on=['concept_system'])
+        self.core_startup_report = orchestrator.run()
+        self.log(self.core_startup_report.format_timeline())
+
+        # Subsystems the rest of startup relies on
+        failed = [name for name, node in self.core_startup_report.nodes.items() if node.status != 'ready']
+        if failed:
+            raise RuntimeError(f"Core subsystems failed to initialize: {', '.join(failed)}")
+
     def _initialize_ez_robot(self):
         """Initialize EZ-Robot connection with enhanced startup sequencing."""
         try:
@@ -1285,9 +1329,14 @@ class PersonalityBotApp(tk.Tk):
                     if speech_data:
                         carl_instance.log(f"🎤 Received speech from ARC: '{speech_data}'")
                         
-                        # Process speech through CARL's cognitive systems
+                        # Queue speech for CARL's cognitive systems and answer immediately
                         if carl_instance.cognitive_state["is_processing"]:
-                            carl_instance._handle_speech_input(speech_data)
+                            # Reflex/memory lookups start now instead of when the queue reaches this input
+                            carl_instance.speculative_prefetcher.speculate(speech_data, final=True)
+                            queued = carl_instance.ingestion_queue.submit('speech', speech_data)
+                            if not queued['accepted']:
+                                return jsonify({"status": "busy", "message": "Ingestion queue full", "queue_depth": queued['depth']}), 503
+                            return jsonify({"status": queued['status'], "message": f"Received: {speech_data}", "queue_depth": queued['depth']}), 202
                         else:
                             carl_instance.log(f"🎤 Received speech: '{speech_data}' but bot is not running - ignoring input")
                         
@@ -1300,6 +1349,28 @@ class PersonalityBotApp(tk.Tk):
                     carl_instance.log(f"❌ Error processing speech POST request: {e}")
                     return jsonify({"status": "error", "message": str(e)}), 500
             
+            @self.flask_app.route('/speech/partial', methods=['POST'])
+            def receive_partial_speech():
+                """Receive a partial (still changing) speech recognition from ARC."""
+                try:
+                    partial_text = request.form.get('speech')
+                    if not partial_text:
+                        json_data = request.get_json(silent=True)
+                        if json_data:
+                            partial_text = json_data.get('speech', '')
+                    
+                    if not partial_text:
+                        return jsonify({"status": "error", "message": "No speech data received"}), 400
+                    if not carl_instance.cognitive_state["is_processing"]:
+                        return jsonify({"status": "ignored", "message": "Bot is not running"}), 200
+                    
+                    started = carl_instance.speculative_prefetcher.speculate(partial_text, final=False)
+                    return jsonify({"status": "prefetching", "tasks_started": started}), 202
+                    
+                except Exception as e:
+                    carl_instance.log(f"❌ Error processing partial speech POST request: {e}")
+                    return jsonify({"status": "error", "message": str(e)}), 500
+            
             @self.flask_app.route('/vision', methods=['POST'])
             def receive_vision():
                 """Receive vision data from ARC via HTTP POST."""
@@ -1320,37 +1391,35 @@ class PersonalityBotApp(tk.Tk):
                     if object_name:
                         carl_instance.log(f"👁️ Received vision from ARC: '{object_name}' (Color: {object_color}, Shape: {object_shape})")
                         
-                        # 🔧 FIX: Immediately capture image when ARC sends vision data
-                        image_path = None
-                        if hasattr(carl_instance, 'vision_system') and carl_instance.vision_system:
-                            try:
-                                # Capture current camera image immediately
-                                image_path = carl_instance.vision_system.capture_camera_image()
-                                if image_path:
-                                    carl_instance.log(f"📸 Image captured for ARC vision: {os.path.basename(image_path)}")
-                                else:
-                                    carl_instance.log("⚠️ Failed to capture image for ARC vision")
-                            except Exception as e:
-                                carl_instance.log(f"❌ Error capturing image for ARC vision: {e}")
-                        
-                        # Create vision event for immediate processing
-                        from vision_events import VisionEvent
-                        vision_event = VisionEvent(
-                            name=object_name,
-                            label=object_name,
-                            confidence=0.8,
-                            timestamp=datetime.now().isoformat(),
-                            bbox=[0, 0, 100, 100],  # Default bbox
-                            source="arc_vision"
-                        )
-                        
-                        # Store image path in vision event for memory association
-                        if image_path:
-                            vision_event.image_path = image_path
-                        
-                        # Process vision through CARL's cognitive systems immediately
+                        # Queue the detection; repeated detections of the same object coalesce while waiting
                         if carl_instance.cognitive_state["is_processing"]:
-                            carl_instance._handle_vision_event(vision_event)
+                            # Grab the frame now: the memshot must show what ARC saw, not the scene at dequeue time
+                            image_path = carl_instance._capture_arc_vision_frame()
+                            
+                            # Warm the concept lookups for the object while it waits in the queue
+                            carl_instance.speculative_prefetcher.warm(object_name, ('concepts',))
+                            queued = carl_instance.ingestion_queue.submit(
+                                'vision',
+                                {
+                                    'object_name': object_name,
+                                    'object_color': object_color,
+                                    'object_shape': object_shape,
+                                    'image_path': image_path,
+                                    'timestamp': datetime.now().isoformat()
+                                },
+                                key=f"{object_name.strip().lower()}|{object_color.strip().lower()}"
+                            )
+                            if not queued['accepted']:
+                                carl_instance._discard_arc_vision_frame({'image_path': image_path})
+                                return jsonify({"status": "busy", "message": "Ingestion queue full", "queue_depth": queued['depth']}), 503
+                            return jsonify({
+                                "status": queued['status'],
+                                "message": f"Received vision: {object_name}",
+                                "object_name": object_name,
+                                "object_color": object_color,
+                                "object_shape": object_shape,
+                                "queue_depth": queued['depth']
+                            }), 202
                         else:
                             carl_instance.log(f"👁️ Received vision: '{object_name}' but bot is not running - ignoring input")
                         
@@ -1426,9 +1495,16 @@ class PersonalityBotApp(tk.Tk):
                         carl_instance.pending_arc_images = []
                     carl_instance.pending_arc_images.append(arc_image_data)
                     
-                    # Process the image if CARL is running
+                    # Queue the image for processing if CARL is running
                     if carl_instance.cognitive_state["is_processing"]:
-                        carl_instance._process_arc_image_notification(arc_image_data)
+                        queued = carl_instance.ingestion_queue.submit('arc_image', arc_image_data, key=image_path)
+                        return jsonify({
+                            "status": queued['status'],
+                            "message": f"ARC image notification received: {image_filename}",
+                            "mid": mid,
+                            "image_data": arc_image_data,
+                            "queue_depth": queued['depth']
+                        }), 202 if queued['accepted'] else 503
                     
                     return jsonify({
                         "status": "success",
@@ -1461,6 +1537,8 @@ class PersonalityBotApp(tk.Tk):
                     "vision_active": True,  # Vision endpoint is always available
                     "ez_robot_connected": carl_instance.ez_robot_connected,
                     "total_memories": carl_instance.total_memories,
+                    "ingestion_queue": carl_instance.ingestion_queue.get_stats(),
+                    "speculation": carl_instance.speculative_prefetcher.get_stats(),
                     "server_port": carl_instance.speech_server_port,
                     "server_host": carl_instance.speech_server_host,
                     "endpoints": {
@@ -1480,6 +1558,58 @@ class PersonalityBotApp(tk.Tk):
             carl_instance.log(f"❌ Error initializing Flask server: {e}")
             self.flask_app = None
 
+    def _capture_arc_vision_frame(self) -> Optional[str]:
+        """Capture the current camera frame as the memshot for an ARC detection (request thread)."""
+        if not (hasattr(self, 'vision_system') and self.vision_system):
+            return None
+        try:
+            image_path = self.vision_system.capture_camera_image()
+            if image_path:
+                self.log(f"📸 Image captured for ARC vision: {os.path.basename(image_path)}")
+            else:
+                self.log("⚠️ Failed to capture image for ARC vision")
+            return image_path
+        except Exception as e:
+            self.log(f"❌ Error capturing image for ARC vision: {e}")
+            return None
+
+    def _discard_arc_vision_frame(self, vision_data: Dict):
+        """Delete the frame of an ARC detection that will never be stored (superseded or dropped)."""
+        image_path = vision_data.get('image_path')
+        if not image_path or not os.path.exists(image_path):
+            return
+        try:
+            os.remove(image_path)
+            self.log(f"🗑️ Discarded superseded ARC vision capture: {os.path.basename(image_path)}")
+        except OSError as e:
+            self.log(f"⚠️ Could not remove superseded ARC vision capture {image_path}: {e}")
+
+    def _ingest_arc_vision(self, vision_data: Dict):
+        """Handle a queued ARC vision detection (ingestion worker thread)."""
+        object_name = vision_data['object_name']
+        
+        # The frame was captured when the detection arrived
+        image_path = vision_data.get('image_path')
+        
+        from vision_events import VisionEvent
+        vision_event = VisionEvent(
+            name=object_name,
+            label=object_name,
+            confidence=0.8,
+            timestamp=vision_data.get('timestamp', datetime.now().isoformat()),
+            bbox=[0, 0, 100, 100],  # Default bbox
+            source="arc_vision"
+        )
+        
+        # Store image path in vision event for memory association
+        if image_path:
+            vision_event.image_path = image_path
+        
+        if self.cognitive_state["is_processing"]:
+            self._handle_vision_event(vision_event)
+        else:
+            self.log(f"👁️ Dropping queued vision '{object_name}' - bot is no longer running")
+
     def _start_flask_server(self):
         """Start the Flask HTTP server in a separate thread."""
         if not self.flask_app:
@@ -1511,6 +1641,7 @@ class PersonalityBotApp(tk.Tk):
                 name="Flask-Server"
             )
             self.flask_thread.start()
+            self.ingestion_queue.start()
             
             # Wait a moment for server to start
             time.sleep(1)
@@ -1549,6 +1680,8 @@ class PersonalityBotApp(tk.Tk):
         try:
             self.flask_server_running = False
             self.log("📡 Stopping Flask HTTP server...")
+            self.ingestion_queue.stop()
+            self.speculative_prefetcher.cancel()
             
             # The server will stop automatically when the thread ends
             if self.flask_thread and self.flask_thread.is_alive():
@@ -2616,6 +2749,35 @@ class PersonalityBotApp(tk.Tk):
             self.log(f"Error getting dominant emotion from STM: {e}")
             return None
 
+    def _register_speculative_tasks(self):
+        """Register the work process_input can reuse when it was started ahead of time."""
+        def reflex(text):
+            if hasattr(self, 'perception_system') and self.perception_system:
+                # Match only; process_input records the hit once it claims the result
+                return self.perception_system.check_reflex_response(text, record=False)
+            return None
+        
+        def memory(text):
+            if hasattr(self, 'memory_retrieval_system') and self.memory_retrieval_system.is_context_free_query(text):
+                return self.memory_retrieval_system.retrieve_memory(query=text)
+            return None
+        
+        def concepts(text):
+            return get_current_context().concept_index.search(text)
+        
+        def draft(text):
+            if hasattr(self, 'judgment_system') and self.judgment_system:
+                return self.judgment_system.process_openai_fallback(text)
+            return None
+        
+        # Reflex matches are only worth computing for confirmed input
+        self.speculative_prefetcher.register('reflex', reflex, on_partial=False)
+        self.speculative_prefetcher.register('memory', memory)
+        self.speculative_prefetcher.register('concepts', concepts)
+        if self.settings.getboolean('speculation', 'draft_llm', fallback=False):
+            # The draft reply is an API call; only worth it for the final text
+            self.speculative_prefetcher.register('draft', draft, on_partial=False)
+    
     def _handle_speech_input(self, speech_text: str):
         """Handle speech input from JD's Bing Speech Recognition or ARC HTTP POST."""
         try:
@@ -5821,31 +5983,30 @@ class PersonalityBotApp(tk.Tk):
         self.trigger_imagination = trigger_imagination.__get__(self, type(self))
 
     
-        # Create imagination GUI
+        # Create imagination GUI once the imagination system has been built (it loads on first use)
         self.imagination_gui = None
+        if is_loaded(self, 'imagination_system'):
+            self._attach_imagination_gui()
+        else:
+            self.log("⏳ Imagination system loads on first use - its GUI is attached then")
+    
+    def _attach_imagination_gui(self):
+        """Create the imagination GUI for the imagination system (main thread)."""
+        if getattr(self, 'imagination_gui', None) or not hasattr(self, 'imagination_container'):
+            return
         
         # Ensure imagination system is available
-        if not hasattr(self, 'imagination_system') or not self.imagination_system:
+        if not self.imagination_system:
             try:
-                # Check if required systems are available
-                if (hasattr(self, 'api_client') and hasattr(self, 'memory_system') and 
-                    hasattr(self, 'concept_system') and hasattr(self, 'neucogar_engine')):
-                    from imagination_system import ImaginationSystem
-                    self.imagination_system = ImaginationSystem(
-                        self.api_client,
-                        self.memory_system,
-                        self.concept_system,
-                        self.neucogar_engine
-                    )
+                # First built before its required systems existed (or failed); try again
+                self.imagination_system = self._create_imagination_system()
+                if self.imagination_system:
                     self.log("✅ Imagination system initialized for GUI")
-                else:
-                    self.log("⚠️ Required systems not available for imagination system initialization")
-                    self.imagination_system = None
             except Exception as e:
                 self.log(f"⚠️ Could not initialize imagination system for GUI: {e}")
                 self.imagination_system = None
         
-        if hasattr(self, 'imagination_system') and self.imagination_system:
+        if self.imagination_system:
             try:
                 from imagination_gui import ImaginationGUI
                 # Create the imagination GUI directly in the container (matching abandoned version)
@@ -5885,8 +6046,10 @@ class PersonalityBotApp(tk.Tk):
             else:
                 self.log("⚠️ Imagination frame not available")
             
-            # Check if imagination system is available
-            if hasattr(self, 'imagination_system') and self.imagination_system:
+            # Check if imagination system is available (without building it)
+            if not is_loaded(self, 'imagination_system'):
+                self.log("⏳ Imagination system not loaded yet - it loads on first use")
+            elif self.imagination_system:
                 self.log("✅ Imagination system is available")
                 
                 # Check if imagination GUI is available
@@ -5931,7 +6094,9 @@ class PersonalityBotApp(tk.Tk):
             ]
             
             for attr, name in gui_components:
-                if hasattr(self, attr) and getattr(self, attr):
+                if attr == 'imagination_system' and not is_loaded(self, attr):
+                    self.log(f"⏳ {name} loads on first use")
+                elif hasattr(self, attr) and getattr(self, attr):
                     self.log(f"✅ {name} is available")
                 else:
                     self.log(f"⚠️ {name} is not available")
@@ -5945,7 +6110,7 @@ class PersonalityBotApp(tk.Tk):
             
             # Test 3: Check imagination system capabilities
             self.log("📋 Test 3: Checking imagination system capabilities...")
-            if hasattr(self, 'imagination_system') and self.imagination_system:
+            if is_loaded(self, 'imagination_system') and self.imagination_system:
                 required_methods = ['imagine_async', 'generate_episode']
                 for method in required_methods:
                     if hasattr(self.imagination_system, method):
@@ -6744,7 +6909,7 @@ class PersonalityBotApp(tk.Tk):
                     if 0 <= row <= 2 and 0 <= col <= 2:
                         # Try to determine game type from current game state
                         game_type = "tic_tac_toe"  # Default
-                        if hasattr(self, 'generic_game_system') and self.generic_game_system:
+                        if is_loaded(self, 'generic_game_system') and self.generic_game_system:
                             game_type = "tic_tac_toe"
                         # Future: Add logic to detect other game types
                         
@@ -6939,15 +7104,7 @@ class PersonalityBotApp(tk.Tk):
             action = game_request.get("action")
             game_type = game_request.get("game_type", "tic_tac_toe")
             
-            # Initialize generic game system if not already done
-            if not hasattr(self, 'generic_game_system') or self.generic_game_system is None:
-                # Ensure typing module is available in dynamic import context
-                import typing
-                from generic_game_system import GenericGameSystem
-                from logic_system import LogicSystem
-                if not hasattr(self, 'logic_system'):
-                    self.logic_system = LogicSystem(self.api_client)
-                self.generic_game_system = GenericGameSystem(self.logic_system, self)
+            # generic_game_system is built on first access
             
             if action == "list_games":
                 # List available games
@@ -7087,7 +7244,7 @@ class PersonalityBotApp(tk.Tk):
             board_state = None
             current_turn = None
             try:
-                if hasattr(self, 'generic_game_system') and self.generic_game_system:
+                if is_loaded(self, 'generic_game_system') and self.generic_game_system:
                     state = self.generic_game_system.get_game_state()
                     board_state = state.get('board')
                     current_turn = state.get('current_turn')
@@ -7100,7 +7257,7 @@ class PersonalityBotApp(tk.Tk):
             game_type = "tic_tac_toe"  # Default, could be made dynamic
             
             try:
-                if hasattr(self, 'generic_game_system') and self.generic_game_system:
+                if is_loaded(self, 'generic_game_system') and self.generic_game_system:
                     game_state = self.generic_game_system.get_game_state()
                     game_type = game_state.get('game_type', 'tic_tac_toe')
                     move_history = game_state.get('moves', [])
@@ -7700,7 +7857,7 @@ class PersonalityBotApp(tk.Tk):
                 return f"Human player move"
             
             # Try to get reasoning from the game system
-            if hasattr(self, 'generic_game_system') and self.generic_game_system:
+            if is_loaded(self, 'generic_game_system') and self.generic_game_system:
                 game_data = getattr(self.generic_game_system, 'current_game_data', {})
                 moves = game_data.get('moves', [])
                 if moves:
@@ -7715,16 +7872,7 @@ class PersonalityBotApp(tk.Tk):
     def _get_simple_carl_move(self):
         """Get a simple move for CARL in tic-tac-toe."""
         try:
-            # Ensure generic_game_system is initialized
-            if not hasattr(self, 'generic_game_system') or self.generic_game_system is None:
-                # Ensure typing module is available in dynamic import context
-                import typing
-                from generic_game_system import GenericGameSystem
-                from logic_system import LogicSystem
-                if not hasattr(self, 'logic_system'):
-                    self.logic_system = LogicSystem(self.api_client)
-                self.generic_game_system = GenericGameSystem(self.logic_system, self)
-            
+            # generic_game_system is built on first access
             game_state = self.generic_game_system.get_game_state()
             board = game_state.get("board", [])
             
@@ -8206,12 +8354,21 @@ class PersonalityBotApp(tk.Tk):
                 if not hasattr(self, 'vision_image_label') or not self.winfo_exists():
                     break
                 
-                # Fetch image from ARC
-                response = requests.get(vision_url, timeout=2)
-                if response.status_code == 200:
+                # Reuse the vision system's grabbed frame instead of polling the camera again
+                image_bytes = None
+                vision_system = getattr(self, 'vision_system', None)
+                if vision_system and getattr(vision_system, 'frame_grabber', None) and vision_system.frame_grabber.is_running:
+                    frame = vision_system.frame_grabber.latest(max_age=2.0)
+                    image_bytes = frame.data if frame else None
+                else:
+                    response = requests.get(vision_url, timeout=2)
+                    if response.status_code == 200:
+                        image_bytes = response.content
+                
+                if image_bytes:
                     try:
                         # Convert to PIL Image
-                        image = Image.open(io.BytesIO(response.content))
+                        image = Image.open(io.BytesIO(image_bytes))
                         
                         # Resize to 160x120
                         image = image.resize((160, 120), Image.Resampling.LANCZOS)
@@ -15725,8 +15882,8 @@ MEMORY AWARENESS: You have access to your own memories stored in both working me
                     # InnerSelf doesn't have stop_processing - just log that we're stopping
                     self.log("🛑 Stopping inner self (no stop_processing method available)")
             
-            # Stop consciousness evaluation
-            if hasattr(self, 'enhanced_consciousness_evaluation') and self.enhanced_consciousness_evaluation:
+            # Stop consciousness evaluation (if it was ever started)
+            if is_loaded(self, 'enhanced_consciousness_evaluation') and self.enhanced_consciousness_evaluation:
                 self.enhanced_consciousness_evaluation.stop_evaluation()
                 self.log("🛑 Stopped consciousness evaluation")
             
@@ -16963,11 +17120,6 @@ This information was found in recent memories.
                 from collections import deque
                 self.task_queue = deque()
             
-            # Initialize session_reporter if not exists
-            if not hasattr(self, 'session_reporter') or self.session_reporter is None:
-                from session_reporting import SessionReporter
-                self.session_reporter = SessionReporter(output_dir="reports")
-            
             # Step 1: Load and evaluate needs
             needs_result = self._evaluate_needs()
             if needs_result:
@@ -17660,11 +17812,11 @@ This information was found in recent memories.
             active_games = []
             
             # Check game theory system
-            if hasattr(self, 'game_theory_system') and self.game_theory_system:
+            if is_loaded(self, 'game_theory_system') and self.game_theory_system:
                 active_games.extend(self.game_theory_system.list_active_games())
             
             # Check generic game system
-            if hasattr(self, 'generic_game_system') and self.generic_game_system:
+            if is_loaded(self, 'generic_game_system') and self.generic_game_system:
                 if hasattr(self.generic_game_system, 'current_game') and self.generic_game_system.current_game:
                     active_games.append(self.generic_game_system.current_game)
             
@@ -18084,18 +18236,13 @@ This information was found in recent memories.
             # 🔧 FIX: Don't bypass cognitive processing - integrate reflex responses into the pipeline
             reflex_response = None
             if hasattr(self, 'perception_system') and self.perception_system:
-                reflex_response = self.perception_system.check_reflex_response(user_input)
+                prefetched, reflex_response = self.speculative_prefetcher.claim(user_input, 'reflex')
+                if not prefetched:
+                    reflex_response = self.perception_system.check_reflex_response(user_input, record=False)
                 if reflex_response and reflex_response.get('pattern_matched', False):
                     self.log(f"⚡ REFLEX RESPONSE DETECTED: {reflex_response['response']} (confidence: {reflex_response['confidence']:.2f})")
-                    # Store reflex response in memory but continue with cognitive processing
-                    if hasattr(self, 'memory_system') and self.memory_system:
-                        self.memory_system.store_memory(
-                            content=f"Reflex response: {user_input} -> {reflex_response['response']}",
-                            memory_type="working",
-                            context=None,
-                            importance=0.3,
-                            source="reflex_system"
-                        )
+                    # Store reflex response in memory (the match itself had no side effects) but continue with cognitive processing
+                    self.perception_system.record_reflex_response(user_input, reflex_response)
                     # Continue with cognitive processing - don't return early
             
             # CRITICAL: Pause input processing during vision analysis
@@ -18215,7 +18362,9 @@ This information was found in recent memories.
             # 🔧 FIX: Don't bypass cognitive processing - integrate OpenAI fallback into the pipeline
             openai_fallback = None
             if hasattr(self, 'judgment_system') and self.judgment_system:
-                openai_fallback = self.judgment_system.process_openai_fallback(user_input)
+                prefetched, openai_fallback = self.speculative_prefetcher.claim(user_input, 'draft')
+                if not prefetched:
+                    openai_fallback = self.judgment_system.process_openai_fallback(user_input)
                 if openai_fallback and openai_fallback.get('response'):
                     self.log(f"🎲 OPENAI FALLBACK DETECTED: {openai_fallback['response']} (confidence: {openai_fallback['confidence']:.2f})")
                     # Store OpenAI fallback in memory but continue with cognitive processing
@@ -19151,11 +19300,15 @@ Return the values to understand, only in first person point of view, the WHO WHA
                     }
             else:
                 # Use the existing memory retrieval system for other queries
-                retrieval_result = self.memory_retrieval_system.retrieve_memory(
-                    query=user_input,
-                    context=context,
-                    cognitive_ticks=cognitive_ticks
-                )
+                prefetched, retrieval_result = False, None
+                if self.memory_retrieval_system.is_context_free_query(user_input):
+                    prefetched, retrieval_result = self.speculative_prefetcher.claim(user_input, 'memory')
+                if not prefetched or retrieval_result is None:
+                    retrieval_result = self.memory_retrieval_system.retrieve_memory(
+                        query=user_input,
+                        context=context,
+                        cognitive_ticks=cognitive_ticks
+                    )
             
             # Log the retrieval process
             self.log(f"🧠 Memory retrieval method: {retrieval_result.get('method', 'unknown')}")
@@ -20450,16 +20603,12 @@ Return the values to understand, only in first person point of view, the WHO WHA
                         return False
                     
                     # Update position after successful transition
-                    if transition_skill in ["stand up", "stand", "getup"]:
-                        self.position_system.update_current_position("standing")
-                        # Also update ActionSystem position for consistency
-                        if hasattr(self, 'action_system'):
-                            self.action_system.update_body_position("standing")
-                    elif transition_skill in ["sit down", "sit"]:
-                        self.position_system.update_current_position("sitting")
+                    end_pose = self.position_system.get_skill_end_pose(transition_skill)
+                    if end_pose:
+                        self.position_system.update_current_position(end_pose)
                         # Also update ActionSystem position for consistency
                         if hasattr(self, 'action_system'):
-                            self.action_system.update_body_position("sitting")
+                            self.action_system.update_body_position(end_pose)
                 
                 self.log(f"  ✅ Position transition completed")
             
@@ -23641,29 +23790,13 @@ Return the values to understand, only in first person point of view, the WHO WHA
         else:
             return obj
 
-    def log(self, message):
-        if hasattr(self, 'output_text'):
-            try:
-                # Temporarily enable text widget for writing
-                self.output_text.config(state='normal')
-                
-                # Insert message with timestamp
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                self.output_text.insert(tk.END, f"{timestamp}: {message}\n")
-                
-                # Disable text widget to prevent editing
-                self.output_text.config(state='disabled')
-                
-                # Smooth scroll to bottom without flickering
-                self.output_text.see(tk.END)
-                
-                # Update display without forcing layout changes
-                self.output_text.update_idletasks()
-                
-            except Exception as e:
-                print(f"Error in log method: {e}")
+    def log(self, message, level=None):
+        # Queue for the batched output window sink; safe from any thread
+        log_sink = getattr(self, 'log_sink', None)
+        if log_sink:
+            log_sink.submit(str(message), level)
         else:
-            print(f"{datetime.now()}: {message}")
+            write_console(f"{datetime.now()}: {message}\n")
 
     def redirect_stdout_stderr(self):
         sys.stdout = self
@@ -23671,7 +23804,7 @@ Return the values to understand, only in first person point of view, the WHO WHA
 
     def write(self, message):
         if message.strip():  # Avoid logging empty messages
-            self.log(message)
+            self.log(message.rstrip('\n'))
 
     def flush(self):
         pass  # Required for file-like object interface
@@ -25322,6 +25455,12 @@ Return the values to understand, only in first person point of view, the WHO WHA
             except Exception as e:
                 self.log(f"⚠️ Failed to cleanup vision system during shutdown: {e}")
         
+        # Remove stored images no memory references anymore
+        try:
+            get_current_context().memory_store.collect_unreferenced_images()
+        except Exception as e:
+            self.log(f"⚠️ Image garbage collection failed: {e}")
+        
         # Stop all processes
         self.stop_bot()
         # Destroy the window
@@ -30368,8 +30507,8 @@ catalog_builder = CatalogBuilder()
             else:
                 self.log("⚠️ _initialize_imagination_system method not available")
             
-            # Generate startup imagination
-            self._generate_startup_imagination()
+            # Generate startup imagination once the window is up (it may build the imagination system)
+            self.after(100, self._generate_startup_imagination)
             
             # Update GUI status labels
             self._update_startup_gui_status()
@@ -30470,10 +30609,9 @@ catalog_builder = CatalogBuilder()
     def _generate_startup_imagination(self):
         """Generate initial imagination on startup to demonstrate CARL's creative capabilities."""
         try:
-            if hasattr(self, 'imagination_system') and self.imagination_system:
-                # Check if CARL has previous memories to determine startup type
-                has_previous_memories = self._check_for_previous_memories()
-                
+            # Check if CARL has previous memories to determine startup type (before building the imagination system)
+            has_previous_memories = self._check_for_previous_memories()
+            if has_previous_memories or self.imagination_system:
                 if has_previous_memories:
                     # Normal startup - CARL has previous memories and experiences
                     self.log("🔄 Normal startup - CARL has previous memories and experiences")
@@ -33178,8 +33316,8 @@ References:
                 if image_label:
                     if visual_path and os.path.exists(visual_path):
                         try:
-                            # Load and display the image
-                            image = Image.open(visual_path)
+                            # Load the cached thumbnail instead of decoding the full image
+                            image = Image.open(get_thumbnail(visual_path, (300, 300)))
                             # Resize image to fit in the label
                             image.thumbnail((300, 300), Image.Resampling.LANCZOS)
                             photo = ImageTk.PhotoImage(image)
@@ -37440,7 +37578,7 @@ RECENT DIRECTION HISTORY:
             contains_direct_question = False
             
             # Check for human turn in games
-            if hasattr(self, 'game_theory_system') and self.game_theory_system:
+            if is_loaded(self, 'game_theory_system') and self.game_theory_system:
                 try:
                     current_game = self.game_theory_system.get_current_game()
                     if current_game and hasattr(current_game, 'current_turn'):
@@ -37465,7 +37603,7 @@ RECENT DIRECTION HISTORY:
             ctx = {"user_text": getattr(event, 'perceived_message', ''), "channel": "speech"}
             
             # Check if this is game-related
-            if hasattr(self, 'game_theory_system') and self.game_theory_system:
+            if is_loaded(self, 'game_theory_system') and self.game_theory_system:
                 try:
                     current_game = self.game_theory_system.get_current_game()
                     if current_game and hasattr(current_game, 'game_id'):
@@ -37720,7 +37858,7 @@ RECENT DIRECTION HISTORY:
                 bbox=vision_event.bbox
             )
             
-            if vision_deduplication.is_duplicate(dedup_event):
+            if get_current_context().vision_deduplication.is_duplicate(dedup_event):
                 self.log(f"👁️ Skipping duplicate vision event: {vision_event.label}")
                 return
             
@@ -38140,7 +38278,9 @@ RECENT DIRECTION HISTORY:
                         stm_data = []
                     
                     # Get vision-related memories from the last 20 entries
-                    for memory in stm_data[-20:]:  # Use -20: to get last 20, not first 20
+                    # Normalized detection rows are joined with their scene analysis here
+                    scenes = index_scenes(stm_data)
+                    for memory in expand_vision_records(stm_data[-20:], scenes):  # Use -20: to get last 20, not first 20
                         # 🔧 CRITICAL FIX: Look for vision memories in multiple formats
                         is_vision_memory = (
                             memory.get('type') in ['vision_event', 'vision_object_detection'] or
@@ -40593,8 +40733,8 @@ This memory entry enables CARL to recognize and respond appropriately to this ob
             if pdb_pipeline_status:
                 context_parts.append(f"PDB Pipeline: {' → '.join(pdb_pipeline_status)}")
             
-            # Add PDB counter context
-            if hasattr(self, 'enhanced_consciousness_evaluation') and self.enhanced_consciousness_evaluation:
+            # Add PDB counter context (no counters before the evaluation is first used)
+            if is_loaded(self, 'enhanced_consciousness_evaluation') and self.enhanced_consciousness_evaluation:
                 pdb_counters = self.enhanced_consciousness_evaluation.get_pdb_counters()
                 if pdb_counters:
                     counter_summary = []
@@ -41920,8 +42060,11 @@ INNER WORLD INTEGRATION:
     def _initialize_earthly_game_engine(self):
         """Initialize the earthly game engine."""
         try:
-            # Get earthly game configuration
-            earthly_config = self.game_theory_system.get_game_config("earthly_life_liig")
+            # Get earthly game configuration (without building the game theory system)
+            if is_loaded(self, 'game_theory_system'):
+                earthly_config = self.game_theory_system.get_game_config("earthly_life_liig")
+            else:
+                earthly_config = import_attr('game_theory', 'load_game_config')("earthly_life_liig")
             if earthly_config:
                 from earthly_incomplete_game import EarthlyIncompleteGame
                 self.earthly_game = EarthlyIncompleteGame(self, earthly_config)
@@ -2,32 +2,195 @@
 """
 CARL Mapping Updater - Updates existing system files to use completed mappings.
 
-This script reads the carl_completed_mappings.json file and updates existing 
+This script reads the carl_completed_mappings.json file and updates existing
 needs, goals, skills, and concepts files to include the proper associations
 and baseline mental concept associations.
+
+Updates run in bulk: the mappings are indexed by name once, each target file
+is diffed against its mapping, and only files whose mapped fields changed are
+rewritten (atomically, via a temp file and rename) on a thread pool. A dry run
+reports what would change without writing anything.
 """
 
 import os
 import json
+import time
+import argparse
 from datetime import datetime
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+KINDS = ('needs', 'goals', 'skills', 'concepts')
+
+# Target field -> (mapping field, default) copied from each mapping entry
+MAPPED_FIELDS = {
+    'needs': {
+        "priority": ("Priority", 0.0),
+        "IsUsedInNeeds": ("IsUsedInNeeds", True),
+        "AssociatedGoals": ("AssociatedGoals", []),
+        "AssociatedNeeds": ("AssociatedNeeds", [])
+    },
+    'goals': {
+        "priority": ("Priority", 0.5),
+        "IsUsedInNeeds": ("IsUsedInNeeds", True),
+        "AssociatedGoals": ("AssociatedGoals", []),
+        "AssociatedNeeds": ("AssociatedNeeds", [])
+    },
+    'skills': {
+        "Priority": ("Priority", 0.0),
+        "IsUsedInNeeds": ("IsUsedInNeeds", False),
+        "AssociatedGoals": ("AssociatedGoals", []),
+        "AssociatedNeeds": ("AssociatedNeeds", [])
+    },
+    'concepts': {
+        "IsUsedInNeeds": ("IsUsedInNeeds", False),
+        "AssociatedGoals": ("AssociatedGoals", []),
+        "AssociatedNeeds": ("AssociatedNeeds", [])
+    }
+}
+
+KIND_HEADERS = {
+    'needs': "🔄 Updating needs files...",
+    'goals': "🎯 Updating goals files...",
+    'skills': "🛠️ Updating skills files...",
+    'concepts': "🧠 Updating concepts files..."
+}
+
+# Not part of the diff: rewriting a file only to refresh this would defeat the point
+TIMESTAMP_FIELD = "last_updated"
+
+
+def new_record(kind: str, name: str) -> Dict:
+    """Default contents of a target file that doesn't exist yet."""
+    if kind == 'needs':
+        return {
+            "name": name,
+            "urgency": 0.5,
+            "satisfaction": 1.0,
+            "decay_rate": 0.1,
+            "associated_skills": [],
+            "associated_senses": [],
+            "concepts": [name],
+            "skill_class": {
+                "category": "Cognitive Skill",
+                "related_intelligence": "Intrapersonal"
+            },
+            "prerequisites": [],
+            "future_steps": []
+        }
+    if kind == 'goals':
+        return {
+            "name": name,
+            "progress": 0.0,
+            "associated_skills": [],
+            "associated_senses": [],
+            "concepts": [name],
+            "skill_class": {
+                "category": "Cognitive Skill",
+                "related_intelligence": "Intrapersonal"
+            },
+            "prerequisites": [],
+            "future_steps": []
+        }
+    if kind == 'skills':
+        return {
+            "Name": name,
+            "Concepts": [],
+            "Motivators": [],
+            "Techniques": [],
+            "skill_class": {
+                "category": "Generic Skill",
+                "related_intelligence": "General"
+            },
+            "prerequisites": [],
+            "future_steps": []
+        }
+    return {
+        "word": name,
+        "type": "general",
+        "first_seen": str(datetime.now()),
+        "occurrences": 1,
+        "contexts": [],
+        "emotional_history": [],
+        "conceptnet_data": {
+            "has_data": False,
+            "last_lookup": None,
+            "edges": [],
+            "relationships": []
+        },
+        "related_concepts": []
+    }
+
+
+@dataclass
+class MappingChange:
+    """Outcome for one target file."""
+    kind: str
+    name: str
+    path: str
+    action: str  # "create", "update", "unchanged" or "error"
+    changed_fields: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class MappingUpdateReport:
+    """Change report of one bulk update (or dry run)."""
+    dry_run: bool
+    changes: List[MappingChange] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def count(self, action: str) -> int:
+        return sum(1 for change in self.changes if change.action == action)
+
+    @property
+    def written(self) -> int:
+        """Files written (or that would be written in a dry run)."""
+        return self.count("create") + self.count("update")
+
+    def format(self, verbose: bool = True) -> str:
+        """Printable summary, listing every created or updated file if verbose."""
+        prefix = "Would write" if self.dry_run else "Wrote"
+        lines = [f"{prefix} {self.written} of {len(self.changes)} files "
+                 f"({self.count('create')} new, {self.count('update')} updated, "
+                 f"{self.count('unchanged')} unchanged, {self.count('error')} errors) "
+                 f"in {self.elapsed:.2f}s"]
+        if verbose:
+            for change in self.changes:
+                if change.action == "create":
+                    lines.append(f"  ✨ {change.kind}/{change.name}")
+                elif change.action == "update":
+                    lines.append(f"  📝 {change.kind}/{change.name}: {', '.join(change.changed_fields)}")
+                elif change.action == "error":
+                    lines.append(f"  ❌ {change.kind}/{change.name}: {change.error}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable report."""
+        return {
+            'dry_run': self.dry_run,
+            'elapsed': self.elapsed,
+            'counts': {action: self.count(action) for action in ("create", "update", "unchanged", "error")},
+            'changes': [change.__dict__ for change in self.changes if change.action != "unchanged"]
+        }
+
 
 class MappingUpdater:
     """Updates CARL's system files based on completed mappings."""
-    
-    def __init__(self):
+
+    def __init__(self, mappings_file: str = 'carl_completed_mappings.json', base_dir: str = '.',
+                 max_workers: int = 8):
+        self.mappings_file = mappings_file
+        self.max_workers = max_workers
         self.mappings = self._load_mappings()
-        self.base_dirs = {
-            'goals': 'goals',
-            'needs': 'needs', 
-            'skills': 'skills',
-            'concepts': 'concepts'
-        }
-        
+        self.base_dirs = {kind: os.path.join(base_dir, kind) for kind in KINDS}
+        self.index = self._build_index()
+
     def _load_mappings(self) -> Dict:
         """Load the completed mappings from carl_completed_mappings.json."""
         try:
-            with open('carl_completed_mappings.json', 'r') as f:
+            with open(self.mappings_file, 'r') as f:
                 mappings = json.load(f)
                 print(f"✅ Loaded mappings with {len(mappings.get('needs', []))} needs, "
                       f"{len(mappings.get('goals', []))} goals, "
@@ -35,247 +198,160 @@ class MappingUpdater:
                       f"{len(mappings.get('concepts', []))} concepts")
                 return mappings
         except FileNotFoundError:
-            print("❌ carl_completed_mappings.json not found!")
+            print(f"❌ {self.mappings_file} not found!")
             return {'needs': [], 'goals': [], 'skills': [], 'concepts': []}
         except json.JSONDecodeError as e:
-            print(f"❌ Error parsing carl_completed_mappings.json: {e}")
+            print(f"❌ Error parsing {self.mappings_file}: {e}")
             return {'needs': [], 'goals': [], 'skills': [], 'concepts': []}
-    
+
+    def _build_index(self) -> Dict[str, Dict[str, Dict]]:
+        """Index each kind's mappings by lowercase name (later entries win, as they were written last)."""
+        index = {}
+        for kind in KINDS:
+            index[kind] = {}
+            for mapping in self.mappings.get(kind, []):
+                name = mapping.get("Name", "")
+                if name:
+                    index[kind][name.lower()] = mapping
+        return index
+
     def _get_mapping_by_name(self, mappings_list: List[Dict], name: str) -> Optional[Dict]:
         """Find a mapping entry by name."""
+        for kind, indexed in self.index.items():
+            if mappings_list is self.mappings.get(kind):
+                return indexed.get(name.lower())
         for mapping in mappings_list:
             if mapping.get("Name", "").lower() == name.lower():
                 return mapping
         return None
-    
-    def update_needs_files(self):
-        """Update existing needs files with mapping associations."""
-        print("\n🔄 Updating needs files...")
-        needs_dir = self.base_dirs['needs']
-        
-        if not os.path.exists(needs_dir):
-            os.makedirs(needs_dir, exist_ok=True)
-            
-        needs_mappings = self.mappings.get('needs', [])
-        
-        for need_mapping in needs_mappings:
-            need_name = need_mapping.get("Name", "")
-            if not need_name:
-                continue
-                
-            need_file = os.path.join(needs_dir, f"{need_name}.json")
-            
-            # Load existing file or create new one
-            if os.path.exists(need_file):
-                with open(need_file, 'r') as f:
-                    need_data = json.load(f)
-                print(f"  📝 Updating existing need: {need_name}")
+
+    def get_mapping(self, kind: str, name: str) -> Optional[Dict]:
+        """Mapping entry of a need, goal, skill or concept by name."""
+        return self.index.get(kind, {}).get(name.lower())
+
+    def _targets(self, kind: str) -> List[Tuple[str, Dict]]:
+        """(name, mapping) pairs to apply, one per target file."""
+        targets = {}
+        for mapping in self.mappings.get(kind, []):
+            name = mapping.get("Name", "")
+            if name:
+                targets[name] = mapping
+        return list(targets.items())
+
+    def _diff_target(self, kind: str, name: str, mapping: Dict, exists: bool, dry_run: bool) -> MappingChange:
+        """Diff one target file against its mapping and write it if it changed."""
+        path = os.path.join(self.base_dirs[kind], f"{name}.json")
+        try:
+            if exists:
+                with open(path, 'r') as f:
+                    current = json.load(f)
+                data = dict(current)
             else:
-                need_data = {
-                    "name": need_name,
-                    "urgency": 0.5,
-                    "satisfaction": 1.0,
-                    "decay_rate": 0.1,
-                    "associated_skills": [],
-                    "associated_senses": [],
-                    "concepts": [need_name],
-                    "skill_class": {
-                        "category": "Cognitive Skill",
-                        "related_intelligence": "Intrapersonal"
-                    },
-                    "prerequisites": [],
-                    "future_steps": []
-                }
-                print(f"  ✨ Creating new need: {need_name}")
-            
-            # Update with mapping data
-            need_data["priority"] = need_mapping.get("Priority", 0.0)
-            need_data["IsUsedInNeeds"] = need_mapping.get("IsUsedInNeeds", True)
-            need_data["AssociatedGoals"] = need_mapping.get("AssociatedGoals", [])
-            need_data["AssociatedNeeds"] = need_mapping.get("AssociatedNeeds", [])
-            need_data["last_updated"] = str(datetime.now())
-            
-            # Save updated file
-            with open(need_file, 'w') as f:
-                json.dump(need_data, f, indent=4)
-                
-            print(f"    Goals: {need_data['AssociatedGoals']}")
-            print(f"    Needs: {need_data['AssociatedNeeds']}")
-    
-    def update_goals_files(self):
-        """Update existing goals files with mapping associations."""
-        print("\n🎯 Updating goals files...")
-        goals_dir = self.base_dirs['goals']
-        
-        if not os.path.exists(goals_dir):
-            os.makedirs(goals_dir, exist_ok=True)
-            
-        goals_mappings = self.mappings.get('goals', [])
-        
-        for goal_mapping in goals_mappings:
-            goal_name = goal_mapping.get("Name", "")
-            if not goal_name:
-                continue
-                
-            goal_file = os.path.join(goals_dir, f"{goal_name}.json")
-            
-            # Load existing file or create new one
-            if os.path.exists(goal_file):
-                with open(goal_file, 'r') as f:
-                    goal_data = json.load(f)
-                print(f"  📝 Updating existing goal: {goal_name}")
+                current = None
+                data = new_record(kind, name)
+
+            for target_field, (mapping_field, default) in MAPPED_FIELDS[kind].items():
+                data[target_field] = mapping.get(mapping_field, default)
+
+            if current is None:
+                action, changed = "create", []
             else:
-                goal_data = {
-                    "name": goal_name,
-                    "progress": 0.0,
-                    "associated_skills": [],
-                    "associated_senses": [],
-                    "concepts": [goal_name],
-                    "skill_class": {
-                        "category": "Cognitive Skill",
-                        "related_intelligence": "Intrapersonal"
-                    },
-                    "prerequisites": [],
-                    "future_steps": []
-                }
-                print(f"  ✨ Creating new goal: {goal_name}")
-            
-            # Update with mapping data
-            goal_data["priority"] = goal_mapping.get("Priority", 0.5)
-            goal_data["IsUsedInNeeds"] = goal_mapping.get("IsUsedInNeeds", True)
-            goal_data["AssociatedGoals"] = goal_mapping.get("AssociatedGoals", [])
-            goal_data["AssociatedNeeds"] = goal_mapping.get("AssociatedNeeds", [])
-            goal_data["last_updated"] = str(datetime.now())
-            
-            # Save updated file
-            with open(goal_file, 'w') as f:
-                json.dump(goal_data, f, indent=4)
-                
-            print(f"    Goals: {goal_data['AssociatedGoals']}")
-            print(f"    Needs: {goal_data['AssociatedNeeds']}")
-    
-    def update_skills_files(self):
+                keys = (set(current) | set(data)) - {TIMESTAMP_FIELD}
+                changed = sorted(key for key in keys if current.get(key) != data.get(key))
+                action = "update" if changed else "unchanged"
+
+            if action != "unchanged" and not dry_run:
+                data[TIMESTAMP_FIELD] = str(datetime.now())
+                self._write_json(path, data)
+            return MappingChange(kind=kind, name=name, path=path, action=action, changed_fields=changed)
+        except Exception as e:
+            return MappingChange(kind=kind, name=name, path=path, action="error", error=str(e))
+
+    def _write_json(self, path: str, data: Dict):
+        """Write a JSON file atomically."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=4)
+        os.replace(temp_path, path)
+
+    def bulk_update(self, kinds: Iterable[str] = KINDS, dry_run: bool = False) -> MappingUpdateReport:
+        """
+        Bring target files in line with the mappings, writing only changed files.
+
+        Args:
+            kinds: Which of needs, goals, skills and concepts to update
+            dry_run: Report what would change without writing
+
+        Returns:
+            MappingUpdateReport
+        """
+        started = time.perf_counter()
+        report = MappingUpdateReport(dry_run=dry_run)
+        jobs = []
+        for kind in kinds:
+            directory = self.base_dirs[kind]
+            if not dry_run:
+                os.makedirs(directory, exist_ok=True)
+            # One directory listing instead of an exists() call per target
+            try:
+                existing = {entry.name for entry in os.scandir(directory) if entry.is_file()}
+            except FileNotFoundError:
+                existing = set()
+            jobs.extend((kind, name, mapping, f"{name}.json" in existing)
+                        for name, mapping in self._targets(kind))
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                report.changes = list(executor.map(
+                    lambda job: self._diff_target(*job, dry_run=dry_run), jobs))
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _update_kind(self, kind: str) -> MappingUpdateReport:
+        print(f"\n{KIND_HEADERS[kind]}")
+        report = self.bulk_update(kinds=(kind,))
+        print(report.format())
+        return report
+
+    def update_needs_files(self) -> MappingUpdateReport:
+        """Update existing needs files with mapping associations."""
+        return self._update_kind('needs')
+
+    def update_goals_files(self) -> MappingUpdateReport:
+        """Update existing goals files with mapping associations."""
+        return self._update_kind('goals')
+
+    def update_skills_files(self) -> MappingUpdateReport:
         """Update existing skills files with mapping associations."""
-        print("\n🛠️ Updating skills files...")
-        skills_dir = self.base_dirs['skills']
-        
-        if not os.path.exists(skills_dir):
-            os.makedirs(skills_dir, exist_ok=True)
-            
-        skills_mappings = self.mappings.get('skills', [])
-        
-        for skill_mapping in skills_mappings:
-            skill_name = skill_mapping.get("Name", "")
-            if not skill_name:
-                continue
-                
-            skill_file = os.path.join(skills_dir, f"{skill_name}.json")
-            
-            # Load existing file or create new one
-            if os.path.exists(skill_file):
-                with open(skill_file, 'r') as f:
-                    skill_data = json.load(f)
-                print(f"  📝 Updating existing skill: {skill_name}")
-            else:
-                skill_data = {
-                    "Name": skill_name,
-                    "Concepts": [],
-                    "Motivators": [],
-                    "Techniques": [],
-                    "skill_class": {
-                        "category": "Generic Skill",
-                        "related_intelligence": "General"
-                    },
-                    "prerequisites": [],
-                    "future_steps": []
-                }
-                print(f"  ✨ Creating new skill: {skill_name}")
-            
-            # Update with mapping data
-            skill_data["Priority"] = skill_mapping.get("Priority", 0.0)
-            skill_data["IsUsedInNeeds"] = skill_mapping.get("IsUsedInNeeds", False)
-            skill_data["AssociatedGoals"] = skill_mapping.get("AssociatedGoals", [])
-            skill_data["AssociatedNeeds"] = skill_mapping.get("AssociatedNeeds", [])
-            skill_data["last_updated"] = str(datetime.now())
-            
-            # Save updated file
-            with open(skill_file, 'w') as f:
-                json.dump(skill_data, f, indent=4)
-                
-            print(f"    Goals: {skill_data['AssociatedGoals']}")
-            print(f"    Needs: {skill_data['AssociatedNeeds']}")
-    
-    def update_concepts_files(self):
+        return self._update_kind('skills')
+
+    def update_concepts_files(self) -> MappingUpdateReport:
         """Update existing concepts files with mapping associations."""
-        print("\n🧠 Updating concepts files...")
-        concepts_dir = self.base_dirs['concepts']
-        
-        if not os.path.exists(concepts_dir):
-            os.makedirs(concepts_dir, exist_ok=True)
-            
-        concepts_mappings = self.mappings.get('concepts', [])
-        
-        for concept_mapping in concepts_mappings:
-            concept_name = concept_mapping.get("Name", "")
-            if not concept_name:
-                continue
-                
-            concept_file = os.path.join(concepts_dir, f"{concept_name}.json")
-            
-            # Load existing file or create new one
-            if os.path.exists(concept_file):
-                with open(concept_file, 'r') as f:
-                    concept_data = json.load(f)
-                print(f"  📝 Updating existing concept: {concept_name}")
-            else:
-                concept_data = {
-                    "word": concept_name,
-                    "type": "general",
-                    "first_seen": str(datetime.now()),
-                    "occurrences": 1,
-                    "contexts": [],
-                    "emotional_history": [],
-                    "conceptnet_data": {
-                        "has_data": False,
-                        "last_lookup": None,
-                        "edges": [],
-                        "relationships": []
-                    },
-                    "related_concepts": []
-                }
-                print(f"  ✨ Creating new concept: {concept_name}")
-            
-            # Update with mapping data
-            concept_data["IsUsedInNeeds"] = concept_mapping.get("IsUsedInNeeds", False)
-            concept_data["AssociatedGoals"] = concept_mapping.get("AssociatedGoals", [])
-            concept_data["AssociatedNeeds"] = concept_mapping.get("AssociatedNeeds", [])
-            concept_data["last_updated"] = str(datetime.now())
-            
-            # Save updated file
-            with open(concept_file, 'w') as f:
-                json.dump(concept_data, f, indent=4)
-                
-            print(f"    Goals: {concept_data['AssociatedGoals']}")
-            print(f"    Needs: {concept_data['AssociatedNeeds']}")
-    
-    def run_full_update(self):
+        return self._update_kind('concepts')
+
+    def run_full_update(self, dry_run: bool = False) -> MappingUpdateReport:
         """Run the complete mapping update process."""
-        print("🚀 Starting CARL mapping update process...")
+        print("🚀 Starting CARL mapping update process" + (" (dry run)..." if dry_run else "..."))
         print(f"📁 Working in: {os.getcwd()}")
-        
-        self.update_needs_files()
-        self.update_goals_files()
-        self.update_skills_files()
-        self.update_concepts_files()
-        
+
+        report = self.bulk_update(dry_run=dry_run)
+        print(report.format())
+        if dry_run:
+            return report
+
         print("\n✅ Mapping update complete!")
         print("🎯 All system files now use completed mappings for baseline associations.")
         print("💫 Core emotions will be properly impacted by neurotransmitter processes.")
+        return report
 
 def main():
     """Main entry point."""
-    updater = MappingUpdater()
-    updater.run_full_update()
+    parser = argparse.ArgumentParser(description="Update CARL's system files from completed mappings")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing files")
+    parser.add_argument("--workers", type=int, default=8, help="Files processed concurrently")
+    args = parser.parse_args()
+    updater = MappingUpdater(max_workers=args.workers)
+    updater.run_full_update(dry_run=args.dry_run)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,284 @@
+"""
+Content-Addressed Image Store
+
+Stores memshots and vision captures once, named by their SHA-256 digest.
+
+Memory events, vision captures and MID associations keep their familiar paths
+(``memories/memshots/evt_*.jpg``, ``memories/vision/camera_capture_*.jpg``),
+but those paths are hard links to a single blob under ``memories/blobs``, so
+identical frames take disk space once. The blob's link count is its reference
+count: when every memory file pointing at a blob has been deleted, the
+garbage collector removes the blob and its thumbnails. Thumbnails for the
+memory explorer are generated lazily and cached per size.
+
+Stored paths share their data with the blob, so replace them (write a new
+file and ``os.replace`` it) instead of rewriting them in place.
+"""
+
+import os
+import sys
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Optional imports - only used if available
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+def file_digest(path: str, chunk_size: int = 1 << 16) -> str:
+    """SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentAddressedImageStore:
+    """Hash-named image blobs with hard-link reference counting."""
+
+    def __init__(self, root: str = os.path.join("memories", "blobs"), digest_cache_size: int = 4096):
+        self.root = root
+        self.thumbs_dir = os.path.join(root, "thumbs")
+        self._logger = None
+        # Least recently used digests beyond digest_cache_size are dropped
+        self.digest_cache_size = digest_cache_size
+        self._digest_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        # Digests are looked up from the Flask, vision and GUI threads
+        self._digest_lock = threading.Lock()
+
+        # Statistics
+        self.blobs_written = 0
+        self.duplicates_linked = 0
+        self.copy_fallbacks = 0
+        self.thumbnails_generated = 0
+
+        os.makedirs(root, exist_ok=True)
+
+    def set_logger(self, logger):
+        """Set the logger for this store."""
+        self._logger = logger
+
+    def _log(self, message: str):
+        if self._logger:
+            self._logger(message)
+
+    def blob_path(self, digest: str, ext: str = ".jpg") -> str:
+        """Path of the blob for a digest."""
+        return os.path.join(self.root, digest[:2], f"{digest}{ext.lower() or '.bin'}")
+
+    def digest_of(self, path: str) -> str:
+        """Digest of a file, cached by path, size and mtime."""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._digest_lock:
+            digest = self._digest_cache.get(key)
+            if digest is not None:
+                self._digest_cache.move_to_end(key)
+                return digest
+        # Hash outside the lock; a concurrent miss on the same file computes the same digest
+        digest = file_digest(path)
+        with self._digest_lock:
+            self._digest_cache[key] = digest
+            self._digest_cache.move_to_end(key)
+            while len(self._digest_cache) > self.digest_cache_size:
+                self._digest_cache.popitem(last=False)
+        return digest
+
+    def put(self, image_path: str) -> Tuple[str, str]:
+        """
+        Add an image to the store (no-op if the content is already stored).
+
+        Returns:
+            (digest, blob path)
+        """
+        digest = self.digest_of(image_path)
+        blob = self.blob_path(digest, os.path.splitext(image_path)[1])
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            # Write via a temp file so a crash never leaves a truncated blob under a valid name
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(blob), suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(image_path, temp_path)
+            os.replace(temp_path, blob)
+            self.blobs_written += 1
+        return digest, blob
+
+    def _link(self, blob: str, dest_path: str):
+        """Hard-link a blob to dest_path, falling back to a copy."""
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)
+        try:
+            os.link(blob, dest_path)
+        except (OSError, NotImplementedError, AttributeError):
+            # Different volume or no hard-link support: keep a private copy
+            shutil.copy2(blob, dest_path)
+            self.copy_fallbacks += 1
+
+    def store_as(self, image_path: str, dest_path: str) -> str:
+        """
+        Store an image and make dest_path a link to its blob (replaces shutil.copy2).
+
+        Returns:
+            Digest of the image
+        """
+        digest, blob = self.put(image_path)
+        os.makedirs(os.path.dirname(dest_path) or '.', exist_ok=True)
+        self._link(blob, dest_path)
+        return digest
+
+    def ingest(self, image_path: str) -> str:
+        """
+        Deduplicate an existing file in place.
+
+        If the content is already stored, the file is replaced by a link to the
+        existing blob; otherwise the file itself becomes the blob's first link.
+
+        Returns:
+            Digest of the image
+        """
+        digest = self.digest_of(image_path)
+        blob = self.blob_path(digest, os.path.splitext(image_path)[1])
+        if os.path.exists(blob):
+            if not os.path.samefile(blob, image_path):
+                self._link(blob, image_path)
+                self.duplicates_linked += 1
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                os.link(image_path, blob)
+            except (OSError, NotImplementedError, AttributeError):
+                shutil.copy2(image_path, blob)
+                self.copy_fallbacks += 1
+            self.blobs_written += 1
+        return digest
+
+    def reference_count(self, digest: str) -> int:
+        """Number of memory files linked to a blob (excluding the blob itself)."""
+        blob = self._find_blob(digest)
+        if not blob:
+            return 0
+        return os.stat(blob).st_nlink - 1
+
+    def _find_blob(self, digest: str) -> Optional[str]:
+        directory = os.path.join(self.root, digest[:2])
+        if not os.path.isdir(directory):
+            return None
+        for name in os.listdir(directory):
+            if name.startswith(digest):
+                return os.path.join(directory, name)
+        return None
+
+    def thumbnail(self, image_path: str, size: Tuple[int, int] = (300, 300)) -> str:
+        """
+        Get a cached thumbnail of an image, generating it on first use.
+
+        Returns:
+            Thumbnail path, or image_path itself when thumbnails can't be made
+        """
+        if not PIL_AVAILABLE:
+            return image_path
+        try:
+            digest = self.digest_of(image_path)
+            thumb = os.path.join(self.thumbs_dir, f"{size[0]}x{size[1]}", digest[:2], f"{digest}.jpg")
+            if not os.path.exists(thumb):
+                os.makedirs(os.path.dirname(thumb), exist_ok=True)
+                with Image.open(image_path) as img:
+                    img.draft('RGB', size)  # Lets the JPEG decoder downscale while decoding
+                    img = img.convert('RGB')
+                    img.thumbnail(size, Image.LANCZOS)
+                    temp_path = f"{thumb}.{os.getpid()}.tmp"
+                    img.save(temp_path, format='JPEG', quality=85)
+                os.replace(temp_path, thumb)
+                self.thumbnails_generated += 1
+            return thumb
+        except Exception as e:
+            self._log(f"[IMAGES] thumbnail error for {image_path}: {e}")
+            return image_path
+
+    def _iter_blobs(self):
+        """Yield (path, stat) of every blob, skipping thumbnails and temp files."""
+        for directory in os.listdir(self.root):
+            shard = os.path.join(self.root, directory)
+            if len(directory) != 2 or not os.path.isdir(shard):
+                continue
+            for name in os.listdir(shard):
+                if not name.endswith('.tmp'):
+                    path = os.path.join(shard, name)
+                    yield path, os.stat(path)
+
+    def collect_garbage(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Remove blobs no memory file links to anymore, with their thumbnails.
+
+        Memory files written through the copy fallback hold their own data, so
+        their blobs are removed too without losing anything.
+
+        Returns:
+            Number of removed blobs and freed bytes
+        """
+        removed = 0
+        freed = 0
+        orphans = set()
+        for blob, stat in list(self._iter_blobs()):
+            if stat.st_nlink > 1:
+                continue
+            orphans.add(os.path.splitext(os.path.basename(blob))[0])
+            removed += 1
+            freed += stat.st_size
+            if not dry_run:
+                os.remove(blob)
+
+        if orphans and os.path.isdir(self.thumbs_dir):
+            for directory, _, files in os.walk(self.thumbs_dir):
+                for name in files:
+                    if os.path.splitext(name)[0] in orphans:
+                        thumb = os.path.join(directory, name)
+                        freed += os.path.getsize(thumb)
+                        if not dry_run:
+                            os.remove(thumb)
+
+        if removed:
+            self._log(f"[IMAGES] garbage collected {removed} unreferenced blobs ({freed // 1024} KB)")
+        return {'removed': removed, 'freed_bytes': freed}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get blob store statistics."""
+        blobs = 0
+        blob_bytes = 0
+        references = 0
+        for _, stat in self._iter_blobs():
+            blobs += 1
+            blob_bytes += stat.st_size
+            references += max(0, stat.st_nlink - 1)
+        return {
+            'blobs': blobs,
+            'blob_bytes': blob_bytes,
+            'references': references,
+            'blobs_written': self.blobs_written,
+            'duplicates_linked': self.duplicates_linked,
+            'copy_fallbacks': self.copy_fallbacks,
+            'thumbnails_generated': self.thumbnails_generated
+        }
+
+
+def get_thumbnail(image_path: str, size: Tuple[int, int] = (300, 300)) -> str:
+    """Convenience function to get a cached thumbnail path."""
+    from runtime_context import get_current_context
+    return get_current_context().image_store.thumbnail(image_path, size)
+
+
+if __name__ == "__main__":
+    # python -m memory.image_store [blob_root] [--dry-run]
+    roots = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    store = ContentAddressedImageStore(roots[0] if roots else os.path.join("memories", "blobs"))
+    store.set_logger(print)
+    print(store.collect_garbage(dry_run='--dry-run' in sys.argv))
+    print(store.get_stats())
@@ -6,13 +6,18 @@ Implements event commit contracts and memory retrieval API.
 """
 
 import os
+import re
 import json
 import time
 import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, asdict
-import shutil
+from memory.image_store import ContentAddressedImageStore
+from runtime_context import get_current_context
+
+# Vision capture filenames written by VisionSystem (camera_capture_*.jpg, vision_capture_*.jpg)
+_CAPTURE_NAME = re.compile(r'(?:camera|vision)_capture_[^"\'/\\\s]+\.(?:jpg|jpeg|png)', re.IGNORECASE)
 
 
 @dataclass
@@ -44,6 +49,7 @@ class MemoryStore:
         self.memory_dir = memory_dir
         self.events_file = os.path.join(memory_dir, "events.json")
         self.memshots_dir = os.path.join(memory_dir, "memshots")
+        self.image_store = ContentAddressedImageStore(os.path.join(memory_dir, "blobs"))
         self._logger = None
         
         # Ensure directories exist
@@ -56,6 +62,7 @@ class MemoryStore:
     def set_logger(self, logger):
         """Set the logger for this store."""
         self._logger = logger
+        self.image_store.set_logger(logger)
     
     def commit_event(self, event_ctx: Dict[str, Any], image_path: Optional[str] = None) -> str:
         """
@@ -74,14 +81,15 @@ class MemoryStore:
         
         # Handle image file
         final_image_path = None
+        image_digest = None
         if image_path and os.path.exists(image_path):
-            # Copy image to memshots directory
+            # Link the image into memshots; identical frames share one stored blob
             image_ext = os.path.splitext(image_path)[1]
             final_image_path = f"memshots/{event_id}{image_ext}"
             dest_path = os.path.join(self.memory_dir, final_image_path)
             
             try:
-                shutil.copy2(image_path, dest_path)
+                image_digest = self.image_store.store_as(image_path, dest_path)
                 if self._logger:
                     self._logger(f"[MEMORY] saved image: {final_image_path}")
             except Exception as e:
@@ -98,6 +106,7 @@ class MemoryStore:
             "concepts": event_ctx.get("concepts", []),
             "emotion": event_ctx.get("emotion", {"primary": "neutral", "sub": "neutral"}),
             "image_file": final_image_path,
+            "image_sha256": image_digest,
             "metadata": event_ctx.get("metadata", {})
         }
         
@@ -271,8 +280,68 @@ class MemoryStore:
             "total_events": total_events,
             "events_with_images": events_with_images,
             "event_types": event_types,
-            "memory_file_size": os.path.getsize(self.events_file) if os.path.exists(self.events_file) else 0
+            "memory_file_size": os.path.getsize(self.events_file) if os.path.exists(self.events_file) else 0,
+            "images": self.image_store.get_stats()
         }
+    
+    def remove_orphaned_captures(self, min_age_seconds: float = 300.0) -> int:
+        """
+        Delete vision captures that no memory file mentions.
+
+        Captures are linked into the image store when they are taken, so an
+        unused capture would otherwise keep its blob alive forever.
+
+        Args:
+            min_age_seconds: Keep captures younger than this (they may not be saved to memory yet)
+
+        Returns:
+            Number of captures removed
+        """
+        capture_dir = os.path.join(self.memory_dir, "vision")
+        if not os.path.isdir(capture_dir):
+            return 0
+        cutoff = time.time() - min_age_seconds
+        captures = [name for name in os.listdir(capture_dir)
+                    if _CAPTURE_NAME.fullmatch(name)
+                    and os.path.getmtime(os.path.join(capture_dir, name)) < cutoff]
+        if not captures:
+            return 0
+
+        # Every capture name mentioned by a memory file is still referenced
+        referenced = set()
+        for directory, subdirs, files in os.walk(self.memory_dir):
+            if os.path.abspath(directory) == os.path.abspath(self.image_store.root):
+                subdirs[:] = []
+                continue
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                try:
+                    with open(os.path.join(directory, name), 'r', encoding='utf-8', errors='replace') as f:
+                        referenced.update(match.lower() for match in _CAPTURE_NAME.findall(f.read()))
+                except OSError:
+                    continue
+
+        removed = 0
+        for name in captures:
+            if name.lower() in referenced:
+                continue
+            try:
+                os.remove(os.path.join(capture_dir, name))
+                removed += 1
+            except OSError as e:
+                if self._logger:
+                    self._logger(f"[MEMORY] could not remove orphaned capture {name}: {e}")
+        if removed and self._logger:
+            self._logger(f"[MEMORY] removed {removed} orphaned vision captures")
+        return removed
+    
+    def collect_unreferenced_images(self) -> Dict[str, int]:
+        """Remove orphaned vision captures, then stored images no memory file references anymore."""
+        captures_removed = self.remove_orphaned_captures()
+        result = self.image_store.collect_garbage()
+        result['captures_removed'] = captures_removed
+        return result
 
 
 # Global instance
@@ -281,24 +350,24 @@ memory_store = MemoryStore()
 
 def commit_event(event_ctx: Dict[str, Any], image_path: Optional[str] = None) -> str:
     """Convenience function to commit an event."""
-    return memory_store.commit_event(event_ctx, image_path)
+    return get_current_context().memory_store.commit_event(event_ctx, image_path)
 
 
 def recall_memory(query: str) -> List[MemoryHit]:
     """Convenience function to recall memories."""
-    return memory_store.recall_memory(query)
+    return get_current_context().memory_store.recall_memory(query)
 
 
 def get_event_by_id(event_id: str) -> Optional[Dict[str, Any]]:
     """Convenience function to get event by ID."""
-    return memory_store.get_event_by_id(event_id)
+    return get_current_context().memory_store.get_event_by_id(event_id)
 
 
 def get_events_by_concept(concept: str) -> List[Dict[str, Any]]:
     """Convenience function to get events by concept."""
-    return memory_store.get_events_by_concept(concept)
+    return get_current_context().memory_store.get_events_by_concept(concept)
 
 
 def get_recent_events(hours: int = 24) -> List[Dict[str, Any]]:
     """Convenience function to get recent events."""
-    return memory_store.get_recent_events(hours)
+    return get_current_context().memory_store.get_recent_events(hours)
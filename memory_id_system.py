@@ -19,6 +19,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 
+from memory.image_store import file_digest
+
 class MemoryIDSystem:
     """
     CARL's Memory ID system for unique identification and traceability.
@@ -118,9 +120,11 @@ class MemoryIDSystem:
                 self.logger.warning(f"MID {mid} not found in registry")
                 return False
             
-            # Update MID registry with image path
+            # Update MID registry with image path (and content digest when the file is local)
             self.mid_registry[mid]['image_path'] = image_path
             self.mid_registry[mid]['related_files'].append(image_path)
+            if os.path.isfile(image_path):
+                self.mid_registry[mid]['image_sha256'] = file_digest(image_path)
             
             # Update image-MID registry
             self.image_mid_registry[image_path] = mid
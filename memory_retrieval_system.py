@@ -12,6 +12,9 @@ from typing import Dict, List, Optional, Tuple
 import math
 import difflib
 
+from concept_fuzzy_index import iter_strings
+from runtime_context import get_current_context
+
 class MemoryRetrievalSystem:
     """
     Human-like memory retrieval system that implements the four main retrieval processes:
@@ -51,6 +54,7 @@ class MemoryRetrievalSystem:
             'chomp_and_count_dino': ['chomp', 'dino', 'dinosaur', 'toy', 'plaything', 'green dinosaur', 'vtech'],
             'me': ['self', 'carl', 'robot', 'humanoid', 'reflection', 'mirror']
         }
+        self._concept_index = None
         
     def _initialize_retrieval_preferences(self) -> Dict:
         """Initialize retrieval preferences based on personality type."""
@@ -104,6 +108,14 @@ class MemoryRetrievalSystem:
         matcher = difflib.SequenceMatcher(None, str1, str2)
         return matcher.ratio()
     
+    @property
+    def concept_index(self):
+        """Shared concept/thing fuzzy index, expanded with this system's synonyms."""
+        if self._concept_index is None:
+            self._concept_index = get_current_context().concept_index
+            self._concept_index.add_synonyms(self.synonym_mappings)
+        return self._concept_index
+    
     def _fuzzy_match_objects(self, query: str, concept_data: Dict) -> Tuple[bool, float]:
         """
         Perform fuzzy matching against concept template data.
@@ -128,13 +140,14 @@ class MemoryRetrievalSystem:
                 if self._calculate_levenshtein_similarity(query_lower, keyword.lower()) >= self.fuzzy_match_threshold:
                     return True, self._calculate_levenshtein_similarity(query_lower, keyword.lower())
             
-            # Check Learning_Integration for additional keywords
+            # Check Learning_Integration for additional keywords (its short phrases, not the whole dict text)
             learning_integration = concept_data.get('Learning_Integration', {})
-            if learning_integration:
-                # Extract keywords from Learning_Integration
-                integration_text = str(learning_integration).lower()
-                if self._calculate_levenshtein_similarity(query_lower, integration_text) >= self.fuzzy_match_threshold:
-                    return True, self._calculate_levenshtein_similarity(query_lower, integration_text)
+            for integration_text in iter_strings(learning_integration):
+                if len(integration_text) > 40:
+                    continue
+                similarity = self._calculate_levenshtein_similarity(query_lower, integration_text)
+                if similarity >= self.fuzzy_match_threshold:
+                    return True, similarity
             
             # Check synonym mappings
             for base_word, synonyms in self.synonym_mappings.items():
@@ -604,6 +617,10 @@ class MemoryRetrievalSystem:
                 "reasoning": f"Relearning process error: {str(e)}"
             }
     
+    def is_context_free_query(self, query: str) -> bool:
+        """Whether retrieve_memory answers this query without using context (safe to prefetch)."""
+        return bool(query) and (self._is_object_recognition_query(query) or self._is_entity_recall_query(query))
+    
     def _is_object_recognition_query(self, query: str) -> bool:
         """Check if the query is asking about object recognition."""
         try:
@@ -663,8 +680,8 @@ class MemoryRetrievalSystem:
             episodic_memories = self._search_episodic_memory_for_object_recognition(query)
             
             # Search for objects in things directory using fuzzy matching
-            things_dir = "things"
-            concepts_dir = "concepts"
+            things_dir = self.concept_index.directory_path('things')
+            concepts_dir = self.concept_index.directory_path('concepts')
             best_match = None
             best_confidence = 0.0
             
@@ -695,9 +712,10 @@ class MemoryRetrievalSystem:
                         best_match = memory
                         best_match['source'] = 'episodic_memory'
             
-            # Search in things directory
+            # Search in things directory (only things whose terms share trigrams with the query or its synonyms)
             if os.path.exists(things_dir):
-                for filename in os.listdir(things_dir):
+                for document in self.concept_index.candidate_documents([query], directory='things'):
+                    filename = document.filename
                     if filename.endswith('.json'):
                         thing_name = filename.replace('_self_learned.json', '').replace('.json', '')
                         
@@ -731,12 +749,11 @@ class MemoryRetrievalSystem:
             
             # Search in concepts directory for more comprehensive matches
             if os.path.exists(concepts_dir):
-                for filename in os.listdir(concepts_dir):
+                for document in self.concept_index.candidate_documents([query], directory='concepts'):
+                    filename = document.filename
                     if filename.endswith('.json'):
                         try:
-                            concept_file = os.path.join(concepts_dir, filename)
-                            with open(concept_file, 'r', encoding='utf-8') as f:
-                                concept_data = json.load(f)
+                            concept_data = document.data
                             
                             # Check against concept name
                             concept_name = concept_data.get('word', filename.replace('.json', ''))
@@ -777,7 +794,7 @@ class MemoryRetrievalSystem:
                                     'filename': filename,
                                     'confidence': confidence,
                                     'directory': concepts_dir,
-                                    'concept_data': concept_data
+                                    'concept_data': dict(concept_data)
                                 }
                                 
                         except Exception as e:
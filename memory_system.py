@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import logging
 
+from consciousness_evidence_stream import publish_evidence
+
 @dataclass
 class MemoryItem:
     """Represents a single memory item with metadata."""
@@ -47,21 +49,16 @@ class MemorySystem:
     Comprehensive memory system that coordinates all memory-related functionality.
     """
     
-    def __init__(self, personality_type: str = "INTP"):
+    def __init__(self, personality_type: str = "INTP", memory_root: str = "memories"):
         self.personality_type = personality_type
         self.logger = logging.getLogger(__name__)
+        self.memory_root = memory_root
         
         # Memory storage directories with standardized organization
         self.memory_dirs = {
-            'episodic': 'memories/episodic',
-            'semantic': 'memories/semantic',
-            'working': 'memories/working',
-            'procedural': 'memories/procedural',
-            'imagined': 'memories/imagined',
-            'vision': 'memories/vision',
-            'self_recognition': 'memories/self_recognition',
-            'relationships': 'memories/relationships',
-            'first_interaction': 'memories/first_interaction'
+            name: os.path.join(memory_root, name)
+            for name in ('episodic', 'semantic', 'working', 'procedural', 'imagined', 'vision',
+                         'self_recognition', 'relationships', 'first_interaction')
         }
         
         # Ensure memory directories exist
@@ -837,7 +834,7 @@ DETECTION DETAILS:
         """
         try:
             vision_memories = []
-            memories_dir = "memories"
+            memories_dir = self.memory_root
             
             if os.path.exists(memories_dir):
                 # Search through all memory files
@@ -1339,6 +1336,14 @@ DETECTION DETAILS:
                             with open(file_path, 'w', encoding='utf-8') as f:
                                 json.dump(memory_item, f, indent=2, ensure_ascii=False)
             
+            # Publish consciousness evidence at write time
+            if memory_id:
+                publish_evidence('memory_usage', importance, source='memory_system.store_event')
+                if event_data.get('emotional_context'):
+                    publish_evidence('emotional_context', emotional_intensity, source='memory_system.store_event')
+                if event_data.get('WHO'):
+                    publish_evidence('social_interaction', importance, source='memory_system.store_event')
+            
             return memory_id
             
         except Exception as e:
@@ -1602,7 +1607,7 @@ DETECTION DETAILS:
             first_meeting_memories = []
             
             # Search in memories directory for first meeting events
-            memories_dir = "memories"
+            memories_dir = self.memory_root
             if os.path.exists(memories_dir):
                 for filename in os.listdir(memories_dir):
                     if filename.endswith('.json'):
@@ -1721,7 +1726,7 @@ DETECTION DETAILS:
             first_interaction_memories = []
             
             # Search in memories directory for first interaction events
-            memories_dir = "memories"
+            memories_dir = self.memory_root
             if os.path.exists(memories_dir):
                 for filename in os.listdir(memories_dir):
                     if 'first_interaction' in filename.lower():
@@ -1756,7 +1761,7 @@ DETECTION DETAILS:
             early_conversation_memories = []
             
             # Search in memories directory for early conversation events
-            memories_dir = "memories"
+            memories_dir = self.memory_root
             if os.path.exists(memories_dir):
                 for filename in os.listdir(memories_dir):
                     if filename.endswith('.json'):
@@ -1873,7 +1878,7 @@ DETECTION DETAILS:
             self.logger.info("🔧 Standardizing memory file organization...")
             
             # Process all memory files in the root memories directory
-            memories_root = "memories"
+            memories_root = self.memory_root
             if not os.path.exists(memories_root):
                 return
             
@@ -1999,7 +2004,7 @@ DETECTION DETAILS:
             memory_id = memory_data.get('id', '')
             
             # Search for associated images
-            image_dirs = ['memories/vision', 'memories/episodic', 'memories']
+            image_dirs = [self.memory_dirs['vision'], self.memory_dirs['episodic'], self.memory_root]
             
             for image_dir in image_dirs:
                 if os.path.exists(image_dir):
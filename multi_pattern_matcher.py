@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Multi-Pattern Matcher
+=====================
+
+Aho-Corasick automaton for finding every occurrence of a fixed set of
+literal patterns in a single left-to-right pass over the text. Used where
+CARL previously ran long chains of ``substring in text`` checks against the
+same piece of text (evidence scanning, humor cue detection).
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of literal patterns.
+
+    Matching is case-sensitive; callers that want case-insensitive matching
+    should pass lowercased patterns and lowercase the text before scanning.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Literal patterns to search for (empty strings are ignored)
+        """
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        seen = set()
+        for pattern in patterns:
+            if pattern and pattern not in seen:
+                seen.add(pattern)
+                self._add_pattern(pattern)
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str):
+        """Insert a pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (len(self.patterns),)
+        self.patterns.append(pattern)
+
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge output sets."""
+        queue = deque()
+        for state in self._goto[0].values():
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                if self._output[self._fail[next_state]]:
+                    self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Return the set of patterns that occur anywhere in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched patterns
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return {self.patterns[index] for index in found}
+
+    def contains_any(self, text: str) -> bool:
+        """Return True as soon as any pattern is found in the text."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+        return False
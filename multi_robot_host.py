@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Multi-Robot Host
+================
+
+Supervisor that runs several CARL instances on one machine.
+
+Each robot runs the headless CarlRuntime in its own worker process with its
+own RuntimeContext (data root + per-instance singletons). Read-only knowledge
+such as the ConceptNet mirror and the AIML snapshot is shared by linking it
+into every data root. The supervisor collects per-robot metrics and reports
+aggregate throughput, which also makes it a soak-test harness for many
+simulated robots.
+
+Usage:
+    python multi_robot_host.py --robots 8 --events 500 --root robots/
+"""
+
+import os
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional
+
+DEFAULT_SHARED_KNOWLEDGE = {
+    'conceptnet_cache': 'conceptnet_cache',
+    'aiml': 'aiml'
+}
+
+
+@dataclass
+class RobotSpec:
+    """Configuration for one hosted robot instance."""
+    instance_id: str
+    data_root: str
+    events: int = 100
+    personality_type: str = "INTP"
+    shared_knowledge: Dict[str, str] = field(default_factory=dict)
+
+
+def run_robot_instance(spec: RobotSpec) -> Dict[str, Any]:
+    """
+    Run one simulated robot to completion in the current (worker) process.
+
+    Kept at module level so it can be shipped to a process pool.
+
+    Args:
+        spec: Robot configuration
+
+    Returns:
+        Runtime metrics for the robot
+    """
+    from runtime_context import RuntimeContext
+    context = RuntimeContext(spec.instance_id, spec.data_root, spec.shared_knowledge)
+    context.activate()
+
+    from carl_runtime import CarlRuntime
+    runtime = CarlRuntime(personality_type=spec.personality_type, data_dir=context.data_root)
+    context.set('runtime', runtime)
+
+    for i in range(spec.events):
+        if i % 2:
+            runtime.submit_vision(f"object_{i % 7}", "red")
+        else:
+            runtime.submit_speech(f"Hello {spec.instance_id}, message number {i}")
+
+    start = time.perf_counter()
+    runtime.drain()
+    elapsed = time.perf_counter() - start
+
+    metrics = runtime.get_metrics()
+    metrics.update({
+        'instance_id': spec.instance_id,
+        'pid': os.getpid(),
+        'elapsed_seconds': elapsed,
+        'events_per_second': metrics['events_processed'] / elapsed if elapsed > 0 else 0.0
+    })
+    return metrics
+
+
+class MultiRobotSupervisor:
+    """
+    Runs N CARL instances in a process pool and aggregates their metrics.
+    """
+
+    def __init__(self, robots: int, root_dir: str = "robots",
+                 shared_knowledge: Optional[Dict[str, str]] = None,
+                 max_workers: Optional[int] = None, personality_type: str = "INTP"):
+        """
+        Initialize the supervisor.
+
+        Args:
+            robots: Number of robot instances
+            root_dir: Directory that holds one data root per robot
+            shared_knowledge: Name -> shared read-only path linked into every data root
+            max_workers: Process pool size (defaults to the number of robots, capped by CPUs)
+            personality_type: MBTI personality type of every robot
+        """
+        self.robots = robots
+        self.root_dir = os.path.abspath(root_dir)
+        if shared_knowledge is None:
+            shared_knowledge = {name: os.path.abspath(path) for name, path in DEFAULT_SHARED_KNOWLEDGE.items()}
+        self.shared_knowledge = shared_knowledge
+        self.max_workers = max_workers or min(robots, os.cpu_count() or 1)
+        self.personality_type = personality_type
+        self.logger = logging.getLogger(__name__)
+
+    def build_specs(self, events: int) -> List[RobotSpec]:
+        """Create the per-robot configurations."""
+        return [
+            RobotSpec(
+                instance_id=f"carl_{index:03d}",
+                data_root=os.path.join(self.root_dir, f"carl_{index:03d}"),
+                events=events,
+                personality_type=self.personality_type,
+                shared_knowledge=self.shared_knowledge
+            )
+            for index in range(self.robots)
+        ]
+
+    def run(self, events: int = 100) -> Dict[str, Any]:
+        """
+        Run every robot and report aggregate throughput.
+
+        Args:
+            events: Simulated inputs per robot
+
+        Returns:
+            Aggregate and per-robot metrics
+        """
+        specs = self.build_specs(events)
+        results: List[Dict[str, Any]] = []
+        failures: Dict[str, str] = {}
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(run_robot_instance, spec): spec for spec in specs}
+            for future in as_completed(futures):
+                spec = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"❌ Robot {spec.instance_id} failed: {e}")
+                    failures[spec.instance_id] = str(e)
+        wall_time = time.perf_counter() - start
+
+        return self.aggregate(results, failures, wall_time)
+
+    @staticmethod
+    def aggregate(results: List[Dict[str, Any]], failures: Dict[str, str], wall_time: float) -> Dict[str, Any]:
+        """Combine per-robot metrics into host-level throughput figures."""
+        total_events = sum(r['events_processed'] for r in results)
+        per_robot_rates = sorted(r['events_per_second'] for r in results)
+        stage_seconds: Dict[str, float] = {}
+        for r in results:
+            for stage, seconds in r.get('stage_seconds', {}).items():
+                stage_seconds[stage] = stage_seconds.get(stage, 0.0) + seconds
+
+        return {
+            'robots': len(results) + len(failures),
+            'robots_succeeded': len(results),
+            'failures': failures,
+            'total_events': total_events,
+            'wall_seconds': wall_time,
+            'host_events_per_second': total_events / wall_time if wall_time > 0 else 0.0,
+            'robot_events_per_second': {
+                'min': per_robot_rates[0] if per_robot_rates else 0.0,
+                'median': per_robot_rates[len(per_robot_rates) // 2] if per_robot_rates else 0.0,
+                'max': per_robot_rates[-1] if per_robot_rates else 0.0
+            },
+            'stage_ms_per_event': {stage: 1000.0 * s / total_events for stage, s in stage_seconds.items()} if total_events else {},
+            'per_robot': sorted(results, key=lambda r: r['instance_id'])
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host several CARL instances on one machine")
+    parser.add_argument('--robots', type=int, default=4, help='Number of robot instances')
+    parser.add_argument('--events', type=int, default=100, help='Simulated inputs per robot')
+    parser.add_argument('--root', default='robots', help='Directory for per-robot data roots')
+    parser.add_argument('--workers', type=int, default=None, help='Process pool size')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    supervisor = MultiRobotSupervisor(args.robots, args.root, max_workers=args.workers)
+    report = supervisor.run(args.events)
+
+    print(f"🤖 Robots: {report['robots_succeeded']}/{report['robots']}  Events: {report['total_events']}")
+    print(f"⏱️  {report['wall_seconds']:.3f}s  ->  {report['host_events_per_second']:.1f} events/s on this host")
+    rates = report['robot_events_per_second']
+    print(f"   per robot: min {rates['min']:.1f}  median {rates['median']:.1f}  max {rates['max']:.1f} events/s")
+    for instance_id, error in report['failures'].items():
+        print(f"❌ {instance_id}: {error}")
+
+
+if __name__ == "__main__":
+    main()
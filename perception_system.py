@@ -708,13 +708,15 @@ class PerceptionSystem:
                 "error": str(e)
             }
     
-    def check_reflex_response(self, user_input: str, context: Dict = None) -> Optional[Dict]:
+    def check_reflex_response(self, user_input: str, context: Dict = None, record: bool = True) -> Optional[Dict]:
         """
         Check for AIML reflex response before full cognitive processing.
         
         Args:
             user_input: The user's input text
             context: Additional context information
+            record: Log and store the reflex hit; False for a pure lookup (speculative
+                    checks), to be followed by record_reflex_response() when the hit is used
             
         Returns:
             Dict containing reflex response if found, None otherwise
@@ -723,37 +725,55 @@ class PerceptionSystem:
             if not self.aiml_enabled or not self.aiml_integration:
                 return None
             
-            # Process input through reflex system
-            reflex_result = self.aiml_integration.process_input(user_input, context)
+            # Match input against the reflex system
+            reflex_result = self.aiml_integration.match_input(user_input)
             
             if reflex_result.get('pattern_matched', False):
-                # Log reflex hit to memory system
-                if hasattr(self.main_app, 'memory_system') and self.main_app.memory_system:
-                    self.main_app.memory_system.store_memory(
-                        content=f"Reflex response: {user_input} -> {reflex_result['response']}",
-                        memory_type="working",
-                        context=None,  # Will be created by memory system
-                        importance=0.3,
-                        source="reflex_system"
-                    )
-                
-                # Enhanced logging for reflex hits
-                if hasattr(self.main_app, 'log'):
-                    self.main_app.log(f"⚡ Reflex response: '{user_input}' -> '{reflex_result['response']}' (confidence: {reflex_result['confidence']:.2f})")
-                
-                return {
+                reflex_response = {
                     'response': reflex_result['response'],
                     'source': 'reflex',
                     'confidence': reflex_result['confidence'],
                     'processing_time': reflex_result['processing_time'],
                     'pattern_matched': True
                 }
+                if record:
+                    self.record_reflex_response(user_input, reflex_response, context)
+                return reflex_response
             
             return None
             
         except Exception as e:
             print(f"Error checking reflex response: {e}")
             return None
+    
+    def record_reflex_response(self, user_input: str, reflex_response: Dict, context: Dict = None):
+        """
+        Log a reflex hit and store it in memory (once per handled input).
+        
+        Args:
+            user_input: The user's input text
+            reflex_response: Result of check_reflex_response()
+            context: Additional context information
+        """
+        try:
+            self.aiml_integration.record_reflex_hit(user_input, reflex_response['response'], context)
+            
+            # Log reflex hit to memory system
+            if hasattr(self.main_app, 'memory_system') and self.main_app.memory_system:
+                self.main_app.memory_system.store_memory(
+                    content=f"Reflex response: {user_input} -> {reflex_response['response']}",
+                    memory_type="working",
+                    context=None,  # Will be created by memory system
+                    importance=0.3,
+                    source="reflex_system"
+                )
+            
+            # Enhanced logging for reflex hits
+            if hasattr(self.main_app, 'log'):
+                self.main_app.log(f"⚡ Reflex response: '{user_input}' -> '{reflex_response['response']}' (confidence: {reflex_response['confidence']:.2f})")
+            
+        except Exception as e:
+            print(f"Error recording reflex response: {e}")
 
     def get_directory_summary(self) -> str:
         """
@@ -17,6 +17,8 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+from skill_catalog import SkillCatalog, get_skill_catalog
+
 class PositionAwareSkillSystem:
     """
     Position-aware skill execution system for CARL.
@@ -26,12 +28,13 @@ class PositionAwareSkillSystem:
     and executes necessary transitions before performing the action.
     """
     
-    def __init__(self, skills_dir: str = "skills"):
+    def __init__(self, skills_dir: str = "skills", skill_catalog: Optional[SkillCatalog] = None):
         """
         Initialize the position-aware skill system.
         
         Args:
             skills_dir: Directory containing skill files
+            skill_catalog: Shared skill catalog (the runtime context's for the default directory)
         """
         self.skills_dir = skills_dir
         self.current_position = "sitting"  # Default position (CARL starts sitting)
@@ -44,48 +47,42 @@ class PositionAwareSkillSystem:
             "standing_to_sitting": ["sit down", "sit"]
         }
         
-        # Load all skills with position requirements
-        self.skills_with_positions = self._load_skills_with_positions()
+        # Skills and the pose-transition graph come from the shared catalog
+        if skill_catalog is None:
+            skill_catalog = get_skill_catalog() if skills_dir == "skills" else SkillCatalog(skills_dir)
+        self.skill_catalog = skill_catalog
+        self._skills_with_positions: Dict[str, Dict] = {}
+        self._positions_version = None
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        
+        if not os.path.exists(self.skills_dir):
+            self.logger.warning(f"Skills directory '{self.skills_dir}' not found!")
     
-    def _load_skills_with_positions(self) -> Dict[str, Dict]:
+    @property
+    def skills_with_positions(self) -> Dict[str, Dict]:
         """
-        Load all skill files and extract position requirements.
+        Position requirements of all skills, refreshed when skill files change.
         
         Returns:
             Dictionary mapping skill names to their position requirements
         """
-        skills = {}
-        
-        if not os.path.exists(self.skills_dir):
-            self.logger.warning(f"Skills directory '{self.skills_dir}' not found!")
-            return skills
-        
-        for filename in os.listdir(self.skills_dir):
-            if filename.endswith('.json'):
-                skill_path = os.path.join(self.skills_dir, filename)
-                try:
-                    with open(skill_path, 'r', encoding='utf-8') as f:
-                        skill_data = json.load(f)
-                    
-                    skill_name = skill_data.get("Name", filename[:-5])
-                    start_position = skill_data.get("start_position", "any")
-                    
-                    skills[skill_name] = {
-                        "start_position": start_position,
-                        "prerequisite_pose": skill_data.get("prerequisite_pose", "any"),
-                        "command_type": skill_data.get("command_type", "AutoPositionAction"),
-                        "file_path": skill_path,
-                        "data": skill_data
-                    }
-                    
-                except Exception as e:
-                    self.logger.error(f"Error loading skill {filename}: {e}")
-        
-        return skills
+        records = self.skill_catalog.records()
+        if self._positions_version != self.skill_catalog.version:
+            self._skills_with_positions = {
+                name: {
+                    "start_position": record.data.get("start_position", "any"),
+                    "prerequisite_pose": record.start_pose,
+                    "end_pose": record.end_pose,
+                    "command_type": record.data.get("command_type", "AutoPositionAction"),
+                    "file_path": record.path
+                }
+                for name, record in records.items()
+            }
+            self._positions_version = self.skill_catalog.version
+        return self._skills_with_positions
     
     def update_current_position(self, new_position: str) -> None:
         """
@@ -188,6 +185,9 @@ class PositionAwareSkillSystem:
         """
         Get the skills needed to transition between positions.
         
+        This is the minimum expected duration path through the pose-transition
+        graph of the skill catalog (memoized per position pair).
+        
         Args:
             from_position: Current position
             to_position: Target position
@@ -195,15 +195,19 @@ class PositionAwareSkillSystem:
         Returns:
             List of skills to execute for the transition
         """
-        if from_position == to_position:
-            return []
-        
-        if from_position == "sitting" and to_position == "standing":
-            return ["stand up", "stand", "getup"]
-        elif from_position == "standing" and to_position == "sitting":
-            return ["sit down", "sit"]
+        return self.skill_catalog.transition_skills(from_position, to_position)
+    
+    def get_skill_end_pose(self, skill_name: str) -> Optional[str]:
+        """
+        Get the position a skill leaves CARL in.
         
-        return []
+        Args:
+            skill_name: Name of the skill
+            
+        Returns:
+            End position, or None if the skill doesn't change position
+        """
+        return self.skill_catalog.end_pose(skill_name)
     
     def analyze_skill_execution_plan(self, requested_skill: str) -> Dict:
         """
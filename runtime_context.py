@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Runtime Context
+===============
+
+Instance-scoped runtime state for running several CARL instances per machine.
+
+CARL's modules keep process-wide singletons (memory store, concept graph,
+vision deduplication, the concept index, the skill catalog, the init
+registry) and resolve data files relative to the working directory
+(``concepts/``, ``memories/``, ``short_term_memory.json`` ...). A
+RuntimeContext gives one robot instance:
+
+- its own data root, with shared read-only knowledge (ConceptNet mirror,
+  AIML snapshot) linked in rather than copied where possible,
+- its own lazily created singletons,
+- activation, which makes it the current context and moves the process into
+  its data root so existing relative paths resolve per robot.
+
+The default context wraps the existing module-level singletons, so code that
+never activates another context behaves exactly as before.
+"""
+
+import os
+import shutil
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class InitRegistry:
+    """Global initialization registry to prevent duplicate system initialization."""
+
+    def __init__(self):
+        self.flags = {
+            'systems': False,
+            'eyes_system': False,
+            'skill_exec_system': False,
+            'beliefs': False,
+            'concepts': False,
+            'skills': False,
+            'needs': False,
+            'senses': False,
+            'neucogar': False,
+            'imagination': False,
+            'humor': False,
+            'memory': False,
+            'inner_world': False,
+            'vision': False,
+            'flask': False
+        }
+
+    def is_initialized(self, system: str) -> bool:
+        """Check if a system has been initialized."""
+        return self.flags.get(system, False)
+
+    def mark_initialized(self, system: str):
+        """Mark a system as initialized."""
+        self.flags[system] = True
+
+    def reset(self):
+        """Reset all initialization flags."""
+        for key in self.flags:
+            self.flags[key] = False
+
+
+def _create_memory_store(context: 'RuntimeContext'):
+    from memory.store import MemoryStore
+    return MemoryStore(memory_dir=context.path('memories'))
+
+
+def _create_concept_graph(context: 'RuntimeContext'):
+    from graph.concept_graph import ConceptGraphSystem
+    return ConceptGraphSystem()
+
+
+def _create_vision_deduplication(context: 'RuntimeContext'):
+    from vision_deduplication import VisionDeduplicationSystem
+    return VisionDeduplicationSystem()
+
+
+def _create_image_store(context: 'RuntimeContext'):
+    # Shares the blob directory (and statistics) of this instance's memory store
+    return context.memory_store.image_store
+
+
+def _create_concept_index(context: 'RuntimeContext'):
+    from concept_fuzzy_index import ConceptFuzzyIndex
+    return ConceptFuzzyIndex(root=None if context.is_default else context.data_root)
+
+
+def _create_skill_catalog(context: 'RuntimeContext'):
+    from skill_catalog import SkillCatalog
+    return SkillCatalog(skills_dir='skills' if context.is_default else context.path('skills'))
+
+
+def _create_init_registry(context: 'RuntimeContext'):
+    return InitRegistry()
+
+
+# Per-instance singletons and how to build them for a non-default context
+SINGLETON_FACTORIES: Dict[str, Callable[['RuntimeContext'], Any]] = {
+    'memory_store': _create_memory_store,
+    'concept_graph': _create_concept_graph,
+    'vision_deduplication': _create_vision_deduplication,
+    'image_store': _create_image_store,
+    'concept_index': _create_concept_index,
+    'skill_catalog': _create_skill_catalog,
+    'init_registry': _create_init_registry
+}
+
+# Module globals the default context reuses, so existing imports keep working
+_DEFAULT_SINGLETONS = {
+    'memory_store': ('memory.store', 'memory_store'),
+    'concept_graph': ('graph.concept_graph', 'concept_graph'),
+    'vision_deduplication': ('vision_deduplication', 'vision_deduplication')
+}
+
+
+class RuntimeContext:
+    """
+    Data root and singletons for one CARL instance.
+    """
+
+    def __init__(self, instance_id: str = "default", data_root: Optional[str] = None,
+                 shared_knowledge: Optional[Dict[str, str]] = None, is_default: bool = False):
+        """
+        Initialize a runtime context.
+
+        Args:
+            instance_id: Name of the robot instance
+            data_root: Directory holding this instance's data (cwd if None)
+            shared_knowledge: Relative name -> shared read-only path (e.g.
+                {'conceptnet_cache': '/srv/carl/conceptnet_cache', 'aiml': '/srv/carl/aiml'})
+            is_default: Reuse the process-wide module singletons
+        """
+        self.instance_id = instance_id
+        self.data_root = os.path.abspath(data_root or os.getcwd())
+        self.shared_knowledge = dict(shared_knowledge or {})
+        self.is_default = is_default
+        self.logger = logging.getLogger(__name__)
+        self._singletons: Dict[str, Any] = {}
+        # Reentrant: factories may read other singletons (image_store reads memory_store)
+        self._lock = threading.RLock()
+
+    def path(self, *parts: str) -> str:
+        """Resolve a path inside this instance's data root."""
+        return os.path.join(self.data_root, *parts)
+
+    def get(self, name: str, factory: Optional[Callable[['RuntimeContext'], Any]] = None) -> Any:
+        """
+        Get (creating on first use) a per-instance singleton.
+
+        Args:
+            name: Singleton name
+            factory: Builder for singletons not listed in SINGLETON_FACTORIES
+
+        Returns:
+            The singleton for this context
+        """
+        with self._lock:
+            if name not in self._singletons:
+                if self.is_default and name in _DEFAULT_SINGLETONS:
+                    module_name, attribute = _DEFAULT_SINGLETONS[name]
+                    module = __import__(module_name, fromlist=[attribute])
+                    self._singletons[name] = getattr(module, attribute)
+                else:
+                    builder = factory or SINGLETON_FACTORIES.get(name)
+                    if builder is None:
+                        raise KeyError(f"No factory registered for runtime singleton '{name}'")
+                    self._singletons[name] = builder(self)
+            return self._singletons[name]
+
+    def set(self, name: str, instance: Any):
+        """Register an existing object as a per-instance singleton."""
+        with self._lock:
+            self._singletons[name] = instance
+
+    @property
+    def memory_store(self):
+        return self.get('memory_store')
+
+    @property
+    def concept_graph(self):
+        return self.get('concept_graph')
+
+    @property
+    def vision_deduplication(self):
+        return self.get('vision_deduplication')
+
+    @property
+    def image_store(self):
+        return self.get('image_store')
+
+    @property
+    def concept_index(self):
+        return self.get('concept_index')
+
+    @property
+    def skill_catalog(self):
+        return self.get('skill_catalog')
+
+    @property
+    def init_registry(self):
+        return self.get('init_registry')
+
+    def prepare(self):
+        """Create the data root and link shared read-only knowledge into it."""
+        os.makedirs(self.data_root, exist_ok=True)
+        for name, source in self.shared_knowledge.items():
+            target = self.path(name)
+            if os.path.lexists(target) or not os.path.exists(source):
+                continue
+            source = os.path.abspath(source)
+            try:
+                os.symlink(source, target, target_is_directory=os.path.isdir(source))
+            except (OSError, NotImplementedError):
+                # Symlinks may need elevated rights (e.g. on Windows); fall back to a copy
+                if os.path.isdir(source):
+                    shutil.copytree(source, target)
+                else:
+                    shutil.copy2(source, target)
+                self.logger.info(f"Copied shared knowledge '{name}' into {self.data_root}")
+
+    def activate(self):
+        """
+        Make this the current context and move the process into its data root.
+
+        Only use this in a process dedicated to one instance: the working
+        directory is process-wide.
+        """
+        self.prepare()
+        os.chdir(self.data_root)
+        set_current_context(self)
+
+
+_default_context = RuntimeContext(is_default=True)
+_current_context = _default_context
+
+
+def get_current_context() -> RuntimeContext:
+    """Get the runtime context of this process."""
+    return _current_context
+
+
+def set_current_context(context: Optional[RuntimeContext]):
+    """Set the runtime context of this process (None restores the default)."""
+    global _current_context
+    _current_context = context or _default_context
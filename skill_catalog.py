@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Skill Catalog
+=============
+
+Shared, file-watched view of the skills/*.json files and the pose-transition
+graph built from them.
+
+ActionSystem and PositionAwareSkillSystem each parsed the whole skills
+directory on construction and never noticed skill files created later.
+SkillCatalog loads each file once, rescans the directory at most every
+``refresh_interval`` seconds and only re-parses files whose mtime or size
+changed.
+
+From the pose metadata of every skill it builds a graph whose nodes are body
+poses and whose edges are skills that change pose:
+
+- the start pose is ``prerequisite_pose`` (or the older ``start_position``);
+  a skill with start pose "any" can be started from every pose,
+- the end pose is ``end_pose`` / ``end_position``, or the known result of the
+  standard posture skills (stand up, sit down, ...),
+- the edge weight is the skill's expected duration (``estimated_duration`` or
+  ``duration`` in seconds, else derived from ``duration_type``).
+
+``transition_skills(from_pose, to_pose)`` returns the minimum expected
+duration skill sequence (Dijkstra), memoized per pose pair until a skill file
+changes.
+"""
+
+import os
+import json
+import time
+import heapq
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_SKILL_DURATION = 2.0  # seconds
+DEFAULT_POSES = ("standing", "sitting")
+
+# Poses the standard posture skills end in when their file doesn't say
+DEFAULT_END_POSES = {
+    "stand up": "standing",
+    "stand": "standing",
+    "getup": "standing",
+    "get up": "standing",
+    "sit down": "sitting",
+    "sit": "sitting",
+    "lie down": "lying"
+}
+
+# Transitions used when no skill file describes a pose change
+BUILTIN_TRANSITIONS = (
+    ("stand up", "sitting", "standing"),
+    ("sit down", "standing", "sitting")
+)
+
+
+def parse_duration(data: Dict[str, Any]) -> float:
+    """Expected duration of a skill in seconds."""
+    for key in ("estimated_duration", "duration"):
+        value = data.get(key)
+        if isinstance(value, (int, float)) and value > 0:
+            return float(value)
+    duration_type = str(data.get("duration_type", ""))
+    if duration_type.endswith("ms") and duration_type[:-2].isdigit():
+        return int(duration_type[:-2]) / 1000.0
+    return DEFAULT_SKILL_DURATION
+
+
+@dataclass
+class SkillRecord:
+    """One skill file and its pose metadata."""
+    key: str  # File name without .json
+    name: str
+    path: str
+    signature: Tuple[int, int]
+    data: Dict[str, Any]
+    start_pose: str = "any"
+    end_pose: Optional[str] = None
+    duration: float = DEFAULT_SKILL_DURATION
+
+    @classmethod
+    def from_data(cls, key: str, path: str, signature: Tuple[int, int], data: Dict[str, Any]) -> 'SkillRecord':
+        name = data.get("Name", key)
+        if "prerequisite_pose" in data:
+            start_pose = data.get("prerequisite_pose") or "any"
+        else:
+            start_pose = data.get("start_position") or "any"
+        end_pose = data.get("end_pose") or data.get("end_position") or DEFAULT_END_POSES.get(str(name).lower())
+        return cls(key=key, name=name, path=path, signature=signature, data=data,
+                   start_pose=start_pose, end_pose=end_pose, duration=parse_duration(data))
+
+
+@dataclass
+class PoseGraph:
+    """Pose-transition graph for one catalog version."""
+    edges: Dict[str, List[Tuple[float, str, str]]] = field(default_factory=dict)  # pose -> [(duration, skill, end pose)]
+    routes: Dict[Tuple[str, str], List[str]] = field(default_factory=dict)
+
+    def add_edge(self, from_pose: str, to_pose: str, skill: str, duration: float):
+        self.edges.setdefault(from_pose, []).append((duration, skill, to_pose))
+        self.edges.setdefault(to_pose, [])
+
+    def shortest_path(self, from_pose: str, to_pose: str) -> List[str]:
+        """Dijkstra over expected durations; ties prefer fewer skills, then skill name."""
+        best = {from_pose: (0.0, 0)}
+        queue = [(0.0, 0, from_pose, ())]
+        while queue:
+            cost, hops, pose, path = heapq.heappop(queue)
+            if pose == to_pose:
+                return list(path)
+            if best.get(pose, (cost, hops)) < (cost, hops):
+                continue
+            for duration, skill, next_pose in sorted(self.edges.get(pose, ())):
+                candidate = (cost + duration, hops + 1)
+                if next_pose not in best or candidate < best[next_pose]:
+                    best[next_pose] = candidate
+                    heapq.heappush(queue, (candidate[0], candidate[1], next_pose, path + (skill,)))
+        return []
+
+
+class SkillCatalog:
+    """
+    Skills loaded once from a directory and refreshed when their files change.
+    """
+
+    def __init__(self, skills_dir: str = "skills", refresh_interval: float = 2.0):
+        """
+        Initialize the catalog.
+
+        Args:
+            skills_dir: Directory containing skill files
+            refresh_interval: Minimum seconds between directory rescans
+        """
+        self.skills_dir = skills_dir
+        self.refresh_interval = refresh_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._records: Dict[str, SkillRecord] = {}  # path -> record
+        self._by_key: Dict[str, Dict[str, Any]] = {}
+        self._by_name: Dict[str, SkillRecord] = {}
+        self._graph: Optional[PoseGraph] = None
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.version = 0
+        self.files_loaded = 0
+        self.load_errors = 0
+        self.route_hits = 0
+        self.route_misses = 0
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Reload skill files that were added, changed or removed since the last scan.
+
+        Args:
+            force: Rescan even if the refresh interval hasn't passed
+
+        Returns:
+            Number of skills added, reloaded or dropped
+        """
+        now = time.monotonic()
+        if not force and self._last_refresh and now - self._last_refresh < self.refresh_interval:
+            return 0
+        with self._lock:
+            self._last_refresh = now
+            try:
+                entries = [entry for entry in os.scandir(self.skills_dir) if entry.name.endswith('.json')]
+            except OSError:
+                entries = []
+
+            changed = 0
+            seen = set()
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                seen.add(entry.path)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                record = self._records.get(entry.path)
+                if record is not None and record.signature == signature:
+                    continue
+                self._records.pop(entry.path, None)
+                changed += 1
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if not isinstance(data, dict):
+                        raise ValueError("skill file is not a JSON object")
+                except Exception as e:
+                    self.load_errors += 1
+                    self.logger.error(f"Error loading skill {entry.name}: {e}")
+                    continue
+                self._records[entry.path] = SkillRecord.from_data(entry.name[:-5], entry.path, signature, data)
+                self.files_loaded += 1
+
+            for path in [path for path in self._records if path not in seen]:
+                del self._records[path]
+                changed += 1
+
+            if changed or self._graph is None:
+                ordered = sorted(self._records.values(), key=lambda record: record.key)
+                self._by_key = {record.key: record.data for record in ordered}
+                self._by_name = {record.name: record for record in ordered}
+                self._graph = None
+                self.version += 1
+            return changed
+
+    def skills(self) -> Dict[str, Dict[str, Any]]:
+        """Skill data keyed by file name (without .json)."""
+        self.refresh()
+        return self._by_key
+
+    def records(self) -> Dict[str, SkillRecord]:
+        """Skill records keyed by skill Name."""
+        self.refresh()
+        return self._by_name
+
+    def get(self, name: str) -> Optional[SkillRecord]:
+        """Record of a skill by Name or file name."""
+        records = self.records()
+        record = records.get(name)
+        if record is None and name in self._by_key:
+            record = next((r for r in records.values() if r.key == name), None)
+        return record
+
+    def _build_graph(self) -> PoseGraph:
+        graph = PoseGraph()
+        transitions = [record for record in self._by_name.values() if record.end_pose]
+        if not transitions:
+            for skill, from_pose, to_pose in BUILTIN_TRANSITIONS:
+                graph.add_edge(from_pose, to_pose, skill, DEFAULT_SKILL_DURATION)
+            return graph
+
+        poses = set(DEFAULT_POSES)
+        for record in self._by_name.values():
+            poses.update(pose for pose in (record.start_pose, record.end_pose) if pose and pose != "any")
+        for record in transitions:
+            sources = poses if record.start_pose == "any" else {record.start_pose}
+            for pose in sources:
+                if pose != record.end_pose:
+                    graph.add_edge(pose, record.end_pose, record.name, record.duration)
+        return graph
+
+    def transition_skills(self, from_pose: str, to_pose: str) -> List[str]:
+        """
+        Shortest (minimum expected duration) skill sequence between two poses.
+
+        Args:
+            from_pose: Current pose
+            to_pose: Target pose
+
+        Returns:
+            Skills to execute in order ([] if already there or unreachable)
+        """
+        if from_pose == to_pose:
+            return []
+        self.refresh()
+        with self._lock:
+            if self._graph is None:
+                self._graph = self._build_graph()
+            route = self._graph.routes.get((from_pose, to_pose))
+            if route is None:
+                self.route_misses += 1
+                route = self._graph.routes[(from_pose, to_pose)] = self._graph.shortest_path(from_pose, to_pose)
+            else:
+                self.route_hits += 1
+            return list(route)
+
+    def end_pose(self, skill_name: str) -> Optional[str]:
+        """Pose a skill leaves CARL in (None if it doesn't change pose)."""
+        record = self.get(skill_name)
+        if record is not None:
+            return record.end_pose
+        return DEFAULT_END_POSES.get(skill_name.lower())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get catalog statistics."""
+        with self._lock:
+            return {
+                'skills': len(self._records),
+                'version': self.version,
+                'files_loaded': self.files_loaded,
+                'load_errors': self.load_errors,
+                'transition_skills': sum(1 for record in self._records.values() if record.end_pose),
+                'route_hits': self.route_hits,
+                'route_misses': self.route_misses
+            }
+
+
+def get_skill_catalog() -> SkillCatalog:
+    """The skill catalog of the current runtime context."""
+    from runtime_context import get_current_context
+    return get_current_context().skill_catalog
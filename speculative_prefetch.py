@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Speculative Prefetch
+====================
+
+Starts the likely work for an utterance before CARL's cognitive pipeline
+asks for it.
+
+Speech reaches CARL as partial recognitions, then as the final text (which
+may wait in the ingestion queue behind other inputs). Only when the pipeline
+runs does it check reflexes, recall memories and ask the model for a reply.
+``SpeculativePrefetcher`` runs registered tasks on a small thread pool as
+soon as text is known:
+
+- ``speculate(text, final=False)`` for partial speech starts
+  the tasks that are safe on unconfirmed input (lookups without side effects),
+- ``speculate(text, final=True)`` for the final text also starts the tasks
+  that are only worth running on confirmed input (reflex check, draft reply),
+- ``claim(text, task)`` in the pipeline returns the speculative result when
+  it was computed for the same (normalized) text, waiting for it if it is
+  still running; otherwise the caller computes it as before,
+- speculations are kept per utterance (up to ``max_speculations``), so final
+  text still waiting in the queue keeps its results when more speech
+  arrives; a partial-input speculation is cancelled by the next new text,
+- ``warm(text, tasks)`` runs lookups for other inputs (vision events) to
+  warm caches without touching the current speculation.
+"""
+
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", (text or "").lower())).strip()
+
+
+@dataclass
+class SpeculativeTask:
+    """Work that can run ahead of the pipeline."""
+    name: str
+    func: Callable[[str], Any]
+    on_partial: bool = True  # Safe to run on unconfirmed input
+
+
+@dataclass
+class Speculation:
+    """Tasks started for one utterance."""
+    key: str
+    text: str
+    final: bool = False  # Confirmed input; kept until claimed, expired or evicted
+    started_at: float = field(default_factory=time.monotonic)
+    futures: Dict[str, Future] = field(default_factory=dict)
+    task_started: Dict[str, float] = field(default_factory=dict)
+    task_finished: Dict[str, float] = field(default_factory=dict)
+
+
+class SpeculativePrefetcher:
+    """
+    Runs registered tasks ahead of time and hands their results to the pipeline.
+    """
+
+    def __init__(self, max_workers: int = 3, max_age: float = 30.0, claim_timeout: float = 30.0,
+                 max_speculations: int = 8):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            max_workers: Threads running speculative tasks
+            max_age: Seconds after which an unclaimed speculation is discarded
+            claim_timeout: Longest a claim waits for a still-running task
+            max_speculations: Utterances with speculative work kept at once (oldest dropped)
+        """
+        self.max_workers = max_workers
+        self.max_speculations = max_speculations
+        self.max_age = max_age
+        self.claim_timeout = claim_timeout
+        self.enabled = True
+        self.logger = logging.getLogger(__name__)
+
+        self._tasks: Dict[str, SpeculativeTask] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._speculations: "OrderedDict[str, Speculation]" = OrderedDict()  # key -> speculation
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.speculations = 0
+        self.tasks_started = 0
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+        self.failures = 0
+        self.saved_seconds = 0.0
+
+    def register(self, name: str, func: Callable[[str], Any], on_partial: bool = True):
+        """
+        Register a speculative task.
+
+        Args:
+            name: Task name used by claim()
+            func: Called with the utterance text on a worker thread
+            on_partial: Whether the task may run on partial (unconfirmed) input
+        """
+        self._tasks[name] = SpeculativeTask(name=name, func=func, on_partial=on_partial)
+
+    def _submit(self, speculation: Speculation, task: SpeculativeTask):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Speculative")
+
+        def run():
+            try:
+                return task.func(speculation.text)
+            finally:
+                speculation.task_finished[task.name] = time.monotonic()
+
+        speculation.task_started[task.name] = time.monotonic()
+        speculation.futures[task.name] = self._executor.submit(run)
+        self.tasks_started += 1
+
+    def speculate(self, text: str, final: bool = False, tasks: Optional[Iterable[str]] = None) -> int:
+        """
+        Start speculative work for an utterance.
+
+        Args:
+            text: Partial or final input text
+            final: True for confirmed input (also runs tasks not safe on partials)
+            tasks: Restrict to these task names
+
+        Returns:
+            Number of tasks started
+        """
+        key = normalize_utterance(text)
+        if not self.enabled or not key:
+            return 0
+        with self._lock:
+            self._drop_expired()
+            speculation = self._speculations.get(key)
+            if speculation is None:
+                # Partial input is superseded by whatever text comes next
+                for other in [other for other in self._speculations.values() if not other.final]:
+                    self._cancel(other)
+                    del self._speculations[other.key]
+                speculation = self._speculations[key] = Speculation(key=key, text=text)
+                self.speculations += 1
+                while len(self._speculations) > self.max_speculations:
+                    self._cancel(self._speculations.popitem(last=False)[1])
+            speculation.final = speculation.final or final
+
+            started = 0
+            for task in self._tasks.values():
+                if tasks is not None and task.name not in tasks:
+                    continue
+                if task.name in speculation.task_started or not (final or task.on_partial):
+                    continue
+                self._submit(speculation, task)
+                started += 1
+            return started
+
+    def warm(self, text: str, tasks: Iterable[str]) -> int:
+        """
+        Run side-effect-free tasks for text without touching the utterance speculations.
+
+        Used for inputs that aren't the next utterance (e.g. vision events)
+        to warm caches; the results are not claimable.
+
+        Returns:
+            Number of tasks started
+        """
+        if not self.enabled or not normalize_utterance(text):
+            return 0
+        with self._lock:
+            speculation = Speculation(key="", text=text)
+            started = 0
+            for name in tasks:
+                task = self._tasks.get(name)
+                if task is not None and task.on_partial:
+                    self._submit(speculation, task)
+                    started += 1
+            return started
+
+    def _expired(self, speculation: Speculation) -> bool:
+        return time.monotonic() - speculation.started_at > self.max_age
+
+    def _drop_expired(self):
+        """Cancel and forget speculations older than max_age (lock held)."""
+        for speculation in [s for s in self._speculations.values() if self._expired(s)]:
+            self._cancel(speculation)
+            del self._speculations[speculation.key]
+
+    def _cancel(self, speculation: Speculation):
+        """Cancel tasks that haven't started; running ones finish and are discarded."""
+        for future in speculation.futures.values():
+            if not future.done():
+                future.cancel()
+                self.cancelled += 1
+
+    def cancel(self):
+        """Drop all speculations."""
+        with self._lock:
+            for speculation in self._speculations.values():
+                self._cancel(speculation)
+            self._speculations.clear()
+
+    def claim(self, text: str, name: str, timeout: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        Take a speculative result for the final input.
+
+        Each result can be claimed once. A result computed for different text,
+        a failed task or one that doesn't finish within the timeout is a miss.
+
+        Args:
+            text: The final input text
+            name: Task name
+            timeout: Longest wait for a running task (claim_timeout if None)
+
+        Returns:
+            (hit, result)
+        """
+        if name not in self._tasks:
+            return False, None
+        key = normalize_utterance(text)
+        with self._lock:
+            self._drop_expired()
+            speculation = self._speculations.get(key)
+            future = speculation.futures.pop(name, None) if speculation is not None else None
+        if future is None:
+            self.misses += 1
+            return False, None
+
+        claimed_at = time.monotonic()
+        try:
+            result = future.result(timeout=self.claim_timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self.misses += 1
+            return False, None
+        except Exception as e:
+            self.failures += 1
+            self.misses += 1
+            self.logger.debug(f"Speculative task {name} failed: {e}")
+            return False, None
+
+        # Work done before the pipeline asked for it
+        started = speculation.task_started.get(name, claimed_at)
+        finished = speculation.task_finished.get(name, claimed_at)
+        self.saved_seconds += max(0.0, min(finished, claimed_at) - started)
+        self.hits += 1
+        return True, result
+
+    def shutdown(self):
+        """Cancel pending work and stop the worker threads."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get speculation statistics."""
+        claims = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'tasks': sorted(self._tasks),
+            'speculations': self.speculations,
+            'active_speculations': len(self._speculations),
+            'tasks_started': self.tasks_started,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / claims if claims else 0.0,
+            'cancelled': self.cancelled,
+            'failures': self.failures,
+            'saved_ms': 1000.0 * self.saved_seconds,
+            'avg_saved_ms': 1000.0 * self.saved_seconds / self.hits if self.hits else 0.0
+        }
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Startup Orchestrator
+====================
+
+Dependency-aware startup of CARL's subsystems.
+
+Startup used to construct subsystems one after another and separate the
+robot startup phases with fixed sleeps. Here every startup step is a node
+that names the nodes it depends on and, optionally, a readiness probe:
+
+- a node starts as soon as all its dependencies are ready, on a small
+  thread pool (or on the calling thread for ``main_thread`` nodes such as
+  Tk work),
+- a node is ready when its function returned without raising (and didn't
+  return False) and its probe, if any, reports True within ``ready_timeout``,
+- nodes whose dependencies failed are skipped, not run,
+- ``run()`` returns a ``StartupReport`` with each node's start/finish offsets,
+  the critical path (the dependency chain that determined time-to-ready) and
+  a printable timeline, so time-to-ready can be tracked as a benchmark.
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"
+PENDING = "pending"
+
+
+@dataclass
+class StartupNode:
+    """One startup step."""
+    name: str
+    func: Callable[[], Any]
+    depends_on: Sequence[str] = ()
+    probe: Optional[Callable[[], bool]] = None  # Readiness check after func returns
+    ready_timeout: float = 10.0
+    probe_interval: float = 0.05
+    main_thread: bool = False
+
+    # Filled in by the orchestrator (seconds since run() started)
+    status: str = PENDING
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+@dataclass
+class StartupReport:
+    """Outcome and timeline of one startup run."""
+    nodes: Dict[str, StartupNode]
+    time_to_ready: float
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return all(node.status == READY for node in self.nodes.values())
+
+    def status(self, name: str) -> str:
+        return self.nodes[name].status
+
+    def serial_time(self) -> float:
+        """Sum of node durations (time a one-after-another startup would take)."""
+        return sum(node.duration for node in self.nodes.values())
+
+    def format_timeline(self, width: int = 40) -> str:
+        """Text timeline: one bar per node, critical path marked with *."""
+        total = self.time_to_ready or 1e-9
+        lines = [f"Startup timeline: {1000 * self.time_to_ready:.0f}ms to ready "
+                 f"({1000 * self.serial_time():.0f}ms of work)"]
+        ordered = sorted(self.nodes.values(), key=lambda node: (node.started is None, node.started or 0.0, node.name))
+        name_width = max((len(name) for name in self.nodes), default=0)
+        for node in ordered:
+            if node.started is None:
+                bar = ""
+            else:
+                start = int(width * node.started / total)
+                length = max(1, int(width * node.duration / total))
+                bar = " " * start + "#" * min(length, width - start)
+            marker = "*" if node.name in self.critical_path else " "
+            lines.append(f"{marker} {node.name.ljust(name_width)} |{bar.ljust(width)}| "
+                         f"{1000 * node.duration:7.1f}ms {node.status}" + (f" ({node.error})" if node.error else ""))
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable report."""
+        return {
+            'success': self.success,
+            'time_to_ready_ms': 1000 * self.time_to_ready,
+            'serial_time_ms': 1000 * self.serial_time(),
+            'critical_path': list(self.critical_path),
+            'nodes': {
+                name: {
+                    'status': node.status,
+                    'depends_on': list(node.depends_on),
+                    'start_ms': None if node.started is None else 1000 * node.started,
+                    'duration_ms': 1000 * node.duration,
+                    'error': node.error
+                }
+                for name, node in self.nodes.items()
+            }
+        }
+
+
+class StartupOrchestrator:
+    """
+    Runs startup nodes concurrently in dependency order.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            max_workers: Threads running nodes concurrently
+        """
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self.nodes: Dict[str, StartupNode] = {}
+
+    def add(self, name: str, func: Callable[[], Any], depends_on: Sequence[str] = (),
+            probe: Optional[Callable[[], bool]] = None, ready_timeout: float = 10.0,
+            probe_interval: float = 0.05, main_thread: bool = False) -> StartupNode:
+        """
+        Add a startup node.
+
+        Args:
+            name: Unique node name
+            func: Startup work; returning False (or raising) fails the node
+            depends_on: Nodes that must be ready first
+            probe: Called until it returns True before the node counts as ready
+            ready_timeout: Longest wait for the probe
+            probe_interval: Seconds between probe calls
+            main_thread: Run on the thread calling run() (e.g. for Tk work)
+
+        Returns:
+            The node
+        """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate startup node: {name}")
+        node = StartupNode(name=name, func=func, depends_on=tuple(depends_on), probe=probe,
+                           ready_timeout=ready_timeout, probe_interval=probe_interval,
+                           main_thread=main_thread)
+        self.nodes[name] = node
+        return node
+
+    def _validate(self):
+        """Reject unknown dependencies and cycles."""
+        for node in self.nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self.nodes:
+                    raise ValueError(f"Startup node {node.name} depends on unknown node {dependency}")
+        visiting, done = set(), set()
+
+        def visit(name: str, path: List[str]):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.nodes:
+            visit(name, [])
+
+    def _execute(self, node: StartupNode, origin: float):
+        """Run a node's function and wait for its probe."""
+        node.started = time.perf_counter() - origin
+        try:
+            node.result = node.func()
+            if node.result is False:
+                raise RuntimeError("returned False")
+            if node.probe is not None:
+                deadline = time.monotonic() + node.ready_timeout
+                while not node.probe():
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"not ready after {node.ready_timeout:.1f}s")
+                    time.sleep(node.probe_interval)
+            node.status = READY
+        except Exception as e:
+            node.status = FAILED
+            node.error = str(e) or type(e).__name__
+            self.logger.warning(f"❌ Startup node {node.name} failed: {node.error}")
+        finally:
+            node.finished = time.perf_counter() - origin
+
+    def run(self, timeout: Optional[float] = None) -> StartupReport:
+        """
+        Run every node.
+
+        Args:
+            timeout: Longest total wait (nodes still running afterwards are reported as pending)
+
+        Returns:
+            StartupReport
+        """
+        self._validate()
+        for node in self.nodes.values():
+            node.status, node.started, node.finished, node.result, node.error = PENDING, None, None, None, None
+
+        origin = time.perf_counter()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        condition = threading.Condition()
+        dispatched = set()
+        main_queue: List[StartupNode] = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="Startup")
+
+        def dispatch():
+            """Start every node whose dependencies are settled (condition held)."""
+            progressed = True
+            while progressed:
+                progressed = False
+                for node in self.nodes.values():
+                    if node.name in dispatched:
+                        continue
+                    statuses = [self.nodes[d].status for d in node.depends_on]
+                    if any(status in (FAILED, SKIPPED) for status in statuses):
+                        node.status = SKIPPED
+                        node.error = "dependency not ready"
+                        dispatched.add(node.name)
+                        progressed = True
+                    elif all(status == READY for status in statuses):
+                        dispatched.add(node.name)
+                        if node.main_thread:
+                            main_queue.append(node)
+                        else:
+                            executor.submit(run_node, node)
+            condition.notify_all()
+
+        def run_node(node: StartupNode):
+            self._execute(node, origin)
+            # Workers dispatch dependents themselves so they don't wait for a busy main thread
+            with condition:
+                dispatch()
+
+        try:
+            while True:
+                with condition:
+                    dispatch()
+                    if not main_queue:
+                        if all(node.status != PENDING for node in self.nodes.values()):
+                            break
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.logger.warning("⚠️ Startup timed out waiting for nodes")
+                            break
+                        condition.wait(remaining)
+                        continue
+
+                # Main-thread nodes run outside the lock so workers can report progress
+                self._execute(main_queue.pop(0), origin)
+        finally:
+            executor.shutdown(wait=False)
+
+        time_to_ready = time.perf_counter() - origin
+        report = StartupReport(nodes=dict(self.nodes), time_to_ready=time_to_ready,
+                               critical_path=self._critical_path())
+        self.logger.info(f"🚀 Startup finished in {1000 * time_to_ready:.0f}ms "
+                         f"(critical path: {' -> '.join(report.critical_path)})")
+        return report
+
+    def _critical_path(self) -> List[str]:
+        """Chain of nodes, each waiting on the dependency that finished last, ending at the last node."""
+        finished = [node for node in self.nodes.values() if node.finished is not None]
+        if not finished:
+            return []
+        node = max(finished, key=lambda n: n.finished)
+        path = [node.name]
+        while True:
+            dependencies = [self.nodes[d] for d in node.depends_on if self.nodes[d].finished is not None]
+            if not dependencies:
+                break
+            node = max(dependencies, key=lambda n: n.finished)
+            path.append(node.name)
+        return list(reversed(path))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the background camera frame grabber.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from camera_frame_grabber import CameraFrameGrabber, iter_mjpeg_frames
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Returns numbered JPEG payloads and counts requests."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def get(self, url, timeout=None, stream=False):
+        self.requests += 1
+        return FakeResponse(b'\xff\xd8frame%d\xff\xd9' % self.requests)
+
+    def close(self):
+        pass
+
+
+class TestCameraFrameGrabber(unittest.TestCase):
+    """Test cases for CameraFrameGrabber."""
+
+    def test_double_buffer_flip(self):
+        grabber = CameraFrameGrabber(session=FakeSession())
+        self.assertIsNone(grabber.latest())
+        grabber.fetch_once()
+        grabber.fetch_once()
+        frame = grabber.latest()
+        self.assertEqual(frame.sequence, 2)
+        self.assertIn(b'frame2', frame.data)
+        self.assertIsNone(grabber.latest(max_age=-1))
+
+    def test_background_thread_and_memshot(self):
+        session = FakeSession()
+        grabber = CameraFrameGrabber(interval=0.01, session=session)
+        grabber.start()
+        try:
+            self.assertIsNotNone(grabber.wait_for_frame(after_sequence=1, timeout=2.0))
+        finally:
+            grabber.stop()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = grabber.save_latest(temp_dir, prefix="memshot")
+            self.assertTrue(os.path.basename(path).startswith("memshot_"))
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), grabber.latest().data)
+        self.assertGreaterEqual(grabber.get_stats()['frames_grabbed'], 2)
+
+    def test_fetch_error_is_recorded(self):
+        class FailingSession(FakeSession):
+            def get(self, url, timeout=None, stream=False):
+                raise ConnectionError("camera offline")
+        grabber = CameraFrameGrabber(session=FailingSession())
+        self.assertIsNone(grabber.fetch_once())
+        self.assertEqual(grabber.fetch_errors, 1)
+        self.assertIsNone(grabber.save_latest(tempfile.gettempdir()))
+
+    def test_mjpeg_frames_split_across_chunks(self):
+        stream = b'--boundary\r\n\r\n\xff\xd8one\xff\xd9\r\n--boundary\r\n\r\n\xff\xd8two\xff\xd9'
+        chunks = [stream[i:i + 7] for i in range(0, len(stream), 7)]
+        self.assertEqual(list(iter_mjpeg_frames(chunks)), [b'\xff\xd8one\xff\xd9', b'\xff\xd8two\xff\xd9'])
+
+
+if __name__ == '__main__':
+    unittest.main()
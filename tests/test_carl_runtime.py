@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the headless CARL runtime.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from carl_runtime import CarlRuntime, ThreadScheduler, run_benchmark
+
+
+class TestThreadScheduler(unittest.TestCase):
+    """Test cases for ThreadScheduler."""
+
+    def test_callbacks_run_in_deadline_order(self):
+        scheduler = ThreadScheduler()
+        scheduler.start()
+        calls = []
+        done = threading.Event()
+        scheduler.after(30, lambda: (calls.append('late'), done.set()))
+        scheduler.after(0, calls.append, 'early')
+        cancelled = scheduler.after(10, calls.append, 'cancelled')
+        scheduler.after_cancel(cancelled)
+        self.assertTrue(done.wait(2.0))
+        scheduler.stop()
+        self.assertEqual(calls, ['early', 'late'])
+
+    def test_cancelling_a_fired_callback_is_not_remembered(self):
+        scheduler = ThreadScheduler()
+        scheduler.start()
+        done = threading.Event()
+        handle = scheduler.after(0, done.set)
+        self.assertTrue(done.wait(2.0))
+        time.sleep(0.01)
+        scheduler.after_cancel(handle)
+        scheduler.stop()
+        self.assertEqual(scheduler._cancelled, set())
+        self.assertEqual(scheduler._pending, set())
+
+
+class TestCarlRuntime(unittest.TestCase):
+    """Test cases for CarlRuntime."""
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_tick_runs_pipeline_and_notifies_observers(self):
+        replies = []
+        runtime = CarlRuntime(respond=lambda item, context: f"echo {item.content}")
+        runtime.add_observer(replies.append)
+        runtime.submit_speech("Hello Carl")
+        runtime.submit_vision("ball", "red")
+
+        self.assertEqual(runtime.drain(), 2)
+        self.assertIsNone(runtime.tick())
+        self.assertEqual(replies[0]['reply'], "echo Hello Carl")
+        self.assertEqual(replies[1]['content'], "I see red ball")
+        self.assertIn('memory', replies[0]['timings'])
+        self.assertEqual(runtime.get_metrics()['events_processed'], 2)
+
+    def test_started_runtime_processes_queued_input(self):
+        runtime = CarlRuntime(base_processing_time=0.05, min_processing_time=0.01, max_processing_time=0.05)
+        processed = threading.Event()
+        runtime.add_observer(lambda result: processed.set())
+        runtime.start()
+        try:
+            runtime.submit_speech("Are you there?")
+            self.assertTrue(processed.wait(2.0))
+        finally:
+            runtime.stop()
+
+    def test_full_queue_drops_input(self):
+        runtime = CarlRuntime(max_queue=1)
+        self.assertTrue(runtime.submit_speech("one"))
+        self.assertFalse(runtime.submit_speech("two"))
+        self.assertEqual(runtime.get_metrics()['inputs_dropped'], 1)
+
+    def test_data_dir_isolates_memories(self):
+        runtime = CarlRuntime(data_dir=os.path.join(self.temp_dir, 'robot_a'))
+        runtime.submit_speech("Hello Carl")
+        runtime.drain()
+        episodic = os.path.join(self.temp_dir, 'robot_a', 'memories', 'episodic')
+        self.assertEqual(len(os.listdir(episodic)), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'memories')))
+
+    def test_benchmark_leaves_no_data_behind(self):
+        result = run_benchmark(robots=2, events=4)
+        self.assertEqual(result['events'], 8)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for batched AI calls in CognitiveFunctionAICallManager.
+"""
+
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cognitive_ai_integration_system import AICallContext, CognitiveFunctionAICallManager
+
+FUNCTIONS = ["extroversion", "intuition", "thinking", "feeling"]
+TRAITS = {"mbti_type": "INTP"}
+
+
+def make_context(message="What do you think about dinosaurs?"):
+    return AICallContext("event", message, TRAITS, {}, [], [], [], {}, {}, {})
+
+
+class SlowClientManager(CognitiveFunctionAICallManager):
+    """Manager whose model calls take a fixed time and are counted."""
+
+    def __init__(self, **kwargs):
+        super().__init__(openai_client=object(), **kwargs)
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call_openai(self, prompt):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return {f: {"insights": [f]} for f in FUNCTIONS}
+
+
+class TestAICallBatching(unittest.TestCase):
+    """Test cases for merged and concurrent AI calls."""
+
+    def test_merged_mode_issues_one_call(self):
+        manager = SlowClientManager()
+        results = asyncio.run(manager.make_ai_calls(FUNCTIONS, make_context(), TRAITS, mode="merged"))
+        self.assertEqual(len(manager.prompts), 1)
+        for function in FUNCTIONS:
+            self.assertIn(f"### {function}", manager.prompts[0])
+            self.assertEqual(results[function].response, {"insights": [function]})
+
+    def test_concurrent_mode_respects_cap(self):
+        manager = SlowClientManager(max_concurrency=2)
+        asyncio.run(manager.make_ai_calls(FUNCTIONS, make_context(), TRAITS, mode="concurrent"))
+        asyncio.run(manager.make_ai_calls(FUNCTIONS, make_context("Another message"), TRAITS, mode="sequential"))
+        self.assertEqual(manager.max_in_flight, 2)
+        events = manager.get_stats()["events"]
+        self.assertLess(events["concurrent"]["avg_wall_ms"], events["sequential"]["avg_wall_ms"])
+
+    def test_cached_functions_are_not_called_again(self):
+        manager = SlowClientManager()
+        context = make_context()
+        asyncio.run(manager.make_ai_call("thinking", context, TRAITS))
+        self.assertFalse(manager.should_make_ai_call("thinking", context, {"decision": {"thinking": 0.9}}))
+        results = asyncio.run(manager.make_ai_calls(["thinking", "feeling"], context, TRAITS, mode="merged"))
+        self.assertTrue(results["thinking"].cache_hit)
+        self.assertFalse(results["feeling"].cache_hit)
+        self.assertEqual(len(manager.prompts), 2)
+        self.assertEqual(manager.get_stats()["cache"]["size"], 2)
+
+    def test_mock_responses_without_client(self):
+        manager = CognitiveFunctionAICallManager()
+        results = asyncio.run(manager.make_ai_calls(FUNCTIONS, make_context(), TRAITS))
+        self.assertIn("interpretations", results["intuition"].response)
+        with self.assertRaises(ValueError):
+            asyncio.run(manager.make_ai_calls(FUNCTIONS, make_context(), TRAITS, mode="parallel"))
+
+
+if __name__ == '__main__':
+    unittest.main()
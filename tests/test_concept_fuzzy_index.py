@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared concept/thing fuzzy index.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from concept_fuzzy_index import ConceptFuzzyIndex
+from runtime_context import RuntimeContext, set_current_context
+from vision_system import VisionSystem
+
+
+class TestConceptFuzzyIndex(unittest.TestCase):
+    """Test cases for ConceptFuzzyIndex."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.root, 'concepts'))
+        os.makedirs(os.path.join(self.root, 'things'))
+        self._write('concepts', 'ball.json', {'word': 'ball', 'keywords': ['sphere', 'toy ball'],
+                                               'related_concepts': ['play']})
+        self._write('concepts', 'cup.json', {'word': 'cup', 'keywords': ['mug'],
+                                              'Learning_Integration': {'notes': ['coffee mug']}})
+        self._write('things', 'chomp.json', {'name': 'Chomp', 'keywords': ['dinosaur', 'vtech'], 'color': 'green'})
+        self.index = ConceptFuzzyIndex(root=self.root, refresh_interval=0.0,
+                                       synonym_mappings={'cat': ['kitty', 'feline']})
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write(self, directory, filename, data):
+        path = os.path.join(self.root, directory, filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return path
+
+    def test_search_ranks_fuzzy_matches(self):
+        results = self.index.search('balls')
+        self.assertEqual(results[0][0].filename, 'ball.json')
+        self.assertGreater(results[0][1], 0.8)
+        self.assertEqual(self.index.search('dinosuar', directory='things')[0][0].filename, 'chomp.json')
+        self.assertEqual(self.index.search('coffee mugs')[0][0].filename, 'cup.json')
+        self.assertEqual(self.index.search('zzzz'), [])
+
+    def test_candidates_are_restricted_to_overlapping_terms(self):
+        candidates = self.index.candidate_documents(['sphere'], directory='concepts')
+        self.assertEqual([document.filename for document in candidates], ['ball.json'])
+        self.assertEqual(self.index.candidate_documents(['green'], directory='concepts'), [])
+
+    def test_candidates_are_not_truncated_by_default(self):
+        for i in range(100):
+            self._write('concepts', f'ball_{i}.json', {'word': f'ball{i}'})
+        self.index.refresh(force=True)
+        self.assertEqual(len(self.index.candidate_documents(['ball'], directory='concepts')), 101)
+
+        limited = ConceptFuzzyIndex(root=self.root, refresh_interval=0.0, max_candidates=5)
+        self.assertLessEqual(len(limited.candidate_documents(['ball'], directory='concepts')), 5)
+
+    def test_synonym_expansion(self):
+        self._write('things', 'cat.json', {'name': 'cat'})
+        self.index.refresh(force=True)
+        self.assertEqual(self.index.expand('kitty'), ['kitty', 'cat'])
+        self.assertEqual(self.index.search('kitty')[0][0].filename, 'cat.json')
+
+    def test_incremental_refresh(self):
+        self.index.refresh(force=True)
+        loaded = self.index.documents_loaded
+        self.assertEqual(self.index.refresh(force=True), 0)
+        self.assertEqual(self.index.documents_loaded, loaded)
+
+        path = self._write('concepts', 'cup.json', {'word': 'teacup', 'keywords': ['saucer']})
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        os.remove(os.path.join(self.root, 'concepts', 'ball.json'))
+        self.assertEqual(self.index.refresh(force=True), 2)
+        self.assertNotIn('ball.json', [document.filename for document, _, _ in self.index.search('sphere')])
+        self.assertEqual(self.index.search('saucer')[0][0].data['word'], 'teacup')
+        self.assertEqual(self.index.search('mug'), [])
+
+    def test_text_cache_keeps_most_recent_memories(self):
+        episodic = os.path.join(self.root, 'memories', 'episodic')
+        os.makedirs(episodic)
+        for i in range(5):
+            path = os.path.join(episodic, f'event_{i}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'event': f'saw ball {i}', 'timestamp': f'2025-01-0{i + 1}T10:00:00'}, f)
+            # File times run backwards (e.g. restored from a backup); the memory timestamp decides
+            os.utime(path, ns=((9 - i) * 1_000_000_000, (9 - i) * 1_000_000_000))
+        index = ConceptFuzzyIndex(root=self.root, refresh_interval=0.0, max_text_documents=3)
+        self.assertEqual(sorted(document.filename for document in index.documents('episodic')),
+                         ['event_2.json', 'event_3.json', 'event_4.json'])
+
+        os.remove(os.path.join(episodic, 'event_4.json'))
+        self.assertIn('event_1.json', [document.filename for document in index.documents('episodic')])
+        self.assertEqual(index.get_stats()['documents']['episodic'], 3)
+
+    def test_lookup_is_fast(self):
+        for i in range(500):
+            self._write('concepts', f'concept_{i}.json', {'word': f'object{i}', 'keywords': [f'thing{i}', 'common']})
+        self.index.refresh(force=True)
+        self.index.refresh_interval = 60.0
+        started = time.perf_counter()
+        for _ in range(100):
+            self.index.search('object42', top_k=5)
+        per_query_ms = 1000 * (time.perf_counter() - started) / 100
+        self.assertLess(per_query_ms, 5.0)
+
+
+class TestVisionThingLookup(unittest.TestCase):
+    """Test that VisionSystem skips malformed thing files."""
+
+    def setUp(self):
+        # The lookup must resolve things/ in the context's data root, not the working directory
+        self.original_cwd = os.getcwd()
+        self.root = tempfile.mkdtemp()
+        self.things_dir = os.path.join(self.root, 'things')
+        os.makedirs(self.things_dir)
+        os.chdir(os.path.join(self.root, 'things'))
+        set_current_context(RuntimeContext('vision_test', self.root))
+        self.vision = VisionSystem.__new__(VisionSystem)
+        self.vision.logger = logging.getLogger(__name__)
+
+    def tearDown(self):
+        set_current_context(None)
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_malformed_thing_is_skipped(self):
+        for filename, data in (('broken.json', {'name': None, 'keywords': ['chomp', 3]}),
+                               ('chomp.json', {'name': 'Chomp', 'keywords': ['dinosaur']})):
+            with open(os.path.join(self.things_dir, filename), 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        with open(os.path.join(self.things_dir, 'torn.json'), 'w', encoding='utf-8') as f:
+            f.write('{"name": "chomp')
+
+        with self.assertLogs(__name__, level='WARNING'):
+            match = self.vision._search_things_directory_for_object('chomp')
+        self.assertEqual(match['source_file'], 'chomp.json')
+
+
+if __name__ == '__main__':
+    unittest.main()
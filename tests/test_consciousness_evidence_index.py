@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental consciousness evidence index.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from multi_pattern_matcher import MultiPatternMatcher
+from consciousness_evidence_index import (
+    ConsciousnessEvidenceIndex, categorize_memory_file, categorize_log_line
+)
+from runtime_context import RuntimeContext, set_current_context
+
+
+class TestMultiPatternMatcher(unittest.TestCase):
+    """Test cases for the Aho-Corasick matcher."""
+
+    def test_overlapping_patterns(self):
+        matcher = MultiPatternMatcher(['he', 'she', 'his', 'hers'])
+        self.assertEqual(matcher.find_all('ushers'), {'he', 'she', 'hers'})
+
+    def test_no_match(self):
+        matcher = MultiPatternMatcher(['vision', 'goal'])
+        self.assertEqual(matcher.find_all('nothing here'), set())
+        self.assertFalse(matcher.contains_any('nothing here'))
+        self.assertTrue(matcher.contains_any('a goal'))
+
+
+class TestConsciousnessEvidenceIndex(unittest.TestCase):
+    """Test cases for ConsciousnessEvidenceIndex."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory_dir = os.path.join(self.temp_dir, 'memories')
+        os.makedirs(self.memory_dir)
+        self.index_path = os.path.join(self.temp_dir, 'index.json')
+        self.patterns = {'episodic_memories': os.path.join(self.memory_dir, '*_event.json')}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_memory(self, name, data):
+        path = os.path.join(self.memory_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return path
+
+    def test_categorize_memory_file(self):
+        path = self._write_memory('vision_event.json', {
+            'timestamp': '2025-01-01T00:00:00',
+            'WHO': 'Joe',
+            'neucogar_emotional_state': {'joy': 0.5}
+        })
+        entry = categorize_memory_file(path)
+        self.assertIn('vision_events', entry['buckets'])
+        self.assertIn('social_interactions', entry['buckets'])
+        self.assertIn('emotional_events', entry['buckets'])
+        self.assertIn('memory_events', entry['buckets'])
+        self.assertNotIn('learning_events', entry['buckets'])
+        self.assertIn('neucogar_emotional_state', entry['matched_indicators'])
+
+    def test_unchanged_files_are_not_reindexed(self):
+        self._write_memory('a_event.json', {'goal': 'x'})
+        index = ConsciousnessEvidenceIndex(index_path=self.index_path)
+        index.refresh_memory_files(self.patterns)
+        self.assertEqual(index.last_stats['files_reindexed'], 1)
+        index.save()
+
+        reloaded = ConsciousnessEvidenceIndex(index_path=self.index_path)
+        results = reloaded.refresh_memory_files(self.patterns)
+        self.assertEqual(reloaded.last_stats['files_reindexed'], 0)
+        self.assertIn('purpose_driven_events', results[0][1]['buckets'])
+
+        self._write_memory('b_event.json', {'skill': 'wave'})
+        reloaded.refresh_memory_files(self.patterns)
+        self.assertEqual(reloaded.last_stats['files_reindexed'], 1)
+
+    def test_log_is_scanned_incrementally(self):
+        log_file = os.path.join(self.temp_dir, 'system.log')
+        with open(log_file, 'w', encoding='utf-8') as f:
+            f.write("2025-01-01 10:00:00 memory stored\nnothing interesting\n")
+        index = ConsciousnessEvidenceIndex(index_path=self.index_path)
+        entries = index.refresh_log(log_file)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['bucket'], 'memory_events')
+        self.assertEqual(entries[0]['timestamp'], '2025-01-01 10:00:00')
+
+        scanned = index.last_stats['log_bytes_scanned']
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write("🎮 CARL made move at 4\n")
+        entries = index.refresh_log(log_file)
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[1]['line_number'], 3)
+        self.assertEqual(entries[1]['bucket'], 'game_reasoning_events')
+        self.assertLess(index.last_stats['log_bytes_scanned'] - scanned, 40)
+
+    def test_log_history_is_capped(self):
+        log_file = os.path.join(self.temp_dir, 'system.log')
+        with open(log_file, 'w', encoding='utf-8') as f:
+            f.write("".join(f"memory stored {i}\n" for i in range(10)))
+        index = ConsciousnessEvidenceIndex(index_path=self.index_path, max_log_entries=3)
+        entries = index.refresh_log(log_file)
+        self.assertEqual([entry['line_number'] for entry in entries], [8, 9, 10])
+        index.save()
+
+        reloaded = ConsciousnessEvidenceIndex(index_path=self.index_path, max_log_entries=3)
+        self.assertEqual(len(reloaded.refresh_log(log_file)), 3)
+        stats = reloaded.get_stats()
+        self.assertEqual((stats['log_entries'], stats['log_evidence_lines']), (3, 10))
+
+    def test_default_index_path_is_in_context_root(self):
+        set_current_context(RuntimeContext('robot', self.temp_dir))
+        try:
+            index = ConsciousnessEvidenceIndex()
+        finally:
+            set_current_context(None)
+        self.assertEqual(index.index_path, os.path.join(self.temp_dir, 'consciousness_evidence_index.json'))
+
+    def test_log_line_categories(self):
+        self.assertIsNone(categorize_log_line("just a line"))
+        self.assertEqual(categorize_log_line("Self recognition event: mirror"), 'self_recognition_events')
+        self.assertEqual(categorize_log_line("PDB Counter updated"), 'purpose_driven_events')
+        self.assertEqual(categorize_log_line("awareness rising"), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
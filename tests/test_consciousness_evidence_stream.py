@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming consciousness evidence counters.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+import enhanced_consciousness_evaluation
+from consciousness_evidence_stream import ConsciousnessEvidenceCounters, EvidenceEvent
+from enhanced_consciousness_evaluation import EnhancedConsciousnessEvaluation
+
+
+class TestConsciousnessEvidenceCounters(unittest.TestCase):
+    """Test cases for ConsciousnessEvidenceCounters."""
+
+    def setUp(self):
+        self.counters = ConsciousnessEvidenceCounters()
+
+    def test_publish_and_snapshot(self):
+        self.assertTrue(self.counters.publish('memory_usage', 0.5, file_path='memories/a.json'))
+        self.counters.publish('memory_usage', 1.5)
+        self.assertFalse(self.counters.publish('not_a_category'))
+
+        snapshot = self.counters.snapshot()
+        self.assertEqual(snapshot['memory_usage']['count'], 2)
+        self.assertEqual(snapshot['memory_usage']['recent_count'], 2)
+        self.assertEqual(snapshot['memory_usage']['file_paths'], ['memories/a.json'])
+        self.assertEqual(snapshot['self_recognition']['count'], 0)
+
+    def test_old_evidence_is_not_recent(self):
+        self.counters.publish('game_reasoning', timestamp=time.time() - 10 * 24 * 3600)
+        snapshot = self.counters.snapshot()
+        self.assertEqual(snapshot['game_reasoning']['count'], 1)
+        self.assertEqual(snapshot['game_reasoning']['recent_count'], 0)
+
+    def test_reconciliation_replays_concurrent_events(self):
+        self.counters.publish('self_recognition')
+        self.assertFalse(self.counters.is_reconciled())
+
+        self.counters.begin_reconciliation()
+        self.counters.publish('learning_adaptation')
+        self.counters.finish_reconciliation([EvidenceEvent('memory_usage', 2.5, timestamp=0.0)])
+
+        snapshot = self.counters.snapshot()
+        self.assertTrue(self.counters.is_reconciled())
+        self.assertEqual(snapshot['self_recognition']['count'], 0)
+        self.assertEqual(snapshot['memory_usage']['count'], 1)
+        self.assertEqual(snapshot['memory_usage']['recent_count'], 0)
+        self.assertEqual(snapshot['learning_adaptation']['count'], 1)
+
+
+class TestSerializedReconciliation(unittest.TestCase):
+    """Test that reconciliations of the shared counters never overlap."""
+
+    def setUp(self):
+        counters_patch = mock.patch.object(enhanced_consciousness_evaluation, 'evidence_counters',
+                                           ConsciousnessEvidenceCounters())
+        self.counters = counters_patch.start()
+        self.addCleanup(counters_patch.stop)
+
+        self.evaluator = EnhancedConsciousnessEvaluation()
+        self.gathers = 0
+        self.running = 0
+        self.max_running = 0
+        self.gather_started = threading.Event()
+        self.evaluator._gather_comprehensive_evidence = self._slow_gather
+
+    def _slow_gather(self, include_runtime_output=True):
+        self.gathers += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.gather_started.set()
+        time.sleep(0.2)
+        self.running -= 1
+        return {}
+
+    def test_concurrent_reconciliations_run_one_at_a_time(self):
+        threads = [threading.Thread(target=self.evaluator.reconcile_evidence_counters, args=(False,))
+                   for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.gathers, 2)
+        self.assertEqual(self.max_running, 1)
+        self.assertTrue(self.counters.is_reconciled())
+
+    def test_evaluation_waits_for_in_flight_reconciliation(self):
+        background = threading.Thread(target=self.evaluator.reconcile_evidence_counters, args=(False,))
+        background.start()
+        self.gather_started.wait(5)
+
+        result = self.evaluator.evaluate_consciousness_comprehensive()
+        background.join(5)
+        self.assertNotIn('error', result)
+        self.assertEqual(result['evidence_summary']['source'], 'streaming_counters')
+        self.assertEqual(self.gathers, 1)
+
+        # Asking for a disk scan explicitly still gets one
+        self.evaluator.evaluate_consciousness_comprehensive(use_counters=False)
+        self.assertEqual(self.gathers, 2)
+
+
+class TestReconciliationCounting(unittest.TestCase):
+    """Test that reconciled counters follow the same rules as published evidence."""
+
+    def setUp(self):
+        counters_patch = mock.patch.object(enhanced_consciousness_evaluation, 'evidence_counters',
+                                           ConsciousnessEvidenceCounters())
+        self.counters = counters_patch.start()
+        self.addCleanup(counters_patch.stop)
+        self.evaluator = EnhancedConsciousnessEvaluation()
+
+    def test_reconciled_evidence_counts_like_published_evidence(self):
+        items = [
+            {'file_path': 'memories/episodic/a.json', 'timestamp': '', 'matched_indicators': ['episodic_memory']},
+            {'file_path': '', 'timestamp': '2000-01-01T00:00:00', 'matched_indicators': ['memory_recall']}
+        ]
+        self.evaluator._gather_comprehensive_evidence = lambda include_runtime_output=True: {'memory_events': items}
+        self.evaluator.reconcile_evidence_counters(include_runtime_output=False)
+        reconciled = self.counters.snapshot()['memory_usage']
+
+        live = ConsciousnessEvidenceCounters()
+        live.publish('memory_usage', file_path='memories/episodic/a.json')
+        live.publish('memory_usage', file_path='', timestamp=946684800.0)
+        published = live.snapshot()['memory_usage']
+
+        for key in ('count', 'recent_count', 'file_paths'):
+            self.assertEqual(reconciled[key], published[key], key)
+        self.assertEqual(reconciled['recent_count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
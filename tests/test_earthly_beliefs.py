@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the Bayesian belief store and value of information in EarthlyIncompleteGame.
+"""
+
+import math
+import random
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+import earthly_incomplete_game
+from earthly_incomplete_game import BeliefState, EarthlyIncompleteGame
+
+PRIORS = {
+    "weather": {"probs": {"sunny": 0.5, "rainy": 0.3, "snowy": 0.2}},
+    "door_open": {"p": 0.5},
+    "friendliness": {"alpha": 2.0, "beta": 2.0},
+    "settled": {"probs": {"yes": 1.0, "no": 0.0}}
+}
+
+
+def make_game():
+    config = {
+        "beliefs": {"priors": PRIORS, "latent_vars": list(PRIORS), "voi_threshold": 0.05},
+        "reward_model": {"needs": {"energy": 1.0}, "homeostasis": {"setpoints": {"energy": 0.6}}},
+        "actions": {
+            "probe": [{"id": "look_outside", "obs": "weather"}, {"id": "check_door", "obs": ["door_open"]}],
+            "task": [{"id": "rest", "need": "energy", "delta": 0.2}]
+        }
+    }
+    return EarthlyIncompleteGame(None, config)
+
+
+class BeliefStateChecks:
+    """Checks run with and without NumPy."""
+
+    def test_entropy(self):
+        belief = BeliefState(PRIORS)
+        self.assertAlmostEqual(belief.entropy("door_open"), math.log(2), places=6)
+        self.assertAlmostEqual(belief.entropy("settled"), 0.0, places=6)
+        self.assertEqual(belief.entropy("missing"), 0.0)
+
+    def test_expected_entropy_matches_enumeration(self):
+        belief = BeliefState(PRIORS)
+        # Bernoulli 0.5 with 90% accurate probe: posterior is 0.9/0.1 whatever is observed
+        h = -(0.9 * math.log(0.9) + 0.1 * math.log(0.1))
+        self.assertAlmostEqual(belief.expected_entropy("door_open"), h, places=6)
+        gains = belief.information_gains()
+        self.assertGreater(gains["weather"], 0.0)
+        self.assertEqual(gains["settled"], 0.0)
+        self.assertTrue(all(gain >= 0 for gain in gains.values()))
+
+    def test_bayesian_update(self):
+        belief = BeliefState(PRIORS)
+        belief.update("weather", "rainy")
+        probs = belief.latent["weather"]["probs"]
+        # Posterior ∝ prior * likelihood: rainy 0.3*0.9, others 0.05 each
+        total = 0.5 * 0.05 + 0.3 * 0.9 + 0.2 * 0.05
+        self.assertAlmostEqual(probs["rainy"], 0.27 / total, places=6)
+        self.assertAlmostEqual(sum(probs.values()), 1.0, places=6)
+
+        belief.update("door_open", True, likelihood={True: 0.8, False: 0.2})
+        self.assertAlmostEqual(belief.latent["door_open"]["p"], 0.8, places=6)
+
+        belief.update("friendliness", 1.0)
+        self.assertEqual(belief.latent["friendliness"]["alpha"], 4.0)
+
+    def test_monte_carlo_close_to_exact(self):
+        belief = BeliefState(PRIORS)
+        exact = belief.information_gains()
+        sampled = belief.information_gains("monte_carlo", samples=4000, rng=random.Random(3))
+        for key in ("weather", "door_open"):
+            self.assertAlmostEqual(sampled[key], exact[key], delta=0.05)
+
+    def test_diffuse(self):
+        belief = BeliefState(PRIORS)
+        before = belief.entropy("weather")
+        belief.diffuse(0.5)
+        self.assertGreater(belief.entropy("weather"), before)
+        self.assertAlmostEqual(sum(belief.latent["weather"]["probs"].values()), 1.0, places=6)
+
+
+@unittest.skipUnless(earthly_incomplete_game.NUMPY_AVAILABLE, "NumPy not installed")
+class TestBeliefStateNumpy(BeliefStateChecks, unittest.TestCase):
+    """Vectorized belief store."""
+
+    def test_many_variables_under_a_millisecond(self):
+        priors = {f"v{i}": {"probs": {"a": 0.2, "b": 0.3, "c": 0.5}} for i in range(300)}
+        belief = BeliefState(priors)
+        belief.information_gains()
+        start = time.perf_counter()
+        for _ in range(20):
+            belief.information_gains()
+        self.assertLess((time.perf_counter() - start) / 20, 0.001)
+
+
+class TestBeliefStatePython(BeliefStateChecks, unittest.TestCase):
+    """List-based fallback used without NumPy."""
+
+    def setUp(self):
+        patcher = mock.patch.object(earthly_incomplete_game, "NUMPY_AVAILABLE", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestEarthlyIncompleteGame(unittest.TestCase):
+    """Probe selection by value of information."""
+
+    def test_suggests_most_informative_probe(self):
+        game = make_game()
+        action = game.suggest_action({"energy": 0.5})
+        voi = dict(game.value_of_information())
+        expected = "look_outside" if voi["weather"] > voi["door_open"] else "check_door"
+        self.assertEqual(action["type"], "probe")
+        self.assertEqual(action["action_id"], expected)
+
+    def test_task_when_beliefs_are_certain(self):
+        game = make_game()
+        for _ in range(10):
+            game.apply_observation("weather", "sunny")
+            game.apply_observation("door_open", True)
+        game.voi_threshold = 0.2
+        self.assertEqual(game.suggest_action({"energy": 0.1})["type"], "task")
+
+
+if __name__ == '__main__':
+    unittest.main()
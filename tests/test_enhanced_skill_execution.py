@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the priority-heap skill executor.
+"""
+
+import sys
+import time
+import threading
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from enhanced_skill_execution_system import EnhancedSkillExecutionSystem
+
+
+class FakeActionSystem:
+    """Records executed skills; fails the skills listed in fail_times that many times."""
+
+    def __init__(self, gate=None):
+        self.executed = []
+        self.fail_times = {}
+        self.gate = gate
+
+    def _execute_ezrobot_command(self, command, skill_name):
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        self.executed.append(skill_name)
+        if self.fail_times.get(skill_name, 0) > 0:
+            self.fail_times[skill_name] -= 1
+            return None
+        return True
+
+
+def wait_until(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestEnhancedSkillExecutionSystem(unittest.TestCase):
+    """Test cases for EnhancedSkillExecutionSystem."""
+
+    def make_system(self, gate=None):
+        action_system = FakeActionSystem(gate)
+        system = EnhancedSkillExecutionSystem(ez_robot=object(), action_system=action_system)
+        system.min_command_interval = 0.0
+        system.retry_delay = 0.05
+        self.addCleanup(system.stop)
+        return system, action_system
+
+    def test_priority_order(self):
+        gate = threading.Event()
+        system, actions = self.make_system(gate)
+        system.execute_skill("blocker")
+        self.assertTrue(wait_until(lambda: system.executing_commands))
+        system.execute_skill("wave", priority=1)
+        system.execute_skill("bow", priority=5)
+        system.execute_skill("sit", priority=3)
+        gate.set()
+        self.assertTrue(wait_until(lambda: len(actions.executed) == 4))
+        self.assertEqual(actions.executed, ["blocker", "bow", "sit", "wave"])
+
+    def test_duplicate_skill_is_merged(self):
+        gate = threading.Event()
+        system, actions = self.make_system(gate)
+        system.execute_skill("blocker")
+        self.assertTrue(wait_until(lambda: system.executing_commands))
+        system.execute_skill("wave", priority=1)
+        system.execute_skill("sit", priority=2)
+        self.assertTrue(system.execute_skill("wave", priority=4))
+        self.assertEqual(system.get_execution_stats()['queue_size'], 2)
+        gate.set()
+        self.assertTrue(wait_until(lambda: len(actions.executed) == 3))
+        time.sleep(0.05)
+        self.assertEqual(actions.executed, ["blocker", "wave", "sit"])
+        self.assertEqual(system.get_execution_stats()['deduplicated_commands'], 1)
+
+    def test_retry_does_not_block_other_commands(self):
+        system, actions = self.make_system()
+        system.retry_delay = 0.3
+        actions.fail_times["wave"] = 1
+        system.execute_skill("wave")
+        self.assertTrue(wait_until(lambda: actions.executed == ["wave"]))
+        system.execute_skill("bow")
+        # bow runs while wave waits for its retry
+        self.assertTrue(wait_until(lambda: actions.executed[:2] == ["wave", "bow"], timeout=0.25))
+        self.assertTrue(wait_until(lambda: actions.executed == ["wave", "bow", "wave"]))
+        self.assertEqual(system.command_history[-1]['attempts'], 2)
+
+    def test_rate_limit_spaces_commands(self):
+        system, actions = self.make_system()
+        system.min_command_interval = 0.2
+        start = time.monotonic()
+        system.execute_skill("wave")
+        system.execute_skill("bow")
+        self.assertTrue(wait_until(lambda: len(actions.executed) == 2))
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_queue_wait_metrics(self):
+        system, actions = self.make_system()
+        system.execute_skill("wave")
+        self.assertTrue(wait_until(lambda: system.command_history))
+        stats = system.get_execution_stats()
+        self.assertIn('queue_wait_p50_ms', stats)
+        self.assertIn('queue_wait_p99_ms', stats)
+        self.assertGreaterEqual(stats['queue_wait_p99_ms'], stats['queue_wait_p50_ms'])
+        self.assertEqual(stats['queue_size'], 0)
+
+    def test_stop_wakes_idle_worker(self):
+        system, _ = self.make_system()
+        start = time.monotonic()
+        system.stop()
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertFalse(system.command_processor_thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for deadline-driven exercise monitoring on a simulated clock.
+"""
+
+import os
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from exercise_scheduler import DeadlineScheduler, SimulatedClock
+from fatigue_modeling_system import FatigueModelingSystem
+from exercise_monitoring_system import (ExerciseConfig, ExerciseMonitoringSystem,
+                                        ExerciseType, StopReason)
+
+
+class FakeNeucogar:
+    """Minimal NEUCOGAR engine."""
+
+    def __init__(self, **levels):
+        self.levels = {"dopamine": 0.5, "serotonin": 0.5, "norepinephrine": 0.5}
+        self.levels.update(levels)
+
+    def get_neurotransmitter_state(self):
+        return dict(self.levels)
+
+    def update_neurotransmitter_levels(self, levels):
+        self.levels.update(levels)
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Test cases for DeadlineScheduler."""
+
+    def test_advance_runs_deadlines_at_their_times(self):
+        scheduler = DeadlineScheduler(SimulatedClock())
+        seen = []
+        scheduler.schedule("a", 10.0, lambda: seen.append(("a", scheduler.clock.now())))
+        scheduler.schedule("b", 5.0, lambda: seen.append(("b", scheduler.clock.now())))
+        scheduler.schedule("b", 7.0, lambda: seen.append(("b2", scheduler.clock.now())))  # Replaces b
+        scheduler.advance(20.0)
+        self.assertEqual(seen, [("b2", 7.0), ("a", 10.0)])
+        self.assertEqual(scheduler.clock.now(), 20.0)
+
+    def test_cancel(self):
+        scheduler = DeadlineScheduler(SimulatedClock())
+        seen = []
+        scheduler.schedule("a", 1.0, lambda: seen.append("a"))
+        self.assertTrue(scheduler.cancel("a"))
+        scheduler.advance(5.0)
+        self.assertEqual(seen, [])
+        self.assertIsNone(scheduler.next_deadline())
+
+    def test_real_clock_thread(self):
+        scheduler = DeadlineScheduler()
+        fired = threading.Event()
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        scheduler.schedule("a", scheduler.clock.now() + 0.05, fired.set)
+        self.assertTrue(fired.wait(2.0))
+
+
+class TestFatigueModel(unittest.TestCase):
+    """Test cases for the clock-driven fatigue model."""
+
+    def test_update_frequency_does_not_change_result(self):
+        results = []
+        for step in (1.0, 60.0):
+            clock = SimulatedClock()
+            model = FatigueModelingSystem(clock=clock)
+            model.start_activity("dancing", intensity=0.5)
+            for _ in range(int(60 / step)):
+                clock.set(clock.now() + step)
+                model.update_fatigue()
+            results.append((model.fatigue_level, model.current_energy))
+        self.assertAlmostEqual(results[0][0], results[1][0])
+        self.assertAlmostEqual(results[0][1], results[1][1])
+        self.assertAlmostEqual(results[0][0], 0.015 * 0.5 * 60)
+
+    def test_seconds_until_energy(self):
+        clock = SimulatedClock()
+        model = FatigueModelingSystem(clock=clock)
+        self.assertIsNone(model.seconds_until_energy(0.5))  # Resting
+        model.start_activity("exercise")
+        seconds = model.seconds_until_energy(0.5)
+        self.assertAlmostEqual(seconds, 0.5 / (0.02 * 0.8))
+        clock.set(seconds)
+        model.update_fatigue()
+        self.assertAlmostEqual(model.current_energy, 0.5)
+        self.assertIsNone(model.seconds_until_energy(0.05))  # Below the floor
+
+
+class TestExerciseMonitoring(unittest.TestCase):
+    """Test cases for ExerciseMonitoringSystem on a simulated clock."""
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        self.stops = []
+
+    def make_system(self, neucogar=None, **config):
+        clock = SimulatedClock()
+        system = ExerciseMonitoringSystem(
+            neucogar_engine=neucogar,
+            stop_callback=lambda name, reason: self.stops.append((name, reason, clock.now())),
+            scheduler=DeadlineScheduler(clock),
+            data_dir=self.data_dir
+        )
+        config.setdefault("max_duration_seconds", 3600)
+        system.exercise_configs["long_walk"] = ExerciseConfig(
+            name="long_walk", exercise_type=ExerciseType.ENDURANCE, **config)
+        return system
+
+    def test_hour_long_session_in_milliseconds(self):
+        system = self.make_system()
+        started = time.perf_counter()
+        self.assertTrue(system.start_exercise("long_walk"))
+        system.scheduler.advance(7200.0)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+        self.assertEqual(self.stops, [("long_walk", StopReason.DURATION_EXCEEDED, 3600.0)])
+        self.assertFalse(system.is_exercise_active("long_walk"))
+        self.assertLessEqual(system.checks, 3)  # Woke for the deadline, not every second
+        self.assertEqual(system.get_exercise_stats("long_walk")["total_duration"], 3600.0)
+
+    def test_serotonin_deadline(self):
+        neucogar = FakeNeucogar(serotonin=0.7)
+        system = self.make_system(neucogar)
+        system.start_exercise("long_walk")
+        system.scheduler.advance(3600.0)
+
+        # Serotonin falls 0.1 per minute: 0.7 -> 0.4 (legacy threshold) after 180s
+        self.assertEqual(len(self.stops), 1)
+        name, reason, stopped_at = self.stops[0]
+        self.assertEqual(reason, StopReason.FATIGUE_THRESHOLD)
+        self.assertAlmostEqual(stopped_at, 180.0, places=2)
+        self.assertAlmostEqual(neucogar.levels["serotonin"], 0.4, places=3)
+        self.assertLess(system.checks, 60)
+
+    def test_external_level_change_is_noticed(self):
+        neucogar = FakeNeucogar()
+        system = self.make_system(neucogar)
+        system.start_exercise("long_walk")
+        system.scheduler.advance(20.0)
+        neucogar.levels["dopamine"] = 0.95
+        system.scheduler.advance(system.sensor_check_interval)
+        self.assertEqual(self.stops[0][1], StopReason.FATIGUE_THRESHOLD)
+        self.assertLessEqual(self.stops[0][2], 20.0 + system.sensor_check_interval)
+
+    def test_energy_safety_limit(self):
+        system = self.make_system(safety_limits={"energy": 0.5})
+        system.start_exercise("long_walk")
+        system.scheduler.advance(3600.0)
+        self.assertEqual(self.stops[0][1], StopReason.SAFETY_LIMIT)
+        self.assertAlmostEqual(self.stops[0][2], 0.5 / (0.02 * 0.8), places=2)
+
+    def test_reps_limit_stops_immediately(self):
+        system = self.make_system(max_reps=3)
+        system.start_exercise("long_walk")
+        system.scheduler.advance(10.0)
+        system.increment_reps("long_walk", 3)
+        self.assertEqual(self.stops, [("long_walk", StopReason.REPS_EXCEEDED, 10.0)])
+
+    def test_stats_journal_and_compaction(self):
+        system = self.make_system()
+        system.journal_compact_threshold = 3
+        for minutes in (1, 2):
+            system.start_exercise("long_walk")
+            system.scheduler.advance(minutes * 60.0)
+            system.stop_exercise("long_walk")
+        self.assertFalse(os.path.exists(system.stats_path))
+        with open(system.journal_path) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        reloaded = self.make_system()
+        self.assertEqual(reloaded.get_exercise_stats("long_walk")["total_sessions"], 2)
+        self.assertEqual(reloaded.get_exercise_stats("long_walk")["total_duration"], 180.0)
+
+        # The third session triggers compaction
+        reloaded.journal_compact_threshold = 3
+        reloaded.start_exercise("long_walk")
+        reloaded.scheduler.advance(60.0)
+        reloaded.stop_exercise("long_walk")
+        self.assertEqual(os.path.getsize(reloaded.journal_path), 0)
+        with open(reloaded.stats_path) as f:
+            self.assertEqual(json.load(f)["long_walk"]["total_sessions"], 3)
+
+    def test_journal_records_in_snapshot_are_not_replayed(self):
+        system = self.make_system()
+        system.start_exercise("long_walk")
+        system.scheduler.advance(60.0)
+        system.stop_exercise("long_walk")
+        system._save_exercise_stats()  # Crash before the journal was truncated
+
+        reloaded = self.make_system()
+        self.assertEqual(reloaded.get_exercise_stats("long_walk")["total_sessions"], 1)
+
+    def test_configs_written_only_when_defaults_added(self):
+        system = self.make_system()
+        mtime = os.stat(system.configs_path).st_mtime_ns
+        time.sleep(0.01)
+        self.make_system()
+        self.assertEqual(os.stat(system.configs_path).st_mtime_ns, mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the local negamax game solver.
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from game_solver import GameSolver, GridGameSpec, benchmark_against_priority
+
+
+def empty_board(rows=3, cols=3):
+    return [["" for _ in range(cols)] for _ in range(rows)]
+
+
+class TestGridGameSpec(unittest.TestCase):
+    """Test cases for GridGameSpec."""
+
+    def test_tic_tac_toe_lines(self):
+        self.assertEqual(len(GridGameSpec(3, 3).lines), 8)
+        self.assertEqual(len(GridGameSpec(6, 7, 4).lines), 69)
+
+    def test_outcome(self):
+        spec = GridGameSpec(3, 3)
+        symbols = {"CARL": "X", "Human": "O"}
+        board = [["X", "O", ""], ["O", "X", ""], ["", "", "X"]]
+        self.assertEqual(spec.outcome(board, symbols), {"status": "win", "winner": "CARL"})
+        board = [["X", "O", "X"], ["X", "O", "O"], ["O", "X", "X"]]
+        self.assertEqual(spec.outcome(board, symbols)["status"], "draw")
+        self.assertEqual(spec.outcome(empty_board(), symbols)["status"], "ongoing")
+
+    def test_gravity_moves(self):
+        spec = GridGameSpec(6, 7, 4, gravity=True)
+        board = empty_board(6, 7)
+        self.assertTrue(spec.is_legal(board, 5, 3))
+        self.assertFalse(spec.is_legal(board, 4, 3))
+        self.assertEqual(len(spec.legal_moves(0)), 7)
+
+
+class TestGameSolver(unittest.TestCase):
+    """Test cases for GameSolver."""
+
+    def test_empty_tic_tac_toe_is_a_draw(self):
+        solver = GameSolver(GridGameSpec(3, 3))
+        result = solver.choose_move(empty_board(), "X", "O")
+        self.assertTrue(result["exact"])
+        self.assertEqual(result["outcome"], "draw")
+        self.assertLess(result["elapsed_ms"], 500)
+
+    def test_takes_win_and_blocks(self):
+        solver = GameSolver(GridGameSpec(3, 3))
+        board = [["X", "X", ""], ["O", "O", ""], ["", "", ""]]
+        self.assertEqual(solver.choose_move(board, "X", "O")["move"], [0, 2])
+        board = [["O", "O", ""], ["X", "", ""], ["", "", "X"]]
+        self.assertEqual(solver.choose_move(board, "X", "O")["move"], [0, 2])
+
+    def test_never_loses_as_second_player(self):
+        spec = GridGameSpec(3, 3)
+        solver = GameSolver(spec)
+        symbols = {"Human": "X", "CARL": "O"}
+        losses = []
+
+        def play(board, human_turn):
+            outcome = spec.outcome(board, symbols)
+            if outcome["status"] != "ongoing":
+                if outcome["winner"] == "Human":
+                    losses.append([row[:] for row in board])
+                return
+            if human_turn:
+                for r in range(3):
+                    for c in range(3):
+                        if board[r][c] == "":
+                            board[r][c] = "X"
+                            play(board, False)
+                            board[r][c] = ""
+            else:
+                r, c = solver.choose_move(board, "O", "X")["move"]
+                board[r][c] = "O"
+                play(board, True)
+                board[r][c] = ""
+
+        play(empty_board(), True)
+        self.assertEqual(losses, [])
+        self.assertGreater(solver.get_stats()['tt_hits'], 0)
+
+    def test_connect_four_respects_time_budget(self):
+        solver = GameSolver(GridGameSpec(6, 7, 4, gravity=True), time_budget=0.1)
+        board = empty_board(6, 7)
+        start = time.monotonic()
+        result = solver.choose_move(board, "X", "O")
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(result["move"], [5, 3])
+        board[5][0] = board[5][1] = board[5][2] = "X"
+        self.assertEqual(solver.choose_move(board, "O", "X")["move"], [5, 3])
+
+    def test_connect_four_is_not_solved_by_reused_table_entries(self):
+        # The table is shared across moves; depth-limited entries must not read as solved
+        spec = GridGameSpec(6, 7, 4, gravity=True)
+        solver = GameSolver(spec, time_budget=0.05)
+        board = empty_board(6, 7)
+        for ply in range(6):
+            symbol, other = ("X", "O") if ply % 2 == 0 else ("O", "X")
+            result = solver.choose_move(board, symbol, other)
+            self.assertFalse(result["exact"], f"ply {ply}: {result}")
+            self.assertNotEqual(result["outcome"], "draw")
+            r, c = result["move"]
+            board[r][c] = symbol
+        self.assertEqual(solver.get_stats()['solved_exactly'], 0)
+
+    def test_benchmark_against_priority(self):
+        report = benchmark_against_priority()
+        self.assertEqual(report["solver"]["loss"], 0)
+        self.assertLessEqual(report["solver"]["draw"], report["priority"]["draw"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched GUI log sink.
+"""
+
+import os
+import sys
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from gui_log_sink import GuiLogSink, infer_log_level, write_console
+
+
+class FakeTextWidget:
+    """Minimal stand-in for tk.Text that stores lines."""
+
+    def __init__(self):
+        self.lines = []
+        self.insert_calls = 0
+
+    def config(self, **kwargs):
+        pass
+
+    def insert(self, index, text):
+        self.insert_calls += 1
+        self.lines.extend(text.splitlines())
+
+    def index(self, index):
+        return f"{len(self.lines) + 1}.0"
+
+    def delete(self, start, end):
+        count = int(end.split('.')[0]) - 1
+        del self.lines[:count]
+
+    def see(self, index):
+        pass
+
+
+class FakeRoot:
+    """Records after() callbacks without running them."""
+
+    def after(self, ms, callback):
+        return 'after#1'
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class TestGuiLogSink(unittest.TestCase):
+    """Test cases for GuiLogSink."""
+
+    def setUp(self):
+        self.sink = GuiLogSink(max_lines=10, max_batch=100, display_level='INFO', log_file=None)
+        self.widget = FakeTextWidget()
+        self.sink.attach(FakeRoot(), self.widget)
+
+    def test_messages_are_written_in_one_batch(self):
+        for i in range(5):
+            self.sink.submit(f"message {i}")
+        self.assertEqual(self.widget.insert_calls, 0)
+        self.sink.flush()
+        self.assertEqual(self.widget.insert_calls, 1)
+        self.assertEqual(len(self.widget.lines), 5)
+        self.assertTrue(self.widget.lines[-1].endswith("message 4"))
+
+    def test_widget_is_bounded(self):
+        for i in range(25):
+            self.sink.submit(f"message {i}")
+        self.sink.flush()
+        self.assertEqual(len(self.widget.lines), 10)
+        self.assertTrue(self.widget.lines[0].endswith("message 15"))
+        self.assertEqual(self.sink.get_stats()['lines_trimmed'], 15)
+
+    def test_level_filtering(self):
+        self.sink.submit("noisy detail", logging.DEBUG)
+        self.sink.submit("❌ Error talking to ARC")
+        self.sink.flush()
+        self.assertEqual(len(self.widget.lines), 1)
+        self.assertEqual(self.sink.get_stats()['filtered'], 1)
+
+    def test_infer_log_level(self):
+        self.assertEqual(infer_log_level("❌ Failed"), logging.ERROR)
+        self.assertEqual(infer_log_level("⚠️ Careful"), logging.WARNING)
+        self.assertEqual(infer_log_level("🧠 Thinking"), logging.INFO)
+
+    def test_no_console_under_pythonw(self):
+        # pythonw sets sys.__stdout__ and sys.__stderr__ to None
+        with mock.patch.object(sys, '__stdout__', None), mock.patch.object(sys, '__stderr__', None):
+            write_console("dropped\n", 'stderr')
+            with tempfile.NamedTemporaryFile() as not_a_directory:
+                sink = GuiLogSink(log_file=os.path.join(not_a_directory.name, 'carl.log'))
+            self.assertIsNone(sink._file_logger)
+            sink.submit("before the window exists")
+        self.assertEqual(sink.get_stats()['submitted'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
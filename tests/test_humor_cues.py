@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for compiled humor cue detection and the recent joke log.
+"""
+
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+humor_system = None
+_original_cwd = os.getcwd()
+_work_dir = tempfile.mkdtemp()
+
+
+def setUpModule():
+    # Importing creates the global HumorSystem, which writes humor/ into the working directory
+    global humor_system
+    os.chdir(_work_dir)
+    humor_system = importlib.import_module('humor_system')
+
+
+def tearDownModule():
+    os.chdir(_original_cwd)
+    shutil.rmtree(_work_dir, ignore_errors=True)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestHumorCueMatcher(unittest.TestCase):
+    """Test cases for HumorCueMatcher."""
+
+    def setUp(self):
+        self.matcher = humor_system.HumorCueMatcher()
+
+    def test_all_cue_sets_in_one_scan(self):
+        cues = self.matcher.scan("that silly pun was an unexpected joke, tell me that joke again")
+        self.assertEqual(sorted(cues.incongruity_cues),
+                         [("absurdity", "silly"), ("puns", "pun"), ("surprise", "unexpected")])
+        self.assertEqual(cues.humor_keywords, ["joke"])
+        self.assertTrue(cues.repeat_request)
+
+    def test_known_jokes_match_both_directions(self):
+        self.assertEqual(self.matcher.scan("ha, an impasta!").known_joke,
+                         ("what do you call a fake noodle", "an impasta"))
+        # Input that is part of a punchline
+        self.assertEqual(self.matcher.scan("outstanding in his field").known_joke[0],
+                         "why did the scarecrow win an award")
+        # The first joke in table order wins
+        self.assertEqual(self.matcher.scan("a gummy bear and a bulldozer").known_joke[1], "a gummy bear")
+        self.assertIsNone(self.matcher.scan("hello there").known_joke)
+
+    def test_keywords_keep_table_order(self):
+        self.assertEqual(self.matcher.scan("perfect, that was funny").humor_keywords, ["funny", "perfect"])
+
+    def test_detection_methods_use_scan(self):
+        system = humor_system.humor_system
+        self.assertAlmostEqual(system._detect_incongruity_cues("silly twist?"), 0.5)
+        self.assertEqual(system._detect_humor_keywords("so funny"), ["funny"])
+        self.assertEqual(system._detect_known_jokes("tyrannosaurus wrecks")["confidence"], 0.9)
+
+
+class TestRecentJokeLog(unittest.TestCase):
+    """Test cases for RecentJokeLog."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "humor", "recent_jokes.jsonl")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_log(self, **kwargs):
+        return humor_system.RecentJokeLog(path=self.path, window_seconds=3600, clock=self.clock, **kwargs)
+
+    def test_latest_and_window(self):
+        log = self.make_log()
+        for i in range(5):
+            log.append({"setup": f"setup {i}", "punchline": f"punchline {i}"})
+            self.clock.now += 600
+        self.assertEqual([joke["setup"] for joke in log.latest(3)], ["setup 4", "setup 3", "setup 2"])
+        self.clock.now += 2400  # First three are now older than an hour
+        self.assertEqual(len(log), 2)
+
+    def test_bounded_and_persisted(self):
+        log = self.make_log(max_entries=3)
+        for i in range(5):
+            log.append({"setup": f"setup {i}"})
+        self.assertEqual(len(log), 3)
+
+        reloaded = self.make_log(max_entries=3)
+        self.assertEqual([joke["setup"] for joke in reloaded.latest()], ["setup 4", "setup 3", "setup 2"])
+
+    def test_compaction_and_torn_line(self):
+        log = self.make_log(compact_threshold=4)
+        for i in range(3):
+            log.append({"setup": f"old {i}"})
+        self.clock.now += 7200
+        log.append({"setup": "new"})  # Reaches the threshold; expired entries are dropped
+        with open(self.path) as f:
+            lines = f.readlines()
+        self.assertEqual([json.loads(line)["joke_data"]["setup"] for line in lines], ["new"])
+
+        with open(self.path, 'a') as f:
+            f.write('{"told_at": ')
+        self.assertEqual([joke["setup"] for joke in self.make_log().latest()], ["new"])
+
+    def test_repeat_query_uses_log(self):
+        system = humor_system.humor_system
+        original = system.recent_jokes
+        try:
+            system.recent_jokes = self.make_log()
+            self.assertIn("love to tell you", system.check_joke_repeat_query("tell me that joke again"))
+            system.recent_jokes.append({"setup": "Why?", "punchline": "Because!"})
+            self.assertIn("Why? ... Because!", system.check_joke_repeat_query("Tell me that joke again"))
+            self.assertIn("another one", system.check_joke_repeat_query("another joke please"))
+            self.assertIsNone(system.check_joke_repeat_query("what time is it"))
+        finally:
+            system.recent_jokes = original
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed memshot/vision image store.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from memory.image_store import ContentAddressedImageStore
+from memory.store import MemoryStore
+
+
+class TestContentAddressedImageStore(unittest.TestCase):
+    """Test cases for ContentAddressedImageStore."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = ContentAddressedImageStore(os.path.join(self.temp_dir, "blobs"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_identical_captures_share_one_blob(self):
+        first = self._write("capture_1.jpg", b'\xff\xd8same frame')
+        second = self._write("capture_2.jpg", b'\xff\xd8same frame')
+        digest = self.store.ingest(first)
+        self.assertEqual(self.store.ingest(second), digest)
+
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual(self.store.reference_count(digest), 2)
+        self.assertEqual(self.store.get_stats()['blobs'], 1)
+        self.assertEqual(self.store.duplicates_linked, 1)
+
+    def test_digest_cache_is_bounded(self):
+        store = ContentAddressedImageStore(os.path.join(self.temp_dir, "small"), digest_cache_size=2)
+        paths = [self._write(f"frame_{i}.jpg", b'\xff\xd8' + bytes([i])) for i in range(4)]
+        for path in paths:
+            store.digest_of(path)
+        store.digest_of(paths[2])  # Most recently used survives the next eviction
+        store.digest_of(paths[0])
+        cached = {key[0] for key in store._digest_cache}
+        self.assertEqual(cached, {os.path.abspath(paths[2]), os.path.abspath(paths[0])})
+
+    def test_digest_cache_is_thread_safe(self):
+        store = ContentAddressedImageStore(os.path.join(self.temp_dir, "small"), digest_cache_size=4)
+        paths = [self._write(f"frame_{i}.jpg", b'\xff\xd8' + bytes([i])) for i in range(16)]
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(200):
+                    store.digest_of(paths[(i + offset) % len(paths)])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(store._digest_cache), 4)
+
+    def test_garbage_collection_removes_unreferenced_blobs(self):
+        kept = self._write("kept.jpg", b'\xff\xd8kept')
+        dropped = self._write("dropped.jpg", b'\xff\xd8dropped')
+        self.store.ingest(kept)
+        self.store.ingest(dropped)
+        os.remove(dropped)
+
+        self.assertEqual(self.store.collect_garbage()['removed'], 1)
+        self.assertEqual(self.store.get_stats()['blobs'], 1)
+        with open(kept, 'rb') as f:
+            self.assertEqual(f.read(), b'\xff\xd8kept')
+
+    def test_memory_store_links_memshots(self):
+        memory = MemoryStore(memory_dir=os.path.join(self.temp_dir, "memories"))
+        image = self._write("frame.jpg", b'\xff\xd8frame')
+        first = memory.get_event_by_id(memory.commit_event({"event_type": "vision"}, image))
+        second = memory.get_event_by_id(memory.commit_event({"event_type": "vision"}, image))
+
+        self.assertEqual(first["image_sha256"], second["image_sha256"])
+        self.assertEqual(memory.image_store.reference_count(first["image_sha256"]), 2)
+        self.assertEqual(memory.get_stats()["images"]["blobs"], 1)
+
+    def test_orphaned_vision_captures_are_collected(self):
+        memory = MemoryStore(memory_dir=os.path.join(self.temp_dir, "memories"))
+        vision_dir = os.path.join(memory.memory_dir, "vision")
+        os.makedirs(vision_dir)
+        kept = os.path.join(vision_dir, "camera_capture_20250101_100000.jpg")
+        orphan = os.path.join(vision_dir, "camera_capture_20250101_100005.jpg")
+        for path, data in ((kept, b'\xff\xd8kept'), (orphan, b'\xff\xd8orphan')):
+            with open(path, 'wb') as f:
+                f.write(data)
+            memory.image_store.ingest(path)
+        with open(os.path.join(vision_dir, "vision_x_vision_episodic.json"), 'w', encoding='utf-8') as f:
+            json.dump({"filepath": kept.replace('/', '\\')}, f)
+
+        self.assertEqual(memory.remove_orphaned_captures(min_age_seconds=60), 0)  # Too recent
+        os.utime(kept, (0, 0))
+        os.utime(orphan, (0, 0))
+        result = memory.collect_unreferenced_images()
+        self.assertEqual((result['captures_removed'], result['removed']), (1, 1))
+        self.assertTrue(os.path.exists(kept))
+        self.assertFalse(os.path.exists(orphan))
+        self.assertEqual(memory.image_store.get_stats()['blobs'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the Flask ingestion queue.
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ingestion_queue import IngestionQueue
+
+
+class TestIngestionQueue(unittest.TestCase):
+    """Test cases for IngestionQueue."""
+
+    def setUp(self):
+        self.handled = []
+        self.queue = IngestionQueue(max_size=3)
+        for source in ('speech', 'vision', 'arc_image'):
+            self.queue.register_handler(source, lambda payload, source=source: self.handled.append((source, payload)))
+
+    def test_speech_before_vision(self):
+        self.queue.submit('vision', 'cup', key='cup')
+        self.queue.submit('arc_image', 'img.jpg')
+        self.queue.submit('speech', 'hello')
+        self.queue.drain()
+        self.assertEqual([source for source, _ in self.handled], ['speech', 'arc_image', 'vision'])
+
+    def test_repeated_detections_coalesce(self):
+        self.assertEqual(self.queue.submit('vision', {'n': 1}, key='cup')['status'], 'queued')
+        result = self.queue.submit('vision', {'n': 2}, key='cup')
+        self.assertEqual((result['status'], result['count']), ('coalesced', 2))
+        self.queue.drain()
+        self.assertEqual(self.handled, [('vision', {'n': 2})])
+
+        # Once handled, the next detection queues again
+        self.assertEqual(self.queue.submit('vision', {'n': 3}, key='cup')['status'], 'queued')
+
+    def test_full_queue_drops_lowest_priority(self):
+        for name in ('a', 'b', 'c'):
+            self.queue.submit('vision', name, key=name)
+        self.assertEqual(self.queue.submit('speech', 'hi')['status'], 'queued')
+        self.assertFalse(self.queue.submit('vision', 'd', key='d')['accepted'])
+        stats = self.queue.get_stats()
+        self.assertEqual((stats['depth'], stats['dropped'], stats['rejected']), (3, 1, 1))
+        self.queue.drain()
+        self.assertEqual(self.handled, [('speech', 'hi'), ('vision', 'b'), ('vision', 'c')])
+
+    def test_superseded_and_dropped_payloads_are_discarded(self):
+        discarded = []
+        self.queue.register_handler('vision', lambda payload: self.handled.append(('vision', payload)),
+                                    on_discard=discarded.append)
+        self.queue.submit('vision', {'image_path': 'first.jpg'}, key='cup')
+        self.queue.submit('vision', {'image_path': 'second.jpg'}, key='cup')
+        self.assertEqual(discarded, [{'image_path': 'first.jpg'}])
+
+        self.queue.submit('vision', {'image_path': 'ball.jpg'}, key='ball')
+        self.queue.submit('vision', {'image_path': 'box.jpg'}, key='box')
+        self.queue.submit('speech', 'hi')
+        self.assertEqual(discarded[-1], {'image_path': 'second.jpg'})
+        self.queue.drain()
+        self.assertNotIn(('vision', {'image_path': 'second.jpg'}), self.handled)
+
+    def test_worker_thread_and_stats(self):
+        def failing(payload):
+            raise ValueError("boom")
+        self.queue.register_handler('arc_image', failing)
+        self.queue.start()
+        try:
+            self.queue.submit('speech', 'hello')
+            self.queue.submit('arc_image', 'bad.jpg')
+            deadline = time.time() + 2.0
+            while self.queue.processed + self.queue.failed < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            self.queue.stop()
+        stats = self.queue.get_stats()
+        self.assertEqual((stats['processed'], stats['failed'], stats['depth']), (1, 1, 0))
+        self.assertGreaterEqual(stats['wait_ms']['max'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
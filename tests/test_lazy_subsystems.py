@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for on-demand subsystem loading and the import time benchmark.
+"""
+
+import ast
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from lazy_subsystems import LazySubsystem, import_attr, is_loaded, lazy_subsystem_stats, lazy_subsystems
+import import_time_benchmark
+from import_time_benchmark import LAZY_MODULES, check, measure, parse_importtime
+
+
+class App:
+    builds = 0
+
+    def _build(self):
+        App.builds += 1
+        time.sleep(0.01)
+        return {"built_for": self}
+
+    reporter = LazySubsystem(lambda app: app._build())
+    broken = LazySubsystem(lambda app: app.missing_attribute)
+    dataclass_factory = LazySubsystem(lambda app: import_attr('dataclasses', 'field'))
+
+
+class TestLazySubsystem(unittest.TestCase):
+    """Test cases for LazySubsystem."""
+
+    def setUp(self):
+        App.builds = 0
+
+    def test_built_once_on_first_access(self):
+        app = App()
+        self.assertFalse(is_loaded(app, 'reporter'))
+        self.assertEqual(App.builds, 0)
+        first = app.reporter
+        self.assertIs(first["built_for"], app)
+        self.assertIs(app.reporter, first)
+        self.assertEqual(App.builds, 1)
+        self.assertTrue(is_loaded(app, 'reporter'))
+        self.assertIn('reporter', vars(app))  # Later reads are plain attribute lookups
+
+    def test_instances_are_independent(self):
+        first, second = App(), App()
+        first.reporter
+        self.assertFalse(is_loaded(second, 'reporter'))
+        self.assertIsNot(second.reporter, first.reporter)
+
+    def test_concurrent_first_access_builds_once(self):
+        app = App()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(app.reporter)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(App.builds, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_failed_factory_leaves_none(self):
+        app = App()
+        with self.assertLogs('lazy_subsystems', level='ERROR'):
+            self.assertIsNone(app.broken)
+        self.assertTrue(is_loaded(app, 'broken'))
+
+    def test_assignment_replaces_lazy_value(self):
+        app = App()
+        app.reporter = "manual"
+        self.assertEqual(app.reporter, "manual")
+        self.assertEqual(App.builds, 0)
+
+    def test_stats_and_import_attr(self):
+        app = App()
+        app.reporter
+        stats = lazy_subsystem_stats(app)
+        self.assertEqual(set(stats), {'reporter', 'broken', 'dataclass_factory'})
+        self.assertTrue(stats['reporter']['loaded'])
+        self.assertGreater(stats['reporter']['load_ms'], 0)
+        self.assertFalse(stats['dataclass_factory']['loaded'])
+        import dataclasses
+        self.assertIs(app.dataclass_factory, dataclasses.field)
+
+
+class TestMainImports(unittest.TestCase):
+    """main.py must not import the lazily loaded subsystems at module level."""
+
+    def test_no_module_level_imports(self):
+        source = (Path(__file__).parent.parent / "main.py").read_text(encoding='utf-8')
+        tree = ast.parse(source)
+        imported = set()
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                imported.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imported.add(node.module)
+        self.assertEqual(imported & set(LAZY_MODULES), set())
+
+
+try:
+    import main
+    import tkinter
+    tkinter.Tk().destroy()
+    APP_AVAILABLE = True
+except Exception:
+    APP_AVAILABLE = False
+
+
+@unittest.skipUnless(APP_AVAILABLE, "main.py dependencies or a display not available")
+class TestAppConstruction(unittest.TestCase):
+    """Constructing the app must not build any lazy subsystem."""
+
+    def test_construction_leaves_lazy_subsystems_unloaded(self):
+        app = main.PersonalityBotApp()
+        try:
+            loaded = [name for name in lazy_subsystems(app) if is_loaded(app, name)]
+            self.assertEqual(loaded, [])
+        finally:
+            app.destroy()
+
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | encodings
+import time:       500 |        500 |     json.decoder
+import time:       200 |        700 |   json
+import time:      1000 |       1700 | carl_module
+"""
+
+
+class TestImportTimeBenchmark(unittest.TestCase):
+    """Test cases for the import time benchmark."""
+
+    def test_parse(self):
+        result = parse_importtime("carl_module", SAMPLE)
+        self.assertEqual(result.total_us, 1700)
+        self.assertEqual(result.cumulative_us["json.decoder"], 500)
+        self.assertEqual(result.slowest(2), ["carl_module", "encodings"])
+
+    def test_budget_and_lazy_modules(self):
+        result = parse_importtime("carl_module", SAMPLE)
+        self.assertEqual(check([result], budget_ms=2.0), [])
+        self.assertEqual(len(check([result], budget_ms=1.0)), 1)
+        eager = parse_importtime("carl_module", SAMPLE + "import time:  10 |  10 |   session_reporting\n")
+        self.assertIn("session_reporting", check([eager], budget_ms=2.0)[0])
+
+    def test_measure_real_module(self):
+        result = measure("ttl_cache")
+        self.assertEqual(result.returncode, 0)
+        self.assertGreater(result.total_us, 0)
+        self.assertEqual(import_time_benchmark.main(["--module", "ttl_cache", "--repeat", "1", "--budget-ms", "5000"]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
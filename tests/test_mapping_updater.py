@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk mapping updater.
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from mapping_updater import KINDS, MappingUpdater
+
+
+def make_updater(base_dir, mappings, max_workers=8):
+    mappings_file = os.path.join(base_dir, "mappings.json")
+    with open(mappings_file, 'w') as f:
+        json.dump(mappings, f)
+    with redirect_stdout(io.StringIO()):
+        return MappingUpdater(mappings_file=mappings_file, base_dir=base_dir, max_workers=max_workers)
+
+
+class TestMappingUpdater(unittest.TestCase):
+    """Test cases for MappingUpdater bulk updates."""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.mappings = {
+            'needs': [{"Name": "love", "Priority": 0.9, "AssociatedGoals": ["people"]}],
+            'goals': [{"Name": "exercise", "Priority": 0.6}],
+            'skills': [{"Name": "wave", "Priority": 0.3, "AssociatedNeeds": ["love"]}],
+            'concepts': [{"Name": "robot", "AssociatedGoals": ["production"]}]
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def read(self, kind, name):
+        with open(os.path.join(self.base_dir, kind, f"{name}.json")) as f:
+            return json.load(f)
+
+    def test_creates_then_leaves_unchanged_files_alone(self):
+        updater = make_updater(self.base_dir, self.mappings)
+        report = updater.bulk_update()
+        self.assertEqual(report.count("create"), 4)
+        need = self.read('needs', 'love')
+        self.assertEqual(need["priority"], 0.9)
+        self.assertEqual(need["urgency"], 0.5)
+        self.assertEqual(self.read('skills', 'wave')["AssociatedNeeds"], ["love"])
+
+        path = os.path.join(self.base_dir, 'needs', 'love.json')
+        before = os.stat(path).st_mtime_ns
+        report = updater.bulk_update()
+        self.assertEqual(report.count("unchanged"), 4)
+        self.assertEqual(report.written, 0)
+        self.assertEqual(os.stat(path).st_mtime_ns, before)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.base_dir, 'needs'))), ["love.json"])
+
+    def test_dry_run_reports_changed_fields(self):
+        make_updater(self.base_dir, self.mappings).bulk_update()
+        self.mappings['needs'][0]["Priority"] = 0.1
+        self.mappings['needs'].append({"Name": "play"})
+        updater = make_updater(self.base_dir, self.mappings)
+
+        report = updater.bulk_update(kinds=['needs'], dry_run=True)
+        changes = {change.name: change for change in report.changes}
+        self.assertEqual(changes['love'].action, "update")
+        self.assertEqual(changes['love'].changed_fields, ["priority"])
+        self.assertEqual(changes['play'].action, "create")
+        self.assertIn("Would write 2 of 2 files", report.format())
+        self.assertEqual(self.read('needs', 'love')["priority"], 0.9)
+        self.assertFalse(os.path.exists(os.path.join(self.base_dir, 'needs', 'play.json')))
+
+        updater.bulk_update(kinds=['needs'])
+        self.assertEqual(self.read('needs', 'love')["priority"], 0.1)
+
+    def test_corrupt_file_is_reported(self):
+        os.makedirs(os.path.join(self.base_dir, 'goals'))
+        with open(os.path.join(self.base_dir, 'goals', 'exercise.json'), 'w') as f:
+            f.write("{not json")
+        report = make_updater(self.base_dir, self.mappings).bulk_update()
+        self.assertEqual(report.count("error"), 1)
+        self.assertEqual(report.count("create"), 3)
+
+    def test_name_index(self):
+        updater = make_updater(self.base_dir, self.mappings)
+        self.assertEqual(updater.get_mapping('skills', 'WAVE')["Priority"], 0.3)
+        self.assertIsNone(updater.get_mapping('skills', 'missing'))
+        self.assertEqual(updater._get_mapping_by_name(updater.mappings['concepts'], 'Robot')["Name"], "robot")
+
+    def test_10k_file_corpus(self):
+        per_kind = 2500
+        mappings = {kind: [{"Name": f"{kind}_{i}", "Priority": 0.5, "AssociatedGoals": [f"goal_{i % 50}"]}
+                           for i in range(per_kind)] for kind in KINDS}
+        updater = make_updater(self.base_dir, mappings)
+        started = time.perf_counter()
+        created = updater.bulk_update()
+        create_seconds = time.perf_counter() - started
+        self.assertEqual(created.count("create"), 4 * per_kind)
+
+        # Change 1% of the mappings
+        for kind in KINDS:
+            for mapping in mappings[kind][:25]:
+                mapping["AssociatedGoals"] = ["production"]
+        updater = make_updater(self.base_dir, mappings)
+        started = time.perf_counter()
+        updated = updater.bulk_update()
+        update_seconds = time.perf_counter() - started
+        print(f"\n10k files: create {create_seconds:.2f}s, diff + 100 writes {update_seconds:.2f}s")
+
+        self.assertEqual(updated.count("update"), 100)
+        self.assertEqual(updated.count("unchanged"), 4 * per_kind - 100)
+        self.assertLess(update_seconds, 30.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
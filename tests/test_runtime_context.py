@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for instance-scoped runtime contexts and the multi-robot host.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+import memory.store
+from runtime_context import RuntimeContext, get_current_context, set_current_context
+from multi_robot_host import MultiRobotSupervisor
+
+
+class TestRuntimeContext(unittest.TestCase):
+    """Test cases for RuntimeContext."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        set_current_context(None)
+        shutil.rmtree(self.temp_dir)
+
+    def test_default_context_reuses_module_singletons(self):
+        self.assertIs(get_current_context().memory_store, memory.store.memory_store)
+
+    def test_instances_get_their_own_singletons(self):
+        first = RuntimeContext('a', os.path.join(self.temp_dir, 'a'))
+        second = RuntimeContext('b', os.path.join(self.temp_dir, 'b'))
+        self.assertIsNot(first.concept_graph, second.concept_graph)
+        self.assertIs(first.concept_graph, first.concept_graph)
+        self.assertEqual(first.memory_store.memory_dir, os.path.join(self.temp_dir, 'a', 'memories'))
+        self.assertFalse(first.init_registry.is_initialized('systems'))
+
+    def test_image_store_shares_memory_store(self):
+        # The image_store factory reads memory_store; run in a thread so a deadlock fails instead of hanging
+        context = RuntimeContext('a', os.path.join(self.temp_dir, 'a'))
+        result = {}
+        reader = threading.Thread(target=lambda: result.setdefault('store', context.image_store), daemon=True)
+        reader.start()
+        reader.join(5)
+        self.assertFalse(reader.is_alive(), "reading image_store deadlocked")
+        self.assertIs(result['store'], context.memory_store.image_store)
+
+    def test_prepare_links_shared_knowledge(self):
+        shared = os.path.join(self.temp_dir, 'shared_aiml')
+        os.makedirs(shared)
+        with open(os.path.join(shared, 'greetings.aiml'), 'w') as f:
+            f.write('<aiml/>')
+        context = RuntimeContext('a', os.path.join(self.temp_dir, 'a'), {'aiml': shared})
+        context.prepare()
+        self.assertTrue(os.path.exists(context.path('aiml', 'greetings.aiml')))
+
+
+class TestMultiRobotSupervisor(unittest.TestCase):
+    """Test cases for MultiRobotSupervisor."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_runs_isolated_robots(self):
+        supervisor = MultiRobotSupervisor(2, self.temp_dir, shared_knowledge={}, max_workers=2)
+        report = supervisor.run(events=6)
+        self.assertEqual(report['robots_succeeded'], 2)
+        self.assertEqual(report['total_events'], 12)
+        for instance_id in ('carl_000', 'carl_001'):
+            self.assertTrue(os.path.isdir(os.path.join(self.temp_dir, instance_id, 'memories')))
+
+
+if __name__ == '__main__':
+    unittest.main()
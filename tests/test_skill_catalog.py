@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared skill catalog and its pose-transition planner.
+"""
+
+import os
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from skill_catalog import SkillCatalog, parse_duration
+from position_aware_skill_system import PositionAwareSkillSystem
+
+
+class TestSkillCatalog(unittest.TestCase):
+    """Test cases for SkillCatalog."""
+
+    def setUp(self):
+        self.skills_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.skills_dir)
+        self.catalog = SkillCatalog(self.skills_dir, refresh_interval=0.0)
+
+    def write_skill(self, key, **data):
+        data.setdefault("Name", key)
+        with open(os.path.join(self.skills_dir, f"{key}.json"), 'w') as f:
+            json.dump(data, f)
+
+    def test_builtin_transitions_without_pose_skills(self):
+        self.write_skill("wave", prerequisite_pose="standing")
+        self.assertEqual(self.catalog.transition_skills("sitting", "standing"), ["stand up"])
+        self.assertEqual(self.catalog.transition_skills("standing", "sitting"), ["sit down"])
+        self.assertEqual(self.catalog.transition_skills("sitting", "sitting"), [])
+
+    def test_shortest_duration_path(self):
+        self.write_skill("stand up", prerequisite_pose="sitting", duration_type="3000ms")
+        self.write_skill("getup", prerequisite_pose="sitting", estimated_duration=1.5)
+        self.write_skill("sit down", prerequisite_pose="standing")
+        self.write_skill("roll over", prerequisite_pose="lying", end_pose="sitting", estimated_duration=1.0)
+        self.write_skill("lie down", prerequisite_pose="sitting")
+        self.assertEqual(self.catalog.transition_skills("sitting", "standing"), ["getup"])
+        self.assertEqual(self.catalog.transition_skills("lying", "standing"), ["roll over", "getup"])
+        self.assertEqual(self.catalog.transition_skills("standing", "lying"), ["sit down", "lie down"])
+
+    def test_routes_are_memoized_until_files_change(self):
+        self.write_skill("stand up", prerequisite_pose="sitting")
+        self.catalog.transition_skills("sitting", "standing")
+        self.catalog.transition_skills("sitting", "standing")
+        self.assertEqual(self.catalog.get_stats()['route_hits'], 1)
+
+        self.write_skill("spring up", prerequisite_pose="sitting", end_pose="standing", estimated_duration=0.5)
+        self.assertEqual(self.catalog.transition_skills("sitting", "standing"), ["spring up"])
+        os.remove(os.path.join(self.skills_dir, "spring up.json"))
+        self.assertEqual(self.catalog.transition_skills("sitting", "standing"), ["stand up"])
+
+    def test_unreachable_pose(self):
+        self.write_skill("stand up", prerequisite_pose="sitting")
+        self.assertEqual(self.catalog.transition_skills("sitting", "flying"), [])
+
+    def test_parse_duration(self):
+        self.assertEqual(parse_duration({"duration": 4}), 4.0)
+        self.assertEqual(parse_duration({"duration_type": "3000ms"}), 3.0)
+        self.assertEqual(parse_duration({"duration_type": "auto_stop"}), 2.0)
+
+    def test_position_system_plan(self):
+        self.write_skill("dance", prerequisite_pose="standing")
+        self.write_skill("stand up", prerequisite_pose="sitting")
+        self.write_skill("stand", prerequisite_pose="sitting", estimated_duration=5.0)
+        system = PositionAwareSkillSystem(self.skills_dir, skill_catalog=self.catalog)
+        plan = system.analyze_skill_execution_plan("dance")
+        self.assertTrue(plan["requires_position_change"])
+        self.assertEqual(plan["transition_skills"], ["stand up"])
+        self.assertEqual(plan["total_skills"], ["stand up", "dance"])
+        self.assertEqual(system.get_skill_end_pose("stand up"), "standing")
+        self.assertIn("dance", system.skills_with_positions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for speculative prefetching of pipeline work.
+"""
+
+import sys
+import time
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from aiml_reflex_layer import AIMLReflexIntegration
+from perception_system import PerceptionSystem
+from speculative_prefetch import SpeculativePrefetcher, normalize_utterance
+
+
+class TestSpeculativePrefetcher(unittest.TestCase):
+    """Test cases for SpeculativePrefetcher."""
+
+    def setUp(self):
+        self.prefetcher = SpeculativePrefetcher(max_workers=2)
+        self.calls = []
+        self.prefetcher.register('memory', lambda text: self.calls.append(('memory', text)) or f"memory:{text}")
+        self.prefetcher.register('reflex', lambda text: self.calls.append(('reflex', text)) or f"reflex:{text}",
+                                 on_partial=False)
+
+    def tearDown(self):
+        self.prefetcher.shutdown()
+
+    def test_final_text_result_is_reused(self):
+        self.assertEqual(self.prefetcher.speculate("What is Chomp?", final=True), 2)
+        self.assertEqual(self.prefetcher.claim("what is chomp", 'reflex'), (True, "reflex:What is Chomp?"))
+        # Each result is claimed once
+        self.assertEqual(self.prefetcher.claim("what is chomp", 'reflex'), (False, None))
+        stats = self.prefetcher.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_partial_input_skips_confirmed_only_tasks(self):
+        self.assertEqual(self.prefetcher.speculate("what is", final=False), 1)
+        self.prefetcher.claim("what is", 'memory')
+        self.assertEqual([name for name, _ in self.calls], ['memory'])
+        # The final text adds the remaining tasks to a matching speculation
+        self.assertEqual(self.prefetcher.speculate("What is?", final=True), 1)
+
+    def test_mismatched_final_text_misses(self):
+        self.prefetcher.speculate("what is that", final=False)
+        self.assertEqual(self.prefetcher.claim("what is that ball", 'memory'), (False, None))
+        self.assertEqual(self.prefetcher.claim("anything", 'unregistered'), (False, None))
+        self.assertEqual(self.prefetcher.get_stats()['misses'], 1)
+
+    def test_new_text_cancels_queued_work(self):
+        release = threading.Event()
+        prefetcher = SpeculativePrefetcher(max_workers=1)
+        prefetcher.register('slow', lambda text: release.wait(1.0) and text)
+        prefetcher.register('other', lambda text: text)
+        prefetcher.speculate("first")
+        prefetcher.speculate("second")
+        release.set()
+        self.assertGreaterEqual(prefetcher.get_stats()['cancelled'], 1)
+        self.assertEqual(prefetcher.claim("second", 'other'), (True, "second"))
+        prefetcher.shutdown()
+
+    def test_claim_waits_for_running_task_and_records_savings(self):
+        prefetcher = SpeculativePrefetcher()
+        prefetcher.register('slow', lambda text: time.sleep(0.05) or text.upper())
+        prefetcher.speculate("hello")
+        time.sleep(0.06)
+        self.assertEqual(prefetcher.claim("hello", 'slow'), (True, "HELLO"))
+        self.assertGreater(prefetcher.get_stats()['saved_ms'], 40)
+        prefetcher.shutdown()
+
+    def test_queued_utterances_keep_their_speculations(self):
+        # A second final utterance arrives while the first is still waiting in the queue
+        self.prefetcher.speculate("hello carl", final=True)
+        self.prefetcher.speculate("what time is it", final=True)
+        self.assertEqual(self.prefetcher.claim("Hello, Carl", 'reflex'), (True, "reflex:hello carl"))
+        self.assertEqual(self.prefetcher.claim("what time is it", 'reflex'), (True, "reflex:what time is it"))
+        self.assertEqual(sorted(text for name, text in self.calls if name == 'reflex'),
+                         ["hello carl", "what time is it"])
+
+    def test_speculations_are_bounded(self):
+        prefetcher = SpeculativePrefetcher(max_speculations=2)
+        prefetcher.register('echo', lambda text: text)
+        for text in ("one", "two", "three"):
+            prefetcher.speculate(text, final=True)
+        self.assertEqual(prefetcher.get_stats()['active_speculations'], 2)
+        self.assertEqual(prefetcher.claim("one", 'echo'), (False, None))
+        self.assertEqual(prefetcher.claim("three", 'echo'), (True, "three"))
+        prefetcher.shutdown()
+
+    def test_speculative_reflex_is_stored_once_per_utterance(self):
+        main_app = mock.Mock()
+        integration = AIMLReflexIntegration.__new__(AIMLReflexIntegration)
+        integration.aiml_engine = mock.Mock()
+        integration.aiml_engine.get_reflex_response.side_effect = lambda text: f"reply to {text}"
+        integration.memory_system = None
+        integration.reflex_log = []
+        perception = PerceptionSystem.__new__(PerceptionSystem)
+        perception.main_app = main_app
+        perception.aiml_enabled = True
+        perception.aiml_integration = integration
+
+        prefetcher = SpeculativePrefetcher()
+        prefetcher.register('reflex', lambda text: perception.check_reflex_response(text, record=False),
+                            on_partial=False)
+        utterances = ["hello", "good morning"]
+        for text in utterances:
+            prefetcher.speculate(text, final=True)
+        # What process_input does for each queued utterance
+        for text in utterances:
+            prefetched, reflex_response = prefetcher.claim(text, 'reflex')
+            self.assertTrue(prefetched)
+            perception.record_reflex_response(text, reflex_response)
+        prefetcher.shutdown()
+
+        self.assertEqual(main_app.memory_system.store_memory.call_count, 2)
+        self.assertEqual([entry['input'] for entry in integration.reflex_log], utterances)
+
+    def test_normalize_utterance(self):
+        self.assertEqual(normalize_utterance("  What's   THAT?! "), "what's that")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for the dependency-aware startup orchestrator.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from startup_orchestrator import StartupOrchestrator
+from enhanced_startup_sequencing import EnhancedStartupSequencing
+
+
+class TestStartupOrchestrator(unittest.TestCase):
+    """Test cases for StartupOrchestrator."""
+
+    def test_independent_nodes_run_concurrently(self):
+        orchestrator = StartupOrchestrator(max_workers=4)
+        for name in ("a", "b", "c"):
+            orchestrator.add(name, lambda: time.sleep(0.1))
+        report = orchestrator.run()
+        self.assertTrue(report.success)
+        self.assertLess(report.time_to_ready, 0.25)
+        self.assertGreater(report.serial_time(), 0.29)
+
+    def test_dependencies_and_critical_path(self):
+        order = []
+        lock = threading.Lock()
+
+        def step(name, seconds):
+            def run():
+                time.sleep(seconds)
+                with lock:
+                    order.append(name)
+            return run
+
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("config", step("config", 0.01))
+        orchestrator.add("slow", step("slow", 0.1), depends_on=["config"])
+        orchestrator.add("fast", step("fast", 0.01), depends_on=["config"])
+        orchestrator.add("app", step("app", 0.01), depends_on=["slow", "fast"])
+        report = orchestrator.run()
+
+        self.assertEqual(order[0], "config")
+        self.assertEqual(order[-1], "app")
+        self.assertEqual(report.critical_path, ["config", "slow", "app"])
+        self.assertIn("* slow", report.format_timeline())
+        self.assertEqual(report.to_dict()['nodes']['app']['depends_on'], ["slow", "fast"])
+
+    def test_failure_skips_dependents(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("broken", lambda: 1 / 0)
+        orchestrator.add("offline", lambda: False)
+        orchestrator.add("needs_broken", lambda: None, depends_on=["broken"])
+        orchestrator.add("needs_needs_broken", lambda: None, depends_on=["needs_broken"])
+        orchestrator.add("independent", lambda: None)
+        report = orchestrator.run()
+
+        self.assertFalse(report.success)
+        self.assertEqual(report.status("broken"), "failed")
+        self.assertEqual(report.status("offline"), "failed")
+        self.assertEqual(report.status("needs_broken"), "skipped")
+        self.assertEqual(report.status("needs_needs_broken"), "skipped")
+        self.assertEqual(report.status("independent"), "ready")
+
+    def test_readiness_probe(self):
+        ready_at = time.monotonic() + 0.05
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("server", lambda: None, probe=lambda: time.monotonic() >= ready_at, probe_interval=0.01)
+        orchestrator.add("never", lambda: None, probe=lambda: False, ready_timeout=0.05, probe_interval=0.01)
+        report = orchestrator.run()
+        self.assertEqual(report.status("server"), "ready")
+        self.assertGreaterEqual(report.nodes["server"].duration, 0.04)
+        self.assertEqual(report.status("never"), "failed")
+        self.assertIn("not ready", report.nodes["never"].error)
+
+    def test_main_thread_nodes(self):
+        threads = {}
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("worker", lambda: threads.setdefault("worker", threading.current_thread()))
+        orchestrator.add("ui", lambda: threads.setdefault("ui", threading.current_thread()),
+                         depends_on=["worker"], main_thread=True)
+        self.assertTrue(orchestrator.run().success)
+        self.assertIs(threads["ui"], threading.current_thread())
+        self.assertIsNot(threads["worker"], threading.current_thread())
+
+    def test_invalid_graphs(self):
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("a", lambda: None, depends_on=["b"])
+        orchestrator.add("b", lambda: None, depends_on=["a"])
+        with self.assertRaises(ValueError):
+            orchestrator.run()
+
+        orchestrator = StartupOrchestrator()
+        orchestrator.add("a", lambda: None, depends_on=["missing"])
+        with self.assertRaises(ValueError):
+            orchestrator.run()
+        with self.assertRaises(ValueError):
+            orchestrator.add("a", lambda: None)
+
+
+class FakeRobot:
+    def __init__(self, connected=True):
+        self.connected = connected
+        self.commands = []
+
+    def send_auto_position(self, command):
+        self.commands.append((command, time.monotonic()))
+        return self.connected
+
+
+class FakeApp:
+    def __init__(self, connected=True, speech_seconds=0.2):
+        self.ez_robot = FakeRobot(connected)
+        self.ez_robot_connected = False
+        self.speech_seconds = speech_seconds
+        self.enhanced_systems = 0
+        self.eye_expressions = []
+
+    def _initialize_enhanced_systems(self):
+        self.enhanced_systems += 1
+
+    def _update_eye_expression(self, expression):
+        self.ez_robot.send_auto_position(expression)
+        self.eye_expressions.append(expression)
+
+    def _speak_to_computer_speakers(self, text):
+        time.sleep(self.speech_seconds)
+        return True
+
+
+class TestEnhancedStartupSequencing(unittest.TestCase):
+    """Test cases for the orchestrated robot startup."""
+
+    def test_startup_without_fixed_delays(self):
+        app = FakeApp()
+        sequencing = EnhancedStartupSequencing(app)
+        sequencing.command_spacing = 0.05
+        started = time.monotonic()
+        self.assertTrue(sequencing.execute_startup_sequence())
+        elapsed = time.monotonic() - started
+
+        # Old sequence slept 4.5s; now speech overlaps the eye setup
+        self.assertLess(elapsed, 1.0)
+        self.assertTrue(sequencing.startup_report.success)
+        self.assertEqual(app.enhanced_systems, 1)
+        self.assertEqual(app.eye_expressions, ["eyes_joy"])
+        self.assertEqual(sequencing.startup_report.critical_path[-2:], ["speech_test", "body_function_test"])
+
+        # ARC commands stay at least command_spacing apart
+        times = [t for _, t in app.ez_robot.commands]
+        self.assertEqual(app.ez_robot.commands[0][0], "Waiting Fidget")
+        self.assertGreaterEqual(times[1] - times[0], 0.05)
+        self.assertIsNotNone(sequencing.get_startup_stats()['timeline'])
+
+    def test_failed_connection_skips_robot_steps(self):
+        app = FakeApp(connected=False)
+        sequencing = EnhancedStartupSequencing(app)
+        self.assertFalse(sequencing.execute_startup_sequence())
+        report = sequencing.startup_report
+        self.assertEqual(report.status("connection_test"), "failed")
+        self.assertEqual(report.status("body_function_test"), "skipped")
+        self.assertEqual(app.enhanced_systems, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared TTL cache and the vision caches built on it.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from ttl_cache import TTLCache
+from vision_events import VisionEvent, bbox_iou
+from vision_deduplication import VisionDeduplicationSystem
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.expired = []
+        self.cache = TTLCache(10, clock=self.clock, on_expire=lambda key, value: self.expired.append(key))
+
+    def test_entries_expire_in_write_order(self):
+        self.cache.set('a', 1)
+        self.clock.now = 5
+        self.cache.set('b', 2)
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.get('b'), 2)
+        self.assertEqual(self.expired, ['a'])
+        self.clock.now = 15
+        self.assertEqual(len(self.cache), 0)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expired']), (1, 1, 2))
+
+    def test_set_and_touch_restart_lifetime(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.clock.now = 8
+        self.assertTrue(self.cache.touch('a'))
+        self.cache.set('b', 3)
+        self.clock.now = 12
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.get('b'), 3)
+        self.assertAlmostEqual(self.cache.age('a'), 4)
+        self.assertFalse(self.cache.touch('missing'))
+
+    def test_max_entries_evicts_oldest(self):
+        cache = TTLCache(10, max_entries=2, clock=self.clock)
+        for key in 'abc':
+            cache.set(key, key)
+        self.assertNotIn('a', cache)
+        self.assertEqual([key for key, _ in cache.items()], ['b', 'c'])
+        self.assertEqual(cache.get_stats()['evicted'], 1)
+
+
+class TestVisionDeduplication(unittest.TestCase):
+    """Test cases for spatial vision deduplication."""
+
+    def _event(self, bbox=None, name='cup'):
+        return VisionEvent(name=name, label=name, confidence=0.9, timestamp=0.0, color='red', bbox=bbox)
+
+    def test_bbox_iou(self):
+        self.assertEqual(bbox_iou([0, 0, 10, 10], [0, 0, 10, 10]), 1.0)
+        self.assertEqual(bbox_iou([0, 0, 10, 10], [20, 20, 30, 30]), 0.0)
+        self.assertAlmostEqual(bbox_iou([0, 0, 10, 10], [5, 0, 15, 10]), 1 / 3)
+
+    def test_same_object_in_same_place_is_duplicate(self):
+        dedup = VisionDeduplicationSystem(ttl_seconds=30)
+        self.assertFalse(dedup.is_duplicate(self._event([0, 0, 100, 100])))
+        self.assertTrue(dedup.is_duplicate(self._event([5, 5, 100, 100])))
+        self.assertTrue(dedup.is_duplicate(self._event()))
+
+    def test_same_object_elsewhere_is_not_duplicate(self):
+        dedup = VisionDeduplicationSystem(ttl_seconds=30)
+        self.assertFalse(dedup.is_duplicate(self._event([0, 0, 50, 50])))
+        self.assertFalse(dedup.is_duplicate(self._event([200, 200, 250, 250])))
+        self.assertTrue(dedup.is_duplicate(self._event([200, 200, 250, 250])))
+        stats = dedup.get_stats()
+        self.assertEqual((stats['unique_events'], stats['duplicate_events']), (2, 1))
+        self.assertEqual(stats['spatially_distinct_events'], 1)
+        self.assertEqual(stats['cache']['size'], 2)
+        self.assertEqual((stats['cache']['hits'], stats['cache']['misses']), (1, 2))
+        self.assertAlmostEqual(stats['cache']['hit_rate'], 1 / 3)
+
+    def test_expired_regions_are_forgotten(self):
+        dedup = VisionDeduplicationSystem(ttl_seconds=30)
+        clock = FakeClock()
+        dedup.cache.clock = clock
+        dedup.is_duplicate(self._event([0, 0, 50, 50]))
+        clock.now = 31
+        self.assertFalse(dedup.is_duplicate(self._event([0, 0, 50, 50])))
+        self.assertEqual(dedup.get_stats()['cache']['expired'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled values/beliefs alignment index.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from values_system import AlignmentIndex, ValuesSystem
+
+
+class TestAlignmentIndex(unittest.TestCase):
+    """Test cases for AlignmentIndex and its use in ValuesSystem."""
+
+    def setUp(self):
+        # ValuesSystem keeps its values/, beliefs/ and conflicts/ in the working directory
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.system = ValuesSystem()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_term_precedence(self):
+        index = AlignmentIndex(self.system.values, {})
+        # Name beats related beats opposing beats keyword
+        self.assertEqual(index.score("Honesty and deception")[0]["honesty"], 0.8)
+        self.assertEqual(index.score("trust despite manipulation")[0]["honesty"], 0.6)
+        self.assertEqual(index.score("manipulation to find the truth")[0]["honesty"], -0.8)
+        self.assertEqual(index.score("tell the truth")[0]["honesty"], 0.5)
+        self.assertEqual(index.score("walk around")[0]["honesty"], 0.0)
+        # Terms match as substrings, as before
+        self.assertEqual(index.score("learning new words")[0]["curiosity"], 0.6)
+
+    def test_evaluation_and_conflicts_in_one_scan(self):
+        result = self.system.evaluate_action_alignment("use deception and selfishness")
+        self.assertEqual(result["value_alignments"]["honesty"]["score"], -0.8)
+        self.assertEqual({c["value_id"] for c in result["conflicts"]}, {"honesty", "helpfulness"})
+        self.assertAlmostEqual(result["acc_activation"], 0.6)
+
+        conflicts = self.system.detect_conflicts("use deception and selfishness")
+        self.assertEqual(sorted(c.value_ids[0] for c in conflicts), ["helpfulness", "honesty"])
+        self.assertTrue(all(c.acc_activation == 0.6 for c in conflicts))
+
+    def test_index_is_reused_and_invalidated(self):
+        self.system.evaluate_action_alignment("explore")
+        index = self.system._alignment_index
+        self.system.evaluate_action_alignment("help out")
+        self.assertIs(self.system._alignment_index, index)
+
+        self.system.reinforce_value("curiosity")
+        self.assertIsNone(self.system._alignment_index)
+        self.system.evaluate_action_alignment("explore")
+
+        belief_id = next(iter(self.system.beliefs))
+        self.system.update_belief(belief_id, {}, 0.9)
+        self.assertIsNone(self.system._alignment_index)
+
+        self.system.evaluate_action_alignment("explore")
+        self.system.load_values()
+        self.assertIsNone(self.system._alignment_index)
+
+    def test_edited_terms_after_invalidation(self):
+        self.system.evaluate_action_alignment("explore")
+        self.system.values["efficiency"].opposing_values.append("procrastination")
+        self.system.invalidate_alignment_index()
+        result = self.system.evaluate_action_alignment("procrastination")
+        self.assertEqual(result["value_alignments"]["efficiency"]["score"], -0.8)
+
+    def test_added_value_rebuilds_index(self):
+        self.system.evaluate_action_alignment("explore")
+        value = self.system.values.pop("efficiency")
+        value.id = "thrift"
+        self.system.values["thrift"] = value
+        result = self.system.evaluate_action_alignment("streamline it")
+        self.assertEqual(result["value_alignments"]["thrift"]["score"], 0.5)
+        self.assertEqual(self.system._calculate_value_alignment("waste", value), -0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
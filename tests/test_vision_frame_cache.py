@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for perceptual-hash frame gating of vision analysis.
+"""
+
+import asyncio
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from vision_frame_cache import VisionFrameCache, hamming_distance
+from vision_system import VisionAnalysisResult, VisionSystem
+
+
+class TestVisionFrameCache(unittest.TestCase):
+    """Test cases for VisionFrameCache."""
+
+    def test_near_duplicate_frames_hit(self):
+        cache = VisionFrameCache(hamming_threshold=2)
+        cache.store(0b1111_0000, "desk scene")
+        self.assertEqual(cache.lookup(0b1111_0001), "desk scene")
+        self.assertIsNone(cache.lookup(0b0000_1111))
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_stale_results_are_refreshed(self):
+        cache = VisionFrameCache(ttl_seconds=0.01)
+        cache.store(42, "old")
+        time.sleep(0.02)
+        self.assertIsNone(cache.lookup(42))
+        self.assertEqual(cache.get_stats()['stale'], 1)
+
+    def test_lru_eviction(self):
+        cache = VisionFrameCache(max_entries=2, hamming_threshold=0)
+        cache.store(1, "a")
+        cache.store(2, "b")
+        cache.lookup(1)
+        cache.store(4, "c")
+        self.assertEqual(cache.lookup(1), "a")
+        self.assertIsNone(cache.lookup(2))
+
+    def test_results_are_scoped_to_context(self):
+        cache = VisionFrameCache(hamming_threshold=2)
+        cache.store(0b1111_0000, "desk objects", ("object_listing", "high"))
+        self.assertIsNone(cache.lookup(0b1111_0000, ("self_recognition", "low")))
+        self.assertIsNone(cache.lookup(0b1111_0000, ("object_listing", "low")))
+        self.assertEqual(cache.lookup(0b1111_0001, ("object_listing", "high")), "desk objects")
+
+    def test_unhashable_frames_miss(self):
+        cache = VisionFrameCache()
+        self.assertIsNone(cache.lookup(None))
+        self.assertTrue(cache.frame_changed(None))
+        self.assertEqual(hamming_distance(0b1010, 0b0101), 4)
+
+
+class TestCachedVisionSideEffects(unittest.TestCase):
+    """Test that reused analyses are not saved to memory again."""
+
+    def _capture(self, from_cache):
+        vision = VisionSystem.__new__(VisionSystem)
+        vision.logger = mock.Mock()
+        vision.recent_vision_results = []
+        vision.should_trigger_vision_analysis = lambda: True
+        vision.capture_image = lambda: "frame.jpg"
+        vision._update_vision_context = mock.Mock()
+        vision._save_vision_detections_to_memory = mock.Mock()
+
+        async def analyze(image_path):
+            return VisionAnalysisResult(objects=["cup"], image_path=image_path, from_cache=from_cache)
+        vision.analyze_vision_with_openai = analyze
+
+        response = asyncio.run(vision.capture_and_analyze_vision())
+        self.assertEqual(response["data"]["objects"], ["cup"])
+        return vision._save_vision_detections_to_memory
+
+    def test_cache_hit_skips_memory_save(self):
+        self.assertFalse(self._capture(from_cache=True).called)
+        self.assertTrue(self._capture(from_cache=False).called)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for vision upload image preparation.
+"""
+
+import os
+import sys
+import base64
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+import vision_image_prep
+from vision_image_prep import (ImagePreparationProfile, PIL_AVAILABLE, VisionUploadStats,
+                               prepare_image)
+
+
+class TestPrepareImage(unittest.TestCase):
+    """Test cases for prepare_image."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir, name)
+
+    def test_missing_file(self):
+        self.assertIsNone(prepare_image(self._path("missing.jpg"), ImagePreparationProfile()))
+
+    @unittest.skipIf(PIL_AVAILABLE, "fallback path only runs without PIL")
+    def test_original_bytes_without_pil(self):
+        path = self._path("frame.jpg")
+        with open(path, 'wb') as f:
+            f.write(b'\xff\xd8jpeg-bytes')
+        prepared = prepare_image(path, ImagePreparationProfile(detail="low"))
+        self.assertEqual(base64.b64decode(prepared.base64_data), b'\xff\xd8jpeg-bytes')
+        self.assertEqual(prepared.detail, "low")
+        self.assertFalse(prepared.reencoded)
+
+    @unittest.skipUnless(PIL_AVAILABLE, "PIL not available")
+    def test_downscale_and_budget(self):
+        from PIL import Image
+        path = self._path("frame.png")
+        Image.effect_noise((1600, 1200), 64).convert('RGB').save(path)
+
+        prepared = prepare_image(path, ImagePreparationProfile(max_edge=512, max_bytes=40 * 1024))
+        self.assertLessEqual(max(prepared.width, prepared.height), 512)
+        self.assertLessEqual(prepared.upload_bytes, 40 * 1024)
+        self.assertLess(prepared.upload_bytes, prepared.original_bytes)
+
+    @unittest.skipUnless(PIL_AVAILABLE, "PIL not available")
+    def test_failed_steps_do_not_skip_the_rest(self):
+        from PIL import Image
+        path = self._path("frame.png")
+        Image.effect_noise((1600, 1200), 64).convert('RGB').save(path)
+
+        real_encode = vision_image_prep._encode_jpeg
+
+        def flaky_encode(img, quality):
+            if quality == 70:
+                raise OSError("encoder error")
+            return real_encode(img, quality)
+
+        with mock.patch.object(vision_image_prep.ImageOps, 'exif_transpose', side_effect=ValueError("bad exif")), \
+                mock.patch.object(vision_image_prep, '_encode_jpeg', side_effect=flaky_encode):
+            prepared = prepare_image(path, ImagePreparationProfile(max_edge=512, max_bytes=40 * 1024))
+        self.assertTrue(prepared.reencoded)
+        self.assertLessEqual(max(prepared.width, prepared.height), 512)
+        self.assertLessEqual(prepared.upload_bytes, 40 * 1024)
+        self.assertEqual([failure.split(':')[0] for failure in prepared.failures], ['orient', 'encode q70'])
+
+    def test_upload_stats(self):
+        path = self._path("frame.jpg")
+        with open(path, 'wb') as f:
+            f.write(b'\xff\xd8' + b'\x00' * 1022)
+        stats = VisionUploadStats()
+        stats.record("object_listing", prepare_image(path, ImagePreparationProfile()), api_seconds=0.5)
+        report = stats.get_stats()
+        self.assertEqual(report['uploads'], 1)
+        self.assertAlmostEqual(report['avg_api_ms'], 500.0)
+        self.assertEqual(report['by_purpose'], {"object_listing": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for normalized vision memory records.
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import CARL modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from vision_memory_records import VisionScene, expand_vision_records
+
+
+class TestVisionMemoryRecords(unittest.TestCase):
+    """Test cases for scene/detection normalization."""
+
+    def setUp(self):
+        self.analysis = {"who": "nobody", "what": "a desk with toys", "where": "office",
+                         "why": "exploring", "how": "looking"}
+        self.scene = VisionScene(
+            scene_id="vision_comprehensive_1", timestamp="2025-01-01T10:00:00",
+            image_path="memories/vision/camera_capture_1.jpg",
+            objects=tuple(f"toy {i}" for i in range(10)),
+            object_details={"toy 0": {"colors": ["red"]}},
+            analysis=self.analysis,
+            neucogar={"dopamine": 0.7}
+        )
+
+    def _stm(self):
+        detections = self.scene.detections()
+        rows = [d.to_memory_entry(self.scene.timestamp, self.scene.vision_concepts) for d in reversed(detections)]
+        return rows + [self.scene.to_memory_entry()]
+
+    def test_analysis_stored_once(self):
+        # Only the scene entry carries it (its WHAT and its analysis), not the 10 object rows
+        serialized = json.dumps(self._stm())
+        self.assertEqual(serialized.count("a desk with toys"), 2)
+        self.assertEqual(serialized.count('"analysis"'), 1)
+
+    def test_join_restores_per_object_format(self):
+        joined = expand_vision_records(self._stm())
+        toy = next(entry for entry in joined if entry.get("object_name") == "toy 0")
+        self.assertEqual(toy["type"], "vision_object_detection")
+        self.assertEqual(toy["WHAT"], "a desk with toys")
+        self.assertEqual(toy["analysis"], self.analysis)
+        self.assertEqual(toy["vision_data"]["image_path"], "memories/vision/camera_capture_1.jpg")
+        self.assertEqual(toy["object_details"], {"colors": ["red"]})
+        self.assertIn("desk", toy["concepts"])
+        self.assertEqual(toy["detection_confidence"], 0.8)
+
+    def test_join_without_scene_falls_back(self):
+        row = self._stm()[0]
+        joined = expand_vision_records([row])[0]
+        self.assertEqual(joined["WHAT"], f"Vision: {row['object_name']}")
+        self.assertEqual(joined["analysis"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+TTL Cache
+=========
+
+Shared time-to-live cache for the vision deduplication, stabilization and
+Flask-side detection caches.
+
+Those caches each kept a plain dict and removed stale entries by scanning
+the whole dict (on every event, in the deduplication case). All entries of
+a cache share one TTL, so entries expire in the order they were written:
+the cache keeps them in an OrderedDict ordered by write time and expiry only
+pops from the front until it reaches a live entry - O(1) amortized per
+operation, however large the cache grows.
+
+Reads never extend an entry's lifetime; ``set`` and ``touch`` do.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Write-ordered cache whose entries expire ttl_seconds after their last write.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: Optional[int] = None,
+                 on_expire: Optional[Callable[[Hashable, Any], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry after its last write
+            max_entries: Evict the oldest entries beyond this size (unbounded if None)
+            on_expire: Called with (key, value) when an entry expires or is evicted
+            clock: Monotonic time source in seconds
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.on_expire = on_expire
+        self.clock = clock
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def _expire(self, now: float) -> int:
+        """Drop expired entries from the front (lock held)."""
+        removed = 0
+        entries = self._entries
+        while entries:
+            key, (written_at, value) = next(iter(entries.items()))
+            if now - written_at < self.ttl_seconds:
+                break
+            entries.popitem(last=False)
+            removed += 1
+            if self.on_expire:
+                self.on_expire(key, value)
+        self.expired += removed
+        return removed
+
+    def expire(self) -> int:
+        """
+        Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._expire(self.clock())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Value of a live entry (default if missing or expired)."""
+        with self._lock:
+            self._expire(self.clock())
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[1]
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Seconds since a live entry was last written (None if missing)."""
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            entry = self._entries.get(key)
+            return None if entry is None else now - entry[0]
+
+    def set(self, key: Hashable, value: Any):
+        """Write an entry and restart its lifetime."""
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            self.writes += 1
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    evicted_key, (_, evicted_value) = self._entries.popitem(last=False)
+                    self.evicted += 1
+                    if self.on_expire:
+                        self.on_expire(evicted_key, evicted_value)
+
+    def touch(self, key: Hashable) -> bool:
+        """Restart the lifetime of a live entry without changing its value."""
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._entries[key] = (now, entry[1])
+            self._entries.move_to_end(key)
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self):
+        """Remove all entries (without expiry callbacks)."""
+        with self._lock:
+            self._entries.clear()
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Snapshot of the live (key, value) pairs, oldest write first."""
+        with self._lock:
+            self._expire(self.clock())
+            return iter([(key, value) for key, (_, value) in self._entries.items()])
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            self._expire(self.clock())
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(self.clock())
+            return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (same keys for every cache)."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self),
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'writes': self.writes,
+            'expired': self.expired,
+            'evicted': self.evicted
+        }
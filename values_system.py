@@ -14,6 +14,24 @@ from dataclasses import dataclass, asdict
 import logging
 from enum import Enum
 
+from multi_pattern_matcher import MultiPatternMatcher
+
+# Value-specific keywords, by lowercase value name
+VALUE_KEYWORDS = {
+    "honesty": ["truth", "truthful", "honest", "transparent", "sincere"],
+    "loyalty": ["faithful", "loyal", "committed", "dedicated", "support"],
+    "curiosity": ["learn", "explore", "discover", "understand", "investigate"],
+    "helpfulness": ["help", "assist", "support", "aid", "serve"],
+    "efficiency": ["optimize", "improve", "enhance", "streamline", "effective"]
+}
+
+# Alignment score of each kind of term found in an action, in order of precedence
+VALUE_TERM_SCORES = {"name": 0.8, "related": 0.6, "opposing": -0.8, "keyword": 0.5}
+BELIEF_TERM_SCORES = {"name": 0.7, "related": 0.5, "contradicting": -0.7}
+
+# Alignment below this is reported as a conflict
+CONFLICT_ALIGNMENT = -0.3
+
 class ValueType(Enum):
     """Types of values based on neuroscience categorization."""
     MORAL = "moral"           # vmPFC - abstract moral principles
@@ -85,6 +103,83 @@ class ValueConflict:
     last_updated: str
     resolution_history: List[Dict]  # History of resolution attempts
 
+class AlignmentIndex:
+    """
+    Terms of every value and belief compiled into one automaton.
+
+    Each term maps to the values/beliefs it belongs to, with the term's kind
+    (name, related, opposing, ...) and score. Scoring an action scans its text
+    once; each value or belief takes the score of its highest-precedence
+    matching term, which is what checking each term with ``in`` in turn gave.
+    """
+
+    def __init__(self, values: Dict[str, 'Value'], beliefs: Dict[str, 'Belief']):
+        """
+        Build the index.
+
+        Args:
+            values: Values by ID
+            beliefs: Beliefs by ID
+        """
+        # Term -> [(kind, owner_id, precedence, score)]
+        self.terms: Dict[str, List[Tuple[str, str, int, float]]] = {}
+        # Empty terms are contained in every text
+        self.always: List[Tuple[str, str, int, float]] = []
+        self.value_ids = list(values)
+        self.belief_ids = list(beliefs)
+
+        for value_id, value in values.items():
+            self._add("value", value_id, VALUE_TERM_SCORES, {
+                "name": [value.name],
+                "related": value.related_values,
+                "opposing": value.opposing_values,
+                "keyword": VALUE_KEYWORDS.get(value.name.lower(), [])
+            })
+        for belief_id, belief in beliefs.items():
+            self._add("belief", belief_id, BELIEF_TERM_SCORES, {
+                "name": [belief.name],
+                "related": belief.related_beliefs,
+                "contradicting": belief.contradicting_beliefs
+            })
+        self.matcher = MultiPatternMatcher(self.terms)
+
+    def _add(self, kind: str, owner_id: str, scores: Dict[str, float], terms: Dict[str, List[str]]):
+        for precedence, (term_kind, score) in enumerate(scores.items()):
+            for term in terms[term_kind] or []:
+                if not isinstance(term, str):
+                    continue
+                entry = (kind, owner_id, precedence, score)
+                term = term.lower()
+                if term:
+                    self.terms.setdefault(term, []).append(entry)
+                else:
+                    self.always.append(entry)
+
+    def score(self, action_description: str) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Alignment of an action with every value and belief.
+
+        Args:
+            action_description: Description of the action
+
+        Returns:
+            (value scores by ID, belief scores by ID); 0.0 where no term matched
+        """
+        best: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        matched = [entry for term in self.matcher.find_all(action_description.lower())
+                   for entry in self.terms[term]]
+        for kind, owner_id, precedence, score in matched + self.always:
+            current = best.get((kind, owner_id))
+            if current is None or precedence < current[0]:
+                best[(kind, owner_id)] = (precedence, score)
+
+        value_scores = {value_id: 0.0 for value_id in self.value_ids}
+        belief_scores = {belief_id: 0.0 for belief_id in self.belief_ids}
+        for (kind, owner_id), (_, score) in best.items():
+            (value_scores if kind == "value" else belief_scores)[owner_id] = score
+        return value_scores, belief_scores
+
+
 class ValuesSystem:
     """
     Comprehensive values system implementing neuroscience-based architecture.
@@ -114,6 +209,10 @@ class ValuesSystem:
         self.beliefs: Dict[str, Belief] = {}
         self.conflicts: Dict[str, ValueConflict] = {}
         
+        # Compiled value/belief terms; rebuilt after values or beliefs change
+        self._alignment_index: Optional[AlignmentIndex] = None
+        self._alignment_signature: Optional[Tuple] = None
+        
         # System parameters
         self.reward_threshold = 0.3  # Minimum reward to reinforce value
         self.conflict_detection_threshold = 0.4  # ACC activation threshold
@@ -388,52 +487,27 @@ class ValuesSystem:
             Dictionary with alignment scores and conflict information
         """
         try:
-            # Initialize alignment scores
-            value_alignments = {}
-            belief_alignments = {}
-            conflicts = []
+            value_scores, belief_scores, conflicts = self._score_action(action_description)
             
-            # Evaluate alignment with each value
+            value_alignments = {}
             for value_id, value in self.values.items():
-                alignment_score = self._calculate_value_alignment(action_description, value, context)
                 value_alignments[value_id] = {
-                    "score": alignment_score,
+                    "score": value_scores[value_id],
                     "value_name": value.name,
                     "value_type": value.value_type.value,
                     "strength": value.strength,
                     "emotional_weight": value.emotional_weight
                 }
-                
-                # Check for conflicts
-                if alignment_score < -0.3:  # Negative alignment threshold
-                    conflicts.append({
-                        "type": "value_conflict",
-                        "value_id": value_id,
-                        "value_name": value.name,
-                        "severity": abs(alignment_score),
-                        "description": f"Action conflicts with {value.name}"
-                    })
             
-            # Evaluate alignment with beliefs
+            belief_alignments = {}
             for belief_id, belief in self.beliefs.items():
-                alignment_score = self._calculate_belief_alignment(action_description, belief, context)
                 belief_alignments[belief_id] = {
-                    "score": alignment_score,
+                    "score": belief_scores[belief_id],
                     "belief_name": belief.name,
                     "belief_type": belief.belief_type.value,
                     "confidence": belief.confidence,
                     "value_alignment": belief.value_alignment
                 }
-                
-                # Check for belief conflicts
-                if alignment_score < -0.3:
-                    conflicts.append({
-                        "type": "belief_conflict",
-                        "belief_id": belief_id,
-                        "belief_name": belief.name,
-                        "severity": abs(alignment_score),
-                        "description": f"Action contradicts belief: {belief.name}"
-                    })
             
             # Calculate overall alignment scores
             overall_value_alignment = sum(align["score"] * align["strength"] 
@@ -469,47 +543,51 @@ class ValuesSystem:
                 "neurotransmitter_impact": {}
             }
     
+    def invalidate_alignment_index(self):
+        """Rebuild the alignment index on next use (call after editing value or belief terms)."""
+        self._alignment_index = None
+    
+    def _get_alignment_index(self) -> AlignmentIndex:
+        """The alignment index, rebuilt if values or beliefs were added, removed or replaced."""
+        signature = (tuple((key, id(value)) for key, value in self.values.items()),
+                     tuple((key, id(belief)) for key, belief in self.beliefs.items()))
+        if self._alignment_index is None or signature != self._alignment_signature:
+            self._alignment_index = AlignmentIndex(self.values, self.beliefs)
+            self._alignment_signature = signature
+        return self._alignment_index
+    
+    def _score_action(self, action_description: str) -> Tuple[Dict[str, float], Dict[str, float], List[Dict]]:
+        """Value scores, belief scores and conflicts of an action from one scan of its text."""
+        value_scores, belief_scores = self._get_alignment_index().score(action_description or "")
+        conflicts = []
+        for value_id, score in value_scores.items():
+            if score < CONFLICT_ALIGNMENT:
+                value = self.values[value_id]
+                conflicts.append({
+                    "type": "value_conflict",
+                    "value_id": value_id,
+                    "value_name": value.name,
+                    "severity": abs(score),
+                    "description": f"Action conflicts with {value.name}"
+                })
+        for belief_id, score in belief_scores.items():
+            if score < CONFLICT_ALIGNMENT:
+                belief = self.beliefs[belief_id]
+                conflicts.append({
+                    "type": "belief_conflict",
+                    "belief_id": belief_id,
+                    "belief_name": belief.name,
+                    "severity": abs(score),
+                    "description": f"Action contradicts belief: {belief.name}"
+                })
+        return value_scores, belief_scores, conflicts
+    
     def _calculate_value_alignment(self, action_description: str, value: Value, context: Dict = None) -> float:
         """Calculate how well an action aligns with a specific value."""
         try:
-            # Simple keyword-based alignment calculation
-            # In a more sophisticated implementation, this would use NLP and semantic analysis
-            
-            action_lower = action_description.lower()
-            value_name_lower = value.name.lower()
-            
-            # Check for direct alignment
-            if value_name_lower in action_lower:
-                return 0.8
-            
-            # Check for related concepts
-            for related_value in value.related_values:
-                if related_value.lower() in action_lower:
-                    return 0.6
-            
-            # Check for opposing concepts
-            for opposing_value in value.opposing_values:
-                if opposing_value.lower() in action_lower:
-                    return -0.8
-            
-            # Check for value-specific keywords
-            value_keywords = {
-                "honesty": ["truth", "truthful", "honest", "transparent", "sincere"],
-                "loyalty": ["faithful", "loyal", "committed", "dedicated", "support"],
-                "curiosity": ["learn", "explore", "discover", "understand", "investigate"],
-                "helpfulness": ["help", "assist", "support", "aid", "serve"],
-                "efficiency": ["optimize", "improve", "enhance", "streamline", "effective"]
-            }
-            
-            if value.name.lower() in value_keywords:
-                keywords = value_keywords[value.name.lower()]
-                for keyword in keywords:
-                    if keyword in action_lower:
-                        return 0.5
-            
-            # Default neutral alignment
-            return 0.0
-            
+            if self.values.get(value.id) is value:
+                return self._get_alignment_index().score(action_description)[0][value.id]
+            return AlignmentIndex({value.id: value}, {}).score(action_description)[0][value.id]
         except Exception as e:
             self.logger.error(f"Error calculating value alignment: {e}")
             return 0.0
@@ -517,27 +595,9 @@ class ValuesSystem:
     def _calculate_belief_alignment(self, action_description: str, belief: Belief, context: Dict = None) -> float:
         """Calculate how well an action aligns with a specific belief."""
         try:
-            # Similar to value alignment but for beliefs
-            action_lower = action_description.lower()
-            belief_name_lower = belief.name.lower()
-            
-            # Check for direct alignment
-            if belief_name_lower in action_lower:
-                return 0.7
-            
-            # Check for related concepts
-            for related_belief in belief.related_beliefs:
-                if related_belief.lower() in action_lower:
-                    return 0.5
-            
-            # Check for contradicting concepts
-            for contradicting_belief in belief.contradicting_beliefs:
-                if contradicting_belief.lower() in action_lower:
-                    return -0.7
-            
-            # Default neutral alignment
-            return 0.0
-            
+            if self.beliefs.get(belief.id) is belief:
+                return self._get_alignment_index().score(action_description)[1][belief.id]
+            return AlignmentIndex({}, {belief.id: belief}).score(action_description)[1][belief.id]
         except Exception as e:
             self.logger.error(f"Error calculating belief alignment: {e}")
             return 0.0
@@ -610,6 +670,7 @@ class ValuesSystem:
                 
                 # Increase stability over time
                 value.stability = min(1.0, value.stability + (reinforcement_strength * 0.05))
+                self.invalidate_alignment_index()
                 
                 self.logger.info(f"Reinforced value '{value.name}' - new strength: {value.strength:.3f}")
                 
@@ -638,6 +699,7 @@ class ValuesSystem:
                 
                 # Update hippocampus strength (memory consolidation)
                 belief.hippocampus_strength = min(1.0, belief.hippocampus_strength + evidence_impact)
+                self.invalidate_alignment_index()
                 
                 self.logger.info(f"Updated belief '{belief.name}' - new confidence: {belief.confidence:.3f}")
                 
@@ -649,11 +711,12 @@ class ValuesSystem:
         try:
             conflicts = []
             
-            # Get alignment evaluation
-            alignment_result = self.evaluate_action_alignment(action_description, context)
+            # Only the conflicts are needed, not the full alignment evaluation
+            _, _, alignment_conflicts = self._score_action(action_description)
+            acc_activation = min(1.0, len(alignment_conflicts) * 0.3) if alignment_conflicts else 0.0
             
             # Create conflict objects for significant conflicts
-            for conflict_info in alignment_result["conflicts"]:
+            for conflict_info in alignment_conflicts:
                 if conflict_info["severity"] > self.conflict_detection_threshold:
                     conflict = ValueConflict(
                         id=f"conflict_{datetime.now().timestamp()}",
@@ -661,7 +724,7 @@ class ValuesSystem:
                         belief_ids=[conflict_info.get("belief_id", "")] if conflict_info["type"] == "belief_conflict" else [],
                         conflict_type=conflict_info["type"],
                         intensity=conflict_info["severity"],
-                        acc_activation=alignment_result["acc_activation"],
+                        acc_activation=acc_activation,
                         resolution_status="unresolved",
                         created=datetime.now().isoformat(),
                         last_updated=datetime.now().isoformat(),
@@ -860,6 +923,7 @@ class ValuesSystem:
                             value = Value(**value_data)
                             self.values[value.id] = value
             
+            self.invalidate_alignment_index()
             self.logger.info(f"Loaded {len(self.values)} values from files")
             
         except Exception as e:
@@ -900,6 +964,7 @@ class ValuesSystem:
                             belief = Belief(**belief_data)
                             self.beliefs[belief.id] = belief
             
+            self.invalidate_alignment_index()
             self.logger.info(f"Loaded {len(self.beliefs)} beliefs from files")
             
         except Exception as e:
@@ -5,42 +5,57 @@ Vision Deduplication System
 
 Implements deduplication for vision events to prevent spam and improve
 pipeline robustness. Uses TTL-based caching to ensure events are only
-processed once per object/color combination within a time window.
+processed once per object/color combination (and location, when events
+carry a bbox) within a time window.
 """
 
-import time
 import logging
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
-from collections import defaultdict
-from vision_events import VisionEvent
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+from vision_events import VisionEvent, bbox_iou
+from ttl_cache import TTLCache
 
 class VisionDeduplicationSystem:
     """
     Vision deduplication system with TTL-based caching.
     
     Prevents duplicate vision events by maintaining a cache of recent
-    detections with configurable time-to-live (TTL) values.
+    detections with configurable time-to-live (TTL) values. Events with a
+    bbox are only duplicates of a cached event of the same object/color
+    whose bbox overlaps it (IoU), so two identical objects in different
+    places are both reported.
     """
     
-    def __init__(self, ttl_seconds: int = 30):
+    def __init__(self, ttl_seconds: int = 30, iou_threshold: float = 0.5):
         """
         Initialize the deduplication system.
         
         Args:
             ttl_seconds: Time-to-live for cached events in seconds
+            iou_threshold: Minimum bbox overlap for a same-object event to count as a duplicate
         """
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.iou_threshold = iou_threshold
+        # (name|color, bbox or None) -> first-seen event; regions tracks the live bboxes per name|color
+        self.cache = TTLCache(ttl_seconds, on_expire=self._forget_region)
+        self._regions: Dict[str, Set[Optional[Tuple[float, ...]]]] = {}
         self.logger = logging.getLogger(__name__)
         
         # Statistics
         self.total_events = 0
         self.duplicate_events = 0
         self.unique_events = 0
+        self.spatially_distinct_events = 0
         
         self.logger.info(f"Vision deduplication system initialized with TTL: {ttl_seconds}s")
     
+    def _forget_region(self, key: Hashable, value):
+        cache_key, region = key
+        regions = self._regions.get(cache_key)
+        if regions is not None:
+            regions.discard(region)
+            if not regions:
+                del self._regions[cache_key]
+    
     def is_duplicate(self, event: VisionEvent) -> bool:
         """
         Check if a vision event is a duplicate.
@@ -53,50 +68,42 @@ class VisionDeduplicationSystem:
         """
         self.total_events += 1
         
-        # Clean expired entries
-        self._cleanup_expired()
-        
         # Create cache key
         cache_key = f"{event.name}|{event.color}"
-        current_time = time.time()
+        region = tuple(float(x) for x in event.get_bbox_as_list()) or None
         
-        # Check if we have a recent entry for this object/color
-        if cache_key in self.cache:
-            last_seen = self.cache[cache_key]
-            if current_time - last_seen < self.ttl_seconds:
+        # A recent entry for this object/color is a duplicate unless both bboxes are known and apart
+        self.cache.expire()
+        live_regions = list(self._regions.get(cache_key, ()))
+        for cached_region in live_regions:
+            if region is None or cached_region is None or bbox_iou(region, cached_region) >= self.iou_threshold:
+                key = (cache_key, cached_region)
+                self.cache.get(key)  # counts the cache hit
+                age = self.cache.age(key) or 0.0
                 self.duplicate_events += 1
-                self.logger.debug(f"Duplicate vision event: {cache_key} (last seen: {current_time - last_seen:.1f}s ago)")
+                self.logger.debug(f"Duplicate vision event: {cache_key} (last seen: {age:.1f}s ago)")
                 return True
+        if live_regions:
+            self.spatially_distinct_events += 1
         
         # Not a duplicate, add to cache
-        self.cache[cache_key] = current_time
+        self.cache.get((cache_key, region))  # counts the cache miss
+        self.cache.set((cache_key, region), event)
+        self._regions.setdefault(cache_key, set()).add(region)
         self.unique_events += 1
         self.logger.debug(f"New vision event: {cache_key}")
         return False
     
-    def _cleanup_expired(self):
-        """Remove expired entries from the cache."""
-        current_time = time.time()
-        expired_keys = []
-        
-        for cache_key, timestamp in self.cache.items():
-            if current_time - timestamp >= self.ttl_seconds:
-                expired_keys.append(cache_key)
-        
-        for key in expired_keys:
-            del self.cache[key]
-        
-        if expired_keys:
-            self.logger.debug(f"Cleaned up {len(expired_keys)} expired vision cache entries")
-    
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """Get deduplication statistics."""
         return {
             "total_events": self.total_events,
             "duplicate_events": self.duplicate_events,
             "unique_events": self.unique_events,
+            "spatially_distinct_events": self.spatially_distinct_events,
             "cache_size": len(self.cache),
-            "duplicate_rate": (self.duplicate_events / self.total_events * 100) if self.total_events > 0 else 0
+            "duplicate_rate": (self.duplicate_events / self.total_events * 100) if self.total_events > 0 else 0,
+            "cache": self.cache.get_stats()
         }
     
     def reset_stats(self):
@@ -109,6 +116,7 @@ class VisionDeduplicationSystem:
     def clear_cache(self):
         """Clear all cached entries."""
         self.cache.clear()
+        self._regions.clear()
         self.logger.info("Vision deduplication cache cleared")
 
 # Global instance
@@ -16,6 +16,24 @@ from datetime import datetime
 import time
 
 
+def bbox_iou(a, b) -> float:
+    """
+    Intersection over union of two [x1, y1, x2, y2] boxes.
+    
+    Args:
+        a: First box
+        b: Second box
+        
+    Returns:
+        Overlap ratio from 0.0 (disjoint) to 1.0 (identical)
+    """
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    intersection = max(0.0, ix2 - ix1) * max(0.0, iy2 - iy1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
 @dataclass
 class VisionEvent:
     """
@@ -71,6 +89,12 @@ class VisionEvent:
             return tuple(int(x) for x in self.bbox)
         return self.bbox
     
+    def iou(self, other: 'VisionEvent') -> Optional[float]:
+        """Intersection over union of the two bboxes (None if either has no bbox)."""
+        if not self.bbox or not other.bbox:
+            return None
+        return bbox_iou(self.get_bbox_as_list(), other.get_bbox_as_list())
+    
     def is_duplicate_of(self, other: 'VisionEvent', ttl_seconds: float = 30.0) -> bool:
         """Check if this event is a duplicate of another event."""
         if not isinstance(other, VisionEvent):
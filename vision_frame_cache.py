@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Vision Frame Cache
+==================
+
+Perceptual-hash frame gating for vision analysis.
+
+When the robot is idle the camera keeps returning effectively the same frame,
+and every one of them used to cost a full vision-LLM round trip. Frames are
+reduced to a 64-bit perceptual hash (dHash, or pHash when NumPy is available);
+near-duplicate frames (small Hamming distance) reuse the previous
+VisionAnalysisResult from a small LRU cache until it goes stale. Results are
+only shared between requests with the same context (upload purpose and
+detail), since a different prompt or resolution gives a different answer.
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Optional imports - only used if available
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def compute_dhash(image_path: str, hash_size: int = 8) -> Optional[int]:
+    """
+    Compute the difference hash of an image.
+
+    The image is reduced to (hash_size + 1) x hash_size grayscale pixels and
+    each bit records whether a pixel is brighter than its right neighbour.
+
+    Returns:
+        hash_size * hash_size bit hash, or None if PIL is unavailable or the image can't be read
+    """
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        with Image.open(image_path) as img:
+            small = img.convert('L').resize((hash_size + 1, hash_size), Image.BILINEAR)
+            if NUMPY_AVAILABLE:
+                pixels = np.asarray(small, dtype=np.int16)
+                bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+            else:
+                data = list(small.getdata())
+                bits = [
+                    data[row * (hash_size + 1) + col + 1] > data[row * (hash_size + 1) + col]
+                    for row in range(hash_size) for col in range(hash_size)
+                ]
+        value = 0
+        for bit in bits:
+            value = (value << 1) | int(bit)
+        return value
+    except Exception:
+        return None
+
+
+def compute_phash(image_path: str, hash_size: int = 8, highfreq_factor: int = 4) -> Optional[int]:
+    """
+    Compute the DCT-based perceptual hash of an image (requires NumPy and PIL).
+
+    Returns:
+        hash_size * hash_size bit hash, or None if unavailable
+    """
+    if not (PIL_AVAILABLE and NUMPY_AVAILABLE):
+        return None
+    try:
+        size = hash_size * highfreq_factor
+        with Image.open(image_path) as img:
+            pixels = np.asarray(img.convert('L').resize((size, size), Image.BILINEAR), dtype=np.float64)
+        # 2-D DCT-II via an orthonormal DCT matrix (avoids a SciPy dependency)
+        n = np.arange(size)
+        dct = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+        coefficients = dct @ pixels @ dct.T
+        low = coefficients[:hash_size, :hash_size].flatten()
+        bits = low > np.median(low[1:])
+        value = 0
+        for bit in bits:
+            value = (value << 1) | int(bit)
+        return value
+    except Exception:
+        return None
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Number of differing bits between two hashes."""
+    return bin(first ^ second).count('1')
+
+
+class VisionFrameCache:
+    """
+    LRU cache of vision results keyed by perceptual hash.
+    """
+
+    def __init__(self, max_entries: int = 32, hamming_threshold: int = 5,
+                 ttl_seconds: float = 30.0, hash_method: str = "dhash"):
+        """
+        Initialize the frame cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            hamming_threshold: Maximum Hamming distance for a frame to count as a near duplicate
+            ttl_seconds: Age after which a cached result is stale and must be refreshed
+            hash_method: "dhash" or "phash"
+        """
+        self.max_entries = max_entries
+        self.hamming_threshold = hamming_threshold
+        self.ttl_seconds = ttl_seconds
+        self.hash_method = hash_method
+        self.logger = logging.getLogger(__name__)
+        self._entries: "OrderedDict[Tuple[Hashable, int], Tuple[Any, float]]" = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.unhashable = 0
+        self.last_hash: Optional[int] = None
+
+    def compute_hash(self, image_path: str) -> Optional[int]:
+        """Compute the configured perceptual hash of an image."""
+        if self.hash_method == "phash":
+            frame_hash = compute_phash(image_path)
+            if frame_hash is not None:
+                return frame_hash
+        return compute_dhash(image_path)
+
+    def frame_changed(self, frame_hash: Optional[int]) -> bool:
+        """Check whether a frame differs noticeably from the previous frame seen."""
+        if frame_hash is None or self.last_hash is None:
+            return True
+        return hamming_distance(frame_hash, self.last_hash) > self.hamming_threshold
+
+    def lookup(self, frame_hash: Optional[int], context: Hashable = None) -> Optional[Any]:
+        """
+        Find a fresh cached result for a near-duplicate frame.
+
+        Args:
+            frame_hash: Perceptual hash of the new frame
+            context: Request settings the result must have been produced with
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        if frame_hash is None:
+            self.unhashable += 1
+            self.misses += 1
+            return None
+
+        self.last_hash = frame_hash
+        now = time.monotonic()
+        best_key = None
+        best_distance = self.hamming_threshold + 1
+        for key in self._entries:
+            if key[0] != context:
+                continue
+            distance = hamming_distance(frame_hash, key[1])
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+                if distance == 0:
+                    break
+
+        if best_key is None:
+            self.misses += 1
+            return None
+
+        result, stored_at = self._entries[best_key]
+        if now - stored_at > self.ttl_seconds:
+            del self._entries[best_key]
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(best_key)
+        self.hits += 1
+        return result
+
+    def store(self, frame_hash: Optional[int], result: Any, context: Hashable = None):
+        """Cache the result for a frame and context, evicting the least recently used entry."""
+        if frame_hash is None:
+            return
+        key = (context, frame_hash)
+        self._entries[key] = (result, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached result."""
+        self._entries.clear()
+        self.last_hash = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'unhashable': self.unhashable,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'hamming_threshold': self.hamming_threshold,
+            'ttl_seconds': self.ttl_seconds
+        }
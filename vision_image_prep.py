@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Vision Image Preparation
+========================
+
+Prepares camera frames before they are uploaded to the vision API.
+
+The ARC camera endpoint returns full-resolution JPEGs (with whatever metadata
+the camera adds) and those were base64-encoded and uploaded unchanged. Each
+upload purpose gets an ImagePreparationProfile instead:
+
+- the longest edge is limited to ``max_edge``,
+- the image is re-encoded as JPEG at ``quality``, stepping the quality (and
+  then the size) down until it fits ``max_bytes``,
+- EXIF and other metadata are dropped (orientation is applied first),
+- the API ``detail`` level is chosen per purpose.
+
+A step that fails (e.g. corrupt EXIF data) is recorded in
+``PreparedImage.failures`` and the remaining steps still run; only when no
+JPEG can be encoded at all are the original bytes uploaded. Without PIL the
+original bytes are uploaded unchanged.
+
+Usage (before/after report on a fixture set):
+    python vision_image_prep.py memories/vision/*.jpg
+"""
+
+import io
+import os
+import sys
+import time
+import base64
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Optional imports - only used if available
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+@dataclass
+class ImagePreparationProfile:
+    """Resize/re-encode budget for one upload purpose."""
+    max_edge: int = 1024
+    quality: int = 80
+    min_quality: int = 45
+    max_bytes: int = 150 * 1024
+    detail: str = "auto"
+
+
+@dataclass
+class PreparedImage:
+    """Image payload ready for upload."""
+    base64_data: str
+    mime_type: str
+    detail: str
+    original_bytes: int
+    upload_bytes: int
+    width: int = 0
+    height: int = 0
+    quality: int = 0
+    reencoded: bool = False
+    prep_seconds: float = 0.0
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{self.base64_data}"
+
+
+# Default profiles: object listing needs readable labels and text on objects,
+# mirror/self-recognition only needs to see the overall scene
+DEFAULT_PROFILES: Dict[str, ImagePreparationProfile] = {
+    'object_listing': ImagePreparationProfile(max_edge=1024, quality=80, max_bytes=150 * 1024, detail="high"),
+    'self_recognition': ImagePreparationProfile(max_edge=512, quality=75, max_bytes=48 * 1024, detail="low")
+}
+
+
+def _encode_jpeg(img, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    # No exif/icc arguments are passed, so no metadata is written
+    img.save(buffer, format='JPEG', quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _decode(raw: bytes):
+    with Image.open(io.BytesIO(raw)) as source:
+        source.load()
+        return source.copy()
+
+
+def _scale(img, factor: float):
+    return img.resize((max(1, int(img.width * factor)), max(1, int(img.height * factor))), Image.LANCZOS)
+
+
+def _original(raw: bytes, profile: ImagePreparationProfile, start: float,
+              failures: Optional[List[str]] = None) -> PreparedImage:
+    """The original bytes as the upload payload."""
+    return PreparedImage(
+        base64_data=base64.b64encode(raw).decode('utf-8'),
+        mime_type='image/jpeg',
+        detail=profile.detail,
+        original_bytes=len(raw),
+        upload_bytes=len(raw),
+        prep_seconds=time.perf_counter() - start,
+        failures=list(failures or [])
+    )
+
+
+def prepare_image(image_path: str, profile: ImagePreparationProfile) -> Optional[PreparedImage]:
+    """
+    Resize, re-encode and strip an image according to a profile.
+
+    Each step runs even if an earlier one failed; failures are collected in
+    PreparedImage.failures.
+
+    Args:
+        image_path: Path to the captured image
+        profile: Budget for this upload
+
+    Returns:
+        PreparedImage, or None if the file can't be read
+    """
+    start = time.perf_counter()
+    try:
+        with open(image_path, 'rb') as image_file:
+            raw = image_file.read()
+    except OSError:
+        return None
+
+    if not PIL_AVAILABLE:
+        return _original(raw, profile, start)
+
+    failures: List[str] = []
+
+    def step(name: str, func: Callable[..., Any], *args) -> Any:
+        """Run one preparation step; a failure is recorded and None returned."""
+        try:
+            return func(*args)
+        except Exception as e:
+            failures.append(f"{name}: {e}")
+            return None
+
+    img = step('decode', _decode, raw)
+    if img is None:
+        logging.getLogger(__name__).warning(f"Image preparation failed for {image_path}, uploading original: {failures}")
+        return _original(raw, profile, start, failures)
+
+    img = step('orient', ImageOps.exif_transpose, img) or img
+    if img.mode != 'RGB':
+        img = step('convert', img.convert, 'RGB') or img
+    if max(img.size) > profile.max_edge:
+        img = step('resize', _scale, img, profile.max_edge / max(img.size)) or img
+
+    # Step the quality down, then the resolution, until the encoding fits the budget;
+    # a step that fails to encode is skipped and the next one is tried
+    quality = profile.quality
+    data = step(f'encode q{quality}', _encode_jpeg, img, quality)
+    encoded_quality, encoded_size = quality, img.size
+    lower_qualities = list(range(profile.quality - 10, profile.min_quality - 1, -10))
+    while data is None or len(data) > profile.max_bytes:
+        if lower_qualities:
+            quality = lower_qualities.pop(0)
+        elif max(img.size) > 256:
+            # Quality floor reached; trade resolution instead
+            smaller = step('shrink', _scale, img, 0.75)
+            if smaller is None:
+                break
+            img = smaller
+        else:
+            break
+        candidate = step(f'encode q{quality}', _encode_jpeg, img, quality)
+        if candidate is not None:
+            data, encoded_quality, encoded_size = candidate, quality, img.size
+
+    if failures:
+        logging.getLogger(__name__).warning(f"Image preparation steps failed for {image_path}: {failures}")
+    if data is None:
+        return _original(raw, profile, start, failures)
+
+    return PreparedImage(
+        base64_data=base64.b64encode(data).decode('utf-8'),
+        mime_type='image/jpeg',
+        detail=profile.detail,
+        original_bytes=len(raw),
+        upload_bytes=len(data),
+        width=encoded_size[0],
+        height=encoded_size[1],
+        quality=encoded_quality,
+        reencoded=True,
+        prep_seconds=time.perf_counter() - start,
+        failures=failures
+    )
+
+
+class VisionUploadStats:
+    """
+    Running totals of upload size and vision latency.
+    """
+
+    def __init__(self):
+        self.uploads = 0
+        self.original_bytes = 0
+        self.upload_bytes = 0
+        self.prep_seconds = 0.0
+        self.api_seconds = 0.0
+        self.prep_failures = 0
+        self.by_purpose: Dict[str, int] = {}
+
+    def record(self, purpose: str, prepared: PreparedImage, api_seconds: float = 0.0):
+        """Record one upload."""
+        self.uploads += 1
+        self.original_bytes += prepared.original_bytes
+        self.upload_bytes += prepared.upload_bytes
+        self.prep_seconds += prepared.prep_seconds
+        self.api_seconds += api_seconds
+        self.prep_failures += len(prepared.failures)
+        self.by_purpose[purpose] = self.by_purpose.get(purpose, 0) + 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get upload statistics."""
+        uploads = self.uploads or 1
+        return {
+            'uploads': self.uploads,
+            'avg_original_kb': self.original_bytes / uploads / 1024,
+            'avg_upload_kb': self.upload_bytes / uploads / 1024,
+            'byte_reduction': 1.0 - self.upload_bytes / self.original_bytes if self.original_bytes else 0.0,
+            'avg_prep_ms': 1000.0 * self.prep_seconds / uploads,
+            'avg_api_ms': 1000.0 * self.api_seconds / uploads,
+            'prep_failures': self.prep_failures,
+            'by_purpose': dict(self.by_purpose)
+        }
+
+
+def benchmark(paths: List[str], profiles: Optional[Dict[str, ImagePreparationProfile]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Compare original and prepared upload sizes over a set of fixture images.
+
+    Args:
+        paths: Image files
+        profiles: Profiles to evaluate (DEFAULT_PROFILES if None)
+
+    Returns:
+        Purpose -> statistics
+    """
+    report = {}
+    for purpose, profile in (profiles or DEFAULT_PROFILES).items():
+        stats = VisionUploadStats()
+        for path in paths:
+            prepared = prepare_image(path, profile)
+            if prepared:
+                stats.record(purpose, prepared)
+        report[purpose] = stats.get_stats()
+    return report
+
+
+def main():
+    paths = [p for p in sys.argv[1:] if os.path.isfile(p)]
+    if not paths:
+        print("Usage: python vision_image_prep.py <image> [<image> ...]")
+        return
+    if not PIL_AVAILABLE:
+        print("⚠️  PIL not available - images would be uploaded unchanged")
+
+    for purpose, stats in benchmark(paths).items():
+        print(f"📷 {purpose}: {stats['uploads']} images  "
+              f"{stats['avg_original_kb']:.1f} KB -> {stats['avg_upload_kb']:.1f} KB "
+              f"({100 * stats['byte_reduction']:.0f}% smaller), prep {stats['avg_prep_ms']:.1f} ms/image")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Vision Memory Records
+=====================
+
+Normalized short-term memory records for vision analyses.
+
+A vision analysis used to be written as one comprehensive STM entry plus one
+entry per detected object, and every per-object entry repeated the scene's
+``analysis`` (twice) and the NEUCOGAR block. Now the scene is stored once,
+as the ``vision_comprehensive_analysis`` entry with a ``scene_id``, and each
+object gets a lightweight ``vision_object_detection`` row that references it.
+
+Readers that need the old per-object format (``get_carl_thought`` and the
+episode display) call ``expand_vision_records``. It joins each detection row
+with its scene at read time and produces exactly the fields the old rows had.
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DETECTION_CONFIDENCE = 0.8
+STOP_WORDS = frozenset(['the', 'and', 'or', 'at', 'in', 'on', 'a', 'an'])
+
+# NEUCOGAR block the per-object rows always carried
+DEFAULT_OBJECT_NEUCOGAR = {
+    "primary": "curiosity",
+    "intensity": 0.6,
+    "neuro_coordinates": {
+        "dopamine": 0.6,
+        "serotonin": 0.5,
+        "noradrenaline": 0.4
+    }
+}
+
+
+def extract_vision_concepts(analysis: Dict[str, Any]) -> List[str]:
+    """Extract concept words from the who/what/when/where/why/how fields of an analysis."""
+    concepts = []
+    for field in ('who', 'what', 'when', 'where', 'why', 'how'):
+        value = analysis.get(field, '')
+        if value:
+            for word in str(value).lower().split():
+                if len(word) > 2 and word not in STOP_WORDS:
+                    concepts.append(word)
+    return concepts
+
+
+class VisionScene:
+    """
+    One vision analysis, stored once and shared by its object detections.
+    """
+
+    __slots__ = ('scene_id', 'timestamp', 'image_path', 'objects', 'object_details', 'analysis',
+                 'neucogar', 'danger_detected', 'danger_reason', 'pleasure_detected',
+                 'pleasure_reason', 'vision_concepts')
+
+    def __init__(self, scene_id: str, timestamp: str, image_path: Optional[str], objects: Tuple[str, ...],
+                 object_details: Dict[str, Any], analysis: Dict[str, Any], neucogar: Dict[str, float],
+                 danger_detected: bool = False, danger_reason: str = "",
+                 pleasure_detected: bool = False, pleasure_reason: str = ""):
+        self.scene_id = scene_id
+        self.timestamp = timestamp
+        self.image_path = image_path
+        self.objects = objects
+        self.object_details = object_details
+        self.analysis = analysis
+        self.neucogar = neucogar
+        self.danger_detected = danger_detected
+        self.danger_reason = danger_reason
+        self.pleasure_detected = pleasure_detected
+        self.pleasure_reason = pleasure_reason
+        self.vision_concepts = tuple(sorted(set(extract_vision_concepts(analysis))))
+
+    @classmethod
+    def from_result(cls, result) -> 'VisionScene':
+        """Build a scene from a VisionAnalysisResult."""
+        return cls(
+            scene_id=f"vision_comprehensive_{int(time.time() * 1000)}",
+            timestamp=result.timestamp,
+            image_path=result.image_path,
+            objects=tuple(result.objects),
+            object_details=result.object_details or {},
+            analysis=result.analysis or {},
+            neucogar=result.neucogar,
+            danger_detected=result.danger_detected,
+            danger_reason=result.danger_reason,
+            pleasure_detected=result.pleasure_detected,
+            pleasure_reason=result.pleasure_reason
+        )
+
+    def detections(self) -> List['ObjectDetection']:
+        """Lightweight detection rows for every object in the scene."""
+        stamp = int(time.time())
+        return [
+            ObjectDetection(
+                visual_id=f"vision_{stamp}_{i}_{obj.lower().replace(' ', '_')}",
+                scene_id=self.scene_id,
+                object_name=obj,
+                confidence=DETECTION_CONFIDENCE,
+                object_details=self.object_details.get(obj, {}) if self.object_details else {}
+            )
+            for i, obj in enumerate(self.objects)
+        ]
+
+    def to_memory_entry(self) -> Dict[str, Any]:
+        """The comprehensive STM entry for the scene (the only copy of the analysis)."""
+        analysis = self.analysis
+        return {
+            "id": self.scene_id,
+            "scene_id": self.scene_id,
+            "type": "vision_comprehensive_analysis",
+            "timestamp": self.timestamp,
+            "source": "vision_system",
+            "objects_detected": list(self.objects),
+            "detection_confidence": DETECTION_CONFIDENCE,
+            "WHAT": analysis.get("what", f"Vision analysis detected {len(self.objects)} objects"),
+            "WHERE": analysis.get("where", "Camera view"),
+            "WHY": analysis.get("why", "Comprehensive vision analysis"),
+            "HOW": analysis.get("how", "OpenAI Vision API analysis"),
+            "WHO": analysis.get("who", "Carl (self)"),
+            "emotions": ["curiosity"],
+            "concepts": [obj.lower() for obj in self.objects],
+            "vision_concepts": list(self.vision_concepts),
+            "vision_data": {
+                "objects": list(self.objects),
+                "object_details": self.object_details,
+                "detection_source": "openai_vision",
+                "confidence": DETECTION_CONFIDENCE,
+                "timestamp": self.timestamp,
+                "image_path": self.image_path,
+                "danger_detected": self.danger_detected,
+                "danger_reason": self.danger_reason,
+                "pleasure_detected": self.pleasure_detected,
+                "pleasure_reason": self.pleasure_reason,
+                "neucogar": self.neucogar
+            },
+            "analysis": analysis,
+            "neucogar_emotional_state": {
+                "primary": "curiosity",
+                "intensity": 0.6,
+                "neuro_coordinates": self.neucogar if self.neucogar else DEFAULT_OBJECT_NEUCOGAR["neuro_coordinates"]
+            }
+        }
+
+
+class ObjectDetection(NamedTuple):
+    """One detected object, referencing its scene by id."""
+    visual_id: str
+    scene_id: str
+    object_name: str
+    confidence: float
+    object_details: Dict[str, Any]
+
+    def to_memory_entry(self, timestamp: str, vision_concepts: Iterable[str] = ()) -> Dict[str, Any]:
+        """Lightweight STM row; scene fields are joined in by expand_vision_records."""
+        concepts = [self.object_name.lower()] + list(vision_concepts)
+        entry = {
+            "id": self.visual_id,
+            "type": "vision_object_detection",
+            "timestamp": timestamp,
+            "source": "vision_system",
+            "object_name": self.object_name,
+            "detection_confidence": self.confidence,
+            "visual_id": self.visual_id,
+            "scene_id": self.scene_id,
+            "emotions": ["curiosity"],
+            "concepts": concepts
+        }
+        if self.object_details:
+            entry["object_details"] = self.object_details
+        return entry
+
+
+def join_detection(row: Dict[str, Any], scene: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Rebuild the full per-object record from a detection row and its scene entry.
+
+    Args:
+        row: Lightweight vision_object_detection row
+        scene: The referenced vision_comprehensive_analysis entry (None if evicted)
+
+    Returns:
+        A new dict in the pre-normalization per-object format
+    """
+    obj = row.get("object_name", "")
+    analysis = (scene or {}).get("analysis") or {}
+    scene_vision = (scene or {}).get("vision_data") or {}
+    object_details = row.get("object_details", {})
+
+    joined = dict(row)
+    joined.update({
+        "WHAT": analysis.get("what", f"Vision: {obj}"),
+        "WHERE": analysis.get("where", "Camera view"),
+        "WHY": analysis.get("why", "Object detection during vision analysis"),
+        "HOW": analysis.get("how", "OpenAI Vision API analysis"),
+        "WHO": analysis.get("who", "Carl (self)"),
+        "vision_data": {
+            "object_name": obj,
+            "detection_source": "openai_vision",
+            "confidence": row.get("detection_confidence", DETECTION_CONFIDENCE),
+            "visual_id": row.get("visual_id"),
+            "timestamp": row.get("timestamp"),
+            "image_path": scene_vision.get("image_path"),
+            "object_details": object_details,
+            "analysis": analysis
+        },
+        "object_details": object_details,
+        "analysis": analysis,
+        "neucogar_emotional_state": DEFAULT_OBJECT_NEUCOGAR
+    })
+    if scene and scene.get("vision_concepts"):
+        joined["vision_concepts"] = list(scene["vision_concepts"])
+    return joined
+
+
+def expand_vision_records(entries: List[Dict[str, Any]],
+                          scenes: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """
+    Join normalized detection rows with their scenes, leaving other entries untouched.
+
+    Args:
+        entries: STM entries to return
+        scenes: scene_id -> scene entry; collected from entries if None
+
+    Returns:
+        Entries in their original order, detection rows joined
+    """
+    if scenes is None:
+        scenes = index_scenes(entries)
+    return [
+        join_detection(entry, scenes.get(entry["scene_id"]))
+        if isinstance(entry, dict) and entry.get("type") == "vision_object_detection" and "scene_id" in entry
+        else entry
+        for entry in entries
+    ]
+
+
+def index_scenes(entries: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map scene_id -> scene entry for the comprehensive entries in a list."""
+    return {
+        entry["scene_id"]: entry
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("type") == "vision_comprehensive_analysis" and "scene_id" in entry
+    }
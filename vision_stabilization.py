@@ -15,7 +15,8 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
 import threading
 import queue
-from vision_events import VisionEvent, VisionDetection, VisionCacheEntry
+from vision_events import VisionEvent, VisionDetection
+from ttl_cache import TTLCache
 
 @dataclass
 class VisionStabilizationEntry:
@@ -33,7 +34,7 @@ class VisionStabilizationSystem:
     - Debouncing: Prevents rapid-fire detection spam
     - Deduplication: Avoids sending duplicate detections
     - Queue management: Manages detection queue with priorities
-    - TTL-based caching: Automatically expires old detections
+    - TTL-based caching: Automatically expires old detections (shared TTLCache)
     - Connection-aware: Only sends when ARC is connected
     """
     
@@ -50,8 +51,8 @@ class VisionStabilizationSystem:
         
         self.logger = logging.getLogger(__name__)
         
-        # Detection cache with TTL
-        self.detection_cache: Dict[str, VisionCacheEntry] = {}
+        # Detection cache with TTL (entries expire ttl_seconds after they were last sent)
+        self.detection_cache = TTLCache(ttl_seconds)
         
         # Send queue for Flask
         self.send_queue = queue.Queue(maxsize=max_queue_size)
@@ -153,9 +154,8 @@ class VisionStabilizationSystem:
         current_time = datetime.now()
         
         # Check cache for existing entry
-        if detection_id in self.detection_cache:
-            cache_entry = self.detection_cache[detection_id]
-            
+        cache_entry = self.detection_cache.get(detection_id)
+        if cache_entry is not None:
             # Check if cool-down period has elapsed
             last_sent_time = datetime.fromisoformat(cache_entry.last_sent)
             time_since_last = current_time - last_sent_time
@@ -184,20 +184,18 @@ class VisionStabilizationSystem:
         """Update the detection cache."""
         current_time = datetime.now()
         
-        if detection_id in self.detection_cache:
-            # Update existing entry
-            cache_entry = self.detection_cache[detection_id]
+        cache_entry = self.detection_cache.get(detection_id)
+        if cache_entry is not None:
+            # Update existing entry (its lifetime still runs from the last send)
             cache_entry.detection = detection
             cache_entry.send_count += 1
         else:
             # Create new entry
-            cache_entry = VisionCacheEntry(
+            self.detection_cache.set(detection_id, VisionStabilizationEntry(
                 detection=detection,
                 last_sent=current_time.isoformat(),
                 send_count=1
-            )
-        
-        self.detection_cache[detection_id] = cache_entry
+            ))
     
     def _send_worker(self):
         """Worker thread that sends detections to Flask."""
@@ -215,8 +213,10 @@ class VisionStabilizationSystem:
                 if success:
                     # Update last sent time
                     with self.lock:
-                        if detection_id in self.detection_cache:
-                            self.detection_cache[detection_id].last_sent = datetime.now().isoformat()
+                        cache_entry = self.detection_cache.get(detection_id)
+                        if cache_entry is not None:
+                            cache_entry.last_sent = datetime.now().isoformat()
+                            self.detection_cache.touch(detection_id)
                 
                 # Mark task as done
                 self.send_queue.task_done()
@@ -262,23 +262,10 @@ class VisionStabilizationSystem:
     def cleanup_expired_cache(self):
         """Remove expired entries from the detection cache."""
         try:
-            current_time = datetime.now()
-            expired_entries = []
-            
             with self.lock:
-                for detection_id, cache_entry in self.detection_cache.items():
-                    last_sent_time = datetime.fromisoformat(cache_entry.last_sent)
-                    time_since_last = current_time - last_sent_time
-                    
-                    if time_since_last.total_seconds() > self.ttl_seconds:
-                        expired_entries.append(detection_id)
-                
-                # Remove expired entries
-                for detection_id in expired_entries:
-                    del self.detection_cache[detection_id]
-                
-                if expired_entries:
-                    self.logger.info(f"Cleaned up {len(expired_entries)} expired cache entries")
+                expired = self.detection_cache.expire()
+                if expired:
+                    self.logger.info(f"Cleaned up {expired} expired cache entries")
             
         except Exception as e:
             self.logger.error(f"Error cleaning up expired cache: {e}")
@@ -291,7 +278,8 @@ class VisionStabilizationSystem:
                 "cache_size": len(self.detection_cache),
                 "queue_size": self.send_queue.qsize(),
                 "running": self.running,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": datetime.now().isoformat(),
+                "cache": self.detection_cache.get_stats()
             })
             return stats
     
@@ -328,7 +316,7 @@ class FlaskVisionServer:
         self.logger = logging.getLogger(__name__)
         
         # Detection cache with TTL
-        self.detection_cache: Dict[str, Dict] = {}
+        self.detection_cache = TTLCache(ttl_seconds)
         
         # Statistics
         self.stats = {
@@ -377,15 +365,10 @@ class FlaskVisionServer:
     
     def _should_process_detection(self, detection_id: str, detection_data: Dict) -> bool:
         """Determine if a detection should be processed."""
-        current_time = time.time()
-        
-        if detection_id in self.detection_cache:
-            cache_entry = self.detection_cache[detection_id]
-            
-            # Check TTL
-            if current_time - cache_entry["timestamp"] < self.ttl_seconds:
-                self.stats["total_deduplicated"] += 1
-                return False
+        # Live cache entries are within the TTL
+        if self.detection_cache.get(detection_id) is not None:
+            self.stats["total_deduplicated"] += 1
+            return False
         
         return True
     
@@ -406,32 +389,24 @@ class FlaskVisionServer:
     
     def _update_cache(self, detection_id: str, detection_data: Dict):
         """Update the detection cache."""
-        self.detection_cache[detection_id] = {
+        self.detection_cache.set(detection_id, {
             "data": detection_data,
             "timestamp": time.time()
-        }
+        })
     
     def cleanup_expired_cache(self):
         """Remove expired entries from the cache."""
-        current_time = time.time()
-        expired_entries = []
-        
-        for detection_id, cache_entry in self.detection_cache.items():
-            if current_time - cache_entry["timestamp"] > self.ttl_seconds:
-                expired_entries.append(detection_id)
-        
-        for detection_id in expired_entries:
-            del self.detection_cache[detection_id]
-        
-        if expired_entries:
-            self.logger.info(f"Cleaned up {len(expired_entries)} expired cache entries")
+        expired = self.detection_cache.expire()
+        if expired:
+            self.logger.info(f"Cleaned up {expired} expired cache entries")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get server statistics."""
         stats = self.stats.copy()
         stats.update({
             "cache_size": len(self.detection_cache),
-            "ttl_seconds": self.ttl_seconds
+            "ttl_seconds": self.ttl_seconds,
+            "cache": self.detection_cache.get_stats()
         })
         return stats
 
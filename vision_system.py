@@ -19,7 +19,15 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+from consciousness_evidence_stream import publish_evidence
+from runtime_context import get_current_context
+from vision_frame_cache import VisionFrameCache
+from vision_memory_records import VisionScene
+from camera_frame_grabber import CameraFrameGrabber, DEFAULT_CAMERA_URL
+from vision_image_prep import DEFAULT_PROFILES, ImagePreparationProfile, PreparedImage, VisionUploadStats, prepare_image
+
 # Optional imports - only used if available
 try:
     import cv2
@@ -59,6 +67,7 @@ class VisionAnalysisResult:
     image_path: str = ""
     success: bool = True
     error: Optional[str] = None
+    from_cache: bool = False  # Reused from a near-duplicate frame; its side effects already ran
 
 class VisionSystem:
     """
@@ -98,6 +107,15 @@ class VisionSystem:
             "pleasure_level": 0.0
         }
         
+        # Background frame grabber holding a pooled keep-alive connection to the camera
+        self.frame_max_age = self._get_vision_setting('camera', 'max_frame_age', 2.0)
+        self.frame_grabber = CameraFrameGrabber(
+            camera_url=self._get_camera_url(),
+            interval=self._get_vision_setting('camera', 'grab_interval', 0.2),
+            timeout=self._get_vision_setting('camera', 'grab_timeout', 2.0),
+            mode=self._get_vision_setting('camera', 'grab_mode', 'snapshot')
+        )
+        
         # Initialize camera
         self._initialize_camera()
         
@@ -105,16 +123,62 @@ class VisionSystem:
         self.vision_dir = "memories/vision"
         os.makedirs(self.vision_dir, exist_ok=True)
         
+        # Perceptual-hash gating: near-duplicate frames reuse the previous analysis
+        self.frame_cache_enabled = self._get_vision_setting('vision_cache', 'enabled', True)
+        self.frame_cache = VisionFrameCache(
+            max_entries=self._get_vision_setting('vision_cache', 'max_entries', 32),
+            hamming_threshold=self._get_vision_setting('vision_cache', 'hamming_threshold', 5),
+            ttl_seconds=self._get_vision_setting('vision_cache', 'ttl_seconds', 30.0),
+            hash_method=self._get_vision_setting('vision_cache', 'hash_method', 'dhash')
+        )
+        
+        # Per-purpose resize/re-encode budgets for vision uploads
+        self.upload_profiles = {
+            purpose: ImagePreparationProfile(
+                max_edge=self._get_vision_setting('vision_upload', f'{purpose}_max_edge', default.max_edge),
+                quality=self._get_vision_setting('vision_upload', f'{purpose}_quality', default.quality),
+                min_quality=self._get_vision_setting('vision_upload', 'min_quality', default.min_quality),
+                max_bytes=1024 * self._get_vision_setting('vision_upload', f'{purpose}_max_kb', default.max_bytes // 1024),
+                detail=self._get_vision_setting('vision_upload', f'{purpose}_detail', default.detail)
+            )
+            for purpose, default in DEFAULT_PROFILES.items()
+        }
+        self.upload_stats = VisionUploadStats()
+        
+    def _get_vision_setting(self, section: str, key: str, fallback):
+        """Read a setting from a ConfigParser or dict, converted to the fallback's type."""
+        try:
+            if self.settings is None:
+                return fallback
+            if hasattr(self.settings, 'has_section'):
+                if not self.settings.has_section(section):
+                    return fallback
+                if isinstance(fallback, bool):
+                    return self.settings.getboolean(section, key, fallback=fallback)
+                if isinstance(fallback, int):
+                    return self.settings.getint(section, key, fallback=fallback)
+                if isinstance(fallback, float):
+                    return self.settings.getfloat(section, key, fallback=fallback)
+                return self.settings.get(section, key, fallback=fallback)
+            if isinstance(self.settings, dict):
+                value = self.settings.get(section, {}).get(key, fallback)
+                return type(fallback)(value) if not isinstance(fallback, bool) else bool(value)
+        except (ValueError, TypeError):
+            pass
+        return fallback
+    
+    def _get_camera_url(self) -> str:
+        """Get the camera snapshot URL from settings."""
+        camera_url = getattr(self, 'camera_url', None)
+        if camera_url:
+            return camera_url
+        return self._get_vision_setting('camera', 'url', DEFAULT_CAMERA_URL)
+    
     def _initialize_camera(self):
         """Initialize camera connection using HTTP feed (no OpenCV required)."""
         try:
-            # Test HTTP camera connection instead of OpenCV
-            import requests
-            vision_url = "http://192.168.56.1/CameraImage.jpg?c=Camera"
-            
-            # Test connection
-            response = requests.get(vision_url, timeout=2)
-            if response.status_code == 200:
+            # Test connection (the first frame also primes the grabber's buffer)
+            if self.frame_grabber.fetch_once() is not None:
                 self.camera_active = True
                 self.logger.info("✅ HTTP Camera initialized successfully")
             else:
@@ -128,10 +192,9 @@ class VisionSystem:
     def test_camera_connection(self) -> bool:
         """Test if HTTP camera is available and working."""
         try:
-            import requests
-            vision_url = "http://192.168.56.1/CameraImage.jpg?c=Camera"
-            response = requests.get(vision_url, timeout=2)
-            return response.status_code == 200
+            if self.frame_grabber.latest(max_age=self.frame_max_age) is not None:
+                return True
+            return self.frame_grabber.fetch_once() is not None
         except Exception as e:
             self.logger.warning(f"HTTP Camera test failed: {e}")
             return False
@@ -141,13 +204,39 @@ class VisionSystem:
         # Don't require camera to be active for continuous capture
         # The system can work with manual captures even if HTTP camera is not available
         self.vision_enabled = True
+        self.frame_grabber.camera_url = self._get_camera_url()
+        self.frame_grabber.start()
         self.logger.info("✅ Continuous vision capture started")
     
     def stop_continuous_capture(self):
         """Stop continuous image capture."""
         self.vision_enabled = False
+        self.frame_grabber.stop()
         self.logger.info("⏹️ Continuous vision capture stopped")
     
+    def _capture_latest_frame(self, prefix: str) -> Optional[str]:
+        """
+        Write the newest camera frame to the vision directory.
+        
+        Uses the grabber's in-memory frame when it is fresh, otherwise fetches
+        one snapshot over the grabber's pooled connection.
+        """
+        if self.frame_grabber.latest(max_age=self.frame_max_age) is None:
+            if self.frame_grabber.fetch_once() is None:
+                return None
+        filepath = self.frame_grabber.save_latest(self.vision_dir, prefix)
+        if filepath:
+            # Identical frames (idle camera) share one stored blob
+            try:
+                get_current_context().image_store.ingest(filepath)
+            except Exception as e:
+                self.logger.warning(f"Image deduplication failed for {filepath}: {e}")
+        return filepath
+    
+    def get_frame_grabber_stats(self) -> Dict[str, Any]:
+        """Get camera frame grabber statistics."""
+        return self.frame_grabber.get_stats()
+    
     def capture_image(self) -> Optional[str]:
         """
         Capture a single image from HTTP camera feed and save it to vision directory.
@@ -156,27 +245,12 @@ class VisionSystem:
             Path to captured image or None if failed
         """
         try:
-            import requests
-            
-            # Use HTTP camera feed
-            vision_url = "http://192.168.56.1/CameraImage.jpg?c=Camera"
-            
-            # Fetch image
-            response = requests.get(vision_url, timeout=2)
-            if response.status_code != 200:
+            filepath = self._capture_latest_frame("vision_capture")
+            if not filepath:
                 self.logger.warning("⚠️ Cannot capture image - HTTP camera not available")
                 return None
             
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"vision_capture_{timestamp}.jpg"
-            filepath = os.path.join(self.vision_dir, filename)
-            
-            # Save image
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            self.logger.info(f"📸 Image captured: {filename}")
+            self.logger.info(f"📸 Image captured: {os.path.basename(filepath)}")
             return filepath
                 
         except Exception as e:
@@ -193,6 +267,40 @@ class VisionSystem:
             self.logger.error(f"Image encoding failed: {e}")
             return None
     
+    def prepare_image_for_upload(self, image_path: str, purpose: str = "object_listing") -> Optional[PreparedImage]:
+        """
+        Downscale, re-encode and strip metadata from an image for the vision API.
+        
+        Args:
+            image_path: Path to the captured image
+            purpose: "object_listing" or "self_recognition"
+            
+        Returns:
+            PreparedImage or None if the image can't be read
+        """
+        profile = self.upload_profiles.get(purpose, self.upload_profiles['object_listing'])
+        prepared = prepare_image(image_path, profile)
+        if prepared is None:
+            self.logger.error(f"Image preparation failed: {image_path}")
+        return prepared
+    
+    def _select_upload_purpose(self) -> str:
+        """Use the cheaper self-recognition budget while CARL is looking at a mirror."""
+        latest = self.recent_vision_results[-1] if self.recent_vision_results else None
+        if latest is not None and ("me" in latest.objects or latest.analysis.get("mirror_context", False)):
+            return "self_recognition"
+        return "object_listing"
+    
+    def get_vision_upload_stats(self) -> Dict[str, Any]:
+        """Get upload size and vision latency statistics."""
+        return self.upload_stats.get_stats()
+    
+    def get_vision_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics of the perceptual-hash frame cache."""
+        stats = self.frame_cache.get_stats()
+        stats['enabled'] = self.frame_cache_enabled
+        return stats
+    
     def use_test_image(self) -> Optional[str]:
         """
         Use a test image for vision analysis when camera is not available.
@@ -243,43 +351,18 @@ class VisionSystem:
             Path to captured image or None if failed
         """
         try:
-            import requests
-            from urllib.parse import urlparse
-            
             # Get camera URL from settings or use default
-            camera_url = getattr(self, 'camera_url', None)
-            if not camera_url:
-                # Try to get from settings - handle both ConfigParser and dict
-                if hasattr(self, 'settings') and self.settings:
-                    if hasattr(self.settings, 'has_section') and self.settings.has_section('camera'):
-                        # ConfigParser object
-                        camera_url = self.settings.get('camera', 'url', fallback='http://192.168.56.1/CameraImage.jpg?c=Camera')
-                    elif isinstance(self.settings, dict) and 'camera' in self.settings:
-                        # Dictionary object
-                        camera_url = self.settings.get('camera', {}).get('url', 'http://192.168.56.1/CameraImage.jpg?c=Camera')
-                    else:
-                        # Default fallback
-                        camera_url = 'http://192.168.56.1/CameraImage.jpg?c=Camera'
-                else:
-                    camera_url = 'http://192.168.56.1/CameraImage.jpg?c=Camera'
-            
-            self.logger.info(f"📸 Attempting camera capture from: {camera_url}")
-            
-            # Capture image from camera endpoint
-            response = requests.get(camera_url, timeout=10)
-            if response.status_code == 200:
-                # Save the image
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"camera_capture_{timestamp}.jpg"
-                filepath = os.path.join(self.vision_dir, filename)
-                
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                
-                self.logger.info(f"📸 Camera image captured: {filename}")
+            camera_url = self._get_camera_url()
+            if camera_url != self.frame_grabber.camera_url:
+                self.frame_grabber.camera_url = camera_url
+            
+            # Zero-latency read of the grabber's latest frame; disk write only for this memshot
+            filepath = self._capture_latest_frame("camera_capture")
+            if filepath:
+                self.logger.info(f"📸 Camera image captured: {os.path.basename(filepath)}")
                 return filepath
             else:
-                self.logger.warning(f"📸 Camera endpoint returned status {response.status_code}")
+                self.logger.warning(f"📸 Camera capture from {camera_url} failed: {self.frame_grabber.last_error}")
                 return None
                 
         except Exception as e:
@@ -332,12 +415,13 @@ class VisionSystem:
             self.logger.error(f"Event image capture failed: {e}")
             return None
     
-    async def analyze_vision_with_openai(self, image_path: str) -> VisionAnalysisResult:
+    async def analyze_vision_with_openai(self, image_path: str, purpose: Optional[str] = None) -> VisionAnalysisResult:
         """
         Analyze vision using OpenAI Vision API.
         
         Args:
             image_path: Path to image to analyze
+            purpose: Upload profile ("object_listing" or "self_recognition"); chosen from context if None
             
         Returns:
             VisionAnalysisResult with analysis data
@@ -358,9 +442,23 @@ class VisionSystem:
                     error="OpenAI client not available"
                 )
             
-            # Encode image
-            base64_image = self.encode_image_to_base64(image_path)
-            if not base64_image:
+            purpose = purpose or self._select_upload_purpose()
+            
+            # Reuse the previous analysis when the frame is a near duplicate sent with the same upload settings
+            frame_hash = None
+            cache_context = (purpose, self.upload_profiles.get(purpose, self.upload_profiles['object_listing']).detail)
+            if self.frame_cache_enabled:
+                frame_hash = self.frame_cache.compute_hash(image_path)
+                cached_result = self.frame_cache.lookup(frame_hash, cache_context)
+                if cached_result is not None:
+                    self.logger.info(f"👁️ Near-duplicate frame - reusing previous vision analysis ({len(cached_result.objects)} objects)")
+                    self._update_motion_tracking_based_on_exploration()
+                    return replace(cached_result, timestamp=datetime.now().isoformat(), image_path=image_path,
+                                   from_cache=True)
+            
+            # Downscale and re-encode the image for upload
+            prepared_image = self.prepare_image_for_upload(image_path, purpose)
+            if not prepared_image:
                 return VisionAnalysisResult(
                     objects=[],
                     danger_detected=False,
@@ -457,7 +555,8 @@ Rules:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
+                                "url": prepared_image.data_url,
+                                "detail": prepared_image.detail
                             }
                         }
                     ]
@@ -483,6 +582,9 @@ Rules:
             
             # Track the API call if main_app is available
             call_duration = time.time() - call_start_time
+            self.upload_stats.record(purpose, prepared_image, api_seconds=call_duration)
+            self.logger.info(f"📷 Vision upload ({purpose}): {prepared_image.original_bytes // 1024} KB -> "
+                             f"{prepared_image.upload_bytes // 1024} KB, detail={prepared_image.detail}, {call_duration:.2f}s")
             if hasattr(self, 'main_app') and self.main_app and hasattr(self.main_app, '_track_openai_call'):
                 # Extract the prompt text for tracking
                 prompt_text = ""
@@ -688,6 +790,9 @@ Rules:
             # 🔧 CRITICAL FIX: Save vision detections to memory (ensure it's called from all paths)
             self._save_vision_detections_to_memory(result)
             
+            if self.frame_cache_enabled:
+                self.frame_cache.store(frame_hash, result, cache_context)
+            
             return result
             
         except Exception as e:
@@ -809,6 +914,10 @@ Rules:
                         json.dump(ltm_memory, f, indent=2)
                     
                     self.logger.info(f"✅ Self-reflection stored in LTM: {memory_filename}")
+                    publish_evidence('self_recognition', 0.9, source='vision_system.self_recognition',
+                                     file_path=memory_filepath)
+                    publish_evidence('memory_usage', 0.9, source='vision_system.self_recognition',
+                                     file_path=memory_filepath)
                     
                 except Exception as e:
                     self.logger.error(f"❌ Error storing self-reflection in LTM: {e}")
@@ -955,6 +1064,9 @@ Rules:
                 json.dump(memory_data, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"✅ Self-recognition reaction outcome stored: {memory_filepath}")
+            if outcome == "executed":
+                publish_evidence('purpose_driven_behavior', decision.get("confidence", 0.5),
+                                 source='vision_system.self_recognition_reaction', file_path=memory_filepath)
             
         except Exception as e:
             self.logger.error(f"❌ Error storing self-recognition action outcome: {e}")
@@ -1170,7 +1282,9 @@ Rules:
                 self.recent_vision_results.pop(0)
             
             # 🔧 CRITICAL FIX: Automatically save vision detections to short-term memory
-            self._save_vision_detections_to_memory(result)
+            # (a near-duplicate frame's detections were saved when it was first analyzed)
+            if not result.from_cache:
+                self._save_vision_detections_to_memory(result)
             
             # Clear processing flag
             self.vision_processing_active = False
@@ -1225,146 +1339,52 @@ Rules:
         🔧 CRITICAL FIX: Save vision detections to short-term memory in the format 
         that get_carl_thought expects. This ensures synchronization between vision 
         system and thought processing.
+        
+        The scene analysis is stored once; per-object rows reference it by
+        scene_id and are joined back on read (see vision_memory_records).
         """
         try:
             if not result.objects:
                 return
                 
-            # Create comprehensive vision memory entry with all objects and analysis
-            analysis = result.analysis if result.analysis else {}
-            comprehensive_memory_entry = {
-                "id": f"vision_comprehensive_{int(time.time())}",
-                "type": "vision_comprehensive_analysis",
-                "timestamp": result.timestamp,
-                "source": "vision_system",
-                "objects_detected": result.objects,  # Store all detected objects
-                "detection_confidence": 0.8,
-                "WHAT": analysis.get("what", f"Vision analysis detected {len(result.objects)} objects"),
-                "WHERE": analysis.get("where", "Camera view"),
-                "WHY": analysis.get("why", "Comprehensive vision analysis"),
-                "HOW": analysis.get("how", "OpenAI Vision API analysis"),
-                "WHO": analysis.get("who", "Carl (self)"),
-                "emotions": ["curiosity"],
-                "concepts": [obj.lower() for obj in result.objects],
-                "vision_data": {
-                    "objects": result.objects,
-                    "object_details": result.object_details,
-                    "detection_source": "openai_vision",
-                    "confidence": 0.8,
-                    "timestamp": result.timestamp,
-                    "image_path": result.image_path,
-                    "analysis": analysis,
-                    "danger_detected": result.danger_detected,
-                    "danger_reason": result.danger_reason,
-                    "pleasure_detected": result.pleasure_detected,
-                    "pleasure_reason": result.pleasure_reason,
-                    "neucogar": result.neucogar
-                },
-                "analysis": analysis,  # Store analysis data for STM/LTM
-                "neucogar_emotional_state": {
-                    "primary": "curiosity",
-                    "intensity": 0.6,
-                    "neuro_coordinates": result.neucogar if result.neucogar else {
-                        "dopamine": 0.6,
-                        "serotonin": 0.5,
-                        "noradrenaline": 0.4
-                    }
-                }
-            }
-            
-            # Save comprehensive memory entry
-            self._save_to_short_term_memory(comprehensive_memory_entry)
-            self.logger.info(f"🔧 Saved comprehensive vision analysis to memory: {len(result.objects)} objects detected")
-            
-            # Also create individual entries for each object for detailed tracking
-            for i, obj in enumerate(result.objects):
-                # Generate visual_id for this detection
-                visual_id = f"vision_{int(time.time())}_{i}_{obj.lower().replace(' ', '_')}"
-                
-                # Get object details if available
-                object_details = result.object_details.get(obj, {}) if result.object_details else {}
-                
-                # Create memory entry in the format expected by get_carl_thought
-                memory_entry = {
-                    "id": visual_id,
-                    "type": "vision_object_detection",
-                    "timestamp": result.timestamp,
-                    "source": "vision_system",
-                    "object_name": obj,
-                    "detection_confidence": 0.8,  # Default confidence for OpenAI detections
-                    "visual_id": visual_id,
-                    "WHAT": analysis.get("what", f"Vision: {obj}"),
-                    "WHERE": analysis.get("where", "Camera view"),
-                    "WHY": analysis.get("why", "Object detection during vision analysis"),
-                    "HOW": analysis.get("how", "OpenAI Vision API analysis"),
-                    "WHO": analysis.get("who", "Carl (self)"),
-                    "emotions": ["curiosity"],
-                    "concepts": [obj.lower()],
-                    "vision_data": {
-                        "object_name": obj,
-                        "detection_source": "openai_vision",
-                        "confidence": 0.8,
-                        "visual_id": visual_id,
-                        "timestamp": result.timestamp,
-                        "image_path": result.image_path,
-                        "object_details": object_details,
-                        "analysis": analysis  # Include full analysis data
-                    },
-                    "object_details": object_details,  # Include detailed object information
-                    "analysis": analysis,  # Store analysis data for STM/LTM
-                    "neucogar_emotional_state": {
-                        "primary": "curiosity",
-                        "intensity": 0.6,
-                        "neuro_coordinates": {
-                            "dopamine": 0.6,
-                            "serotonin": 0.5,
-                            "noradrenaline": 0.4
-                        }
-                    }
-                }
-                
-                # 🔧 FIX #3: Extract vision_analysis concepts (who, what, when, where, why, how) for STM/LTM
-                vision_concepts = []
-                if analysis:
-                    # Extract concepts from analysis fields
-                    for field in ['who', 'what', 'when', 'where', 'why', 'how']:
-                        value = analysis.get(field, '')
-                        if value:
-                            # Split into individual words/concepts
-                            words = value.lower().split()
-                            for word in words:
-                                # Filter out common words
-                                if len(word) > 2 and word not in ['the', 'and', 'or', 'at', 'in', 'on', 'a', 'an']:
-                                    vision_concepts.append(word)
-                    
-                    # Add vision concepts to memory entry
-                    if vision_concepts:
-                        memory_entry['vision_concepts'] = list(set(vision_concepts))
-                        memory_entry['concepts'] = memory_entry.get('concepts', []) + vision_concepts
-                
-                # Save to short-term memory
-                self._save_to_short_term_memory(memory_entry)
-                
-                # 🔧 FIX #3: Add vision concepts to LTM concept system
-                if vision_concepts and hasattr(self, 'main_app') and self.main_app:
-                    if hasattr(self.main_app, 'concept_system') and self.main_app.concept_system:
-                        for concept in vision_concepts:
-                            try:
-                                self.main_app.concept_system.create_or_update_concept(
-                                    word=concept,
-                                    word_type="thing",  # Vision concepts are typically things
-                                    event={"WHAT": f"Vision analysis: {concept}", "source": "vision_system"}
-                                )
-                            except Exception as e:
-                                self.logger.error(f"⚠️ Error adding vision concept {concept} to LTM: {e}")
-                
-                self.logger.info(f"🔧 Saved vision detection to memory: {obj} (ID: {visual_id})")
+            # Store the scene (analysis, NEUCOGAR, image) once
+            scene = VisionScene.from_result(result)
+            detections = scene.detections()
+            
+            # Lightweight per-object rows, most recent first like individual inserts
+            entries = [
+                detection.to_memory_entry(result.timestamp, scene.vision_concepts)
+                for detection in reversed(detections)
+            ]
+            entries.append(scene.to_memory_entry())
+            self._save_entries_to_short_term_memory(entries)
+            self.logger.info(f"🔧 Saved vision scene {scene.scene_id} to memory: {len(result.objects)} objects detected")
+            
+            # 🔧 FIX #3: Add vision concepts to LTM concept system (once per scene)
+            if scene.vision_concepts and hasattr(self, 'main_app') and self.main_app:
+                if hasattr(self.main_app, 'concept_system') and self.main_app.concept_system:
+                    for concept in scene.vision_concepts:
+                        try:
+                            self.main_app.concept_system.create_or_update_concept(
+                                word=concept,
+                                word_type="thing",  # Vision concepts are typically things
+                                event={"WHAT": f"Vision analysis: {concept}", "source": "vision_system"}
+                            )
+                        except Exception as e:
+                            self.logger.error(f"⚠️ Error adding vision concept {concept} to LTM: {e}")
+            
+            for detection in detections:
+                self.logger.info(f"🔧 Saved vision detection to memory: {detection.object_name} (ID: {detection.visual_id})")
                 
         except Exception as e:
             self.logger.error(f"❌ Error saving vision detections to memory: {e}")
     
     def _save_to_short_term_memory(self, memory_entry: dict):
         """Save memory entry to short-term memory JSON file."""
+        self._save_entries_to_short_term_memory([memory_entry])
+    
+    def _save_entries_to_short_term_memory(self, memory_entries: List[dict]):
+        """Save several memory entries (most recent first) with one read and one write."""
         try:
             stm_file = 'short_term_memory.json'
             
@@ -1375,8 +1395,8 @@ Rules:
             else:
                 stm_data = []
             
-            # Add new memory entry to the beginning (most recent first)
-            stm_data.insert(0, memory_entry)
+            # Add new memory entries to the beginning (most recent first)
+            stm_data[:0] = memory_entries
             
             # Keep only the last 100 entries to prevent file from growing too large
             if len(stm_data) > 100:
@@ -1546,11 +1566,10 @@ Rules:
         """
         try:
             import os
-            import json
-            from difflib import SequenceMatcher
             
-            concepts_dir = "concepts"
-            if not os.path.exists(concepts_dir):
+            concept_index = get_current_context().concept_index
+            concepts_dir = concept_index.directory_path('concepts')
+            if not concepts_dir or not os.path.exists(concepts_dir):
                 self.logger.warning(f"Concepts directory not found: {concepts_dir}")
                 return self._create_fallback_concept_match(object_name)
             
@@ -1565,27 +1584,20 @@ Rules:
             best_score = 0.0
             match_threshold = 0.6  # Minimum similarity threshold
             
-            # Search through all concept files
-            for filename in os.listdir(concepts_dir):
-                if not filename.endswith('.json'):
-                    continue
-                    
-                concept_file = os.path.join(concepts_dir, filename)
+            # Score only the concept files whose terms share trigrams with the search terms
+            for document in concept_index.candidate_documents(search_terms, directory='concepts'):
                 try:
-                    with open(concept_file, 'r', encoding='utf-8') as f:
-                        concept_data = json.load(f)
-                    
-                    # Calculate match score
+                    concept_data = document.data
                     match_score = self._calculate_concept_match_score(concept_data, search_terms)
                     
                     if match_score > best_score and match_score >= match_threshold:
                         best_score = match_score
-                        best_match = concept_data
+                        best_match = dict(concept_data)
                         best_match['match_score'] = match_score
-                        best_match['source_file'] = filename
-                        
+                        best_match['source_file'] = document.filename
+                
                 except Exception as e:
-                    self.logger.warning(f"Error reading concept file {filename}: {e}")
+                    self.logger.warning(f"Error reading concept file {document.filename}: {e}")
                     continue
             
             # 🔧 ENHANCEMENT: Also search things directory for toy/object data
@@ -1639,13 +1651,11 @@ Rules:
         """
         try:
             import os
-            import json
             from datetime import datetime, timedelta
             
-            memories_dir = "memories"
-            episodic_dir = os.path.join(memories_dir, "episodic")
-            
-            if not os.path.exists(episodic_dir):
+            concept_index = get_current_context().concept_index
+            episodic_dir = concept_index.directory_path('episodic')
+            if not episodic_dir or not os.path.exists(episodic_dir):
                 return None
             
             # Search terms for episodic memory matching
@@ -1659,14 +1669,10 @@ Rules:
             cutoff_date = datetime.now() - timedelta(days=30)
             relevant_memories = []
             
-            for filename in os.listdir(episodic_dir):
-                if not filename.endswith('.json'):
-                    continue
-                
+            # Parsed memories and their lowercased text are cached by the concept index
+            for document in concept_index.documents('episodic'):
                 try:
-                    memory_file = os.path.join(episodic_dir, filename)
-                    with open(memory_file, 'r', encoding='utf-8') as f:
-                        memory_data = json.load(f)
+                    memory_data = document.data
                     
                     # Check if memory is recent enough
                     memory_timestamp = memory_data.get('timestamp', '')
@@ -1679,7 +1685,7 @@ Rules:
                             continue
                     
                     # Check if memory contains object-related information
-                    memory_text = str(memory_data).lower()
+                    memory_text = document.text
                     for term in search_terms:
                         if term in memory_text:
                             # Calculate relevance score
@@ -1689,10 +1695,10 @@ Rules:
                                 'memory_data': memory_data,
                                 'relevance_score': relevance_score,
                                 'timestamp': memory_timestamp,
-                                'filename': filename
+                                'filename': document.filename
                             })
                             break
-                            
+                
                 except Exception as e:
                     continue
             
@@ -1823,10 +1829,10 @@ Rules:
         """
         try:
             import os
-            import json
             
-            things_dir = "things"
-            if not os.path.exists(things_dir):
+            concept_index = get_current_context().concept_index
+            things_dir = concept_index.directory_path('things')
+            if not things_dir or not os.path.exists(things_dir):
                 self.logger.warning(f"Things directory not found: {things_dir}")
                 return None
             
@@ -1835,15 +1841,12 @@ Rules:
             best_score = 0.0
             match_threshold = 0.5  # Minimum similarity threshold for things
             
-            # Search through all things files
-            for filename in os.listdir(things_dir):
-                if not filename.endswith('.json'):
-                    continue
-                
-                thing_file = os.path.join(things_dir, filename)
+            # Score only the things whose terms share trigrams with the object, color or shape
+            search_terms = [object_lower, object_color.lower(), object_shape.lower()]
+            for document in concept_index.candidate_documents(search_terms, directory='things'):
                 try:
-                    with open(thing_file, 'r', encoding='utf-8') as f:
-                        thing_data = json.load(f)
+                    thing_data = document.data
+                    filename = document.filename
                     
                     # Calculate match score
                     match_score = 0.0
@@ -1892,7 +1895,7 @@ Rules:
                         best_match['source'] = 'things_directory'
                 
                 except Exception as e:
-                    self.logger.warning(f"Error reading thing file {filename}: {e}")
+                    self.logger.warning(f"Error reading thing file {document.filename}: {e}")
                     continue
             
             if best_match:
@@ -1961,6 +1964,7 @@ Rules:
 
     def cleanup(self):
         """Clean up camera resources."""
+        self.frame_grabber.stop()
         if self.camera:
             self.camera.release()
         self.camera_active = False